@@ -76,7 +76,7 @@ from .sources.utils import casing
 from .sources.utils.schema_helpers import InternalConfig, ResourceSchemaLoader, check_config_against_spec_or_exit, split_config, expand_refs
 from .sources.utils.transform import TransformConfig, TypeTransformer
 from .utils import AirbyteTracedException, is_cloud_environment
-from .utils.constants import ENV_REQUEST_CACHE_PATH
+from .utils.constants import ENV_PERSISTENT_REQUEST_CACHE_PATH, ENV_REQUEST_CACHE_PATH
 from .utils.event_timing import create_timer
 from .utils.oneof_option_config import OneOfOptionConfig
 from .utils.spec_schema_transformations import resolve_refs
@@ -238,6 +238,7 @@ __all__ = [
     "TransformConfig",
     "TypeTransformer",
     "ENV_REQUEST_CACHE_PATH",
+    "ENV_PERSISTENT_REQUEST_CACHE_PATH",
     "create_timer",
     "OneOfOptionConfig",
     "resolve_refs",
@@ -13,8 +13,9 @@ from .config import (
 )
 from .document_processor import Chunk, DocumentProcessor
 from .embedder import CohereEmbedder, Embedder, FakeEmbedder, OpenAIEmbedder
+from .embedding_cache import EmbeddingCache, SqliteEmbeddingCache
 from .indexer import Indexer
-from .writer import Writer
+from .writer import PipelinedWriter, Writer
 
 __all__ = [
     "AzureOpenAIEmbedder",
@@ -24,6 +25,7 @@ __all__ = [
     "CohereEmbeddingConfigModel",
     "DocumentProcessor",
     "Embedder",
+    "EmbeddingCache",
     "FakeEmbedder",
     "FakeEmbeddingConfigModel",
     "FromFieldEmbedder",
@@ -33,6 +35,8 @@ __all__ = [
     "OpenAICompatibleEmbeddingConfigModel",
     "OpenAIEmbedder",
     "OpenAIEmbeddingConfigModel",
+    "PipelinedWriter",
     "ProcessingConfigModel",
+    "SqliteEmbeddingCache",
     "Writer",
 ]
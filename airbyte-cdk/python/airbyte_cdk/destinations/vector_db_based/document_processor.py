@@ -4,8 +4,12 @@
 
 import json
 import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 import dpath
 from airbyte_cdk.destinations.vector_db_based.config import ProcessingConfigModel, SeparatorSplitterConfigModel, TextSplitterConfigModel
@@ -21,6 +25,9 @@ METADATA_RECORD_ID_FIELD = "_ab_record_id"
 
 CDC_DELETED_FIELD = "_ab_cdc_deleted_at"
 
+# The chunks of a record as (page content, metadata) along with the record id to delete, or None if the record could not be processed
+_SplitRecord = Optional[Tuple[List[Tuple[str, Dict[str, Any]]], Optional[str]]]
+
 
 @dataclass
 class Chunk:
@@ -47,8 +54,13 @@ class DocumentProcessor:
 
     The config parameters specified by the ProcessingConfigModel has to be made part of the connector spec to allow the user to configure the document processor.
     Calling DocumentProcessor.check_config(config) will validate the config and return an error message if the config is invalid.
+
+    Splitting text is CPU-bound, especially with token-based splitters. If max_workers is set, process_records splits records in parallel batches
+    of records_per_worker_batch records using a pool of worker processes. Results are returned in the order of the records.
     """
 
+    _MAX_BATCHES_IN_FLIGHT_PER_WORKER = 2
+
     streams: Mapping[str, ConfiguredAirbyteStream]
 
     @staticmethod
@@ -93,7 +105,18 @@ class DocumentProcessor:
                 disallowed_special=(),
             )
 
-    def __init__(self, config: ProcessingConfigModel, catalog: ConfiguredAirbyteCatalog):
+    def __init__(
+        self,
+        config: ProcessingConfigModel,
+        catalog: ConfiguredAirbyteCatalog,
+        max_workers: int = 0,
+        records_per_worker_batch: int = 64,
+    ):
+        self.config = config
+        self.catalog = catalog
+        self.max_workers = max_workers
+        self.records_per_worker_batch = records_per_worker_batch
+        self._process_pool: Optional[ProcessPoolExecutor] = None
         self.streams = {create_stream_identifier(stream.stream): stream for stream in catalog.streams}
 
         self.splitter = self._get_text_splitter(config.chunk_size, config.chunk_overlap, config.text_splitter)
@@ -125,6 +148,64 @@ class DocumentProcessor:
         id_to_delete = doc.metadata[METADATA_RECORD_ID_FIELD] if METADATA_RECORD_ID_FIELD in doc.metadata else None
         return chunks, id_to_delete
 
+    def process_records(self, records: Sequence[AirbyteRecordMessage]) -> Iterator[Tuple[List[Chunk], Optional[str]]]:
+        """
+        Generate documents from many records, in parallel if max_workers is set.
+        :param records: List of AirbyteRecordMessages
+        :return: For each record, in order, the same tuple as `process`
+        """
+        if self.max_workers <= 0 or len(records) <= self.records_per_worker_batch:
+            for record in records:
+                yield self.process(record)
+            return
+
+        if self._process_pool is None:
+            # Worker processes are spawned as the writer can run threads
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.config, self.catalog),
+            )
+        process_pool = self._process_pool
+        batches = (
+            records[start : start + self.records_per_worker_batch] for start in range(0, len(records), self.records_per_worker_batch)
+        )
+        # Only a few batches per worker are submitted at a time so that the records waiting to be sent to the worker processes are bounded
+        max_batches_in_flight = self.max_workers * self._MAX_BATCHES_IN_FLIGHT_PER_WORKER
+        in_flight: Deque[Tuple[Sequence[AirbyteRecordMessage], Future[List[_SplitRecord]]]] = deque()
+        try:
+            for batch in batches:
+                in_flight.append((batch, process_pool.submit(_split_records, batch)))
+                if len(in_flight) >= max_batches_in_flight:
+                    yield from self._collect_split_records(*in_flight.popleft())
+            while in_flight:
+                yield from self._collect_split_records(*in_flight.popleft())
+        except BrokenProcessPool:
+            # A worker process died (e.g. it ran out of memory). Waiting for the pool to shut down can hang so it is left behind
+            process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+            raise
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+
+    def _collect_split_records(
+        self, batch: Sequence[AirbyteRecordMessage], future: Future[List[_SplitRecord]]
+    ) -> Iterator[Tuple[List[Chunk], Optional[str]]]:
+        for record, split_record in zip(batch, future.result()):
+            if split_record is None:
+                # Processing the record again raises the same error as when processing it in the worker process
+                yield self.process(record)
+                continue
+            chunks, id_to_delete = split_record
+            yield [Chunk(page_content=page_content, metadata=metadata, record=record) for page_content, metadata in chunks], id_to_delete
+
+    def close(self) -> None:
+        if self._process_pool is not None:
+            self._process_pool.shutdown(cancel_futures=True)
+            self._process_pool = None
+
     def _generate_document(self, record: AirbyteRecordMessage) -> Optional[Document]:
         relevant_fields = self._extract_relevant_fields(record, self.text_fields)
         if len(relevant_fields) == 0:
@@ -182,3 +263,28 @@ class DocumentProcessor:
                 new_fields[mapping.to_field] = new_fields.pop(mapping.from_field)
 
         return new_fields
+
+
+_worker_processor: Optional[DocumentProcessor] = None
+
+
+def _init_worker(config: ProcessingConfigModel, catalog: ConfiguredAirbyteCatalog) -> None:
+    """
+    Entry point of the worker processes: the text splitter is created once per worker process
+    """
+    global _worker_processor
+    _worker_processor = DocumentProcessor(config, catalog)
+
+
+def _split_records(records: Iterable[AirbyteRecordMessage]) -> List[_SplitRecord]:
+    assert _worker_processor is not None, "The worker process was not initialized"
+    split_records: List[_SplitRecord] = []
+    for record in records:
+        try:
+            chunks, id_to_delete = _worker_processor.process(record)
+        except Exception:
+            split_records.append(None)
+            continue
+        # Only the chunks are sent back as the main process already holds the record
+        split_records.append(([(chunk.page_content or "", chunk.metadata) for chunk in chunks], id_to_delete))
+    return split_records
@@ -3,9 +3,13 @@
 #
 
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional, Union, cast
+from typing import Deque, List, Optional, Sequence, Tuple, Union, cast
 
 from airbyte_cdk.destinations.vector_db_based.config import (
     AzureOpenAIEmbeddingConfigModel,
@@ -64,13 +68,55 @@ class Embedder(ABC):
 OPEN_AI_VECTOR_SIZE = 1536
 
 OPEN_AI_TOKEN_LIMIT = 150_000  # limit of tokens per minute
+OPEN_AI_MAX_CONCURRENT_REQUESTS = 4
+# OpenAI tokens are about 4 characters long for english text
+_CHARACTERS_PER_TOKEN = 4
+
+
+class _TokenRateLimiter:
+    """
+    Blocks callers until the tokens they are about to send fit in the number of tokens allowed over the last period.
+    """
+
+    def __init__(self, tokens_per_period: int, period_in_seconds: float = 60) -> None:
+        self._tokens_per_period = tokens_per_period
+        self._period_in_seconds = period_in_seconds
+        self._sent_tokens: Deque[Tuple[float, int]] = deque()
+        self._tokens_in_period = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int) -> None:
+        tokens = min(tokens, self._tokens_per_period)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._sent_tokens and self._sent_tokens[0][0] <= now - self._period_in_seconds:
+                    self._tokens_in_period -= self._sent_tokens.popleft()[1]
+                if self._tokens_in_period + tokens <= self._tokens_per_period:
+                    self._sent_tokens.append((now, tokens))
+                    self._tokens_in_period += tokens
+                    return
+                wait_time = self._sent_tokens[0][0] + self._period_in_seconds - now
+            time.sleep(wait_time)
 
 
 class BaseOpenAIEmbedder(Embedder):
-    def __init__(self, embeddings: OpenAIEmbeddings, chunk_size: int):
+    def __init__(
+        self,
+        embeddings: OpenAIEmbeddings,
+        chunk_size: int,
+        max_concurrent_requests: int = OPEN_AI_MAX_CONCURRENT_REQUESTS,
+        tokens_per_minute: Optional[int] = None,
+    ):
+        """
+        :param tokens_per_minute: If set, batches are only sent while the tokens they hold fit in this per-minute budget. Without it, requests
+            are not throttled and the retries of the OpenAI client handle rate limit errors.
+        """
         super().__init__()
         self.embeddings = embeddings
         self.chunk_size = chunk_size
+        self._rate_limiter = _TokenRateLimiter(tokens_per_minute) if tokens_per_minute else None
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent_requests, thread_name_prefix="openai_embedder")
 
     def check(self) -> Optional[str]:
         try:
@@ -83,18 +129,25 @@ class BaseOpenAIEmbedder(Embedder):
         """
         Embed the text of each chunk and return the resulting embedding vectors.
 
-        As the OpenAI API will fail if more than the per-minute limit worth of tokens is sent at once, we split the request into batches and embed each batch separately.
-        It's still possible to run into the rate limit between each embed call because the available token budget hasn't recovered between the calls,
-        but the built-in retry mechanism of the OpenAI client handles that.
+        As the OpenAI API will fail if more than the per-minute limit worth of tokens is sent at once, we split the request into batches. The batches are
+        embedded concurrently. If a tokens per minute budget is configured, a batch is only sent once the tokens it holds (estimated from its length) fit in it.
+        It's still possible to run into the rate limit between requests, but the built-in retry mechanism of the OpenAI client handles that.
         """
         # Each chunk can hold at most self.chunk_size tokens, so tokens-per-minute by maximum tokens per chunk is the number of documents that can be embedded at once without exhausting the limit in a single request
         embedding_batch_size = OPEN_AI_TOKEN_LIMIT // self.chunk_size
         batches = create_chunks(documents, batch_size=embedding_batch_size)
+        futures = [self._executor.submit(self._embed_batch, batch) for batch in batches]
         embeddings: List[Optional[List[float]]] = []
-        for batch in batches:
-            embeddings.extend(self.embeddings.embed_documents([chunk.page_content for chunk in batch]))
+        for future in futures:
+            embeddings.extend(future.result())
         return embeddings
 
+    def _embed_batch(self, batch: Sequence[Document]) -> List[Optional[List[float]]]:
+        texts = [chunk.page_content for chunk in batch]
+        if self._rate_limiter:
+            self._rate_limiter.acquire(sum(min(len(text) // _CHARACTERS_PER_TOKEN + 1, self.chunk_size) for text in texts))
+        return cast(List[Optional[List[float]]], self.embeddings.embed_documents(texts))
+
     @property
     def embedding_dimensions(self) -> int:
         # vector size produced by text-embedding-ada-002 model
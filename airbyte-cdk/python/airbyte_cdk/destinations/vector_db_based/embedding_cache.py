@@ -0,0 +1,138 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from airbyte_cdk.destinations.vector_db_based.embedder import Embedder
+from pydantic.v1 import BaseModel
+
+# SQLite limits the number of variables of a statement
+_MAX_KEYS_PER_QUERY = 500
+
+
+class EmbeddingCache(ABC):
+    """
+    Stores the embeddings of texts so that texts that did not change since a previous sync don't need to be embedded again.
+
+    The Writer looks up the embeddings of the chunks in the cache before calling the embedder and only embeds the chunks that are missing.
+    """
+
+    @abstractmethod
+    def get_embeddings(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Return the cached embedding of each text or None if it is not cached.
+        """
+        pass
+
+    @abstractmethod
+    def put_embeddings(self, texts: Sequence[str], embeddings: Sequence[List[float]]) -> None:
+        pass
+
+
+def embedding_config_key(embedding_config: BaseModel, embedder: Embedder) -> str:
+    """
+    Identify the embeddings produced by an embedder and its configuration. Secrets are left out so that rotating an API key does not
+    invalidate the cache. The model and the dimensions are included as some embedders hardcode them instead of reading them from the
+    configuration.
+    """
+    properties = embedding_config.schema().get("properties", {})
+    secret_fields = {name for name, field_schema in properties.items() if field_schema.get("airbyte_secret")}
+    key = {
+        "embedder": type(embedder).__name__,
+        "model": getattr(getattr(embedder, "embeddings", None), "model", None),
+        "dimensions": embedder.embedding_dimensions,
+        "config": embedding_config.dict(exclude=secret_fields),
+    }
+    return json.dumps(key, sort_keys=True, default=str)
+
+
+class SqliteEmbeddingCache(EmbeddingCache):
+    """
+    EmbeddingCache persisted in a SQLite database.
+
+    Embeddings are keyed by a hash of the text, of the embedder and of its configuration so that changing the model or its settings does
+    not return stale embeddings. Once the embeddings stored take more than `max_size_bytes`, the least recently used ones are evicted.
+
+    Embedders that do not compute the embedding from the text (like the from_field embedder) can't be cached.
+    """
+
+    def __init__(self, path: str, embedding_config: BaseModel, embedder: Embedder, max_size_bytes: int = 1024 * 1024 * 1024) -> None:
+        if getattr(embedding_config, "mode", None) == "from_field":
+            raise ValueError("Embeddings read from a field of the records can't be cached as they don't depend on the text")
+        self._config_key = embedding_config_key(embedding_config, embedder).encode("utf-8")
+        self._max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        # The writer can embed batches from many threads
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, embedding BLOB NOT NULL, last_used REAL NOT NULL) WITHOUT ROWID"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        self._connection.commit()
+        self._size_bytes = self._connection.execute("SELECT COALESCE(SUM(LENGTH(embedding)), 0) FROM embeddings").fetchone()[0]
+
+    def get_embeddings(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        keys = [self._key(text) for text in texts]
+        found: Dict[bytes, List[float]] = {}
+        with self._lock:
+            for start in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                keys_to_query = list(set(keys[start : start + _MAX_KEYS_PER_QUERY]))
+                rows = self._connection.execute(
+                    f"SELECT key, embedding FROM embeddings WHERE key IN ({','.join('?' * len(keys_to_query))})", keys_to_query
+                )
+                found.update((key, array("d", embedding).tolist()) for key, embedding in rows)
+            if found:
+                now = time.time()
+                self._connection.executemany("UPDATE embeddings SET last_used = ? WHERE key = ?", [(now, key) for key in found])
+                self._connection.commit()
+        return [found.get(key) for key in keys]
+
+    def put_embeddings(self, texts: Sequence[str], embeddings: Sequence[List[float]]) -> None:
+        now = time.time()
+        rows = {self._key(text): array("d", embedding).tobytes() for text, embedding in zip(texts, embeddings)}
+        with self._lock:
+            for start in range(0, len(rows), _MAX_KEYS_PER_QUERY):
+                keys = list(rows.keys())[start : start + _MAX_KEYS_PER_QUERY]
+                existing = self._connection.execute(
+                    f"SELECT COALESCE(SUM(LENGTH(embedding)), 0) FROM embeddings WHERE key IN ({','.join('?' * len(keys))})", keys
+                ).fetchone()[0]
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, embedding, last_used) VALUES (?, ?, ?)",
+                    [(key, rows[key], now) for key in keys],
+                )
+                self._size_bytes += sum(len(rows[key]) for key in keys) - existing
+            if self._size_bytes > self._max_size_bytes:
+                self._evict()
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently used embeddings until the cache is back to 90% of its maximum size to avoid evicting on every write.
+        """
+        target_size_bytes = int(self._max_size_bytes * 0.9)
+        keys_to_evict = []
+        size_bytes = self._size_bytes
+        cursor = self._connection.execute("SELECT key, LENGTH(embedding) FROM embeddings ORDER BY last_used")
+        for key, length in cursor:
+            if size_bytes <= target_size_bytes:
+                break
+            keys_to_evict.append((key,))
+            size_bytes -= length
+        cursor.close()
+        self._connection.executemany("DELETE FROM embeddings WHERE key = ?", keys_to_evict)
+        self._size_bytes = size_bytes
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256(self._config_key + b"\0" + text.encode("utf-8")).digest()
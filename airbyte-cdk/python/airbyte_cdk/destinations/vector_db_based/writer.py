@@ -2,13 +2,16 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-
+import threading
 from collections import defaultdict
-from typing import Dict, Iterable, List, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Empty, Full, Queue
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from airbyte_cdk.destinations.vector_db_based.config import ProcessingConfigModel
 from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk, DocumentProcessor
 from airbyte_cdk.destinations.vector_db_based.embedder import Document, Embedder
+from airbyte_cdk.destinations.vector_db_based.embedding_cache import EmbeddingCache
 from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
 from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
 
@@ -24,16 +27,27 @@ class Writer:
     The destination connector is responsible to create a writer instance and pass the input messages iterable to the write method.
     The batch size can be configured by the destination connector to give the freedom of either letting the user configure it or hardcoding it to a sensible value depending on the destination.
     The omit_raw_text parameter can be used to omit the raw text from the chunks. This can be useful if the raw text is very large and not needed for the destination.
+    The embedding_cache parameter can be used to reuse the embeddings of chunks whose text was already embedded, for example by a previous sync.
+    The max_processing_workers parameter can be used to split the text of records in parallel in worker processes. Records are then buffered to be processed in batches.
     """
 
     def __init__(
-        self, processing_config: ProcessingConfigModel, indexer: Indexer, embedder: Embedder, batch_size: int, omit_raw_text: bool
+        self,
+        processing_config: ProcessingConfigModel,
+        indexer: Indexer,
+        embedder: Embedder,
+        batch_size: int,
+        omit_raw_text: bool,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        max_processing_workers: int = 0,
     ) -> None:
         self.processing_config = processing_config
         self.indexer = indexer
         self.embedder = embedder
         self.batch_size = batch_size
         self.omit_raw_text = omit_raw_text
+        self.embedding_cache = embedding_cache
+        self.max_processing_workers = max_processing_workers
         self._init_batch()
 
     def _init_batch(self) -> None:
@@ -49,12 +63,30 @@ class Writer:
             raise ValueError("Cannot embed a chunk without page content")
         return Document(page_content=chunk.page_content, record=chunk.record)
 
+    def _embed_documents(self, documents: List[Document]) -> List[Optional[List[float]]]:
+        """
+        Embed the documents, only calling the embedder for the documents whose embedding is not in the embedding cache.
+        """
+        if self.embedding_cache is None:
+            return self.embedder.embed_documents(documents)
+
+        texts = [document.page_content for document in documents]
+        embeddings = self.embedding_cache.get_embeddings(texts)
+        missing_indexes = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing_indexes:
+            missing_embeddings = self.embedder.embed_documents([documents[i] for i in missing_indexes])
+            for i, embedding in zip(missing_indexes, missing_embeddings):
+                embeddings[i] = embedding
+            embedded_indexes = [i for i in missing_indexes if embeddings[i] is not None]
+            self.embedding_cache.put_embeddings([texts[i] for i in embedded_indexes], [embeddings[i] for i in embedded_indexes])  # type: ignore  # None embeddings are filtered out
+        return embeddings
+
     def _process_batch(self) -> None:
         for (namespace, stream), ids in self.ids_to_delete.items():
             self.indexer.delete(ids, namespace, stream)
 
         for (namespace, stream), chunks in self.chunks.items():
-            embeddings = self.embedder.embed_documents([self._convert_to_document(chunk) for chunk in chunks])
+            embeddings = self._embed_documents([self._convert_to_document(chunk) for chunk in chunks])
             for i, document in enumerate(chunks):
                 document.embedding = embeddings[i]
                 if self.omit_raw_text:
@@ -63,23 +95,183 @@ class Writer:
 
         self._init_batch()
 
+    def _process_messages(self, input_messages: Iterable[AirbyteMessage]) -> Iterable[Tuple[AirbyteMessage, List[Chunk], Optional[str]]]:
+        """
+        Yield each input message along with the chunks and the record id to delete of records.
+
+        If processing workers are configured, records are buffered and processed in parallel. Other messages are yielded after the records
+        that came before them.
+        """
+        if self.max_processing_workers <= 0:
+            for message in input_messages:
+                if message.type == Type.RECORD:
+                    record_chunks, record_id_to_delete = self.processor.process(message.record)
+                    yield message, record_chunks, record_id_to_delete
+                else:
+                    yield message, [], None
+            return
+
+        max_buffered_records = self.max_processing_workers * self.processor.records_per_worker_batch
+        buffered_records: List[AirbyteMessage] = []
+        for message in input_messages:
+            if message.type == Type.RECORD:
+                buffered_records.append(message)
+                if len(buffered_records) < max_buffered_records:
+                    continue
+            yield from self._process_buffered_records(buffered_records)
+            buffered_records = []
+            if message.type != Type.RECORD:
+                yield message, [], None
+        yield from self._process_buffered_records(buffered_records)
+
+    def _process_buffered_records(self, records: List[AirbyteMessage]) -> Iterable[Tuple[AirbyteMessage, List[Chunk], Optional[str]]]:
+        processed_records = self.processor.process_records([message.record for message in records])
+        for message, (record_chunks, record_id_to_delete) in zip(records, processed_records):
+            yield message, record_chunks, record_id_to_delete
+
     def write(self, configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]) -> Iterable[AirbyteMessage]:
-        self.processor = DocumentProcessor(self.processing_config, configured_catalog)
+        self.processor = DocumentProcessor(self.processing_config, configured_catalog, max_workers=self.max_processing_workers)
         self.indexer.pre_sync(configured_catalog)
-        for message in input_messages:
-            if message.type == Type.STATE:
-                # Emitting a state message indicates that all records which came before it have been written to the destination. So we flush
-                # the queue to ensure writes happen, then output the state message to indicate it's safe to checkpoint state
-                self._process_batch()
-                yield message
-            elif message.type == Type.RECORD:
-                record_chunks, record_id_to_delete = self.processor.process(message.record)
-                self.chunks[(message.record.namespace, message.record.stream)].extend(record_chunks)
-                if record_id_to_delete is not None:
-                    self.ids_to_delete[(message.record.namespace, message.record.stream)].append(record_id_to_delete)
-                self.number_of_chunks += len(record_chunks)
-                if self.number_of_chunks >= self.batch_size:
+        try:
+            for message, record_chunks, record_id_to_delete in self._process_messages(input_messages):
+                if message.type == Type.STATE:
+                    # Emitting a state message indicates that all records which came before it have been written to the destination. So we flush
+                    # the queue to ensure writes happen, then output the state message to indicate it's safe to checkpoint state
                     self._process_batch()
+                    yield message
+                elif message.type == Type.RECORD:
+                    self.chunks[(message.record.namespace, message.record.stream)].extend(record_chunks)
+                    if record_id_to_delete is not None:
+                        self.ids_to_delete[(message.record.namespace, message.record.stream)].append(record_id_to_delete)
+                    self.number_of_chunks += len(record_chunks)
+                    if self.number_of_chunks >= self.batch_size:
+                        self._process_batch()
+        finally:
+            self.processor.close()
 
         self._process_batch()
         yield from self.indexer.post_sync()
+
+
+_StreamKey = Tuple[Optional[str], str]
+# A batch whose chunks are being embedded along with the ids of the records to delete before indexing them
+_PendingBatch = Tuple["Future[Dict[_StreamKey, List[Chunk]]]", Dict[_StreamKey, List[str]]]
+_END_OF_BATCHES = None
+
+
+class PipelinedWriter(Writer):
+    """
+    Writer running the document processing, the embedding and the indexing as concurrent stages:
+    * Records are passed through the document processor on the thread consuming the input messages
+    * Full batches are embedded on a thread pool so that the next batches can be processed while waiting on the embedding service
+    * Embedded batches are indexed in order by a dedicated thread: old chunks of a batch are deleted before its new chunks are indexed
+
+    At most `max_pending_batches` batches are being embedded or waiting to be indexed. Once this limit is reached, the consumption of
+    input messages waits for the indexing to catch up. State messages go through the same queue as the batches and are emitted once all
+    the records that came before them have been indexed.
+    """
+
+    def __init__(
+        self,
+        processing_config: ProcessingConfigModel,
+        indexer: Indexer,
+        embedder: Embedder,
+        batch_size: int,
+        omit_raw_text: bool,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        max_processing_workers: int = 0,
+        max_concurrent_embeddings: int = 2,
+        max_pending_batches: int = 4,
+    ) -> None:
+        super().__init__(processing_config, indexer, embedder, batch_size, omit_raw_text, embedding_cache, max_processing_workers)
+        self.max_concurrent_embeddings = max_concurrent_embeddings
+        self.max_pending_batches = max_pending_batches
+
+    def write(self, configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]) -> Iterable[AirbyteMessage]:
+        self.processor = DocumentProcessor(self.processing_config, configured_catalog, max_workers=self.max_processing_workers)
+        self.indexer.pre_sync(configured_catalog)
+        self._pending_batches: "Queue[Union[_PendingBatch, AirbyteMessage, None]]" = Queue(maxsize=self.max_pending_batches)
+        self._indexed_states: "Queue[AirbyteMessage]" = Queue()
+        self._indexing_error: Optional[BaseException] = None
+
+        indexing_thread = threading.Thread(target=self._index_batches, name="vector_db_indexer", daemon=True)
+        indexing_thread.start()
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_embeddings, thread_name_prefix="vector_db_embedder") as embedding_pool:
+            try:
+                for message, record_chunks, record_id_to_delete in self._process_messages(input_messages):
+                    if message.type == Type.STATE:
+                        self._submit_batch(embedding_pool)
+                        self._put_pending(message)
+                    elif message.type == Type.RECORD:
+                        self.chunks[(message.record.namespace, message.record.stream)].extend(record_chunks)
+                        if record_id_to_delete is not None:
+                            self.ids_to_delete[(message.record.namespace, message.record.stream)].append(record_id_to_delete)
+                        self.number_of_chunks += len(record_chunks)
+                        if self.number_of_chunks >= self.batch_size:
+                            self._submit_batch(embedding_pool)
+                    yield from self._get_indexed_states()
+                self._submit_batch(embedding_pool)
+            finally:
+                self.processor.close()
+                self._put_pending(_END_OF_BATCHES, check_indexing_error=False)
+                indexing_thread.join()
+        self._raise_indexing_error()
+        yield from self._get_indexed_states()
+        yield from self.indexer.post_sync()
+
+    def _submit_batch(self, embedding_pool: ThreadPoolExecutor) -> None:
+        if self.chunks or self.ids_to_delete:
+            self._put_pending((embedding_pool.submit(self._embed_chunks, self.chunks), self.ids_to_delete))
+        self._init_batch()
+
+    def _embed_chunks(self, chunks: Dict[_StreamKey, List[Chunk]]) -> Dict[_StreamKey, List[Chunk]]:
+        for stream_chunks in chunks.values():
+            embeddings = self._embed_documents([self._convert_to_document(chunk) for chunk in stream_chunks])
+            for i, document in enumerate(stream_chunks):
+                document.embedding = embeddings[i]
+                if self.omit_raw_text:
+                    document.page_content = None
+        return chunks
+
+    def _index_batches(self) -> None:
+        while True:
+            pending = self._pending_batches.get()
+            if pending is _END_OF_BATCHES:
+                return
+            if self._indexing_error:
+                # Keep consuming so that the thread producing the batches is not blocked
+                continue
+            try:
+                if isinstance(pending, AirbyteMessage):
+                    self._indexed_states.put(pending)
+                    continue
+                embedded_chunks, ids_to_delete = pending
+                # Old chunks are deleted while the new ones are being embedded
+                for (namespace, stream), ids in ids_to_delete.items():
+                    self.indexer.delete(ids, namespace, stream)
+                for (namespace, stream), chunks in embedded_chunks.result().items():
+                    self.indexer.index(chunks, namespace, stream)
+            except BaseException as exception:
+                self._indexing_error = exception
+
+    def _put_pending(self, pending: Union[_PendingBatch, AirbyteMessage, None], check_indexing_error: bool = True) -> None:
+        while True:
+            if check_indexing_error:
+                self._raise_indexing_error()
+            try:
+                self._pending_batches.put(pending, timeout=0.1)
+                return
+            except Full:
+                continue
+
+    def _get_indexed_states(self) -> Iterable[AirbyteMessage]:
+        self._raise_indexing_error()
+        while True:
+            try:
+                yield self._indexed_states.get_nowait()
+            except Empty:
+                return
+
+    def _raise_indexing_error(self) -> None:
+        if self._indexing_error:
+            raise self._indexing_error
@@ -10,9 +10,10 @@ import os.path
 import socket
 import sys
 import tempfile
+import time
 from collections import defaultdict
-from functools import wraps
-from typing import Any, DefaultDict, Iterable, List, Mapping, MutableMapping, Optional, Union
+from functools import lru_cache, wraps
+from typing import Any, DefaultDict, Iterable, List, Mapping, MutableMapping, Optional, TextIO, Union
 from urllib.parse import urlparse
 
 import requests
@@ -28,6 +29,7 @@ from airbyte_cdk.utils import is_cloud_environment, message_utils
 from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets, update_secrets
 from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
+from pydantic_core import PydanticSerializationError, to_json
 from requests import PreparedRequest, Response, Session
 
 logger = init_logger("airbyte")
@@ -35,6 +37,11 @@ logger = init_logger("airbyte")
 VALID_URL_SCHEMES = ["https"]
 CLOUD_DEPLOYMENT_MODE = "cloud"
 
+_RECORD_MESSAGE_PREFIX = b'{"type":"RECORD"'
+_RECORD_MESSAGE_FIELDS = {"type", "record"}
+_REQUIRED_RECORD_FIELDS = {"stream", "data", "emitted_at"}
+_OPTIONAL_RECORD_FIELDS = {"namespace"}
+
 
 class AirbyteEntrypoint(object):
     def __init__(self, source: Source):
@@ -83,6 +90,9 @@ class AirbyteEntrypoint(object):
         return main_parser.parse_args(args)
 
     def run(self, parsed_args: argparse.Namespace) -> Iterable[str]:
+        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self._run_messages(parsed_args))
+
+    def _run_messages(self, parsed_args: argparse.Namespace) -> Iterable[AirbyteMessage]:
         cmd = parsed_args.command
         if not cmd:
             raise Exception("No command passed")
@@ -100,30 +110,26 @@ class AirbyteEntrypoint(object):
                 os.environ[ENV_REQUEST_CACHE_PATH] = temp_dir  # set this as default directory for request_cache to store *.sqlite files
                 if cmd == "spec":
                     message = AirbyteMessage(type=Type.SPEC, spec=source_spec)
-                    yield from [
-                        self.airbyte_message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)
-                    ]
-                    yield self.airbyte_message_to_string(message)
+                    yield from self._emit_queued_messages(self.source)
+                    yield message
                 else:
                     raw_config = self.source.read_config(parsed_args.config)
                     config = self.source.configure(raw_config, temp_dir)
 
-                    yield from [
-                        self.airbyte_message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)
-                    ]
+                    yield from self._emit_queued_messages(self.source)
                     if cmd == "check":
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.check(source_spec, config))
+                        yield from self.check(source_spec, config)
                     elif cmd == "discover":
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.discover(source_spec, config))
+                        yield from self.discover(source_spec, config)
                     elif cmd == "read":
                         config_catalog = self.source.read_catalog(parsed_args.catalog)
                         state = self.source.read_state(parsed_args.state)
 
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.read(source_spec, config, config_catalog, state))
+                        yield from self.read(source_spec, config, config_catalog, state)
                     else:
                         raise Exception("Unexpected command " + cmd)
         finally:
-            yield from [self.airbyte_message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)]
+            yield from self._emit_queued_messages(self.source)
 
     def check(self, source_spec: ConnectorSpecification, config: TConfig) -> Iterable[AirbyteMessage]:
         self.set_up_secret_filter(config, source_spec.connectionSpecification)
@@ -200,8 +206,18 @@ class AirbyteEntrypoint(object):
 
     @staticmethod
     def airbyte_message_to_string(airbyte_message: AirbyteMessage) -> Any:
+        serialized_record = _serialize_record_message(airbyte_message)
+        if serialized_record is not None:
+            return serialized_record.decode()
         return airbyte_message.model_dump_json(exclude_unset=True)
 
+    @staticmethod
+    def airbyte_message_to_bytes(airbyte_message: AirbyteMessage) -> bytes:
+        serialized_record = _serialize_record_message(airbyte_message)
+        if serialized_record is not None:
+            return serialized_record
+        return airbyte_message.model_dump_json(exclude_unset=True).encode()
+
     @classmethod
     def extract_state(cls, args: List[str]) -> Optional[Any]:
         parsed_args = cls.parse_args(args)
@@ -229,13 +245,100 @@ class AirbyteEntrypoint(object):
         return
 
 
+def _serialize_record_message(airbyte_message: AirbyteMessage) -> Optional[bytes]:
+    """
+    Serializes RECORD messages the same way `model_dump_json(exclude_unset=True)` does, without going through the pydantic model
+    serializer: the envelope is a precomputed prefix per stream and only the record data is encoded.
+
+    :return: None if the message is not a RECORD or has fields this fast path doesn't handle (e.g. meta, extra fields)
+    """
+    record = airbyte_message.record
+    if airbyte_message.type != Type.RECORD or record is None:
+        return None
+    if airbyte_message.model_fields_set != _RECORD_MESSAGE_FIELDS or airbyte_message.model_extra or record.model_extra:
+        return None
+    record_fields = record.model_fields_set
+    if not _REQUIRED_RECORD_FIELDS.issubset(record_fields) or not record_fields.issubset(_REQUIRED_RECORD_FIELDS | _OPTIONAL_RECORD_FIELDS):
+        return None
+    has_namespace = "namespace" in record_fields
+    if (
+        type(record.data) is not dict
+        or type(record.emitted_at) is not int
+        or type(record.stream) is not str
+        or (record.namespace is not None and type(record.namespace) is not str)
+    ):
+        return None
+
+    try:
+        # Same options as the pydantic models serialization
+        data = to_json(record.data, inf_nan_mode="null")
+    except PydanticSerializationError:
+        return None
+    return b"".join(
+        (_record_message_prefix(record.stream, record.namespace, has_namespace), data, b',"emitted_at":', b"%d}}" % record.emitted_at)
+    )
+
+
+@lru_cache(maxsize=1024)
+def _record_message_prefix(stream: str, namespace: Optional[str], has_namespace: bool) -> bytes:
+    namespace_field = b'"namespace":' + to_json(namespace) + b"," if has_namespace else b""
+    return b'{"type":"RECORD","record":{' + namespace_field + b'"stream":' + to_json(stream) + b',"data":'
+
+
+class _MessageWriter:
+    """
+    Writes messages serialized as UTF-8 to stdout, one per line. RECORD messages are buffered and written in batches. Any other message
+    (e.g. STATE, TRACE) flushes the buffer along with itself so they are never delayed and are always emitted after the records preceding
+    them.
+    """
+
+    MAX_BUFFERED_BYTES = 64 * 1024
+    MAX_BUFFERING_SECONDS = 1.0
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+        self._buffer: List[bytes] = []
+        self._buffered_bytes = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, message: bytes) -> None:
+        # Each message is written along with its line break in one write so lines are never interleaved with output from other threads
+        line = message + b"\n"
+        self._buffer.append(line)
+        self._buffered_bytes += len(line)
+        if (
+            not message.startswith(_RECORD_MESSAGE_PREFIX)
+            or self._buffered_bytes >= self.MAX_BUFFERED_BYTES
+            or time.monotonic() - self._last_flush >= self.MAX_BUFFERING_SECONDS
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            output = b"".join(self._buffer)
+            self._buffer = []
+            self._buffered_bytes = 0
+            binary_stream = getattr(self._stream, "buffer", None)
+            if binary_stream is not None:
+                # Text written directly to stdout (e.g. by print) needs to go out first to preserve ordering
+                self._stream.flush()
+                binary_stream.write(output)
+                binary_stream.flush()
+            else:
+                self._stream.write(output.decode())
+                self._stream.flush()
+        self._last_flush = time.monotonic()
+
+
 def launch(source: Source, args: List[str]) -> None:
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    for message in source_entrypoint.run(parsed_args):
-        # simply printing is creating issues for concurrent CDK as Python uses different two instructions to print: one for the message and
-        # the other for the break line. Adding `\n` to the message ensure that both are printed at the same time
-        print(f"{message}\n", end="", flush=True)
+    writer = _MessageWriter(sys.stdout)
+    try:
+        for message in source_entrypoint._run_messages(parsed_args):
+            writer.write(AirbyteEntrypoint.airbyte_message_to_bytes(message))
+    finally:
+        writer.flush()
 
 
 def _init_internal_request_filter() -> None:
@@ -126,6 +126,19 @@ class ConcurrentReadProcessor:
         4. Emit the message
         5. Emit messages that were added to the message repository
         """
+        yield from self._record_to_messages(record)
+        yield from self._message_repository.consume_queue()
+
+    def on_record_batch(self, records: List[Record]) -> Iterable[AirbyteMessage]:
+        """
+        This method is called when a batch of records is read from a partition. Records are handled the same way as in `on_record` except
+        that the messages added to the message repository are emitted once for the whole batch.
+        """
+        for record in records:
+            yield from self._record_to_messages(record)
+        yield from self._message_repository.consume_queue()
+
+    def _record_to_messages(self, record: Record) -> Iterable[AirbyteMessage]:
         # Do not pass a transformer or a schema
         # AbstractStreams are expected to return data as they are expected.
         # Any transformation on the data should be done before reaching this point
@@ -138,7 +151,6 @@ class ConcurrentReadProcessor:
                 yield stream_status_as_airbyte_message(stream.as_airbyte_stream(), AirbyteStreamStatus.RUNNING)
             self._record_counter[stream.name] += 1
         yield message
-        yield from self._message_repository.consume_queue()
 
     def on_exception(self, exception: StreamThreadException) -> Iterable[AirbyteMessage]:
         """
@@ -3,6 +3,7 @@
 #
 import concurrent
 import logging
+import multiprocessing
 from queue import Queue
 from typing import Iterable, Iterator, List
 
@@ -18,6 +19,7 @@ from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionRea
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
 from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
+from airbyte_cdk.sources.streams.concurrent.process_pool_partition_reader import ProcessPoolPartitionReader
 from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger, SliceLogger
 
 
@@ -30,6 +32,7 @@ class ConcurrentSource:
     """
 
     DEFAULT_TIMEOUT_SECONDS = 900
+    DEFAULT_RECORD_BATCH_MAX_LATENCY_SECONDS = 1.0
 
     @staticmethod
     def create(
@@ -39,16 +42,38 @@ class ConcurrentSource:
         slice_logger: SliceLogger,
         message_repository: MessageRepository,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        record_batch_size: int = 1,
+        record_batch_max_latency_seconds: float = DEFAULT_RECORD_BATCH_MAX_LATENCY_SECONDS,
+        num_partition_processes: int = 0,
     ) -> "ConcurrentSource":
+        """
+        :param num_partition_processes: If greater than 0, partitions are read in a pool of this number of processes instead of in the
+          threads of the worker pool. This allows CPU-bound streams to use more than one core. Processes are started using the "spawn"
+          method as forking a process running threads is unsafe. As each partition read in a process is awaited by a thread of the worker
+          pool, num_workers should be greater than num_partition_processes.
+        """
         is_single_threaded = initial_number_of_partitions_to_generate == 1 and num_workers == 1
         too_many_generator = not is_single_threaded and initial_number_of_partitions_to_generate >= num_workers
         assert not too_many_generator, "It is required to have more workers than threads generating partitions"
+        process_pool = (
+            concurrent.futures.ProcessPoolExecutor(max_workers=num_partition_processes, mp_context=multiprocessing.get_context("spawn"))
+            if num_partition_processes > 0
+            else None
+        )
         threadpool = ThreadPoolManager(
             concurrent.futures.ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="workerpool"),
             logger,
+            process_pool=process_pool,
         )
         return ConcurrentSource(
-            threadpool, logger, slice_logger, message_repository, initial_number_of_partitions_to_generate, timeout_seconds
+            threadpool,
+            logger,
+            slice_logger,
+            message_repository,
+            initial_number_of_partitions_to_generate,
+            timeout_seconds,
+            record_batch_size,
+            record_batch_max_latency_seconds,
         )
 
     def __init__(
@@ -59,6 +84,8 @@ class ConcurrentSource:
         message_repository: MessageRepository = InMemoryMessageRepository(),
         initial_number_partitions_to_generate: int = 1,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        record_batch_size: int = 1,
+        record_batch_max_latency_seconds: float = DEFAULT_RECORD_BATCH_MAX_LATENCY_SECONDS,
     ) -> None:
         """
         :param threadpool: The threadpool to submit tasks to
@@ -67,6 +94,8 @@ class ConcurrentSource:
         :param message_repository: The repository to emit messages to
         :param initial_number_partitions_to_generate: The initial number of concurrent partition generation tasks. Limiting this number ensures will limit the latency of the first records emitted. While the latency is not critical, emitting the records early allows the platform and the destination to process them as early as possible.
         :param timeout_seconds: The maximum number of seconds to wait for a record to be read from the queue. If no record is read within this time, the source will stop reading and return.
+        :param record_batch_size: The maximum number of records partition readers put in the queue as one item. Batching records reduces the contention on the queue and the per-item overhead of the main thread when many workers produce small records. If 1, records are put in the queue individually.
+        :param record_batch_max_latency_seconds: The maximum time a record is held by a partition reader before its batch is put in the queue. Only applies if record_batch_size is greater than 1.
         """
         self._threadpool = threadpool
         self._logger = logger
@@ -74,6 +103,8 @@ class ConcurrentSource:
         self._message_repository = message_repository
         self._initial_number_partitions_to_generate = initial_number_partitions_to_generate
         self._timeout_seconds = timeout_seconds
+        self._record_batch_size = record_batch_size
+        self._record_batch_max_latency_seconds = record_batch_max_latency_seconds
 
     def read(
         self,
@@ -93,7 +124,7 @@ class ConcurrentSource:
             self._logger,
             self._slice_logger,
             self._message_repository,
-            PartitionReader(queue),
+            self._create_partition_reader(queue),
         )
 
         # Enqueue initial partition generation tasks
@@ -107,6 +138,18 @@ class ConcurrentSource:
         self._threadpool.check_for_errors_and_shutdown()
         self._logger.info("Finished syncing")
 
+    def _create_partition_reader(self, queue: Queue[QueueItem]) -> PartitionReader:
+        if self._threadpool.has_process_pool:
+            # Sending records from other processes one by one would be too costly so they are always batched
+            return ProcessPoolPartitionReader(
+                queue,
+                self._threadpool,
+                self._logger,
+                self._record_batch_size if self._record_batch_size > 1 else ProcessPoolPartitionReader.DEFAULT_RECORD_BATCH_SIZE,
+                self._record_batch_max_latency_seconds,
+            )
+        return PartitionReader(queue, self._record_batch_size, self._record_batch_max_latency_seconds)
+
     def _submit_initial_partition_generators(self, concurrent_stream_processor: ConcurrentReadProcessor) -> Iterable[AirbyteMessage]:
         for _ in range(self._initial_number_partitions_to_generate):
             status_message = concurrent_stream_processor.start_next_partition_generator()
@@ -143,5 +186,7 @@ class ConcurrentSource:
             yield from concurrent_stream_processor.on_partition_complete_sentinel(queue_item)
         elif isinstance(queue_item, Record):
             yield from concurrent_stream_processor.on_record(queue_item)
+        elif isinstance(queue_item, list):
+            yield from concurrent_stream_processor.on_record_batch(queue_item)
         else:
             raise ValueError(f"Unknown queue item type: {type(queue_item)}")
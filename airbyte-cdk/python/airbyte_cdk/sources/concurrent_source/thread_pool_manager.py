@@ -3,13 +3,16 @@
 #
 import logging
 import threading
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from typing import Any, Callable, List, Optional
 
 
 class ThreadPoolManager:
     """
     Wrapper to abstract away the threadpool and the logic to wait for pending tasks to be completed.
+
+    Optionally, a process pool can be provided so that CPU-bound work can be offloaded to other processes. Tasks submitted to the process
+    pool are not tracked: they are expected to be submitted and awaited by a task of the threadpool.
     """
 
     DEFAULT_MAX_QUEUE_SIZE = 10_000
@@ -19,13 +22,16 @@ class ThreadPoolManager:
         threadpool: ThreadPoolExecutor,
         logger: logging.Logger,
         max_concurrent_tasks: int = DEFAULT_MAX_QUEUE_SIZE,
+        process_pool: Optional[Executor] = None,
     ):
         """
         :param threadpool: The threadpool to use
         :param logger: The logger to use
         :param max_concurrent_tasks: The maximum number of tasks that can be pending at the same time
+        :param process_pool: The process pool to offload CPU-bound work to, if any
         """
         self._threadpool = threadpool
+        self._process_pool = process_pool
         self._logger = logger
         self._max_concurrent_tasks = max_concurrent_tasks
         self._futures: List[Future[Any]] = []
@@ -43,6 +49,18 @@ class ThreadPoolManager:
     def submit(self, function: Callable[..., Any], *args: Any) -> None:
         self._futures.append(self._threadpool.submit(function, *args))
 
+    @property
+    def has_process_pool(self) -> bool:
+        return self._process_pool is not None
+
+    def submit_to_process_pool(self, function: Callable[..., Any], *args: Any) -> Future[Any]:
+        """
+        Submit a task to the process pool. The function and the arguments need to be picklable.
+        """
+        if self._process_pool is None:
+            raise ValueError("No process pool was provided to the ThreadPoolManager")
+        return self._process_pool.submit(function, *args)
+
     def _prune_futures(self, futures: List[Future[Any]]) -> None:
         """
         Take a list in input and remove the futures that are completed. If a future has an exception, it'll raise and kill the stream
@@ -75,6 +93,8 @@ class ThreadPoolManager:
         # Without a way to stop the threads that have already started, this will not stop the Python application. We are fine today with
         # this imperfect approach because we only do this in case of `self._most_recently_seen_exception` which we don't expect to happen
         self._threadpool.shutdown(wait=False, cancel_futures=True)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
 
     def is_done(self) -> bool:
         return all([f.done() for f in self._futures])
@@ -0,0 +1,49 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import time
+from datetime import timedelta
+from typing import Optional
+
+from airbyte_cdk.sources.declarative.async_job.status import AsyncJobStatus
+from airbyte_cdk.sources.types import StreamSlice
+
+
+class AsyncJob:
+    """
+    Description of an API job that is responsible for generating the records of a slice.
+
+    The status of a job is updated by the job repository. A job that is still running once its timeout is reached is considered as timed
+    out.
+    """
+
+    def __init__(self, api_job_id: str, job_parameters: StreamSlice, timeout: Optional[timedelta] = None) -> None:
+        self._api_job_id = api_job_id
+        self._job_parameters = job_parameters
+        self._status = AsyncJobStatus.RUNNING
+        self._timeout = timeout
+        self._started_at = time.monotonic()
+
+    def api_job_id(self) -> str:
+        return self._api_job_id
+
+    def job_parameters(self) -> StreamSlice:
+        return self._job_parameters
+
+    def status(self) -> AsyncJobStatus:
+        if self._status == AsyncJobStatus.RUNNING and self._has_reached_timeout():
+            return AsyncJobStatus.TIMED_OUT
+        return self._status
+
+    def update_status(self, status: AsyncJobStatus) -> None:
+        if self._status.is_terminal():
+            # A job can't go back from a terminal status
+            return
+        self._status = status
+
+    def _has_reached_timeout(self) -> bool:
+        return self._timeout is not None and time.monotonic() - self._started_at > self._timeout.total_seconds()
+
+    def __repr__(self) -> str:
+        return f"AsyncJob(api_job_id={self._api_job_id}, job_parameters={self._job_parameters}, status={self._status})"
@@ -0,0 +1,142 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import time
+from typing import Callable, Dict, Iterable, Iterator, List
+
+import requests
+from airbyte_cdk.models import FailureType
+from airbyte_cdk.sources.declarative.async_job.job import AsyncJob
+from airbyte_cdk.sources.declarative.async_job.repository import AsyncJobRepository
+from airbyte_cdk.sources.declarative.async_job.status import AsyncJobStatus
+from airbyte_cdk.sources.types import StreamSlice
+from airbyte_cdk.utils.traced_exception import AirbyteTracedException
+
+LOGGER = logging.getLogger("airbyte")
+
+
+class AsyncJobOrchestrator:
+    """
+    Creates a job for each slice and yields the jobs as they complete.
+
+    At most `max_concurrent_jobs` jobs are running at the same time: a job is created for the next slice as soon as a running job reaches a
+    terminal status. The status of all the running jobs is updated in a single polling loop. Between two polls, the orchestrator waits for
+    a delay that starts at `initial_polling_delay_in_seconds` and doubles every time a poll completes no job, up to
+    `max_polling_delay_in_seconds`. The delay is reset every time a job completes.
+
+    A job that fails or times out is created again for the same slice until `max_job_attempts` attempts were made for this slice, after
+    which the sync fails. Jobs that are still running when the orchestrator stops are aborted.
+    """
+
+    def __init__(
+        self,
+        job_repository: AsyncJobRepository,
+        slices: Iterable[StreamSlice],
+        max_concurrent_jobs: int = 3,
+        max_job_attempts: int = 3,
+        initial_polling_delay_in_seconds: float = 1,
+        max_polling_delay_in_seconds: float = 60,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if max_concurrent_jobs < 1:
+            raise ValueError(f"max_concurrent_jobs should be at least 1. Got {max_concurrent_jobs}")
+        self._job_repository = job_repository
+        self._slices = iter(slices)
+        self._max_concurrent_jobs = max_concurrent_jobs
+        self._max_job_attempts = max_job_attempts
+        self._initial_polling_delay_in_seconds = initial_polling_delay_in_seconds
+        self._max_polling_delay_in_seconds = max_polling_delay_in_seconds
+        self._sleep = sleep
+
+        self._running_jobs: List[AsyncJob] = []
+        self._attempts_per_job: Dict[str, int] = {}
+
+    def create_and_get_completed_jobs(self) -> Iterator[AsyncJob]:
+        """
+        Yield the jobs as they complete, which is not necessarily the order of the slices. The results of a job should be fetched using
+        `fetch_results` before consuming the next job as jobs are only created for the following slices while the generator is consumed.
+        """
+        polling_delay = self._initial_polling_delay_in_seconds
+        has_more_slices = True
+        try:
+            while True:
+                while has_more_slices and len(self._running_jobs) < self._max_concurrent_jobs:
+                    next_slice = next(self._slices, None)
+                    if next_slice is None:
+                        has_more_slices = False
+                    else:
+                        self._start_job(next_slice, attempt=1)
+                if not self._running_jobs:
+                    return
+
+                self._job_repository.update_jobs_status(self._running_jobs)
+                completed_jobs = self._process_terminal_jobs()
+                if completed_jobs:
+                    polling_delay = self._initial_polling_delay_in_seconds
+                    yield from completed_jobs
+                elif self._running_jobs:
+                    self._sleep(polling_delay)
+                    polling_delay = min(polling_delay * 2, self._max_polling_delay_in_seconds)
+        finally:
+            self._abort_running_jobs()
+
+    def fetch_results(self, job: AsyncJob) -> Iterable[requests.Response]:
+        """
+        Fetch the results of a completed job then delete the job
+        """
+        yield from self._job_repository.fetch_results(job)
+        self._job_repository.delete(job)
+
+    def _start_job(self, stream_slice: StreamSlice, attempt: int) -> None:
+        job = self._job_repository.start(stream_slice)
+        self._running_jobs.append(job)
+        self._attempts_per_job[job.api_job_id()] = attempt
+
+    def _process_terminal_jobs(self) -> List[AsyncJob]:
+        completed_jobs = []
+        for job in list(self._running_jobs):
+            status = job.status()
+            if not status.is_terminal():
+                continue
+
+            self._running_jobs.remove(job)
+            attempt = self._attempts_per_job.pop(job.api_job_id())
+            if status == AsyncJobStatus.COMPLETED:
+                completed_jobs.append(job)
+            elif attempt < self._max_job_attempts:
+                LOGGER.warning(f"Job {job.api_job_id()} has status {status.value} after {attempt} attempt(s). Creating it again.")
+                self._clean_up_failed_job(job, status)
+                self._start_job(job.job_parameters(), attempt=attempt + 1)
+            else:
+                self._clean_up_failed_job(job, status)
+                raise AirbyteTracedException(
+                    message="An asynchronous job failed too many times.",
+                    internal_message=f"Job {job.api_job_id()} for slice {job.job_parameters()} has status {status.value} after {attempt} attempt(s)",
+                    failure_type=FailureType.system_error,
+                )
+        return completed_jobs
+
+    def _abort_running_jobs(self) -> None:
+        running_jobs = self._running_jobs
+        self._running_jobs = []
+        for job in running_jobs:
+            self._abort(job)
+
+    def _abort(self, job: AsyncJob) -> None:
+        try:
+            self._job_repository.abort(job)
+        except Exception as exception:
+            # Failing to abort a job should not hide the reason why the orchestrator stopped
+            LOGGER.warning(f"Could not abort job {job.api_job_id()}: {exception}")
+
+    def _clean_up_failed_job(self, job: AsyncJob, status: AsyncJobStatus) -> None:
+        # The API considers a timed out job as still running so it is aborted while a failed job only needs to be deleted
+        if status == AsyncJobStatus.TIMED_OUT:
+            self._abort(job)
+            return
+        try:
+            self._job_repository.delete(job)
+        except Exception as exception:
+            LOGGER.warning(f"Could not delete job {job.api_job_id()}: {exception}")
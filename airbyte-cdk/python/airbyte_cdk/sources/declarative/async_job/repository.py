@@ -0,0 +1,46 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from abc import abstractmethod
+from typing import Iterable
+
+import requests
+from airbyte_cdk.sources.declarative.async_job.job import AsyncJob
+from airbyte_cdk.sources.types import StreamSlice
+
+
+class AsyncJobRepository:
+    """
+    Interface to the API creating the jobs, getting their status and fetching their results.
+    """
+
+    @abstractmethod
+    def start(self, stream_slice: StreamSlice) -> AsyncJob:
+        """
+        Create a job generating the records of the slice
+        """
+
+    @abstractmethod
+    def update_jobs_status(self, jobs: Iterable[AsyncJob]) -> None:
+        """
+        Get the status of the jobs from the API and update them. Jobs already in a terminal status are not expected to be passed.
+        """
+
+    @abstractmethod
+    def fetch_results(self, job: AsyncJob) -> Iterable[requests.Response]:
+        """
+        Download the results of a completed job. The responses can be streamed so that the results are decoded as they are downloaded.
+        """
+
+    @abstractmethod
+    def abort(self, job: AsyncJob) -> None:
+        """
+        Cancel a job that is still running, if the API allows it
+        """
+
+    @abstractmethod
+    def delete(self, job: AsyncJob) -> None:
+        """
+        Clean up a job once its results were fetched or once it failed, if the API allows it
+        """
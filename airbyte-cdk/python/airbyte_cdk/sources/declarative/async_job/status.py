@@ -0,0 +1,19 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from enum import Enum
+
+
+class AsyncJobStatus(Enum):
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+    TIMED_OUT = "TIMED_OUT"
+
+    def is_terminal(self) -> bool:
+        """
+        A status is terminal when it can't be updated anymore. For example, a completed job stays completed while a running job might
+        become completed, failed or timed out.
+        """
+        return self != AsyncJobStatus.RUNNING
@@ -0,0 +1,41 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import argparse
+import json
+import sys
+from typing import List
+
+from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.yaml_declarative_source import YamlDeclarativeSource
+
+
+def compile_manifest(path_to_yaml: str, output_path: str) -> None:
+    """
+    Resolve, propagate and validate the manifest once and write the result so that sources created from this manifest can skip these
+    steps on startup. The compiled manifest is only used if it was created from the same manifest with the same version of the CDK so it
+    should be created when building the connector, after its dependencies are installed.
+    """
+    with open(path_to_yaml, "r") as manifest_file:
+        manifest = YamlDeclarativeSource._parse(manifest_file.read())
+    compiled_manifest = ManifestDeclarativeSource(manifest).compiled_manifest
+    with open(output_path, "w") as output_file:
+        # YAML manifests can contain values like dates that are not JSON serializable. They are written as strings
+        json.dump(compiled_manifest, output_file, default=str)
+
+
+def main(args: List[str]) -> None:
+    parser = argparse.ArgumentParser(description="Compile a low-code manifest to speed up the startup of the source")
+    parser.add_argument("path_to_yaml", type=str, help="path to the manifest yaml file")
+    parser.add_argument(
+        "--output", type=str, required=False, help="path to write the compiled manifest to. Defaults to <manifest name>.compiled.json"
+    )
+    parsed_args = parser.parse_args(args)
+    output_path = parsed_args.output or YamlDeclarativeSource.compiled_manifest_path(parsed_args.path_to_yaml)
+    compile_manifest(parsed_args.path_to_yaml, output_path)
+    print(f"Compiled manifest written to {output_path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -50,6 +50,7 @@ class DeclarativeStream(Stream):
             else self.stream_cursor_field
         )
         self._schema_loader = self.schema_loader if self.schema_loader else DefaultSchemaLoader(config=self.config, parameters=parameters)
+        self._json_schema: Optional[Mapping[str, Any]] = None
 
     @property  # type: ignore
     def primary_key(self) -> Optional[Union[str, List[str], List[List[str]]]]:
@@ -141,8 +142,14 @@ class DeclarativeStream(Stream):
 
         The default implementation of this method looks for a JSONSchema file with the same name as this stream's "name" property.
         Override as needed.
+
+        The schema is loaded once per stream: loading it can be expensive (reading the file, resolving references) and as this method is
+        called for every slice, returning the same schema instance allows components like the RecordSelector schema normalization to
+        re-use what they derive from it. The schema must therefore not be mutated.
         """
-        return self._schema_loader.get_json_schema()
+        if self._json_schema is None:
+            self._json_schema = self._schema_loader.get_json_schema()
+        return self._json_schema
 
     def stream_slices(
         self, *, sync_mode: SyncMode, cursor_field: Optional[List[str]] = None, stream_state: Optional[Mapping[str, Any]] = None
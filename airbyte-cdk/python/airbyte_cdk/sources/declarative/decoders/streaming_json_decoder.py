@@ -0,0 +1,259 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import codecs
+import fnmatch
+import json
+import logging
+import re
+from dataclasses import InitVar, dataclass
+from typing import Any, Callable, Generator, Iterator, List, Mapping
+
+import requests
+from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
+
+logger = logging.getLogger("airbyte")
+
+_GLOB_CHARACTERS = frozenset("*?[]")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that can follow a value. A number that is not followed by one of them may be continued in the next chunk
+_VALUE_DELIMITERS = frozenset(",]} \t\n\r")
+_CONTAINER_TOKENS = re.compile(r'["\[\]{}]')
+_STRING_TOKENS = re.compile(r'["\\]')
+
+_SegmentMatcher = Callable[[str], bool]
+_OnMatch = Callable[[], Iterator[Any]]
+
+
+class _IncrementalJsonReader:
+    """
+    Reads JSON values from a stream of text chunks. Only the part of the document that has not been consumed yet is kept in memory and
+    values are decoded by the C implementation of the json module as soon as they are complete.
+    """
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        self._chunks = chunks
+        self._buffer = ""
+        self._position = 0
+        self._is_exhausted = False
+        self._decoder = json.JSONDecoder()
+
+    def peek(self) -> str:
+        """
+        Skip whitespaces and return the next character without consuming it. An empty string is returned at the end of the document.
+        """
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()  # type: ignore  # the regex always matches
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if self._is_exhausted:
+                return ""
+            self._read_more()
+
+    def consume(self, character: str) -> None:
+        if self.peek() != character:
+            raise self._error(f"Expecting '{character}'")
+        self._position += 1
+
+    def decode_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+                # A number can be truncated at the end of a chunk (e.g. "12." or "1e") and only be complete once it is followed by a delimiter
+                if (
+                    not isinstance(value, (int, float))
+                    or self._is_exhausted
+                    or (end < len(self._buffer) and self._buffer[end] in _VALUE_DELIMITERS)
+                ):
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._is_exhausted:
+                    raise
+            # Doubling the data to decode ensures that values spanning many chunks don't get decoded over and over again
+            self._read_more(len(self._buffer) - self._position)
+
+    def decode_values(self) -> Iterator[Any]:
+        yield self.decode_value()
+
+    def skip_value(self) -> None:
+        """
+        Consume the next value without decoding it. Objects, arrays and strings are skipped by scanning for the brackets and quotes
+        delimiting them so that the memory used doesn't depend on the size of the value. Their content is not validated.
+        """
+        if self.peek() not in ("{", "[", '"'):
+            # Numbers, booleans and null are small enough to be decoded
+            self.decode_value()
+            return
+
+        depth = 0
+        in_string = False
+        while True:
+            match = (_STRING_TOKENS if in_string else _CONTAINER_TOKENS).search(self._buffer, self._position)
+            if match is None:
+                self._position = len(self._buffer)
+                self._read_more_or_raise()
+                continue
+
+            token = match.group()
+            if token == "\\":
+                if match.end() == len(self._buffer):
+                    # The escaped character is in the next chunk
+                    self._position = match.start()
+                    self._read_more_or_raise()
+                    continue
+                self._position = match.end() + 1
+            elif token == '"':
+                self._position = match.end()
+                in_string = not in_string
+                if not in_string and depth == 0:
+                    return
+            else:
+                self._position = match.end()
+                depth += 1 if token in ("{", "[") else -1
+                if depth == 0:
+                    return
+
+    def _read_more_or_raise(self) -> None:
+        if self._is_exhausted:
+            raise self._error("Unterminated value")
+        self._read_more()
+
+    def _read_more(self, at_least: int = 1) -> None:
+        if self._position:
+            self._buffer = self._buffer[self._position :]
+            self._position = 0
+        chunks = [self._buffer]
+        read = 0
+        while read < at_least:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._is_exhausted = True
+                break
+            chunks.append(chunk)
+            read += len(chunk)
+        self._buffer = "".join(chunks)
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._position)
+
+
+@dataclass
+class StreamingJsonDecoder(Decoder):
+    """
+    Decoder strategy that parses the json-encoded content of a response incrementally instead of loading it in memory all at once.
+
+    When used by a DpathExtractor, only the elements under the field path are decoded and each of them is yielded as soon as it is
+    parsed so that the memory used is bounded by the size of a record instead of the size of the response. Else, it behaves like the
+    JsonDecoder.
+
+    As the response is streamed, it can only be read once. This decoder can therefore not be used with components that need to read
+    the body of the response like paginators.
+    """
+
+    parameters: InitVar[Mapping[str, Any]]
+    chunk_size: int = 64 * 1024
+
+    def is_stream_response(self) -> bool:
+        return True
+
+    def decode(self, response: requests.Response) -> Generator[Mapping[str, Any], None, None]:
+        reader = self._reader(response)
+        try:
+            if reader.peek() == "[":
+                yield from self._iterate_array(reader, lambda _: True, reader.decode_values)
+            else:
+                yield reader.decode_value()
+        except json.JSONDecodeError as exception:
+            logger.warning(f"Response cannot be parsed into json: {response.status_code=}, {exception}")
+            yield {}
+
+    def decode_field_path(self, response: requests.Response, field_path: List[Any]) -> Generator[Any, None, None]:
+        """
+        Yields the records found at the field path the same way a DpathExtractor would on the bodies returned by `decode`: if the path
+        contains a `*`, all the values matching the path are yielded. Else, the elements of the array found at the path are yielded or
+        the value found at the path if it is not empty.
+        """
+        reader = self._reader(response)
+        is_values_search = "*" in field_path
+        try:
+            if reader.peek() == "[":
+                yield from self._iterate_array(reader, lambda _: True, lambda: self._search(reader, field_path, is_values_search))
+            else:
+                yield from self._search(reader, field_path, is_values_search)
+        except json.JSONDecodeError as exception:
+            logger.warning(f"Response cannot be parsed into json: {response.status_code=}, {exception}")
+
+    def _reader(self, response: requests.Response) -> _IncrementalJsonReader:
+        text_decoder = codecs.getincrementaldecoder(response.encoding or "utf-8-sig")(errors="replace")
+        return _IncrementalJsonReader(
+            text_decoder.decode(chunk) for chunk in response.iter_content(chunk_size=self.chunk_size) if chunk  # type: ignore  # chunks are bytes
+        )
+
+    def _search(self, reader: _IncrementalJsonReader, path: List[Any], is_values_search: bool) -> Iterator[Any]:
+        if not path:
+            if is_values_search:
+                yield from reader.decode_values()
+            elif reader.peek() == "[":
+                yield from self._iterate_array(reader, lambda _: True, reader.decode_values)
+            else:
+                value = reader.decode_value()
+                if value:
+                    yield value
+            return
+
+        segment, remaining_path = path[0], path[1:]
+        matches = self._segment_matcher(segment)
+        next_character = reader.peek()
+        if next_character == "{":
+            yield from self._iterate_object(reader, matches, lambda: self._search(reader, remaining_path, is_values_search))
+        elif next_character == "[":
+            yield from self._iterate_array(reader, matches, lambda: self._search(reader, remaining_path, is_values_search))
+        else:
+            reader.skip_value()
+
+    def _iterate_object(self, reader: _IncrementalJsonReader, matches: _SegmentMatcher, on_match: _OnMatch) -> Iterator[Any]:
+        reader.consume("{")
+        if reader.peek() == "}":
+            reader.consume("}")
+            return
+        while True:
+            key = reader.decode_value()
+            reader.consume(":")
+            if matches(key):
+                yield from on_match()
+            else:
+                reader.skip_value()
+            if reader.peek() == ",":
+                reader.consume(",")
+            else:
+                reader.consume("}")
+                return
+
+    def _iterate_array(self, reader: _IncrementalJsonReader, matches: _SegmentMatcher, on_match: _OnMatch) -> Iterator[Any]:
+        reader.consume("[")
+        if reader.peek() == "]":
+            reader.consume("]")
+            return
+        index = 0
+        while True:
+            if matches(str(index)):
+                yield from on_match()
+            else:
+                reader.skip_value()
+            index += 1
+            if reader.peek() == ",":
+                reader.consume(",")
+            else:
+                reader.consume("]")
+                return
+
+    @staticmethod
+    def _segment_matcher(segment: Any) -> _SegmentMatcher:
+        # Interpolated segments like "1" are evaluated as integers
+        segment = str(segment)
+        if _GLOB_CHARACTERS.intersection(segment):
+            return lambda key: fnmatch.fnmatchcase(key, segment)
+        return lambda key: key == segment
@@ -3,16 +3,22 @@
 #
 
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Iterable, List, Mapping, Union
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Union
 
 import dpath
 import requests
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.types import Config
 
+_GLOB_CHARACTERS = frozenset("*?[")
+_WILDCARD = "*"
+
+_PathExtractor = Callable[[Any], Any]
+
 
 @dataclass
 class DpathExtractor(RecordExtractor):
@@ -63,20 +69,100 @@ class DpathExtractor(RecordExtractor):
         for path_index in range(len(self.field_path)):
             if isinstance(self.field_path[path_index], str):
                 self._field_path[path_index] = InterpolatedString.create(self.field_path[path_index], parameters=parameters)
+        self._path: Optional[List[Any]] = None
+        self._extract_path: Optional[_PathExtractor] = None
 
     def extract_records(self, response: requests.Response) -> Iterable[Mapping[str, Any]]:
+        if self._path is None or self._extract_path is None:
+            # The field path can only be interpolated with the config and the parameters so it does not change between responses
+            self._path = [path.eval(self.config) for path in self._field_path]
+            self._extract_path = _compile_path(self._path)
+
+        if isinstance(self.decoder, StreamingJsonDecoder):
+            # Only the records are decoded instead of the whole response
+            yield from self.decoder.decode_field_path(response, self._path)
+            return
+
         for body in self.decoder.decode(response):
-            if len(self._field_path) == 0:
-                extracted = body
-            else:
-                path = [path.eval(self.config) for path in self._field_path]
-                if "*" in path:
-                    extracted = dpath.values(body, path)
-                else:
-                    extracted = dpath.get(body, path, default=[])
+            extracted = self._extract_path(body)
             if isinstance(extracted, list):
                 yield from extracted
             elif extracted:
                 yield extracted
             else:
                 yield from []
+
+
+def _compile_path(path: List[Any]) -> _PathExtractor:
+    """
+    Returns a function extracting the value(s) at the path from a body like dpath does. dpath walks the whole body and matches every node
+    against the path so paths made of keys, indexes and `*` are instead resolved by indexing the body directly.
+    """
+    if len(path) == 0:
+        return lambda body: body
+    is_values_search = _WILDCARD in path
+    if not all(_is_compilable_segment(segment) for segment in path):
+        if is_values_search:
+            return lambda body: dpath.values(body, path)
+        return lambda body: dpath.get(body, path, default=[])
+
+    if is_values_search:
+        return lambda body: list(_find_values(body, path, 0))
+    return lambda body: _get(body, path)
+
+
+def _is_compilable_segment(segment: Any) -> bool:
+    if isinstance(segment, bool):
+        return False
+    if isinstance(segment, int):
+        return True
+    return isinstance(segment, str) and (segment == _WILDCARD or not _GLOB_CHARACTERS.intersection(segment))
+
+
+def _get(body: Any, path: List[Any]) -> Any:
+    node = body
+    for segment in path:
+        if isinstance(node, dict):
+            # Like dpath, only string segments match keys
+            if not isinstance(segment, str) or segment not in node:
+                return []
+            node = node[segment]
+        elif isinstance(node, list):
+            index = _as_index(segment, len(node))
+            if index is None:
+                return []
+            node = node[index]
+        else:
+            return []
+    return node
+
+
+def _find_values(node: Any, path: List[Any], depth: int) -> Iterator[Any]:
+    if depth == len(path):
+        yield node
+        return
+
+    segment = path[depth]
+    if isinstance(node, dict):
+        if segment == _WILDCARD:
+            for value in node.values():
+                yield from _find_values(value, path, depth + 1)
+        elif isinstance(segment, str) and segment in node:
+            yield from _find_values(node[segment], path, depth + 1)
+    elif isinstance(node, list):
+        if segment == _WILDCARD:
+            for value in node:
+                yield from _find_values(value, path, depth + 1)
+        else:
+            index = _as_index(segment, len(node))
+            if index is not None:
+                yield from _find_values(node[index], path, depth + 1)
+
+
+def _as_index(segment: Any, length: int) -> Optional[int]:
+    # Like dpath, segments are converted to int to be compared to list indexes and negative indexes are supported
+    try:
+        index = int(segment)
+    except ValueError:
+        return None
+    return index if -length <= index < length else None
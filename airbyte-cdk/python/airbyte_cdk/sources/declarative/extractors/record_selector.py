@@ -16,7 +16,7 @@ from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
 SCHEMA_TRANSFORMER_TYPE_MAPPING = {
     SchemaNormalization.None_: TransformConfig.NoTransform,
-    SchemaNormalization.Default: TransformConfig.DefaultSchemaNormalization,
+    SchemaNormalization.Default: TransformConfig.CompiledSchemaNormalization,
 }
 
 
@@ -3,7 +3,9 @@
 #
 
 import json
-from typing import Any, Callable, Iterable, Mapping, MutableMapping, Optional, Union
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Union
 
 from airbyte_cdk.sources.declarative.incremental.declarative_cursor import DeclarativeCursor
 from airbyte_cdk.sources.declarative.partition_routers.partition_router import PartitionRouter
@@ -57,29 +59,59 @@ class PerPartitionCursor(DeclarativeCursor):
     Between record #3 and #4 | Duplication | #1, #2
 
     Therefore, we need to manage state per partition.
+
+    The partition key of the slices is computed once when the slice is generated and cached on the slice.
+
+    Streams with a lot of partitions can set `max_partitions` to bound the memory used by the cursor:
+    * The partition cursors are kept from the most to the least recently used. Once there are more than `max_partitions` cursors, the
+      least recently used ones are dropped and the cursor falls back to a global state for the stream. The global state is managed by a
+      cursor observing the records of all the partitions which is closed once all the slices have been processed.
+    * When the global state is used, the per-partition states are not emitted anymore and all the partitions start from the global state.
+      Partitions without a state of their own also start from the global state.
+    * The state of a partition is updated when one of its slices is closed instead of asking every partition cursor for its state on each
+      checkpoint. This expects the state of the partition cursors to only change when a slice is closed, like for the DatetimeBasedCursor.
     """
 
     _NO_STATE: Mapping[str, Any] = {}
     _NO_CURSOR_STATE: Mapping[str, Any] = {}
     _KEY = 0
     _VALUE = 1
+    _PARTITION_KEY_ATTRIBUTE = "_per_partition_cursor_partition_key"
 
-    def __init__(self, cursor_factory: CursorFactory, partition_router: PartitionRouter):
+    def __init__(self, cursor_factory: CursorFactory, partition_router: PartitionRouter, max_partitions: Optional[int] = None):
         self._cursor_factory = cursor_factory
         self._partition_router = partition_router
-        self._cursor_per_partition: MutableMapping[str, DeclarativeCursor] = {}
+        self._cursor_per_partition: OrderedDict[str, DeclarativeCursor] = OrderedDict()
         self._partition_serializer = PerPartitionKeySerializer()
+        self._max_partitions = max_partitions
+        # The following are only used when the number of partitions is bounded
+        self._state_per_partition: Dict[str, Mapping[str, Any]] = {}
+        self._global_cursor = self._create_cursor(self._NO_CURSOR_STATE) if max_partitions is not None else None
+        self._use_global_cursor = False
+        self._open_slices = 0
+        self._all_slices_yielded = False
+
+    @property
+    def logger(self) -> logging.Logger:
+        return logging.getLogger("airbyte.PerPartitionCursor")
 
     def stream_slices(self) -> Iterable[StreamSlice]:
+        self._all_slices_yielded = False
         slices = self._partition_router.stream_slices()
         for partition in slices:
-            cursor = self._cursor_per_partition.get(self._to_partition_key(partition.partition))
+            partition_key = self._to_partition_key(partition.partition)
+            cursor = self._get_partition_cursor(partition_key)
             if not cursor:
-                cursor = self._create_cursor(self._NO_CURSOR_STATE)
-                self._cursor_per_partition[self._to_partition_key(partition.partition)] = cursor
+                cursor = self._create_cursor(self._get_global_state())
+                self._add_partition_cursor(partition_key, cursor)
 
             for cursor_slice in cursor.stream_slices():
-                yield StreamSlice(partition=partition, cursor_slice=cursor_slice)
+                stream_slice = StreamSlice(partition=partition, cursor_slice=cursor_slice)
+                setattr(stream_slice, self._PARTITION_KEY_ATTRIBUTE, partition_key)
+                self._open_slices += 1
+                yield stream_slice
+        self._all_slices_yielded = True
+        self._close_global_cursor_if_all_slices_are_processed()
 
     def set_initial_state(self, stream_state: StreamState) -> None:
         """
@@ -114,7 +146,9 @@ class PerPartitionCursor(DeclarativeCursor):
         if not stream_state:
             return
 
-        if "states" not in stream_state:
+        if self._global_cursor:
+            self._set_initial_global_state(stream_state)
+        elif "states" not in stream_state:
             raise AirbyteTracedException(
                 internal_message=f"Could not sync parse the following state: {stream_state}",
                 message="The state for is format invalid. Validate that the migration steps included a reset and that it was performed "
@@ -122,29 +156,55 @@ class PerPartitionCursor(DeclarativeCursor):
                 failure_type=FailureType.config_error,
             )
 
-        for state in stream_state["states"]:
-            self._cursor_per_partition[self._to_partition_key(state["partition"])] = self._create_cursor(state["cursor"])
+        for state in stream_state.get("states", []):
+            partition_key = self._to_partition_key(state["partition"])
+            self._add_partition_cursor(partition_key, self._create_cursor(state["cursor"]))
+            if self._global_cursor and not self._use_global_cursor:
+                self._state_per_partition[partition_key] = state
 
         # Set parent state for partition routers based on parent streams
         self._partition_router.set_initial_state(stream_state)
 
+    def _set_initial_global_state(self, stream_state: StreamState) -> None:
+        if "states" not in stream_state and "state" not in stream_state:
+            raise AirbyteTracedException(
+                internal_message=f"Could not sync parse the following state: {stream_state}",
+                message="The state for is format invalid. Validate that the migration steps included a reset and that it was performed "
+                "properly. Otherwise, please contact Airbyte support.",
+                failure_type=FailureType.config_error,
+            )
+        self._use_global_cursor = bool(stream_state.get("use_global_cursor"))
+        if self._global_cursor and "state" in stream_state:
+            self._global_cursor.set_initial_state(stream_state["state"])
+
     def observe(self, stream_slice: StreamSlice, record: Record) -> None:
-        self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].observe(
-            StreamSlice(partition={}, cursor_slice=stream_slice.cursor_slice), record
-        )
+        partition_key = self._get_partition_key(stream_slice)
+        cursor_slice = StreamSlice(partition={}, cursor_slice=stream_slice.cursor_slice)
+        self._cursor_per_partition[partition_key].observe(cursor_slice, record)
+        if self._global_cursor:
+            self._global_cursor.observe(cursor_slice, record)
 
     def close_slice(self, stream_slice: StreamSlice, *args: Any) -> None:
+        partition_key = self._get_partition_key(stream_slice)
         try:
-            self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].close_slice(
-                StreamSlice(partition={}, cursor_slice=stream_slice.cursor_slice), *args
-            )
+            cursor = self._cursor_per_partition[partition_key]
         except KeyError as exception:
             raise ValueError(
                 f"Partition {str(exception)} could not be found in current state based on the record. This is unexpected because "
                 f"we should only update state for partitions that were emitted during `stream_slices`"
             )
+        cursor.close_slice(StreamSlice(partition={}, cursor_slice=stream_slice.cursor_slice), *args)
+
+        if self._global_cursor:
+            if not self._use_global_cursor:
+                self._update_partition_state(partition_key, cursor)
+            self._open_slices -= 1
+            self._close_global_cursor_if_all_slices_are_processed()
 
     def get_stream_state(self) -> StreamState:
+        if self._global_cursor:
+            return self._get_bounded_stream_state()
+
         states = []
         for partition_tuple, cursor in self._cursor_per_partition.items():
             cursor_state = cursor.get_stream_state()
@@ -162,6 +222,62 @@ class PerPartitionCursor(DeclarativeCursor):
             state["parent_state"] = parent_state
         return state
 
+    def _get_bounded_stream_state(self) -> StreamState:
+        state: dict[str, Any] = {}
+        if self._use_global_cursor:
+            state["use_global_cursor"] = True
+        else:
+            state["states"] = list(self._state_per_partition.values())
+
+        global_state = self._get_global_state()
+        if global_state:
+            state["state"] = global_state
+
+        parent_state = self._partition_router.get_stream_state()
+        if parent_state:
+            state["parent_state"] = parent_state
+        return state
+
+    def _get_global_state(self) -> StreamState:
+        return self._global_cursor.get_stream_state() if self._global_cursor else self._NO_CURSOR_STATE
+
+    def _update_partition_state(self, partition_key: str, cursor: DeclarativeCursor) -> None:
+        cursor_state = cursor.get_stream_state()
+        if cursor_state:
+            partition_state = self._state_per_partition.get(partition_key)
+            partition = partition_state["partition"] if partition_state else self._to_dict(partition_key)
+            self._state_per_partition[partition_key] = {"partition": partition, "cursor": cursor_state}
+
+    def _close_global_cursor_if_all_slices_are_processed(self) -> None:
+        """
+        The global state can only move forward once all the partitions have been read as the partitions that were not read yet might have
+        records older than the ones observed so far.
+        """
+        if self._global_cursor and self._all_slices_yielded and self._open_slices <= 0:
+            self._global_cursor.close_slice(StreamSlice(partition={}, cursor_slice={}))
+
+    def _get_partition_cursor(self, partition_key: str) -> Optional[DeclarativeCursor]:
+        cursor = self._cursor_per_partition.get(partition_key)
+        if cursor and self._max_partitions is not None:
+            self._cursor_per_partition.move_to_end(partition_key)
+        return cursor
+
+    def _add_partition_cursor(self, partition_key: str, cursor: DeclarativeCursor) -> None:
+        self._cursor_per_partition[partition_key] = cursor
+        if self._max_partitions is None:
+            return
+
+        self._cursor_per_partition.move_to_end(partition_key)
+        while len(self._cursor_per_partition) > self._max_partitions:
+            self._cursor_per_partition.popitem(last=False)
+            if not self._use_global_cursor:
+                self.logger.warning(
+                    f"The number of partitions exceeds the limit of {self._max_partitions} partitions. The state of the stream will be tracked "
+                    f"globally instead of per partition."
+                )
+                self._use_global_cursor = True
+                self._state_per_partition.clear()
+
     def _get_state_for_partition(self, partition: Mapping[str, Any]) -> Optional[StreamState]:
         cursor = self._cursor_per_partition.get(self._to_partition_key(partition))
         if cursor:
@@ -176,6 +292,13 @@ class PerPartitionCursor(DeclarativeCursor):
     def _to_partition_key(self, partition: Mapping[str, Any]) -> str:
         return self._partition_serializer.to_partition_key(partition)
 
+    def _get_partition_key(self, stream_slice: StreamSlice) -> str:
+        partition_key: Optional[str] = getattr(stream_slice, self._PARTITION_KEY_ATTRIBUTE, None)
+        if partition_key is None:
+            # The slice was not generated by this cursor
+            partition_key = self._to_partition_key(stream_slice.partition)
+        return partition_key
+
     def _to_dict(self, partition_key: str) -> Mapping[str, Any]:
         return self._partition_serializer.to_partition(partition_key)
 
@@ -205,7 +328,7 @@ class PerPartitionCursor(DeclarativeCursor):
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition=stream_slice.partition, cursor_slice={}),
                 next_page_token=next_page_token,
-            ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_params(
+            ) | self._cursor_per_partition[self._get_partition_key(stream_slice)].get_request_params(
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition={}, cursor_slice=stream_slice.cursor_slice),
                 next_page_token=next_page_token,
@@ -225,7 +348,7 @@ class PerPartitionCursor(DeclarativeCursor):
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition=stream_slice.partition, cursor_slice={}),
                 next_page_token=next_page_token,
-            ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_headers(
+            ) | self._cursor_per_partition[self._get_partition_key(stream_slice)].get_request_headers(
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition={}, cursor_slice=stream_slice.cursor_slice),
                 next_page_token=next_page_token,
@@ -245,7 +368,7 @@ class PerPartitionCursor(DeclarativeCursor):
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition=stream_slice.partition, cursor_slice={}),
                 next_page_token=next_page_token,
-            ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_body_data(
+            ) | self._cursor_per_partition[self._get_partition_key(stream_slice)].get_request_body_data(
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition={}, cursor_slice=stream_slice.cursor_slice),
                 next_page_token=next_page_token,
@@ -265,7 +388,7 @@ class PerPartitionCursor(DeclarativeCursor):
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition=stream_slice.partition, cursor_slice={}),
                 next_page_token=next_page_token,
-            ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_body_json(
+            ) | self._cursor_per_partition[self._get_partition_key(stream_slice)].get_request_body_json(
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition={}, cursor_slice=stream_slice.cursor_slice),
                 next_page_token=next_page_token,
@@ -298,7 +421,7 @@ class PerPartitionCursor(DeclarativeCursor):
     def _get_cursor(self, record: Record) -> DeclarativeCursor:
         if not record.associated_slice:
             raise ValueError("Invalid state as stream slices that are emitted should refer to an existing cursor")
-        partition_key = self._to_partition_key(record.associated_slice.partition)
+        partition_key = self._get_partition_key(record.associated_slice)
         if partition_key not in self._cursor_per_partition:
             raise ValueError("Invalid state as stream slices that are emitted should refer to an existing cursor")
         cursor = self._cursor_per_partition[partition_key]
@@ -3,16 +3,28 @@
 #
 
 import ast
-from typing import Any, Mapping, Optional, Tuple, Type
+from functools import lru_cache
+from typing import Any, FrozenSet, Mapping, Optional, Tuple, Type
 
 from airbyte_cdk.sources.declarative.interpolation.filters import filters
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
 from airbyte_cdk.sources.declarative.interpolation.macros import macros
 from airbyte_cdk.sources.types import Config
-from jinja2 import meta
+from jinja2 import Template, meta
 from jinja2.exceptions import UndefinedError
 from jinja2.sandbox import SandboxedEnvironment
 
+# Markers which can start a jinja block (expression, statement or comment). Strings without any of them are rendered as is by jinja.
+_JINJA_BLOCK_MARKERS = ("{{", "{%", "{#")
+
+# First characters that can start a string that `ast.literal_eval` is able to evaluate: numbers, string/bytes literals and their
+# prefixes, containers, signs, `True`/`False`/`None`, `set()`, `...`, comments and line continuations. Anything else is returned as is
+# without calling literal_eval.
+_LITERAL_FIRST_CHARACTERS = frozenset("0123456789+-.'\"([{TFNbBrRuUs#\\")
+
+# Upper bound on the number of compiled templates kept in memory across all JinjaInterpolation instances
+_TEMPLATE_CACHE_SIZE = 4096
+
 
 class StreamPartitionAccessEnvironment(SandboxedEnvironment):
     """
@@ -62,14 +74,7 @@ class JinjaInterpolation(Interpolation):
     RESTRICTED_BUILTIN_FUNCTIONS = ["range"]  # The range function can cause very expensive computations
 
     def __init__(self) -> None:
-        self._environment = StreamPartitionAccessEnvironment()
-        self._environment.filters.update(**filters)
-        self._environment.globals.update(**macros)
-
-        for extension in self.RESTRICTED_EXTENSIONS:
-            self._environment.extensions.pop(extension, None)
-        for builtin in self.RESTRICTED_BUILTIN_FUNCTIONS:
-            self._environment.globals.pop(builtin, None)
+        self._environment = _environment()
 
     def eval(
         self,
@@ -104,6 +109,9 @@ class JinjaInterpolation(Interpolation):
         return self._literal_eval(self._eval(default, context), valid_types)
 
     def _literal_eval(self, result: Optional[str], valid_types: Optional[Tuple[Type[Any]]]) -> Any:
+        if isinstance(result, str) and not self._may_be_literal(result):
+            # Fast path: the result can't be a python literal so literal_eval would fail and the string would be returned as is
+            return result
         try:
             evaluated = ast.literal_eval(result)  # type: ignore # literal_eval is able to handle None
         except (ValueError, SyntaxError):
@@ -112,15 +120,64 @@ class JinjaInterpolation(Interpolation):
             return evaluated
         return result
 
+    @staticmethod
+    def _may_be_literal(result: str) -> bool:
+        # literal_eval tolerates some leading whitespace so it is ignored before looking at the first character
+        stripped = result.lstrip()
+        return bool(stripped) and stripped[0] in _LITERAL_FIRST_CHARACTERS
+
+    @staticmethod
+    def _is_static(s: str) -> bool:
+        # Jinja normalizes line endings and drops a single trailing newline when rendering, so those strings still need to go through
+        # the engine
+        return not any(marker in s for marker in _JINJA_BLOCK_MARKERS) and "\r" not in s and not s.endswith("\n")
+
     def _eval(self, s: Optional[str], context: Mapping[str, Any]) -> Optional[str]:
+        if isinstance(s, str) and self._is_static(s):
+            # The string is a static value, not a jinja template. It can be returned as is without involving jinja
+            return s
         try:
-            ast = self._environment.parse(s)  # type: ignore # parse is able to handle None
-            undeclared = meta.find_undeclared_variables(ast)
+            undeclared = _find_undeclared_variables(s)
             undeclared_not_in_context = {var for var in undeclared if var not in context}
             if undeclared_not_in_context:
                 raise ValueError(f"Jinja macro has undeclared variables: {undeclared_not_in_context}. Context: {context}")
-            return self._environment.from_string(s).render(context)  # type: ignore # from_string is able to handle None
+            return _compile(s).render(context)
         except TypeError:
             # The string is a static value, not a jinja template
             # It can be returned as is
             return s
+
+
+@lru_cache(maxsize=1)
+def _environment() -> StreamPartitionAccessEnvironment:
+    """
+    Returns the environment shared by all the JinjaInterpolation instances. It is configured the same way for every instance so the
+    templates it compiles can be cached across instances.
+    """
+    environment = StreamPartitionAccessEnvironment()
+    environment.filters.update(**filters)
+    environment.globals.update(**macros)
+
+    for extension in JinjaInterpolation.RESTRICTED_EXTENSIONS:
+        environment.extensions.pop(extension, None)
+    for builtin in JinjaInterpolation.RESTRICTED_BUILTIN_FUNCTIONS:
+        environment.globals.pop(builtin, None)
+    return environment
+
+
+@lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def _find_undeclared_variables(s: Optional[str]) -> FrozenSet[str]:
+    """
+    Parses the template and returns the variables it references. Cached by template string as the same templates are evaluated for every
+    record, page or slice.
+    """
+    ast = _environment().parse(s)  # type: ignore # parse is able to handle None
+    return frozenset(meta.find_undeclared_variables(ast))
+
+
+@lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def _compile(s: Optional[str]) -> Template:
+    """
+    Compiles the template. Cached by template string as the same templates are evaluated for every record, page or slice.
+    """
+    return _environment().from_string(s)  # type: ignore # from_string is able to handle None
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import hashlib
 import json
 import logging
 import pkgutil
@@ -43,11 +44,14 @@ class ManifestDeclarativeSource(DeclarativeSource):
         debug: bool = False,
         emit_connector_builder_messages: bool = False,
         component_factory: Optional[ModelToComponentFactory] = None,
+        compiled_manifest: Optional[Mapping[str, Any]] = None,
     ):
         """
         :param source_config(Mapping[str, Any]): The manifest of low-code components that describe the source connector
         :param debug(bool): True if debug mode is enabled
         :param component_factory(ModelToComponentFactory): optional factory if ModelToComponentFactory's default behaviour needs to be tweaked
+        :param compiled_manifest(Mapping[str, Any]): optional result of `compiled_manifest` for this manifest. If it was compiled from the
+          same manifest with the same version of the CDK, the manifest is not processed and validated again
         """
         self.logger = logging.getLogger(f"airbyte.{self.name}")
 
@@ -56,21 +60,61 @@ class ManifestDeclarativeSource(DeclarativeSource):
         if "type" not in manifest:
             manifest["type"] = "DeclarativeSource"
 
-        resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
-        propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
-        self._source_config = propagated_source_config
+        self._manifest = manifest
+        self._manifest_hash: Optional[str] = None
+        # The hash is only computed if there is a compiled manifest to compare it with
+        is_compiled = bool(compiled_manifest and compiled_manifest.get("manifest_hash") == self._get_manifest_hash())
+        if compiled_manifest and is_compiled:
+            self._source_config = compiled_manifest["manifest"]
+        else:
+            if compiled_manifest:
+                self.logger.info("The compiled manifest was not compiled from this manifest and CDK version and will be ignored")
+            resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
+            propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
+            self._source_config = propagated_source_config
         self._debug = debug
         self._emit_connector_builder_messages = emit_connector_builder_messages
         self._constructor = component_factory if component_factory else ModelToComponentFactory(emit_connector_builder_messages)
         self._message_repository = self._constructor.get_message_repository()
         self._slice_logger: SliceLogger = AlwaysLogSliceLogger() if emit_connector_builder_messages else DebugSliceLogger()
 
-        self._validate_source()
+        if not is_compiled:
+            self._validate_source()
 
     @property
     def resolved_manifest(self) -> Mapping[str, Any]:
         return self._source_config
 
+    @property
+    def compiled_manifest(self) -> Mapping[str, Any]:
+        """
+        The resolved and validated manifest along with a hash of the manifest it was created from. It is meant to be serialized as JSON
+        and given back to the constructor of the source to skip processing and validating the manifest on startup.
+        """
+        return {"manifest_hash": self._get_manifest_hash(), "manifest": self._source_config}
+
+    def _get_manifest_hash(self) -> str:
+        """
+        A hash of the manifest and of the CDK version, as the result of processing a manifest depends on the CDK version
+        """
+        if self._manifest_hash is None:
+            manifest_hash = hashlib.sha256(metadata.version("airbyte_cdk").encode())
+            manifest_hash.update(repr(self._canonical_form(self._manifest)).encode())
+            self._manifest_hash = manifest_hash.hexdigest()
+        return self._manifest_hash
+
+    @classmethod
+    def _canonical_form(cls, value: Any) -> Any:
+        """
+        Mappings are converted to tuples of items sorted by the repr of their keys as YAML mappings can mix keys of different types. Other
+        values are kept as is so that their repr tells their type apart (e.g. a YAML date and the same date as a string).
+        """
+        if isinstance(value, Mapping):
+            return tuple(sorted(((repr(key), cls._canonical_form(item)) for key, item in value.items()), key=lambda item: item[0]))
+        if isinstance(value, list):
+            return [cls._canonical_form(item) for item in value]
+        return value
+
     @property
     def message_repository(self) -> Union[None, MessageRepository]:
         return self._message_repository
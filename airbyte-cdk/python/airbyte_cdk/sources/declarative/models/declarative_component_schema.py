@@ -525,6 +525,7 @@ class SessionTokenRequestBearerAuthenticator(BaseModel):
 class HttpMethod(Enum):
     GET = 'GET'
     POST = 'POST'
+    DELETE = 'DELETE'
 
 
 class Action(Enum):
@@ -617,6 +618,10 @@ class IterableDecoder(BaseModel):
     type: Literal['IterableDecoder']
 
 
+class StreamingJsonDecoder(BaseModel):
+    type: Literal['StreamingJsonDecoder']
+
+
 class MinMaxDatetime(BaseModel):
     type: Literal['MinMaxDatetime']
     datetime: str = Field(
@@ -1202,7 +1207,9 @@ class DpathExtractor(BaseModel):
         ],
         title='Field Path',
     )
-    decoder: Optional[Union[JsonDecoder, JsonlDecoder, IterableDecoder]] = Field(
+    decoder: Optional[
+        Union[JsonDecoder, JsonlDecoder, IterableDecoder, StreamingJsonDecoder]
+    ] = Field(
         None, title='Decoder'
     )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
@@ -1355,7 +1362,7 @@ class DeclarativeStream(BaseModel):
         extra = Extra.allow
 
     type: Literal['DeclarativeStream']
-    retriever: Union[CustomRetriever, SimpleRetriever] = Field(
+    retriever: Union[CustomRetriever, SimpleRetriever, AsyncRetriever] = Field(
         ...,
         description='Component used to coordinate how records are extracted across stream slices and request pages.',
         title='Retriever',
@@ -1486,7 +1493,7 @@ class HttpRequester(BaseModel):
     )
     http_method: Optional[HttpMethod] = Field(
         HttpMethod.GET,
-        description='The HTTP method used to fetch data from the source (can be GET or POST).',
+        description='The HTTP method used to fetch data from the source (can be GET, POST or DELETE).',
         examples=['GET', 'POST'],
         title='HTTP Method',
     )
@@ -1532,6 +1539,11 @@ class HttpRequester(BaseModel):
         description='Enables stream requests caching. This field is automatically set by the CDK.',
         title='Use Cache',
     )
+    use_persistent_cache: Optional[bool] = Field(
+        False,
+        description='Caches the responses having an ETag or a Last-Modified header across syncs. Cached responses are revalidated with the API on each request using If-None-Match/If-Modified-Since headers and only downloaded again if they changed. This is useful for slow-changing streams like parents of substreams. The cache is only enabled if the PERSISTENT_REQUEST_CACHE_PATH environment variable is set.',
+        title='Use Persistent Cache',
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
@@ -1562,6 +1574,12 @@ class ParentStreamConfig(BaseModel):
         description='Indicates whether the parent stream should be read incrementally based on updates in the child stream.',
         title='Incremental Dependency',
     )
+    max_concurrent_slices: Optional[int] = Field(
+        1,
+        description='The number of slices of the parent stream read concurrently. Partitions are emitted as soon as the parent slice they come from has been read. When greater than 1, the parent stream must have slices (for example a date range or a partition router) to benefit from it.',
+        examples=[1, 10],
+        title='Max Concurrent Parent Slices',
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
@@ -1599,7 +1617,9 @@ class SimpleRetriever(BaseModel):
         description='PartitionRouter component that describes how to partition the stream, enabling incremental syncs and checkpointing.',
         title='Partition Router',
     )
-    decoder: Optional[Union[JsonDecoder, JsonlDecoder, IterableDecoder]] = Field(
+    decoder: Optional[
+        Union[JsonDecoder, JsonlDecoder, IterableDecoder, StreamingJsonDecoder]
+    ] = Field(
         None,
         description='Component decoding the response so records can be extracted.',
         title='Decoder',
@@ -1607,6 +1627,105 @@ class SimpleRetriever(BaseModel):
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
+class AsyncJobStatusMap(BaseModel):
+    type: Optional[Literal['AsyncJobStatusMap']] = None
+    running: List[str] = Field(
+        ..., description='The API statuses of the jobs that are still running.'
+    )
+    completed: List[str] = Field(
+        ...,
+        description='The API statuses of the jobs whose results can be downloaded.',
+    )
+    failed: List[str] = Field(
+        ..., description='The API statuses of the jobs that failed.'
+    )
+    timeout: List[str] = Field(
+        ..., description='The API statuses of the jobs that timed out.'
+    )
+
+
+class AsyncRetriever(BaseModel):
+    type: Literal['AsyncRetriever']
+    record_selector: RecordSelector = Field(
+        ...,
+        description='Component that describes how to extract records from the downloaded results.',
+    )
+    status_mapping: AsyncJobStatusMap = Field(
+        ...,
+        description='Async Job Status to Airbyte CDK Async Job Status mapping.',
+    )
+    creation_requester: Union[CustomRequester, HttpRequester] = Field(
+        ...,
+        description='Requester component that describes how to prepare HTTP requests to send to the source API to create the async server-side job. The stream slice is available for interpolation.',
+    )
+    polling_requester: Union[CustomRequester, HttpRequester] = Field(
+        ...,
+        description="Requester component that describes how to prepare HTTP requests to send to the source API to fetch the status of the running async job. The JSON body of the job creation response is available for interpolation as `stream_slice['create_job_response']`.",
+    )
+    download_requester: Union[CustomRequester, HttpRequester] = Field(
+        ...,
+        description="Requester component that describes how to prepare HTTP requests to send to the source API to download the data provided by the completed async job. The URL to download is available for interpolation as `stream_slice['url']`.",
+    )
+    abort_requester: Optional[Union[CustomRequester, HttpRequester]] = Field(
+        None,
+        description="Requester component that describes how to prepare HTTP requests to send to the source API to abort a job once it is timed out from the source's perspective. The JSON body of the job creation response is available for interpolation as `stream_slice['create_job_response']`.",
+    )
+    delete_requester: Optional[Union[CustomRequester, HttpRequester]] = Field(
+        None,
+        description="Requester component that describes how to prepare HTTP requests to send to the source API to delete a job once the records are extracted. The JSON body of the job creation response is available for interpolation as `stream_slice['create_job_response']`.",
+    )
+    status_extractor: Union[CustomRecordExtractor, DpathExtractor] = Field(
+        ...,
+        description='Responsible for fetching the actual status of the async job from the polling response.',
+    )
+    urls_extractor: Union[CustomRecordExtractor, DpathExtractor] = Field(
+        ...,
+        description='Responsible for fetching the URLs of the results of a completed job from the polling response.',
+    )
+    partition_router: Optional[
+        Union[
+            CustomPartitionRouter,
+            ListPartitionRouter,
+            SubstreamPartitionRouter,
+            List[
+                Union[
+                    CustomPartitionRouter, ListPartitionRouter, SubstreamPartitionRouter
+                ]
+            ],
+        ]
+    ] = Field(
+        [],
+        description='PartitionRouter component that describes how to partition the stream. A job is created for each partition.',
+        title='Partition Router',
+    )
+    decoder: Optional[
+        Union[JsonDecoder, JsonlDecoder, IterableDecoder, StreamingJsonDecoder]
+    ] = Field(
+        None,
+        description='Component decoding the downloaded results so records can be extracted. Streaming decoders decode the results as they are downloaded.',
+        title='Decoder',
+    )
+    max_concurrent_jobs: Optional[int] = Field(
+        3,
+        description='The maximum number of jobs running at the same time on the API side.',
+        ge=1,
+        title='Maximum Concurrent Jobs',
+    )
+    max_job_attempts: Optional[int] = Field(
+        3,
+        description='The number of times a job is created for the same stream slice when it fails or times out before the sync fails.',
+        ge=1,
+        title='Maximum Job Attempts',
+    )
+    job_timeout: Optional[str] = Field(
+        None,
+        description='The duration in ISO 8601 duration notation after which a job that is still running is considered as timed out. Omitting it will result in jobs never timing out.',
+        examples=['PT1H', 'PT30M'],
+        title='Job Timeout',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class SubstreamPartitionRouter(BaseModel):
     type: Literal['SubstreamPartitionRouter']
     parent_stream_configs: List[ParentStreamConfig] = Field(
@@ -1623,3 +1742,4 @@ SelectiveAuthenticator.update_forward_refs()
 DeclarativeStream.update_forward_refs()
 SessionTokenAuthenticator.update_forward_refs()
 SimpleRetriever.update_forward_refs()
+AsyncRetriever.update_forward_refs()
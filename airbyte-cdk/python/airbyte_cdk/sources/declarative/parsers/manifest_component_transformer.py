@@ -10,6 +10,16 @@ PARAMETERS_STR = "$parameters"
 
 
 DEFAULT_MODEL_TYPES: Mapping[str, str] = {
+    # AsyncRetriever
+    "AsyncRetriever.abort_requester": "HttpRequester",
+    "AsyncRetriever.creation_requester": "HttpRequester",
+    "AsyncRetriever.delete_requester": "HttpRequester",
+    "AsyncRetriever.download_requester": "HttpRequester",
+    "AsyncRetriever.polling_requester": "HttpRequester",
+    "AsyncRetriever.record_selector": "RecordSelector",
+    "AsyncRetriever.status_extractor": "DpathExtractor",
+    "AsyncRetriever.status_mapping": "AsyncJobStatusMap",
+    "AsyncRetriever.urls_extractor": "DpathExtractor",
     # CompositeErrorHandler
     "CompositeErrorHandler.error_handlers": "DefaultErrorHandler",
     # CursorPagination
@@ -63,6 +73,7 @@ DEFAULT_MODEL_TYPES: Mapping[str, str] = {
 # We retain a separate registry for custom components to automatically insert the type if it is missing. This is intended to
 # be a short term fix because once we have migrated, then type and class_name should be requirements for all custom components.
 CUSTOM_COMPONENTS_MAPPING: Mapping[str, str] = {
+    "AsyncRetriever.partition_router": "CustomPartitionRouter",
     "CompositeErrorHandler.backoff_strategies": "CustomBackoffStrategy",
     "DeclarativeStream.retriever": "CustomRetriever",
     "DeclarativeStream.transformations": "CustomTransformation",
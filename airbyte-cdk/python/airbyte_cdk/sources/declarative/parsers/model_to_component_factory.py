@@ -7,9 +7,12 @@ from __future__ import annotations
 import importlib
 import inspect
 import re
-from typing import Any, Callable, Dict, List, Mapping, Optional, Type, Union, get_args, get_origin, get_type_hints
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Type, Union, get_args, get_origin, get_type_hints
 
 from airbyte_cdk.models import FailureType, Level
+from airbyte_cdk.sources.declarative.async_job.job_orchestrator import AsyncJobOrchestrator
+from airbyte_cdk.sources.declarative.async_job.status import AsyncJobStatus
 from airbyte_cdk.sources.declarative.auth import DeclarativeOauth2Authenticator, JwtAuthenticator
 from airbyte_cdk.sources.declarative.auth.declarative_authenticator import DeclarativeAuthenticator, NoAuth
 from airbyte_cdk.sources.declarative.auth.jwt import JwtAlgorithm
@@ -25,7 +28,7 @@ from airbyte_cdk.sources.declarative.auth.token_provider import InterpolatedStri
 from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import Decoder, IterableDecoder, JsonDecoder, JsonlDecoder
+from airbyte_cdk.sources.declarative.decoders import Decoder, IterableDecoder, JsonDecoder, JsonlDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.extractors.record_filter import ClientSideIncrementalRecordFilterDecorator
 from airbyte_cdk.sources.declarative.extractors.record_selector import SCHEMA_TRANSFORMER_TYPE_MAPPING
@@ -43,6 +46,8 @@ from airbyte_cdk.sources.declarative.models import CustomStateMigration
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import AddedFieldDefinition as AddedFieldDefinitionModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import AddFields as AddFieldsModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import ApiKeyAuthenticator as ApiKeyAuthenticatorModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import AsyncJobStatusMap as AsyncJobStatusMapModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import AsyncRetriever as AsyncRetrieverModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import BasicHttpAuthenticator as BasicHttpAuthenticatorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import BearerAuthenticator as BearerAuthenticatorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CheckStream as CheckStreamModel
@@ -102,6 +107,7 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SessionTokenAuthenticator as SessionTokenAuthenticatorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SimpleRetriever as SimpleRetrieverModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import StreamingJsonDecoder as StreamingJsonDecoderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SubstreamPartitionRouter as SubstreamPartitionRouterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import ValueType
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitTimeFromHeader as WaitTimeFromHeaderModel
@@ -121,6 +127,7 @@ from airbyte_cdk.sources.declarative.requesters.error_handlers.backoff_strategie
     WaitTimeFromHeaderBackoffStrategy,
     WaitUntilTimeFromHeaderBackoffStrategy,
 )
+from airbyte_cdk.sources.declarative.requesters.http_job_repository import AsyncHttpJobRepository
 from airbyte_cdk.sources.declarative.requesters.paginators import DefaultPaginator, NoPagination, PaginatorTestReadDecorator
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies import (
     CursorPaginationStrategy,
@@ -133,7 +140,7 @@ from airbyte_cdk.sources.declarative.requesters.request_option import RequestOpt
 from airbyte_cdk.sources.declarative.requesters.request_options import InterpolatedRequestOptionsProvider
 from airbyte_cdk.sources.declarative.requesters.request_path import RequestPath
 from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod
-from airbyte_cdk.sources.declarative.retrievers import SimpleRetriever, SimpleRetrieverTestReadDecorator
+from airbyte_cdk.sources.declarative.retrievers import AsyncRetriever, SimpleRetriever, SimpleRetrieverTestReadDecorator
 from airbyte_cdk.sources.declarative.schema import DefaultSchemaLoader, InlineSchemaLoader, JsonFileSchemaLoader
 from airbyte_cdk.sources.declarative.spec import Spec
 from airbyte_cdk.sources.declarative.stream_slicers import StreamSlicer
@@ -141,7 +148,7 @@ from airbyte_cdk.sources.declarative.transformations import AddFields, RecordTra
 from airbyte_cdk.sources.declarative.transformations.add_fields import AddedFieldDefinition
 from airbyte_cdk.sources.message import InMemoryMessageRepository, LogAppenderMessageRepositoryDecorator, MessageRepository
 from airbyte_cdk.sources.streams.http.error_handlers.response_models import ResponseAction
-from airbyte_cdk.sources.types import Config
+from airbyte_cdk.sources.types import Config, StreamSlice
 from airbyte_cdk.sources.utils.transform import TypeTransformer
 from isodate import parse_duration
 from pydantic.v1 import BaseModel
@@ -172,6 +179,7 @@ class ModelToComponentFactory:
             AddedFieldDefinitionModel: self.create_added_field_definition,
             AddFieldsModel: self.create_add_fields,
             ApiKeyAuthenticatorModel: self.create_api_key_authenticator,
+            AsyncRetrieverModel: self.create_async_retriever,
             BasicHttpAuthenticatorModel: self.create_basic_http_authenticator,
             BearerAuthenticatorModel: self.create_bearer_authenticator,
             CheckStreamModel: self.create_check_stream,
@@ -204,6 +212,7 @@ class ModelToComponentFactory:
             JsonDecoderModel: self.create_json_decoder,
             JsonlDecoderModel: self.create_jsonl_decoder,
             IterableDecoderModel: self.create_iterable_decoder,
+            StreamingJsonDecoderModel: self.create_streaming_json_decoder,
             JsonFileSchemaLoaderModel: self.create_json_file_schema_loader,
             JwtAuthenticatorModel: self.create_jwt_authenticator,
             LegacyToPerPartitionStateMigrationModel: self.create_legacy_to_per_partition_state_migration,
@@ -680,7 +689,7 @@ class ModelToComponentFactory:
         stream_slicer = None
         if (
             hasattr(model.retriever, "partition_router")
-            and isinstance(model.retriever, SimpleRetrieverModel)
+            and isinstance(model.retriever, (SimpleRetrieverModel, AsyncRetrieverModel))
             and model.retriever.partition_router
         ):
             stream_slicer_model = model.retriever.partition_router
@@ -825,6 +834,7 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
             message_repository=self._message_repository,
             use_cache=model.use_cache,
+            use_persistent_cache=model.use_persistent_cache or False,
             decoder=decoder,
             stream_response=decoder.is_stream_response() if decoder else False,
         )
@@ -869,6 +879,10 @@ class ModelToComponentFactory:
     def create_iterable_decoder(model: IterableDecoderModel, config: Config, **kwargs: Any) -> IterableDecoder:
         return IterableDecoder(parameters={})
 
+    @staticmethod
+    def create_streaming_json_decoder(model: StreamingJsonDecoderModel, config: Config, **kwargs: Any) -> StreamingJsonDecoder:
+        return StreamingJsonDecoder(parameters={})
+
     @staticmethod
     def create_json_file_schema_loader(model: JsonFileSchemaLoaderModel, config: Config, **kwargs: Any) -> JsonFileSchemaLoader:
         return JsonFileSchemaLoader(file_path=model.file_path or "", config=config, parameters=model.parameters or {})
@@ -1010,6 +1024,8 @@ class ModelToComponentFactory:
             partition_field=model.partition_field,
             config=config,
             incremental_dependency=model.incremental_dependency or False,
+            max_concurrent_slices=model.max_concurrent_slices or 1,
+            stream_factory=lambda: self._create_component_from_model(model.stream, config=config),
             parameters=model.parameters or {},
         )
 
@@ -1157,6 +1173,95 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
         )
 
+    def create_async_retriever(
+        self,
+        model: AsyncRetrieverModel,
+        config: Config,
+        *,
+        name: str,
+        primary_key: Optional[Union[str, List[str], List[List[str]]]],
+        stream_slicer: Optional[StreamSlicer],
+        client_side_incremental_sync: Optional[Dict[str, Any]] = None,
+        transformations: List[RecordTransformation],
+        **kwargs: Any,
+    ) -> AsyncRetriever:
+        if isinstance(stream_slicer, DeclarativeCursor):
+            raise ValueError(
+                f"AsyncRetriever does not support incremental syncs as jobs complete out of order. Got a cursor for stream {name}"
+            )
+
+        decoder = self._create_component_from_model(model=model.decoder, config=config) if model.decoder else JsonDecoder(parameters={})
+        record_selector = self._create_component_from_model(
+            model=model.record_selector,
+            config=config,
+            decoder=decoder,
+            transformations=transformations,
+            client_side_incremental_sync=client_side_incremental_sync,
+        )
+        # The API responses describing the jobs are JSON, only the downloaded results are decoded using the decoder of the retriever
+        job_decoder = JsonDecoder(parameters={})
+        job_repository = AsyncHttpJobRepository(
+            creation_requester=self._create_component_from_model(
+                model=model.creation_requester, decoder=job_decoder, config=config, name=f"job creation - {name}"
+            ),
+            polling_requester=self._create_component_from_model(
+                model=model.polling_requester, decoder=job_decoder, config=config, name=f"job polling - {name}"
+            ),
+            download_requester=self._create_component_from_model(
+                model=model.download_requester, decoder=decoder, config=config, name=f"job download - {name}"
+            ),
+            abort_requester=(
+                self._create_component_from_model(
+                    model=model.abort_requester, decoder=job_decoder, config=config, name=f"job abort - {name}"
+                )
+                if model.abort_requester
+                else None
+            ),
+            delete_requester=(
+                self._create_component_from_model(
+                    model=model.delete_requester, decoder=job_decoder, config=config, name=f"job delete - {name}"
+                )
+                if model.delete_requester
+                else None
+            ),
+            status_extractor=self._create_component_from_model(model=model.status_extractor, decoder=job_decoder, config=config),
+            status_mapping=self._create_async_job_status_mapping(model.status_mapping),
+            urls_extractor=self._create_component_from_model(model=model.urls_extractor, decoder=job_decoder, config=config),
+            job_timeout=parse_duration(model.job_timeout) if model.job_timeout else None,
+        )
+        limit_slices_fetched = self._limit_slices_fetched
+
+        def create_job_orchestrator(slices: Iterable[StreamSlice]) -> AsyncJobOrchestrator:
+            return AsyncJobOrchestrator(
+                job_repository,
+                islice(slices, limit_slices_fetched) if limit_slices_fetched else slices,
+                max_concurrent_jobs=model.max_concurrent_jobs or 3,
+                max_job_attempts=model.max_job_attempts or 3,
+            )
+
+        return AsyncRetriever(
+            config=config,
+            job_orchestrator_factory=create_job_orchestrator,
+            record_selector=record_selector,
+            stream_slicer=stream_slicer or SinglePartitionRouter(parameters={}),
+            parameters=model.parameters or {},
+        )
+
+    @staticmethod
+    def _create_async_job_status_mapping(model: AsyncJobStatusMapModel) -> Mapping[str, AsyncJobStatus]:
+        api_status_to_cdk_status: Dict[str, AsyncJobStatus] = {}
+        for cdk_status, api_statuses in (
+            (AsyncJobStatus.RUNNING, model.running),
+            (AsyncJobStatus.COMPLETED, model.completed),
+            (AsyncJobStatus.FAILED, model.failed),
+            (AsyncJobStatus.TIMED_OUT, model.timeout),
+        ):
+            for api_status in api_statuses:
+                if api_status in api_status_to_cdk_status:
+                    raise ValueError(f"API status {api_status} is mapped to both {api_status_to_cdk_status[api_status]} and {cdk_status}")
+                api_status_to_cdk_status[api_status] = cdk_status
+        return api_status_to_cdk_status
+
     @staticmethod
     def create_spec(model: SpecModel, config: Config, **kwargs: Any) -> Spec:
         return Spec(
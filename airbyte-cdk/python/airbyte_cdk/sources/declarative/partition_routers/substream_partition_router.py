@@ -2,15 +2,19 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import InitVar, dataclass
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Union
+from queue import Empty, Queue
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 import dpath
-from airbyte_cdk.models import AirbyteMessage
+from airbyte_cdk.models import AirbyteMessage, SyncMode
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.partition_routers.partition_router import PartitionRouter
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
+from airbyte_cdk.sources.streams.checkpoint import Cursor, ResumableFullRefreshCursor
+from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.types import Config, Record, StreamSlice, StreamState
 from airbyte_cdk.utils import AirbyteTracedException
 
@@ -28,6 +32,9 @@ class ParentStreamConfig:
     partition_field: The partition key
     request_option: How to inject the slice value on an outgoing HTTP request
     incremental_dependency (bool): Indicates if the parent stream should be read incrementally.
+    max_concurrent_slices (int): The number of slices of the parent stream read concurrently
+    stream_factory (Optional[Callable[[], DeclarativeStream]]): Creates new instances of the parent stream. Required to read slices
+        concurrently as the components of a stream can't be used by many threads at the same time.
     """
 
     stream: "DeclarativeStream"  # Parent streams must be DeclarativeStream because we can't know which part of the stream slice is a partition for regular Stream
@@ -37,10 +44,16 @@ class ParentStreamConfig:
     parameters: InitVar[Mapping[str, Any]]
     request_option: Optional[RequestOption] = None
     incremental_dependency: bool = False
+    max_concurrent_slices: int = 1
+    stream_factory: Optional[Callable[[], "DeclarativeStream"]] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self.parent_key = InterpolatedString.create(self.parent_key, parameters=parameters)
         self.partition_field = InterpolatedString.create(self.partition_field, parameters=parameters)
+        if self.max_concurrent_slices < 1:
+            raise ValueError(f"max_concurrent_slices should be at least 1. Got {self.max_concurrent_slices}")
+        if self.max_concurrent_slices > 1 and self.stream_factory is None:
+            raise ValueError("A stream_factory is required to read the slices of the parent stream concurrently")
 
 
 @dataclass
@@ -129,6 +142,13 @@ class SubstreamPartitionRouter(PartitionRouter):
             yield from []
         else:
             for parent_stream_config in self.parent_stream_configs:
+                # Resumable full refresh parents read one page per slice so they are read the usual way as they only have one slice
+                if parent_stream_config.max_concurrent_slices > 1 and not isinstance(
+                    parent_stream_config.stream.get_cursor(), ResumableFullRefreshCursor
+                ):
+                    yield from self._concurrent_stream_slices(parent_stream_config)
+                    continue
+
                 parent_stream = parent_stream_config.stream
                 parent_field = parent_stream_config.parent_key.eval(self.config)  # type: ignore # parent_key is always casted to an interpolated string
                 partition_field = parent_stream_config.partition_field.eval(self.config)  # type: ignore # partition_field is always casted to an interpolated string
@@ -140,57 +160,35 @@ class SubstreamPartitionRouter(PartitionRouter):
                 # read_stateless() assumes the parent is not concurrent. This is currently okay since the concurrent CDK does
                 # not support either substreams or RFR, but something that needs to be considered once we do
                 for parent_record in parent_stream.read_only_records():
-                    parent_partition = None
-                    parent_associated_slice = None
-                    # Skip non-records (eg AirbyteLogMessage)
-                    if isinstance(parent_record, AirbyteMessage):
-                        self.logger.warning(
-                            f"Parent stream {parent_stream.name} returns records of type AirbyteMessage. This SubstreamPartitionRouter is not able to checkpoint incremental parent state."
-                        )
-                        if parent_record.type == MessageType.RECORD:
-                            parent_record = parent_record.record.data
-                        else:
-                            continue
-                    elif isinstance(parent_record, Record):
-                        parent_partition = parent_record.associated_slice.partition if parent_record.associated_slice else {}
-                        parent_associated_slice = parent_record.associated_slice
-                        parent_record = parent_record.data
-                    elif not isinstance(parent_record, Mapping):
-                        # The parent_record should only take the form of a Record, AirbyteMessage, or Mapping. Anything else is invalid
-                        raise AirbyteTracedException(message=f"Parent stream returned records as invalid type {type(parent_record)}")
-                    try:
-                        partition_value = dpath.get(parent_record, parent_field)
-                    except KeyError:
-                        pass
-                    else:
-                        if incremental_dependency:
-                            if previous_associated_slice is None:
-                                previous_associated_slice = parent_associated_slice
-                            elif previous_associated_slice != parent_associated_slice:
-                                # Update the parent state, as parent stream read all record for current slice and state
-                                # is already updated.
-                                #
-                                # When the associated slice of the current record of the parent stream changes, this
-                                # indicates the parent stream has finished processing the current slice and has moved onto
-                                # the next. When this happens, we should update the partition router's current state and
-                                # flush the previous set of collected records and start a new set
-                                #
-                                # Note: One tricky aspect to take note of here is that parent_stream.state will actually
-                                # fetch state of the stream of the previous record's slice NOT the current record's slice.
-                                # This is because in the retriever, we only update stream state after yielding all the
-                                # records. And since we are in the middle of the current slice, parent_stream.state is
-                                # still set to the previous state.
-                                self._parent_state[parent_stream.name] = parent_stream.state
-                                yield from stream_slices_for_parent
-
-                                # Reset stream_slices_for_parent after we've flushed parent records for the previous parent slice
-                                stream_slices_for_parent = []
-                                previous_associated_slice = parent_associated_slice
-                        stream_slices_for_parent.append(
-                            StreamSlice(
-                                partition={partition_field: partition_value, "parent_slice": parent_partition or {}}, cursor_slice={}
-                            )
-                        )
+                    stream_slice, parent_associated_slice = self._to_stream_slice(
+                        parent_stream.name, parent_record, parent_field, partition_field
+                    )
+                    if stream_slice is None:
+                        continue
+                    if incremental_dependency:
+                        if previous_associated_slice is None:
+                            previous_associated_slice = parent_associated_slice
+                        elif previous_associated_slice != parent_associated_slice:
+                            # Update the parent state, as parent stream read all record for current slice and state
+                            # is already updated.
+                            #
+                            # When the associated slice of the current record of the parent stream changes, this
+                            # indicates the parent stream has finished processing the current slice and has moved onto
+                            # the next. When this happens, we should update the partition router's current state and
+                            # flush the previous set of collected records and start a new set
+                            #
+                            # Note: One tricky aspect to take note of here is that parent_stream.state will actually
+                            # fetch state of the stream of the previous record's slice NOT the current record's slice.
+                            # This is because in the retriever, we only update stream state after yielding all the
+                            # records. And since we are in the middle of the current slice, parent_stream.state is
+                            # still set to the previous state.
+                            self._parent_state[parent_stream.name] = parent_stream.state
+                            yield from stream_slices_for_parent
+
+                            # Reset stream_slices_for_parent after we've flushed parent records for the previous parent slice
+                            stream_slices_for_parent = []
+                            previous_associated_slice = parent_associated_slice
+                    stream_slices_for_parent.append(stream_slice)
 
                 # A final parent state update and yield of records is needed, so we don't skip records for the final parent slice
                 if incremental_dependency:
@@ -198,6 +196,127 @@ class SubstreamPartitionRouter(PartitionRouter):
 
                 yield from stream_slices_for_parent
 
+    def _to_stream_slice(
+        self, parent_stream_name: str, parent_record: StreamData, parent_field: str, partition_field: str
+    ) -> Tuple[Optional[StreamSlice], Optional[StreamSlice]]:
+        """
+        Create the stream slice for a parent record. Returns the slice, which is None if the record doesn't have a parent key value, and
+        the parent slice the record was read from if it is known.
+        """
+        parent_partition = None
+        parent_associated_slice = None
+        # Skip non-records (eg AirbyteLogMessage)
+        if isinstance(parent_record, AirbyteMessage):
+            self.logger.warning(
+                f"Parent stream {parent_stream_name} returns records of type AirbyteMessage. This SubstreamPartitionRouter is not able to checkpoint incremental parent state."
+            )
+            if parent_record.type == MessageType.RECORD:
+                parent_record = parent_record.record.data  # type: ignore # record is always set for a message of type RECORD
+            else:
+                return None, None
+        elif isinstance(parent_record, Record):
+            parent_partition = parent_record.associated_slice.partition if parent_record.associated_slice else {}
+            parent_associated_slice = parent_record.associated_slice
+            parent_record = parent_record.data
+        elif not isinstance(parent_record, Mapping):
+            # The parent_record should only take the form of a Record, AirbyteMessage, or Mapping. Anything else is invalid
+            raise AirbyteTracedException(message=f"Parent stream returned records as invalid type {type(parent_record)}")
+        try:
+            partition_value = dpath.get(parent_record, parent_field)
+        except KeyError:
+            return None, parent_associated_slice
+        return (
+            StreamSlice(partition={partition_field: partition_value, "parent_slice": parent_partition or {}}, cursor_slice={}),
+            parent_associated_slice,
+        )
+
+    def _concurrent_stream_slices(self, parent_stream_config: ParentStreamConfig) -> Iterable[StreamSlice]:
+        """
+        Read the slices of the parent stream in a pool of `max_concurrent_slices` threads and emit the stream slices created from the
+        records of a parent slice as soon as this parent slice has been read, regardless of the order of the parent slices.
+
+        Each thread reads with its own instance of the parent stream as its components (paginator, requester, ...) hold the state of the
+        request being made. The parent stream given in the config only generates the parent slices and keeps the parent state.
+
+        With incremental_dependency, the parent state must not move past a parent slice which has not been read. Hence, the records of a
+        parent slice are only observed by the parent cursor once all the parent slices before it have been read. This means that the
+        records of up to twice `max_concurrent_slices` parent slices are held in memory.
+        """
+        parent_stream = parent_stream_config.stream
+        parent_field = parent_stream_config.parent_key.eval(self.config)  # type: ignore # parent_key is always casted to an interpolated string
+        partition_field = parent_stream_config.partition_field.eval(self.config)  # type: ignore # partition_field is always casted to an interpolated string
+        incremental_dependency = parent_stream_config.incremental_dependency
+        max_concurrent_slices = parent_stream_config.max_concurrent_slices
+        max_unobserved_slices = 2 * max_concurrent_slices if incremental_dependency else max_concurrent_slices
+
+        parent_cursor = parent_stream.get_cursor()
+        initial_parent_state = dict(parent_stream.state)
+        # Parent stream instances that are not in use by a thread
+        idle_parent_streams: Queue["DeclarativeStream"] = Queue()
+
+        def read_parent_slice(parent_slice: StreamSlice) -> List[StreamData]:
+            try:
+                reader_stream = idle_parent_streams.get_nowait()
+            except Empty:
+                reader_stream = parent_stream_config.stream_factory()  # type: ignore # stream_factory is validated in ParentStreamConfig
+                reader_stream.state = initial_parent_state
+            try:
+                return list(reader_stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=parent_slice))
+            finally:
+                idle_parent_streams.put(reader_stream)
+
+        parent_slices = iter(parent_stream.stream_slices(sync_mode=SyncMode.full_refresh))
+        futures: Dict[Future[List[StreamData]], Tuple[int, StreamSlice]] = {}
+        read_parent_slices: Dict[int, Tuple[StreamSlice, List[StreamData]]] = {}
+        next_parent_slice_index = 0
+        next_parent_slice_to_observe = 0
+        has_more_parent_slices = True
+        executor = ThreadPoolExecutor(max_workers=max_concurrent_slices, thread_name_prefix=f"{parent_stream.name}_parent_slice_reader")
+        try:
+            while futures or has_more_parent_slices:
+                while has_more_parent_slices and next_parent_slice_index - next_parent_slice_to_observe < max_unobserved_slices:
+                    parent_slice = next(parent_slices, None)
+                    if parent_slice is None:
+                        has_more_parent_slices = False
+                        break
+                    futures[executor.submit(read_parent_slice, parent_slice)] = (next_parent_slice_index, parent_slice)
+                    next_parent_slice_index += 1
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, parent_slice = futures.pop(future)
+                    parent_records = future.result()
+                    if incremental_dependency:
+                        read_parent_slices[index] = (parent_slice, parent_records)
+                        while next_parent_slice_to_observe in read_parent_slices:
+                            self._observe_parent_slice(parent_cursor, *read_parent_slices.pop(next_parent_slice_to_observe))
+                            next_parent_slice_to_observe += 1
+                        self._parent_state[parent_stream.name] = parent_stream.state
+                    else:
+                        next_parent_slice_to_observe += 1
+
+                    for parent_record in parent_records:
+                        stream_slice, _ = self._to_stream_slice(parent_stream.name, parent_record, parent_field, partition_field)
+                        if stream_slice is not None:
+                            yield stream_slice
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _observe_parent_slice(parent_cursor: Optional[Cursor], parent_slice: StreamSlice, parent_records: List[StreamData]) -> None:
+        """
+        Update the parent cursor the same way the retriever would have if it had read the parent slice
+        """
+        if not parent_cursor:
+            return
+        most_recent_record = None
+        for parent_record in parent_records:
+            if isinstance(parent_record, Record):
+                parent_cursor.observe(parent_slice, parent_record)
+                if not most_recent_record or not parent_cursor.is_greater_than_or_equal(most_recent_record, parent_record):
+                    most_recent_record = parent_record
+        parent_cursor.close_slice(parent_slice, most_recent_record)
+
     def set_initial_state(self, stream_state: StreamState) -> None:
         """
         Set the state of the parent streams.
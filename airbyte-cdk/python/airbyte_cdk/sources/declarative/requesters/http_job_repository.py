@@ -0,0 +1,108 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import uuid
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import requests
+from airbyte_cdk.models import FailureType
+from airbyte_cdk.sources.declarative.async_job.job import AsyncJob
+from airbyte_cdk.sources.declarative.async_job.repository import AsyncJobRepository
+from airbyte_cdk.sources.declarative.async_job.status import AsyncJobStatus
+from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
+from airbyte_cdk.sources.declarative.requesters.requester import Requester
+from airbyte_cdk.sources.types import StreamSlice
+from airbyte_cdk.utils.traced_exception import AirbyteTracedException
+
+
+@dataclass
+class AsyncHttpJobRepository(AsyncJobRepository):
+    """
+    Job repository for APIs exposing jobs through HTTP endpoints.
+
+    * The creation requester creates a job for a slice. The slice is available for interpolation as `stream_slice`.
+    * The polling requester gets the status of a job. The JSON body of the creation response is available for interpolation as
+      `stream_slice['create_job_response']`. The status extractor extracts the status from the polling response and the status mapping
+      maps it to an `AsyncJobStatus`.
+    * Once a job is completed, the urls extractor extracts the URLs of the results from the polling response. The download requester
+      downloads each URL, available for interpolation as `stream_slice['url']`.
+    * The optional abort and delete requesters cancel a running job and clean up a job that failed or whose results were downloaded. Like
+      the polling requester, they can interpolate `stream_slice['create_job_response']`.
+
+    Attributes:
+        creation_requester (Requester): Requester creating a job
+        polling_requester (Requester): Requester getting the status of a job
+        download_requester (Requester): Requester downloading the results of a job
+        status_extractor (RecordExtractor): Extractor of the job status from the polling response
+        status_mapping (Mapping[str, AsyncJobStatus]): Mapping from the statuses of the API to job statuses
+        urls_extractor (RecordExtractor): Extractor of the result URLs from the polling response
+        abort_requester (Optional[Requester]): Requester cancelling a job
+        delete_requester (Optional[Requester]): Requester deleting a job
+        job_timeout (Optional[timedelta]): Duration after which a running job is considered as timed out
+    """
+
+    creation_requester: Requester
+    polling_requester: Requester
+    download_requester: Requester
+    status_extractor: RecordExtractor
+    status_mapping: Mapping[str, AsyncJobStatus]
+    urls_extractor: RecordExtractor
+    abort_requester: Optional[Requester] = None
+    delete_requester: Optional[Requester] = None
+    job_timeout: Optional[timedelta] = None
+    _create_job_response_by_id: Dict[str, Mapping[str, Any]] = field(init=False, repr=False, default_factory=dict)
+    _urls_by_id: Dict[str, List[str]] = field(init=False, repr=False, default_factory=dict)
+
+    def start(self, stream_slice: StreamSlice) -> AsyncJob:
+        response = self.creation_requester.send_request(stream_slice=stream_slice)
+        if response is None:
+            raise AirbyteTracedException(
+                internal_message=f"Could not create a job for slice {stream_slice}: the creation request did not return a response",
+                failure_type=FailureType.system_error,
+            )
+        job_id = str(uuid.uuid4())
+        self._create_job_response_by_id[job_id] = response.json()
+        return AsyncJob(api_job_id=job_id, job_parameters=stream_slice, timeout=self.job_timeout)
+
+    def update_jobs_status(self, jobs: Iterable[AsyncJob]) -> None:
+        for job in jobs:
+            response = self._send_job_request(self.polling_requester, job)
+            if response is None:
+                continue
+            status = self._get_status(response)
+            if status == AsyncJobStatus.COMPLETED:
+                self._urls_by_id[job.api_job_id()] = [str(url) for url in self.urls_extractor.extract_records(response)]
+            job.update_status(status)
+
+    def fetch_results(self, job: AsyncJob) -> Iterable[requests.Response]:
+        for url in self._urls_by_id.get(job.api_job_id(), []):
+            response = self.download_requester.send_request(stream_slice=StreamSlice(partition={"url": url}, cursor_slice={}))
+            if response is not None:
+                yield response
+
+    def abort(self, job: AsyncJob) -> None:
+        if self.abort_requester:
+            self._send_job_request(self.abort_requester, job)
+        self._clean(job)
+
+    def delete(self, job: AsyncJob) -> None:
+        if self.delete_requester:
+            self._send_job_request(self.delete_requester, job)
+        self._clean(job)
+
+    def _send_job_request(self, requester: Requester, job: AsyncJob) -> Optional[requests.Response]:
+        create_job_response = self._create_job_response_by_id[job.api_job_id()]
+        return requester.send_request(stream_slice=StreamSlice(partition={"create_job_response": create_job_response}, cursor_slice={}))
+
+    def _get_status(self, response: requests.Response) -> AsyncJobStatus:
+        api_status = next(iter(self.status_extractor.extract_records(response)), None)
+        if api_status not in self.status_mapping:
+            raise ValueError(f"Status {api_status} is not part of the status mapping {list(self.status_mapping.keys())}")
+        return self.status_mapping[api_status]  # type: ignore  # the status was checked to be part of the mapping
+
+    def _clean(self, job: AsyncJob) -> None:
+        self._create_job_response_by_id.pop(job.api_job_id(), None)
+        self._urls_by_id.pop(job.api_job_id(), None)
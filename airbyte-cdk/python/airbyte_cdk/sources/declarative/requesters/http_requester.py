@@ -40,6 +40,7 @@ class HttpRequester(Requester):
         backoff_strategies (Optional[List[BackoffStrategy]]): List of backoff strategies to use when retrying requests
         config (Config): The user-provided configuration as specified by the source's spec
         use_cache (bool): Indicates that data should be cached for this stream
+        use_persistent_cache (bool): Indicates that responses should be cached across syncs and revalidated using conditional requests
     """
 
     name: str
@@ -54,6 +55,7 @@ class HttpRequester(Requester):
     disable_retries: bool = False
     message_repository: MessageRepository = NoopMessageRepository()
     use_cache: bool = False
+    use_persistent_cache: bool = False
     _exit_on_rate_limit: bool = False
     stream_response: bool = False
     decoder: Decoder = field(default_factory=lambda: JsonDecoder(parameters={}))
@@ -86,6 +88,7 @@ class HttpRequester(Requester):
             backoff_strategy=backoff_strategies,
             disable_retries=self.disable_retries,
             message_repository=self.message_repository,
+            use_persistent_cache=self.use_persistent_cache,
         )
 
     @property
@@ -19,6 +19,7 @@ class HttpMethod(Enum):
 
     GET = "GET"
     POST = "POST"
+    DELETE = "DELETE"
 
 
 class Requester(RequestOptionsProvider):
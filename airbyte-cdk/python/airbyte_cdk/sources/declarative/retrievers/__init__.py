@@ -2,7 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from airbyte_cdk.sources.declarative.retrievers.async_retriever import AsyncRetriever
 from airbyte_cdk.sources.declarative.retrievers.retriever import Retriever
 from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever, SimpleRetrieverTestReadDecorator
 
-__all__ = ["Retriever", "SimpleRetriever", "SimpleRetrieverTestReadDecorator"]
+__all__ = ["AsyncRetriever", "Retriever", "SimpleRetriever", "SimpleRetrieverTestReadDecorator"]
@@ -0,0 +1,95 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from dataclasses import InitVar, dataclass, field
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+from airbyte_cdk.models import FailureType
+from airbyte_cdk.sources.declarative.async_job.job import AsyncJob
+from airbyte_cdk.sources.declarative.async_job.job_orchestrator import AsyncJobOrchestrator
+from airbyte_cdk.sources.declarative.extractors.http_selector import HttpSelector
+from airbyte_cdk.sources.declarative.partition_routers.single_partition_router import SinglePartitionRouter
+from airbyte_cdk.sources.declarative.retrievers.retriever import Retriever
+from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
+from airbyte_cdk.sources.streams.core import StreamData
+from airbyte_cdk.sources.types import Config, StreamSlice, StreamState
+from airbyte_cdk.utils.traced_exception import AirbyteTracedException
+
+_JOB_FIELD = "job"
+
+
+@dataclass
+class AsyncRetriever(Retriever):
+    """
+    Retrieves records by creating an asynchronous job on the API side for each stream slice and downloading the results of the jobs.
+
+    The jobs are created and polled by an AsyncJobOrchestrator so that many jobs can be running concurrently. The stream slices of the
+    retriever are the slices of the completed jobs, in the order the jobs complete. The results of a job are selected using the record
+    selector, whose extractor decodes them.
+
+    As jobs complete out of order, the retriever does not support incremental syncs: its state is always empty.
+
+    Attributes:
+        config (Config): The user-provided configuration as specified by the source's spec
+        job_orchestrator_factory (Callable[[Iterable[StreamSlice]], AsyncJobOrchestrator]): Creates the orchestrator of the jobs of the slices
+        record_selector (HttpSelector): The record selector
+        stream_slicer (StreamSlicer): The stream slicer
+        parameters (Mapping[str, Any]): Additional runtime parameters to be used for string interpolation
+    """
+
+    config: Config
+    parameters: InitVar[Mapping[str, Any]]
+    job_orchestrator_factory: Callable[[Iterable[StreamSlice]], AsyncJobOrchestrator]
+    record_selector: HttpSelector
+    stream_slicer: StreamSlicer = field(default_factory=lambda: SinglePartitionRouter(parameters={}))
+
+    def __post_init__(self, parameters: Mapping[str, Any]) -> None:
+        self._job_orchestrator: Optional[AsyncJobOrchestrator] = None
+        self._parameters = parameters
+
+    @property
+    def state(self) -> StreamState:
+        return {}
+
+    @state.setter
+    def state(self, value: StreamState) -> None:
+        """The retriever does not support incremental syncs so the state is ignored"""
+
+    def stream_slices(self) -> Iterable[Optional[StreamSlice]]:
+        self._job_orchestrator = self.job_orchestrator_factory(self.stream_slicer.stream_slices())
+        for completed_job in self._job_orchestrator.create_and_get_completed_jobs():
+            job_parameters = completed_job.job_parameters()
+            yield StreamSlice(
+                partition=job_parameters.partition,
+                cursor_slice=job_parameters.cursor_slice,
+                extra_fields={_JOB_FIELD: completed_job},
+            )
+
+    def read_records(
+        self,
+        records_schema: Mapping[str, Any],
+        stream_slice: Optional[StreamSlice] = None,
+    ) -> Iterable[StreamData]:
+        job = self._get_job(stream_slice)
+        for response in self._job_orchestrator.fetch_results(job):  # type: ignore  # _get_job validates that the orchestrator exists
+            try:
+                yield from self.record_selector.select_records(
+                    response=response,
+                    stream_state={},
+                    records_schema=records_schema,
+                    stream_slice=stream_slice,
+                )
+            finally:
+                # The results can be streamed so the connection is released once the records were read
+                response.close()
+
+    def _get_job(self, stream_slice: Optional[StreamSlice]) -> AsyncJob:
+        job = stream_slice.extra_fields.get(_JOB_FIELD) if stream_slice else None
+        if self._job_orchestrator is None or not isinstance(job, AsyncJob):
+            raise AirbyteTracedException(
+                message="Invalid arguments to AsyncRetriever.read_records: stream_slice is not a slice of a completed job",
+                internal_message=f"AsyncRetriever.read_records can only read the slices returned by AsyncRetriever.stream_slices. Got {stream_slice}",
+                failure_type=FailureType.system_error,
+            )
+        return job
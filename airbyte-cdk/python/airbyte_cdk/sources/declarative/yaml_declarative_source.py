@@ -2,8 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
+import os
 import pkgutil
-from typing import Any
+from typing import Any, Mapping, Optional
 
 import yaml
 from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
@@ -11,7 +13,12 @@ from airbyte_cdk.sources.types import ConnectionDefinition
 
 
 class YamlDeclarativeSource(ManifestDeclarativeSource):
-    """Declarative source defined by a yaml file"""
+    """
+    Declarative source defined by a yaml file
+
+    If the compiled manifest created by `python -m airbyte_cdk.sources.declarative.compile_manifest <path_to_yaml>` is packaged next to
+    the yaml file, the manifest is not processed and validated again on startup.
+    """
 
     def __init__(self, path_to_yaml: str, debug: bool = False) -> None:
         """
@@ -19,7 +26,7 @@ class YamlDeclarativeSource(ManifestDeclarativeSource):
         """
         self._path_to_yaml = path_to_yaml
         source_config = self._read_and_parse_yaml_file(path_to_yaml)
-        super().__init__(source_config, debug)
+        super().__init__(source_config, debug, compiled_manifest=self._read_compiled_manifest(path_to_yaml))
 
     def _read_and_parse_yaml_file(self, path_to_yaml_file: str) -> ConnectionDefinition:
         package = self.__class__.__module__.split(".")[0]
@@ -31,6 +38,22 @@ class YamlDeclarativeSource(ManifestDeclarativeSource):
         else:
             return {}
 
+    def _read_compiled_manifest(self, path_to_yaml_file: str) -> Optional[Mapping[str, Any]]:
+        package = self.__class__.__module__.split(".")[0]
+
+        try:
+            compiled_manifest = pkgutil.get_data(package, self.compiled_manifest_path(path_to_yaml_file))
+        except OSError:
+            return None
+        return json.loads(compiled_manifest) if compiled_manifest else None
+
+    @staticmethod
+    def compiled_manifest_path(path_to_yaml_file: str) -> str:
+        """
+        :return: The path of the compiled manifest for the given yaml file, e.g. manifest.compiled.json for manifest.yaml
+        """
+        return f"{os.path.splitext(path_to_yaml_file)[0]}.compiled.json"
+
     def _emit_manifest_debug_message(self, extra_args: dict[str, Any]) -> None:
         extra_args["path_to_yaml"] = self._path_to_yaml
         self.logger.debug("declarative source created from parsed YAML manifest", extra=extra_args)
@@ -28,6 +28,7 @@ class FileBasedSourceError(Enum):
     ERROR_VALIDATING_RECORD = "One or more records do not pass the schema validation policy. Please modify your input schema, or select a more lenient validation policy."
     ERROR_PARSING_RECORD_MISMATCHED_COLUMNS = "A header field has resolved to `None`. This indicates that the CSV has more rows than the number of header fields. If you input your schema or headers, please verify that the number of columns corresponds to the number of columns in your CSV's rows."
     ERROR_PARSING_RECORD_MISMATCHED_ROWS = "A row's value has resolved to `None`. This indicates that the CSV has more columns in the header field than the number of columns in the row(s). If you input your schema or headers, please verify that the number of columns corresponds to the number of columns in your CSV's rows."
+    ERROR_PARSING_RECORD_TOO_LARGE_MULTILINE_JSON_OBJECT = "Error parsing record. The file is using multiline JSON and a record is larger than the maximum size allowed. This is most likely because a line of the file is not valid JSON."
     STOP_SYNC_PER_SCHEMA_VALIDATION_POLICY = (
         "Stopping sync in accordance with the configured validation policy. Records in file did not conform to the schema."
     )
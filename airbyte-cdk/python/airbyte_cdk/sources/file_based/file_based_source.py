@@ -54,6 +54,8 @@ INITIAL_N_PARTITIONS = MAX_CONCURRENCY // 2
 class FileBasedSource(ConcurrentSourceAdapter, ABC):
     # We make each source override the concurrency level to give control over when they are upgraded.
     _concurrency_level = None
+    # Parsing files is CPU-bound. Sources can set a number of processes to read the partitions of concurrent streams in other processes.
+    _partition_processes = 0
 
     def __init__(
         self,
@@ -83,7 +85,12 @@ class FileBasedSource(ConcurrentSourceAdapter, ABC):
         self.errors_collector: FileBasedErrorsCollector = FileBasedErrorsCollector()
         self._message_repository: Optional[MessageRepository] = None
         concurrent_source = ConcurrentSource.create(
-            MAX_CONCURRENCY, INITIAL_N_PARTITIONS, self.logger, self._slice_logger, self.message_repository
+            MAX_CONCURRENCY,
+            INITIAL_N_PARTITIONS,
+            self.logger,
+            self._slice_logger,
+            self.message_repository,
+            num_partition_processes=self._partition_processes,
         )
         self._state = None
         super().__init__(concurrent_source)
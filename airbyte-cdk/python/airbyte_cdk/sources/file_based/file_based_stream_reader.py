@@ -2,7 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import io
 import logging
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
@@ -10,6 +12,7 @@ from io import IOBase
 from typing import Iterable, List, Optional, Set
 
 from airbyte_cdk.sources.file_based.config.abstract_file_based_spec import AbstractFileBasedSpec
+from airbyte_cdk.sources.file_based.file_prefetcher import FilePrefetcher
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from wcmatch.glob import GLOBSTAR, globmatch
 
@@ -21,6 +24,13 @@ class FileReadMode(Enum):
 
 class AbstractFileBasedStreamReader(ABC):
     DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+    PREFETCH_BLOCK_SIZE = FilePrefetcher.DEFAULT_BLOCK_SIZE
+    PREFETCH_MAX_BLOCKS_AHEAD = FilePrefetcher.DEFAULT_MAX_BLOCKS_AHEAD
+    PREFETCH_MAX_CONCURRENT_REQUESTS = FilePrefetcher.DEFAULT_MAX_CONCURRENT_REQUESTS
+
+    # Created on first use. Its threads are only started once a range is requested, which readers not supporting range reads never do
+    _file_prefetcher: Optional[FilePrefetcher] = None
+    _file_prefetcher_lock = threading.Lock()
 
     def __init__(self) -> None:
         self._config = None
@@ -56,6 +66,82 @@ class AbstractFileBasedStreamReader(ABC):
         """
         ...
 
+    def open_file_sample(
+        self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger, max_bytes: int
+    ) -> IOBase:
+        """
+        Return a file handle to read the beginning of the file for schema inference. Parsers stop reading after roughly `max_bytes`
+        bytes so the rest of the file does not need to be fetched.
+
+        By default, this opens the file using `open_file` which is enough for readers streaming the content of the file (for example
+        using smart_open). Readers downloading the whole file in `open_file` should override this method to only request the first
+        `max_bytes` bytes (for example using a HTTP Range header) and can use `file_sample_from_prefix` to build the file handle.
+        """
+        return self.open_file(file, mode, encoding, logger)
+
+    @staticmethod
+    def file_sample_from_prefix(prefix: bytes, is_whole_file: bool, mode: FileReadMode, encoding: Optional[str]) -> IOBase:
+        """
+        Build a file handle from the first bytes of a file. Unless the prefix is the whole file, what follows the last line break is
+        dropped so that parsers don't read a truncated record. Note that records spanning many lines (for example a CSV value with line
+        breaks) can still be truncated.
+        """
+        if not is_whole_file:
+            prefix = prefix[: prefix.rfind(b"\n") + 1]
+        if mode == FileReadMode.READ_BINARY:
+            return io.BytesIO(prefix)
+        return io.StringIO(prefix.decode(encoding or "utf-8", errors="replace"), newline="")
+
+    def read_file_range(self, file: RemoteFile, start: int, end: int, logger: logging.Logger) -> bytes:
+        """
+        Return the bytes of the file from `start` (inclusive) to `end` (exclusive), for example using a HTTP Range header. Readers
+        implementing this method and `get_file_size` can use `open_file_with_prefetching` in `open_file`.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support reading ranges of files")
+
+    def get_file_size(self, file: RemoteFile, logger: logging.Logger) -> int:
+        """
+        Return the size of the file in bytes.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support reading ranges of files")
+
+    def open_file_with_prefetching(self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger) -> IOBase:
+        """
+        Return a file handle downloading the file with concurrent `read_file_range` requests issued ahead of the parser so that the
+        latency of the remote storage is not paid sequentially. It only applies to files read as-is: compressed files need to be
+        decompressed by the reader first.
+
+        The number and size of the blocks downloaded in advance are configured by the `PREFETCH_*` class attributes.
+        """
+        raw_file = self._get_file_prefetcher(logger).open(file)
+        binary_file = io.BufferedReader(raw_file, buffer_size=io.DEFAULT_BUFFER_SIZE)
+        if mode == FileReadMode.READ_BINARY:
+            return binary_file
+        return io.TextIOWrapper(binary_file, encoding=encoding)
+
+    def prefetch_file(self, file: RemoteFile, logger: logging.Logger, after: Optional[RemoteFile] = None) -> None:
+        """
+        Hint that the file will be opened soon, right after `after` if it is set. If the reader opens files using
+        `open_file_with_prefetching`, the beginning of the file is downloaded in the background once `after` is opened, or immediately if
+        `after` is not set. Else, this does nothing.
+        """
+        if after is not None:
+            self._get_file_prefetcher(logger).prefetch(file, after=after)
+        elif self._file_prefetcher:
+            self._file_prefetcher.prefetch(file)
+
+    def _get_file_prefetcher(self, logger: logging.Logger) -> FilePrefetcher:
+        with self._file_prefetcher_lock:
+            if not self._file_prefetcher:
+                self._file_prefetcher = FilePrefetcher(
+                    lambda file, start, end: self.read_file_range(file, start, end, logger),
+                    lambda file: self.get_file_size(file, logger),
+                    block_size=self.PREFETCH_BLOCK_SIZE,
+                    max_blocks_ahead=self.PREFETCH_MAX_BLOCKS_AHEAD,
+                    max_concurrent_requests=self.PREFETCH_MAX_CONCURRENT_REQUESTS,
+                )
+            return self._file_prefetcher
+
     @abstractmethod
     def get_matching_files(
         self,
@@ -0,0 +1,195 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+ReadRange = Callable[[RemoteFile, int, int], bytes]
+GetSize = Callable[[RemoteFile], int]
+
+
+class FilePrefetcher:
+    """
+    Reads files with concurrent byte-range requests issued ahead of the consumer instead of a single sequential stream.
+
+    Each opened file keeps up to `max_blocks_ahead` blocks of `block_size` bytes being downloaded or waiting to be consumed. Files can also
+    be prefetched before they are opened so that the next file of a slice is downloaded while the current one is parsed. At most
+    `max_prefetched_files` files are prefetched at the same time; the oldest prefetched file is dropped when another one is prefetched.
+    To avoid dropping a prefetched file before it is opened, the next file can be prefetched only once the current one is opened.
+    Hence, the memory used is bounded by `block_size * max_blocks_ahead * (number of opened files + max_prefetched_files)`.
+    """
+
+    DEFAULT_BLOCK_SIZE = 8 * 1024 * 1024
+    DEFAULT_MAX_BLOCKS_AHEAD = 4
+    DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+    DEFAULT_MAX_PREFETCHED_FILES = 1
+
+    def __init__(
+        self,
+        read_range: ReadRange,
+        get_size: GetSize,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_blocks_ahead: int = DEFAULT_MAX_BLOCKS_AHEAD,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        max_prefetched_files: int = DEFAULT_MAX_PREFETCHED_FILES,
+    ) -> None:
+        """
+        :param read_range: Returns the bytes of a file from a start offset (inclusive) to an end offset (exclusive)
+        :param get_size: Returns the size of a file in bytes
+        :param block_size: The size of each range request
+        :param max_blocks_ahead: The maximum number of blocks downloaded ahead of the consumer for each file
+        :param max_concurrent_requests: The maximum number of range requests running at the same time across all files
+        :param max_prefetched_files: The maximum number of files prefetched before being opened
+        """
+        if block_size < 1 or max_blocks_ahead < 1:
+            raise ValueError("The block size and the number of blocks read ahead need to be positive")
+        self._read_range = read_range
+        self._get_size = get_size
+        self._block_size = block_size
+        self._max_blocks_ahead = max_blocks_ahead
+        self._max_prefetched_files = max_prefetched_files
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent_requests, thread_name_prefix="file_prefetcher")
+        self._prefetched_files: "OrderedDict[str, _PrefetchingFile]" = OrderedDict()
+        self._files_to_prefetch_on_open: "OrderedDict[str, RemoteFile]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def prefetch(self, file: RemoteFile, after: Optional[RemoteFile] = None) -> None:
+        """
+        Start downloading the beginning of the file so that it is available once the file is opened.
+
+        :param after: If set, the download only starts once this file is opened. Prefetching the next file before the current one is
+            opened would drop the current one if it was prefetched too.
+        """
+        if self._max_prefetched_files < 1:
+            return
+        with self._lock:
+            if after is not None:
+                self._files_to_prefetch_on_open[after.uri] = file
+                while len(self._files_to_prefetch_on_open) > self._max_prefetched_files:
+                    self._files_to_prefetch_on_open.popitem(last=False)
+                return
+            if file.uri in self._prefetched_files:
+                return
+            self._prefetched_files[file.uri] = self._create_file(file)
+            while len(self._prefetched_files) > self._max_prefetched_files:
+                _, dropped_file = self._prefetched_files.popitem(last=False)
+                dropped_file.close()
+
+    def open(self, file: RemoteFile) -> io.RawIOBase:
+        """
+        :return: A seekable raw binary file object. It can be wrapped in an io.BufferedReader and io.TextIOWrapper like any raw stream.
+        """
+        with self._lock:
+            prefetched_file = self._prefetched_files.pop(file.uri, None)
+            file_to_prefetch = self._files_to_prefetch_on_open.pop(file.uri, None)
+        opened_file = prefetched_file if prefetched_file else self._create_file(file)
+        if file_to_prefetch:
+            self.prefetch(file_to_prefetch)
+        return opened_file
+
+    def _create_file(self, file: RemoteFile) -> "_PrefetchingFile":
+        return _PrefetchingFile(
+            self._executor,
+            lambda start, end: self._read_range(file, start, end),
+            self._executor.submit(self._get_size, file),
+            self._block_size,
+            self._max_blocks_ahead,
+        )
+
+
+class _PrefetchingFile(io.RawIOBase):
+    def __init__(
+        self,
+        executor: ThreadPoolExecutor,
+        read_range: Callable[[int, int], bytes],
+        size: "Future[int]",
+        block_size: int,
+        max_blocks_ahead: int,
+    ) -> None:
+        super().__init__()
+        self._executor = executor
+        self._read_range = read_range
+        self._size = size
+        self._block_size = block_size
+        self._max_blocks_ahead = max_blocks_ahead
+        self._blocks: Dict[int, "Future[bytes]"] = {}
+        self._position = 0
+        # Blocks are scheduled both by the consumer and by the thread getting the size of the file
+        self._blocks_lock = threading.Lock()
+        self._size.add_done_callback(self._on_size_known)
+
+    def _on_size_known(self, size: "Future[int]") -> None:
+        if not size.exception() and size.result() > 0 and not self.closed:
+            try:
+                self._schedule_blocks(0)
+            except ValueError:
+                # The file was closed while its size was being fetched
+                pass
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size.result() + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer: Any) -> int:
+        size = self._size.result()
+        if self._position >= size:
+            return 0
+
+        block_index, offset_in_block = divmod(self._position, self._block_size)
+        block = self._schedule_blocks(block_index).result()
+        length = min(len(buffer), len(block) - offset_in_block)
+        buffer[:length] = memoryview(block)[offset_in_block : offset_in_block + length]
+        self._position += length
+        return length
+
+    def close(self) -> None:
+        super().close()
+        with self._blocks_lock:
+            for block in self._blocks.values():
+                block.cancel()
+            self._blocks.clear()
+
+    def _schedule_blocks(self, first_block_index: int) -> "Future[bytes]":
+        """
+        Drop the blocks that are not in the window starting at `first_block_index` and request the missing ones
+        :return: The first block of the window
+        """
+        size = self._size.result()
+        number_of_blocks = -(-size // self._block_size)
+        window = range(first_block_index, min(first_block_index + self._max_blocks_ahead, number_of_blocks))
+        with self._blocks_lock:
+            for block_index in list(self._blocks.keys()):
+                if block_index not in window:
+                    self._blocks.pop(block_index).cancel()
+            if self.closed:
+                raise ValueError("I/O operation on closed file")
+            for block_index in window:
+                if block_index not in self._blocks:
+                    start = block_index * self._block_size
+                    self._blocks[block_index] = self._executor.submit(self._read_range, start, min(start + self._block_size, size))
+            return self._blocks[first_block_index]
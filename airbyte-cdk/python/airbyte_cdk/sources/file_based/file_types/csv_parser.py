@@ -3,6 +3,8 @@
 #
 
 import csv
+import io
+import itertools
 import json
 import logging
 from abc import ABC, abstractmethod
@@ -12,6 +14,8 @@ from io import IOBase
 from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional, Set, Tuple
 from uuid import uuid4
 
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from airbyte_cdk.models import FailureType
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat, CsvHeaderAutogenerated, CsvHeaderUserProvided, InferenceType
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
@@ -33,7 +37,11 @@ class _CsvReader:
         stream_reader: AbstractFileBasedStreamReader,
         logger: logging.Logger,
         file_read_mode: FileReadMode,
+        max_bytes: Optional[int] = None,
     ) -> Generator[Dict[str, Any], None, None]:
+        """
+        :param max_bytes: If set, only a sample of the beginning of the file of about this size is requested from the stream reader
+        """
         config_format = _extract_format(config)
         lineno = 0
 
@@ -51,7 +59,12 @@ class _CsvReader:
             doublequote=config_format.double_quote,
             quoting=csv.QUOTE_MINIMAL,
         )
-        with stream_reader.open_file(file, file_read_mode, config_format.encoding, logger) as fp:
+        file_handle = (
+            stream_reader.open_file_sample(file, file_read_mode, config_format.encoding, logger, max_bytes)
+            if max_bytes
+            else stream_reader.open_file(file, file_read_mode, config_format.encoding, logger)
+        )
+        with file_handle as fp:
             headers = self._get_headers(fp, config_format, dialect_name)
 
             rows_to_skip = (
@@ -128,15 +141,130 @@ class _CsvReader:
             fp.readline()
 
 
+class _ArrowCsvReader:
+    """
+    Reads CSV files in column-oriented batches using the streaming CSV reader of pyarrow instead of a csv.DictReader.
+
+    The file is opened, its header is read and the rows before the data are skipped the same way _CsvReader does. Then, the rest of the
+    file is parsed by pyarrow with all the values read as strings so that they can be cast the same way as the rows read by _CsvReader.
+    pyarrow can't read every file the csv module can (for example, a value larger than the block size or a row with a mismatched number
+    of fields). In this case, an _ArrowCsvReaderError is raised and the caller is expected to read the rest of the file with _CsvReader.
+    """
+
+    DEFAULT_BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE):
+        self._block_size = block_size
+
+    @staticmethod
+    def supports(config_format: CsvFormat) -> bool:
+        # When errors on fields mismatch are ignored, _CsvReader still emits the rows with the mismatched fields
+        return not config_format.ignore_errors_on_fields_mismatch
+
+    def read_batches(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        file_read_mode: FileReadMode,
+    ) -> Generator[Tuple[List[str], List[List[str]]], None, None]:
+        """
+        :return: The headers and the values of each column for each batch of rows
+        """
+        config_format = _extract_format(config)
+        dialect_name = f"{config.name}_{str(uuid4())}_{DIALECT_NAME}"
+        csv.register_dialect(
+            dialect_name,
+            delimiter=config_format.delimiter,
+            quotechar=config_format.quote_char,
+            escapechar=config_format.escape_char,
+            doublequote=config_format.double_quote,
+            quoting=csv.QUOTE_MINIMAL,
+        )
+        try:
+            with stream_reader.open_file(file, file_read_mode, config_format.encoding, logger) as fp:
+                headers = _CsvReader()._get_headers(fp, config_format, dialect_name)
+                _CsvReader._skip_rows(
+                    fp,
+                    config_format.skip_rows_before_header
+                    + (1 if config_format.header_definition.has_header_row() else 0)
+                    + config_format.skip_rows_after_header,
+                )
+                first_chunk = fp.read(self._block_size)
+                if first_chunk.startswith("\ufeff"):
+                    # pyarrow would drop the byte order mark while the csv module considers it as part of the first value
+                    raise _ArrowCsvReaderError("The data starts with a byte order mark")
+
+                try:
+                    reader = pa_csv.open_csv(
+                        _Utf8EncodedTextFile(fp, first_chunk, self._block_size),
+                        read_options=pa_csv.ReadOptions(column_names=headers, block_size=self._block_size, encoding="utf8"),
+                        parse_options=pa_csv.ParseOptions(
+                            delimiter=config_format.delimiter,
+                            quote_char=config_format.quote_char,
+                            double_quote=config_format.double_quote,
+                            escape_char=config_format.escape_char or False,
+                            newlines_in_values=True,
+                        ),
+                        convert_options=pa_csv.ConvertOptions(
+                            column_types={header: pa.string() for header in headers},
+                            null_values=[],
+                            strings_can_be_null=False,
+                            quoted_strings_can_be_null=False,
+                        ),
+                    )
+                    for batch in reader:
+                        # Converting through numpy is much faster than `to_pylist` for string arrays
+                        yield headers, [column.to_numpy(zero_copy_only=False).tolist() for column in batch.columns]
+                except pa.ArrowInvalid as exception:
+                    raise _ArrowCsvReaderError(str(exception)) from exception
+        finally:
+            csv.unregister_dialect(dialect_name)
+
+
+class _ArrowCsvReaderError(Exception):
+    pass
+
+
+class _Utf8EncodedTextFile(io.RawIOBase):
+    """
+    Exposes a file opened in text mode as the utf-8 encoded bytes pyarrow reads. This way, the decoding of the file (encoding, line
+    breaks) is the same as when the file is read by _CsvReader.
+    """
+
+    def __init__(self, text_file: IOBase, first_chunk: str, chunk_size: int):
+        self._text_file = text_file
+        self._chunk_size = chunk_size
+        self._pending = memoryview(first_chunk.encode("utf-8"))
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            text = self._text_file.read(self._chunk_size)
+            if not text:
+                return 0
+            self._pending = memoryview(text.encode("utf-8"))
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
 class CsvParser(FileTypeParser):
     _MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
 
-    def __init__(self, csv_reader: Optional[_CsvReader] = None, csv_field_max_bytes: int = 2**31):
+    def __init__(
+        self, csv_reader: Optional[_CsvReader] = None, csv_field_max_bytes: int = 2**31, arrow_csv_reader: Optional[_ArrowCsvReader] = None
+    ):
         # Increase the maximum length of data that can be parsed in a single CSV field. The default is 128k, which is typically sufficient
         # but given the use of Airbyte in loading a large variety of data it is best to allow for a larger maximum field size to avoid
         # skipping data on load. https://stackoverflow.com/questions/15063936/csv-error-field-larger-than-field-limit-131072
         csv.field_size_limit(csv_field_max_bytes)
         self._csv_reader = csv_reader if csv_reader else _CsvReader()
+        self._arrow_csv_reader = arrow_csv_reader if arrow_csv_reader else _ArrowCsvReader()
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -163,7 +291,9 @@ class CsvParser(FileTypeParser):
             if config_format.inference_type != InferenceType.NONE
             else _DisabledTypeInferrer()
         )
-        data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode)
+        data_generator = self._csv_reader.read_data(
+            config, file, stream_reader, logger, self.file_read_mode, self._MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE
+        )
         read_bytes = 0
         for row in data_generator:
             for header, value in row.items():
@@ -194,6 +324,7 @@ class CsvParser(FileTypeParser):
         discovered_schema: Optional[Mapping[str, SchemaType]],
     ) -> Iterable[Dict[str, Any]]:
         line_no = 0
+        data_generator: Optional[Generator[Any, None, None]] = None
         try:
             config_format = _extract_format(config)
             if discovered_schema:
@@ -201,9 +332,23 @@ class CsvParser(FileTypeParser):
                 deduped_property_types = CsvParser._pre_propcess_property_types(property_types)
             else:
                 deduped_property_types = {}
+            if self._arrow_csv_reader.supports(config_format):
+                is_cast = bool(deduped_property_types) and not config.schemaless
+                data_generator = self._arrow_csv_reader.read_batches(config, file, stream_reader, logger, self.file_read_mode)
+                try:
+                    for headers, columns in data_generator:
+                        for record in CsvParser._batch_to_records(headers, columns, deduped_property_types, config_format, logger, is_cast):
+                            line_no += 1
+                            yield record
+                    return
+                except _ArrowCsvReaderError as exception:
+                    logger.debug(f"Reading the rest of file {file.uri} without pyarrow: {exception}")
+                    data_generator.close()
+
             cast_fn = CsvParser._get_cast_function(deduped_property_types, config_format, logger, config.schemaless)
             data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode)
-            for row in data_generator:
+            # The records already read by pyarrow are skipped
+            for row in itertools.islice(data_generator, line_no, None):
                 line_no += 1
                 yield CsvParser._to_nullable(
                     cast_fn(row), deduped_property_types, config_format.null_values, config_format.strings_can_be_null
@@ -211,7 +356,81 @@ class CsvParser(FileTypeParser):
         except RecordParseError as parse_err:
             raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line_no) from parse_err
         finally:
-            data_generator.close()
+            if data_generator:
+                data_generator.close()
+
+    @staticmethod
+    def _batch_to_records(
+        headers: List[str],
+        columns: List[List[str]],
+        deduped_property_types: Mapping[str, str],
+        config_format: CsvFormat,
+        logger: logging.Logger,
+        is_cast: bool,
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Produces the same records as `_cast_types` and `_to_nullable` would on each row but casts the values column by column.
+        """
+        # Like for a csv.DictReader, the value of a duplicated header is the last one
+        column_index_by_key: Dict[str, int] = {}
+        for index, header in enumerate(headers):
+            column_index_by_key[header] = index
+
+        keys = []
+        output_columns = []
+        warnings_by_row: Dict[int, List[str]] = defaultdict(list)
+        for key, index in column_index_by_key.items():
+            prop_type = deduped_property_types.get(key)
+            values: List[Any] = columns[index]
+            if is_cast:
+                if prop_type not in TYPE_PYTHON_MAPPING or prop_type is None:
+                    # `_cast_types` drops the values that are not in the schema
+                    continue
+                values = CsvParser._cast_column(key, values, prop_type, config_format, warnings_by_row)
+            null_values = config_format.null_values
+            if null_values and (config_format.strings_can_be_null or prop_type != "string"):
+                values = [None if value in null_values else value for value in values]
+            keys.append(key)
+            output_columns.append(values)
+
+        number_of_rows = len(columns[0]) if columns else 0
+        rows = zip(*output_columns) if output_columns else itertools.repeat((), number_of_rows)
+        for row_index, row_values in enumerate(rows):
+            if row_index in warnings_by_row:
+                logger.warning(f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join(warnings_by_row[row_index])}")
+            yield dict(zip(keys, row_values))
+
+    @staticmethod
+    def _cast_column(
+        key: str, values: List[str], prop_type: str, config_format: CsvFormat, warnings_by_row: Dict[int, List[str]]
+    ) -> List[Any]:
+        _, python_type = TYPE_PYTHON_MAPPING[prop_type]
+        cast: Callable[[str], Any]
+        if python_type is None:
+            cast = _value_to_null
+        elif python_type == bool:
+            cast = partial(_value_to_bool, true_values=config_format.true_values, false_values=config_format.false_values)
+        elif python_type == dict:
+            cast = json.loads
+        elif python_type == list:
+            cast = _value_to_list
+        elif python_type == str:
+            return values
+        else:
+            cast = python_type
+
+        try:
+            return list(map(cast, values))
+        except ValueError:
+            # As for `_cast_types`, the values that can't be cast are emitted as strings
+            cast_values: List[Any] = []
+            for row_index, value in enumerate(values):
+                try:
+                    cast_values.append(cast(value))
+                except ValueError:
+                    warnings_by_row[row_index].append(_format_warning(key, value, prop_type))
+                    cast_values.append(value)
+            return cast_values
 
     @property
     def file_read_mode(self) -> FileReadMode:
@@ -431,6 +650,12 @@ def _value_to_bool(value: str, true_values: Set[str], false_values: Set[str]) ->
     raise ValueError(f"Value {value} is not a valid boolean value")
 
 
+def _value_to_null(value: str) -> None:
+    if value == "":
+        return None
+    raise ValueError(f"Value {value} is not a valid null value")
+
+
 def _value_to_list(value: str) -> List[Any]:
     parsed_value = json.loads(value)
     if isinstance(parsed_value, list):
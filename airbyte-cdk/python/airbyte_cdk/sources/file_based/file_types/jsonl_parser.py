@@ -4,7 +4,8 @@
 
 import json
 import logging
-from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import FileBasedSourceError, RecordParseError
@@ -12,11 +13,21 @@ from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFile
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import PYTHON_TYPE_MAPPING, SchemaType, merge_schemas
+from pydantic_core import from_json
+
+_JSON_STRUCTURAL_CHARACTERS = re.compile(r'[\[\]{}"\\]')
+_JSON_STRUCTURAL_BYTES = re.compile(rb'[\[\]{}"\\]')
+_JSON_OPENING_BRACKETS = {"{", "[", b"{", b"["}
+_JSON_CLOSING_BRACKETS = {"}", "]", b"}", b"]"}
+_JSON_QUOTES = {'"', b'"'}
+_JSON_BACKSLASHES = {"\\", b"\\"}
+_NO_RECORD = object()
 
 
 class JsonlParser(FileTypeParser):
 
     MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
+    MAX_BYTES_PER_MULTILINE_JSON_OBJECT = 20 * 1024 * 1024
     ENCODING = "utf8"
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
@@ -86,30 +97,69 @@ class JsonlParser(FileTypeParser):
         logger: logging.Logger,
         read_limit: bool = False,
     ) -> Iterable[Dict[str, Any]]:
-        with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
+        file_handle = (
+            stream_reader.open_file_sample(file, self.file_read_mode, self.ENCODING, logger, self.MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE)
+            if read_limit
+            else stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger)
+        )
+        with file_handle as fp:
             read_bytes = 0
+            line_no = 0
 
             had_json_parsing_error = False
             has_warned_for_multiline_json_object = False
             yielded_at_least_once = False
 
-            accumulator = None
+            # Lines are parsed one by one until a line is not a JSON value by itself. From then on, the file is considered as using
+            # multiline JSON objects and lines are accumulated until they form a JSON value. Accumulating stops as soon as the accumulated
+            # lines are invalid before their end as more lines can't make them valid.
+            is_multiline = False
+            accumulator: List[Union[bytes, str]] = []
+            accumulated_bytes = 0
+            depth, in_string = 0, False
+            next_parse_attempt_bytes = 0
             for line in fp:
-                if not accumulator:
-                    accumulator = self._instantiate_accumulator(line)
+                line_no += 1
                 read_bytes += len(line)
-                accumulator += line  # type: ignore [operator]  # In reality, it's either bytes or string and we add the same type
-                try:
-                    record = json.loads(accumulator)
-                    if had_json_parsing_error and not has_warned_for_multiline_json_object:
+                record = _NO_RECORD
+                if not is_multiline:
+                    try:
+                        record = _load_json(line)
+                    except ValueError as error:
+                        if line.strip():
+                            if not _is_incomplete(error):
+                                raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line_no)
+                            had_json_parsing_error = True
+                            is_multiline = True
+                            accumulator, accumulated_bytes = [line], len(line)
+                            depth, in_string = _track_json_depth(line, 0, False)
+                            next_parse_attempt_bytes = 2 * accumulated_bytes
+                else:
+                    accumulator.append(line)
+                    accumulated_bytes += len(line)
+                    if accumulated_bytes > self.MAX_BYTES_PER_MULTILINE_JSON_OBJECT:
+                        raise RecordParseError(
+                            FileBasedSourceError.ERROR_PARSING_RECORD_TOO_LARGE_MULTILINE_JSON_OBJECT, filename=file.uri, lineno=line_no
+                        )
+                    depth, in_string = _track_json_depth(line, depth, in_string)
+                    # Parsing is attempted once the brackets opened by the accumulated lines are closed rather than for each line so that
+                    # the accumulated lines are not re-parsed over and over again. Attempting it again each time the accumulated lines double
+                    # in size still detects invalid lines early while keeping the total work linear.
+                    if (depth <= 0 and not in_string) or accumulated_bytes >= next_parse_attempt_bytes:
+                        try:
+                            record = _load_json(line[:0].join(accumulator))  # type: ignore [arg-type]  # lines are either all bytes or all str
+                            accumulator, accumulated_bytes, depth, next_parse_attempt_bytes = [], 0, 0, 0
+                        except ValueError as error:
+                            if not _is_incomplete(error):
+                                raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line_no)
+                            next_parse_attempt_bytes = 2 * accumulated_bytes
+
+                if record is not _NO_RECORD:
+                    if is_multiline and not has_warned_for_multiline_json_object:
                         logger.warning(f"File at {file.uri} is using multiline JSON. Performance could be greatly reduced")
                         has_warned_for_multiline_json_object = True
-
                     yield record
                     yielded_at_least_once = True
-                    accumulator = self._instantiate_accumulator(line)
-                except json.JSONDecodeError:
-                    had_json_parsing_error = True
 
                 if read_limit and yielded_at_least_once and read_bytes >= self.MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE:
                     logger.warning(
@@ -119,11 +169,43 @@ class JsonlParser(FileTypeParser):
                     break
 
             if had_json_parsing_error and not yielded_at_least_once:
-                raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line)
-
-    @staticmethod
-    def _instantiate_accumulator(line: Union[bytes, str]) -> Union[bytes, str]:
-        if isinstance(line, bytes):
-            return bytes("", json.detect_encoding(line))
-        elif isinstance(line, str):
-            return ""
+                raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line_no)
+
+
+def _is_incomplete(error: ValueError) -> bool:
+    """
+    Returns whether the value that failed to decode is valid up to its end, meaning that appending more lines could make it valid
+    """
+    return isinstance(error, json.JSONDecodeError) and error.pos >= len(error.doc.rstrip())
+
+
+def _track_json_depth(line: Union[bytes, str], depth: int, in_string: bool) -> Tuple[int, bool]:
+    """
+    Returns the number of brackets still open and whether a string is still open after the line, given their values before the line
+    """
+    pattern = _JSON_STRUCTURAL_BYTES if isinstance(line, bytes) else _JSON_STRUCTURAL_CHARACTERS
+    escaped_position = -1
+    for match in pattern.finditer(line):  # type: ignore [arg-type]  # the pattern matches the type of the line
+        character = match.group()
+        if in_string:
+            if match.start() == escaped_position:
+                continue
+            if character in _JSON_QUOTES:
+                in_string = False
+            elif character in _JSON_BACKSLASHES:
+                escaped_position = match.end()
+        elif character in _JSON_QUOTES:
+            in_string = True
+        elif character in _JSON_OPENING_BRACKETS:
+            depth += 1
+        elif character in _JSON_CLOSING_BRACKETS:
+            depth -= 1
+    return depth, in_string
+
+
+def _load_json(value: Union[bytes, str]) -> Any:
+    try:
+        return from_json(value)
+    except ValueError:
+        # The json module is more lenient, for example with lone surrogates or with bytes that are not encoded in utf-8
+        return json.loads(value)
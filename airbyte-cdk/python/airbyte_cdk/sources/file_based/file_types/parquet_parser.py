@@ -2,10 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import itertools
 import json
 import logging
 import os
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from urllib.parse import unquote
 
 import pyarrow as pa
@@ -22,6 +23,13 @@ from pyarrow import DictionaryArray, Scalar
 class ParquetParser(FileTypeParser):
 
     ENCODING = None
+    DEFAULT_RECORD_BATCH_SIZE = 10_000
+
+    def __init__(self, record_batch_size: int = DEFAULT_RECORD_BATCH_SIZE):
+        """
+        :param record_batch_size: The maximum number of rows read from the file and converted at once.
+        """
+        self._record_batch_size = record_batch_size
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -70,21 +78,19 @@ class ParquetParser(FileTypeParser):
             with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
                 reader = pq.ParquetFile(fp)
                 partition_columns = {x.split("=")[0]: x.split("=")[1] for x in self._extract_partitions(file.uri)}
-                for row_group in range(reader.num_row_groups):
-                    batch = reader.read_row_group(row_group)
-                    for row in range(batch.num_rows):
+                for batch in reader.iter_batches(batch_size=self._record_batch_size):
+                    # Whole columns are converted at once so that pyarrow creates the python values instead of boxing every value in a
+                    # pyarrow scalar first
+                    column_names = batch.schema.names
+                    columns = [ParquetParser._to_output_values(column, parquet_format) for column in batch.columns]
+                    rows = zip(*columns) if columns else itertools.repeat((), batch.num_rows)
+                    for row in rows:
                         line_no += 1
-                        yield {
-                            **{
-                                column: ParquetParser._to_output_value(batch.column(column)[row], parquet_format)
-                                for column in batch.column_names
-                            },
-                            **partition_columns,
-                        }
+                        record = dict(zip(column_names, row))
+                        record.update(partition_columns)
+                        yield record
         except Exception as exc:
-            raise RecordParseError(
-                FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=f"{row_group=}, {line_no=}"
-            ) from exc
+            raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line_no) from exc
 
     @staticmethod
     def _extract_partitions(filepath: str) -> List[str]:
@@ -104,54 +110,73 @@ class ParquetParser(FileTypeParser):
         else:
             return ParquetParser._scalar_to_python_value(parquet_value, parquet_format)
 
+    @staticmethod
+    def _to_output_values(parquet_values: pa.Array, parquet_format: ParquetFormat) -> List[Any]:
+        """
+        Convert a column of a pyarrow record batch to values that can be output by the source. This is equivalent to calling
+        `_to_output_value` on each entry of the column.
+        """
+        python_values = parquet_values.to_pylist()
+        convert = ParquetParser._python_value_converter(parquet_values.type, parquet_format)
+        if convert is None:
+            return python_values  # type: ignore  # to_pylist returns a list
+        return [None if python_value is None else convert(python_value) for python_value in python_values]
+
     @staticmethod
     def _scalar_to_python_value(parquet_value: Scalar, parquet_format: ParquetFormat) -> Any:
         """
         Convert a pyarrow scalar to a value that can be output by the source.
         """
-        if parquet_value.as_py() is None:
+        python_value = parquet_value.as_py()
+        if python_value is None:
             return None
+        convert = ParquetParser._python_value_converter(parquet_value.type, parquet_format)
+        return python_value if convert is None else convert(python_value)
 
+    @staticmethod
+    def _python_value_converter(parquet_type: pa.DataType, parquet_format: ParquetFormat) -> Optional[Callable[[Any], Any]]:
+        """
+        Return the function converting the python value of a non-null pyarrow value of the given type to a value that can be output by the
+        source or None if the python value can be output as is.
+        """
         # Convert date and datetime objects to isoformat strings
-        if pa.types.is_time(parquet_value.type) or pa.types.is_timestamp(parquet_value.type) or pa.types.is_date(parquet_value.type):
-            return parquet_value.as_py().isoformat()
+        if pa.types.is_time(parquet_type) or pa.types.is_timestamp(parquet_type) or pa.types.is_date(parquet_type):
+            return lambda value: value.isoformat()
 
         # Convert month_day_nano_interval to array
-        if parquet_value.type == pa.month_day_nano_interval():
-            return json.loads(json.dumps(parquet_value.as_py()))
+        if parquet_type == pa.month_day_nano_interval():
+            return lambda value: json.loads(json.dumps(value))
 
         # Decode binary strings to utf-8
-        if ParquetParser._is_binary(parquet_value.type):
-            return parquet_value.as_py().decode("utf-8")
+        if ParquetParser._is_binary(parquet_type):
+            return lambda value: value.decode("utf-8")
 
-        if pa.types.is_decimal(parquet_value.type):
+        if pa.types.is_decimal(parquet_type):
             if parquet_format.decimal_as_float:
-                return float(parquet_value.as_py())
+                return float
             else:
-                return str(parquet_value.as_py())
+                return str
 
-        if pa.types.is_map(parquet_value.type):
-            return {k: v for k, v in parquet_value.as_py()}
+        if pa.types.is_map(parquet_type):
+            return lambda value: {k: v for k, v in value}
 
-        if pa.types.is_null(parquet_value.type):
-            return None
+        if pa.types.is_null(parquet_type):
+            return lambda value: None
 
         # Convert duration to seconds, then convert to the appropriate unit
-        if pa.types.is_duration(parquet_value.type):
-            duration = parquet_value.as_py()
-            duration_seconds = duration.total_seconds()
-            if parquet_value.type.unit == "s":
-                return duration_seconds
-            elif parquet_value.type.unit == "ms":
-                return duration_seconds * 1000
-            elif parquet_value.type.unit == "us":
-                return duration_seconds * 1_000_000
-            elif parquet_value.type.unit == "ns":
-                return duration_seconds * 1_000_000_000 + duration.nanoseconds
+        if pa.types.is_duration(parquet_type):
+            if parquet_type.unit == "s":
+                return lambda duration: duration.total_seconds()
+            elif parquet_type.unit == "ms":
+                return lambda duration: duration.total_seconds() * 1000
+            elif parquet_type.unit == "us":
+                return lambda duration: duration.total_seconds() * 1_000_000
+            elif parquet_type.unit == "ns":
+                return lambda duration: duration.total_seconds() * 1_000_000_000 + duration.nanoseconds
             else:
-                raise ValueError(f"Unknown duration unit: {parquet_value.type.unit}")
+                raise ValueError(f"Unknown duration unit: {parquet_type.unit}")
         else:
-            return parquet_value.as_py()
+            return None
 
     @staticmethod
     def _dictionary_array_to_python_value(parquet_value: DictionaryArray) -> Dict[str, Any]:
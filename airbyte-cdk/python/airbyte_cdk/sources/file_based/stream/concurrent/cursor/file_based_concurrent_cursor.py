@@ -5,14 +5,14 @@
 import logging
 from datetime import datetime, timedelta
 from threading import RLock
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, MutableMapping, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, Type
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.stream.concurrent.cursor.abstract_concurrent_file_based_cursor import AbstractConcurrentFileBasedCursor
-from airbyte_cdk.sources.file_based.stream.cursor import DefaultFileBasedCursor
+from airbyte_cdk.sources.file_based.stream.cursor import DefaultFileBasedCursor, FileHistory
 from airbyte_cdk.sources.file_based.types import StreamState
 from airbyte_cdk.sources.message.repository import MessageRepository
 from airbyte_cdk.sources.streams.concurrent.cursor import CursorField
@@ -60,6 +60,14 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
         self._prev_cursor_value = self._compute_prev_sync_cursor(stream_state)
         self._sync_start = self._compute_start_time()
 
+    @property
+    def _file_to_datetime_history(self) -> FileHistory:
+        return self._history
+
+    @_file_to_datetime_history.setter
+    def _file_to_datetime_history(self, history: Mapping[str, str]) -> None:
+        self._history = history if isinstance(history, FileHistory) else FileHistory(history)
+
     @property
     def state(self) -> MutableMapping[str, Any]:
         return self._state
@@ -108,11 +116,7 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
 
     def _compute_earliest_file_in_history(self) -> Optional[RemoteFile]:
         with self._state_lock:
-            if self._file_to_datetime_history:
-                filename, last_modified = min(self._file_to_datetime_history.items(), key=lambda f: (f[1], f[0]))
-                return RemoteFile(uri=filename, last_modified=datetime.strptime(last_modified, self.DATE_TIME_FORMAT))
-            else:
-                return None
+            return self._file_to_datetime_history.earliest_file()
 
     def add_file(self, file: RemoteFile) -> None:
         """
@@ -135,13 +139,10 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
                     )
                 else:
                     self._pending_files.pop(file.uri)
-                self._file_to_datetime_history[file.uri] = file.last_modified.strftime(self.DATE_TIME_FORMAT)
+                self._file_to_datetime_history.add_file(file)
                 if len(self._file_to_datetime_history) > self.DEFAULT_MAX_HISTORY_SIZE:
-                    # Get the earliest file based on its last modified date and its uri
-                    oldest_file = self._compute_earliest_file_in_history()
-                    if oldest_file:
-                        del self._file_to_datetime_history[oldest_file.uri]
-                    else:
+                    # Remove the earliest file based on its last modified date and its uri
+                    if not self._file_to_datetime_history.remove_earliest_file():
                         raise Exception(
                             "The history is full but there is no files in the history. This should never happen and might be indicative of a bug in the CDK."
                         )
@@ -182,11 +183,7 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
 
     def _compute_latest_file_in_history(self) -> Optional[RemoteFile]:
         with self._state_lock:
-            if self._file_to_datetime_history:
-                filename, last_modified = max(self._file_to_datetime_history.items(), key=lambda f: (f[1], f[0]))
-                return RemoteFile(uri=filename, last_modified=datetime.strptime(last_modified, self.DATE_TIME_FORMAT))
-            else:
-                return None
+            return self._file_to_datetime_history.latest_file()
 
     def get_files_to_sync(self, all_files: Iterable[RemoteFile], logger: logging.Logger) -> Iterable[RemoteFile]:
         """
@@ -208,9 +205,9 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
 
     def _should_sync_file(self, file: RemoteFile, logger: logging.Logger) -> bool:
         with self._state_lock:
-            if file.uri in self._file_to_datetime_history:
+            updated_at_from_history = self._file_to_datetime_history.get_last_modified(file.uri)
+            if updated_at_from_history is not None:
                 # If the file's uri is in the history, we should sync the file if it has been modified since it was synced
-                updated_at_from_history = datetime.strptime(self._file_to_datetime_history[file.uri], self.DATE_TIME_FORMAT)
                 if file.last_modified < updated_at_from_history:
                     self._message_repository.emit_message(
                         AirbyteMessage(
@@ -250,11 +247,11 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
             return len(self._file_to_datetime_history) >= self.DEFAULT_MAX_HISTORY_SIZE
 
     def _compute_start_time(self) -> datetime:
-        if not self._file_to_datetime_history:
+        earliest_file = self._file_to_datetime_history.earliest_file()
+        if not earliest_file:
             return datetime.min
         else:
-            earliest = min(self._file_to_datetime_history.values())
-            earliest_dt = datetime.strptime(earliest, self.DATE_TIME_FORMAT)
+            earliest_dt = earliest_file.last_modified
             if self._is_history_full():
                 time_window = datetime.now() - self._time_window_if_history_is_full
                 earliest_dt = min(earliest_dt, time_window)
@@ -1,4 +1,5 @@
 from .abstract_file_based_cursor import AbstractFileBasedCursor
 from .default_file_based_cursor import DefaultFileBasedCursor
+from .file_history import FileHistory
 
-__all__ = ["AbstractFileBasedCursor", "DefaultFileBasedCursor"]
+__all__ = ["AbstractFileBasedCursor", "DefaultFileBasedCursor", "FileHistory"]
@@ -4,11 +4,12 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Iterable, MutableMapping, Optional
+from typing import Any, Iterable, Mapping, Optional
 
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.stream.cursor.abstract_file_based_cursor import AbstractFileBasedCursor
+from airbyte_cdk.sources.file_based.stream.cursor.file_history import FileHistory
 from airbyte_cdk.sources.file_based.types import StreamState
 
 
@@ -20,7 +21,7 @@ class DefaultFileBasedCursor(AbstractFileBasedCursor):
 
     def __init__(self, stream_config: FileBasedStreamConfig, **_: Any):
         super().__init__(stream_config)
-        self._file_to_datetime_history: MutableMapping[str, str] = {}
+        self._file_to_datetime_history = FileHistory()
         self._time_window_if_history_is_full = timedelta(
             days=stream_config.days_to_sync_if_history_is_full or self.DEFAULT_DAYS_TO_SYNC_IF_HISTORY_IS_FULL
         )
@@ -31,19 +32,24 @@ class DefaultFileBasedCursor(AbstractFileBasedCursor):
         self._start_time = self._compute_start_time()
         self._initial_earliest_file_in_history: Optional[RemoteFile] = None
 
+    @property
+    def _file_to_datetime_history(self) -> FileHistory:
+        return self._history
+
+    @_file_to_datetime_history.setter
+    def _file_to_datetime_history(self, history: Mapping[str, str]) -> None:
+        self._history = history if isinstance(history, FileHistory) else FileHistory(history)
+
     def set_initial_state(self, value: StreamState) -> None:
         self._file_to_datetime_history = value.get("history", {})
         self._start_time = self._compute_start_time()
         self._initial_earliest_file_in_history = self._compute_earliest_file_in_history()
 
     def add_file(self, file: RemoteFile) -> None:
-        self._file_to_datetime_history[file.uri] = file.last_modified.strftime(self.DATE_TIME_FORMAT)
+        self._file_to_datetime_history.add_file(file)
         if len(self._file_to_datetime_history) > self.DEFAULT_MAX_HISTORY_SIZE:
-            # Get the earliest file based on its last modified date and its uri
-            oldest_file = self._compute_earliest_file_in_history()
-            if oldest_file:
-                del self._file_to_datetime_history[oldest_file.uri]
-            else:
+            # Remove the earliest file based on its last modified date and its uri
+            if not self._file_to_datetime_history.remove_earliest_file():
                 raise Exception(
                     "The history is full but there is no files in the history. This should never happen and might be indicative of a bug in the CDK."
                 )
@@ -59,9 +65,9 @@ class DefaultFileBasedCursor(AbstractFileBasedCursor):
         Files are synced in order of last-modified with secondary sort on filename, so the cursor value is
         a string joining the last-modified timestamp of the last synced file and the name of the file.
         """
-        if self._file_to_datetime_history.items():
-            filename, timestamp = max(self._file_to_datetime_history.items(), key=lambda x: (x[1], x[0]))
-            return f"{timestamp}_{filename}"
+        latest_file = self._file_to_datetime_history.latest_file()
+        if latest_file:
+            return f"{self._file_to_datetime_history[latest_file.uri]}_{latest_file.uri}"
         return None
 
     def _is_history_full(self) -> bool:
@@ -71,9 +77,9 @@ class DefaultFileBasedCursor(AbstractFileBasedCursor):
         return len(self._file_to_datetime_history) >= self.DEFAULT_MAX_HISTORY_SIZE
 
     def _should_sync_file(self, file: RemoteFile, logger: logging.Logger) -> bool:
-        if file.uri in self._file_to_datetime_history:
+        updated_at_from_history = self._file_to_datetime_history.get_last_modified(file.uri)
+        if updated_at_from_history is not None:
             # If the file's uri is in the history, we should sync the file if it has been modified since it was synced
-            updated_at_from_history = datetime.strptime(self._file_to_datetime_history[file.uri], self.DATE_TIME_FORMAT)
             if file.last_modified < updated_at_from_history:
                 logger.warning(
                     f"The file {file.uri}'s last modified date is older than the last time it was synced. This is unexpected. Skipping the file."
@@ -114,18 +120,14 @@ class DefaultFileBasedCursor(AbstractFileBasedCursor):
         return self._start_time
 
     def _compute_earliest_file_in_history(self) -> Optional[RemoteFile]:
-        if self._file_to_datetime_history:
-            filename, last_modified = min(self._file_to_datetime_history.items(), key=lambda f: (f[1], f[0]))
-            return RemoteFile(uri=filename, last_modified=datetime.strptime(last_modified, self.DATE_TIME_FORMAT))
-        else:
-            return None
+        return self._file_to_datetime_history.earliest_file()
 
     def _compute_start_time(self) -> datetime:
-        if not self._file_to_datetime_history:
+        earliest_file = self._file_to_datetime_history.earliest_file()
+        if not earliest_file:
             return datetime.min
         else:
-            earliest = min(self._file_to_datetime_history.values())
-            earliest_dt = datetime.strptime(earliest, self.DATE_TIME_FORMAT)
+            earliest_dt = earliest_file.last_modified
             if self._is_history_full():
                 time_window = datetime.now() - self._time_window_if_history_is_full
                 earliest_dt = min(earliest_dt, time_window)
@@ -0,0 +1,124 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import heapq
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+# Files are ordered by last modified date with a secondary sort on the uri
+_HistoryKey = Tuple[datetime, str]
+# Timestamps written with DATE_TIME_FORMAT, which fromisoformat parses like strptime does
+_CANONICAL_TIMESTAMP = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{6}Z")
+
+
+class FileHistory(Dict[str, str]):
+    """
+    The history of the synced files of a file-based stream, mapping the uri of each file to its last modified date.
+
+    It is a dict with the same content as the `history` of the stream state so that it can be serialized as is. In addition, the last
+    modified dates are kept parsed and a heap orders the files so that the earliest file is found in O(log n) instead of scanning the
+    whole history. The latest file is tracked as files are added.
+    """
+
+    DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+    def __init__(self, history: Optional[Mapping[str, str]] = None) -> None:
+        super().__init__(history or {})
+        self._heap: List[_HistoryKey] = []
+        self._latest: Optional[_HistoryKey] = None
+        self._last_modified: Dict[str, datetime] = {uri: self._parse(timestamp) for uri, timestamp in self.items()}
+        self._rebuild_index()
+
+    def add_file(self, file: RemoteFile) -> None:
+        self[file.uri] = file.last_modified.strftime(self.DATE_TIME_FORMAT)
+
+    def get_last_modified(self, uri: str) -> Optional[datetime]:
+        return self._last_modified.get(uri)
+
+    def earliest_file(self) -> Optional[RemoteFile]:
+        while self._heap:
+            last_modified, uri = self._heap[0]
+            if self._last_modified.get(uri) == last_modified:
+                return RemoteFile(uri=uri, last_modified=last_modified)
+            # The file was removed or updated since this entry was pushed
+            heapq.heappop(self._heap)
+        return None
+
+    def latest_file(self) -> Optional[RemoteFile]:
+        if self._latest is None and self._last_modified:
+            self._latest = max((last_modified, uri) for uri, last_modified in self._last_modified.items())
+        return RemoteFile(uri=self._latest[1], last_modified=self._latest[0]) if self._latest else None
+
+    def remove_earliest_file(self) -> Optional[RemoteFile]:
+        earliest_file = self.earliest_file()
+        if earliest_file:
+            del self[earliest_file.uri]
+        return earliest_file
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The default pickling of dict subclasses sets the items before the attributes, which __setitem__ needs
+        return FileHistory, (dict(self),)
+
+    def __setitem__(self, uri: str, timestamp: str) -> None:
+        key = (self._parse(timestamp), uri)
+        super().__setitem__(uri, timestamp)
+        previous_last_modified = self._last_modified.get(uri)
+        self._last_modified[uri] = key[0]
+        heapq.heappush(self._heap, key)
+        if self._latest is not None:
+            if key > self._latest:
+                self._latest = key
+            elif previous_last_modified is not None and self._latest == (previous_last_modified, uri):
+                self._latest = None
+        if len(self._heap) > 2 * len(self) + 16:
+            self._rebuild_index()
+
+    def __delitem__(self, uri: str) -> None:
+        super().__delitem__(uri)
+        last_modified = self._last_modified.pop(uri)
+        if self._latest == (last_modified, uri):
+            self._latest = None
+
+    def pop(self, uri: str, *default: Any) -> Any:  # type: ignore  # the signature of dict.pop is overloaded
+        if uri in self:
+            timestamp = self[uri]
+            del self[uri]
+            return timestamp
+        return super().pop(uri, *default)
+
+    def popitem(self) -> Tuple[str, str]:
+        if not self:
+            raise KeyError("popitem(): history is empty")
+        uri = next(reversed(self.keys()))
+        return uri, self.pop(uri)
+
+    def setdefault(self, uri: str, timestamp: str) -> str:  # type: ignore  # the history has no default value
+        if uri not in self:
+            self[uri] = timestamp
+        return self[uri]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for uri, timestamp in dict(*args, **kwargs).items():
+            self[uri] = timestamp
+
+    def clear(self) -> None:
+        super().clear()
+        self._last_modified.clear()
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        self._heap = [(last_modified, uri) for uri, last_modified in self._last_modified.items()]
+        heapq.heapify(self._heap)
+        self._latest = None
+
+    @classmethod
+    def _parse(cls, timestamp: str) -> datetime:
+        # fromisoformat is much faster than strptime which matters for histories holding many files. It is only used for the format the
+        # history is written with as it accepts timestamps that strptime rejects
+        if _CANONICAL_TIMESTAMP.fullmatch(timestamp):
+            return datetime.fromisoformat(timestamp[:-1])
+        return datetime.strptime(timestamp, cls.DATE_TIME_FORMAT)
@@ -5,6 +5,7 @@
 import asyncio
 import itertools
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from functools import cache
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Set, Union
@@ -89,7 +90,11 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
             raise MissingSchemaError(FileBasedSourceError.MISSING_SCHEMA, stream=self.name)
         # The stream only supports a single file type, so we can use the same parser for all files
         parser = self.get_parser()
-        for file in stream_slice["files"]:
+        files = stream_slice["files"]
+        for file_index, file in enumerate(files):
+            if file_index + 1 < len(files):
+                # the next file is downloaded once this one is opened, while it is parsed
+                self.stream_reader.prefetch_file(files[file_index + 1], self.logger, after=file)
             # only serialize the datetime once
             file_datetime_string = file.last_modified.strftime(self.DATE_TIME_FORMAT)
             n_skipped = line_no = 0
@@ -263,27 +268,37 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
 
         Each file type has a corresponding `infer_schema` handler.
         Dispatch on file type.
+
+        As parsers read and parse files in a blocking way, the schema of each file is inferred in a thread so that up to
+        `n_concurrent_requests` files are processed at the same time. The schemas are merged as soon as they are available.
         """
         base_schema: SchemaType = {}
-        pending_tasks: Set[asyncio.tasks.Task[SchemaType]] = set()
-
-        n_started, n_files = 0, len(files)
-        files_iterator = iter(files)
-        while pending_tasks or n_started < n_files:
-            while len(pending_tasks) <= self._discovery_policy.n_concurrent_requests and (file := next(files_iterator, None)):
-                pending_tasks.add(asyncio.create_task(self._infer_file_schema(file)))
-                n_started += 1
-            # Return when the first task is completed so that we can enqueue a new task as soon as the
-            # number of concurrent tasks drops below the number allowed.
-            done, pending_tasks = await asyncio.wait(pending_tasks, return_when=asyncio.FIRST_COMPLETED)
-            for task in done:
-                try:
-                    base_schema = merge_schemas(base_schema, task.result())
-                except Exception as exc:
-                    self.logger.error(f"An error occurred inferring the schema. \n {traceback.format_exc()}", exc_info=exc)
+        pending_tasks: Set[asyncio.Future[SchemaType]] = set()
+        n_concurrent_requests = self._discovery_policy.n_concurrent_requests
+        loop = asyncio.get_running_loop()
+
+        with ThreadPoolExecutor(max_workers=n_concurrent_requests, thread_name_prefix=f"infer_schema_{self.name}") as executor:
+            n_started, n_files = 0, len(files)
+            files_iterator = iter(files)
+            while pending_tasks or n_started < n_files:
+                while len(pending_tasks) < n_concurrent_requests and (file := next(files_iterator, None)):
+                    pending_tasks.add(loop.run_in_executor(executor, self._infer_file_schema_in_thread, file))
+                    n_started += 1
+                # Return when the first task is completed so that we can enqueue a new task as soon as the
+                # number of concurrent tasks drops below the number allowed.
+                done, pending_tasks = await asyncio.wait(pending_tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        base_schema = merge_schemas(base_schema, task.result())
+                    except Exception as exc:
+                        self.logger.error(f"An error occurred inferring the schema. \n {traceback.format_exc()}", exc_info=exc)
 
         return base_schema
 
+    def _infer_file_schema_in_thread(self, file: RemoteFile) -> SchemaType:
+        # Each thread runs the coroutine of the parser in its own event loop
+        return asyncio.run(self._infer_file_schema(file))
+
     async def _infer_file_schema(self, file: RemoteFile) -> SchemaType:
         try:
             return await self.get_parser().infer_schema(self.config, file, self.stream_reader, self.logger)
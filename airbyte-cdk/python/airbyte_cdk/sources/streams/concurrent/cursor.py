@@ -2,7 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 import functools
+import time
 from abc import ABC, abstractmethod
+from datetime import timedelta
 from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Protocol, Tuple
 
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
@@ -11,6 +13,7 @@ from airbyte_cdk.sources.streams import NO_CURSOR_STATE_KEY
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
 from airbyte_cdk.sources.streams.concurrent.state_converters.abstract_stream_state_converter import AbstractStreamStateConverter
+from airbyte_cdk.sources.streams.concurrent.state_converters.slice_intervals import SliceIntervals
 
 
 def _extract_value(mapping: Mapping[str, Any], path: List[str]) -> Any:
@@ -126,6 +129,16 @@ class FinalStateCursor(Cursor):
 
 
 class ConcurrentCursor(Cursor):
+    """
+    Cursor tracking the slices that have been successfully processed.
+
+    A state message is emitted every time a partition is closed. With many partitions, this can be throttled:
+    * partitions_per_state_emission: emit a state message once this number of partitions has been closed since the last one
+    * state_emission_interval: emit a state message once this time has elapsed since the last one
+    If both are set, a state message is emitted as soon as one of them is reached. The latest state is always emitted when the stream is
+    done through `ensure_at_least_one_state_emitted`.
+    """
+
     _START_BOUNDARY = 0
     _END_BOUNDARY = 1
 
@@ -143,6 +156,8 @@ class ConcurrentCursor(Cursor):
         end_provider: Callable[[], CursorValueType],
         lookback_window: Optional[GapType] = None,
         slice_range: Optional[GapType] = None,
+        partitions_per_state_emission: Optional[int] = None,
+        state_emission_interval: Optional[timedelta] = None,
     ) -> None:
         self._stream_name = stream_name
         self._stream_namespace = stream_namespace
@@ -157,8 +172,16 @@ class ConcurrentCursor(Cursor):
         self._most_recent_record: Optional[Record] = None
         self._has_closed_at_least_one_slice = False
         self.start, self._concurrent_state = self._get_concurrent_state(stream_state)
+        self._slice_intervals: Optional[SliceIntervals] = None
+        if "slices" in self._concurrent_state:
+            self._slice_intervals = SliceIntervals(connector_state_converter, self._concurrent_state["slices"])
+            self._concurrent_state["slices"] = self._slice_intervals.slices
         self._lookback_window = lookback_window
         self._slice_range = slice_range
+        self._partitions_per_state_emission = partitions_per_state_emission
+        self._state_emission_interval = state_emission_interval
+        self._partitions_closed_since_state_emission = 0
+        self._last_state_emission_time = time.monotonic()
 
     @property
     def state(self) -> MutableMapping[str, Any]:
@@ -183,25 +206,26 @@ class ConcurrentCursor(Cursor):
         return self._connector_state_converter.parse_value(self._cursor_field.extract_value(record))
 
     def close_partition(self, partition: Partition) -> None:
-        slice_count_before = len(self.state.get("slices", []))
-        self._add_slice_to_state(partition)
-        if slice_count_before < len(self.state["slices"]):  # only emit if at least one slice has been processed
-            self._merge_partitions()
-            self._emit_state_message()
+        if self._add_slice_to_state(partition):  # only emit if at least one slice has been processed
+            self._partitions_closed_since_state_emission += 1
+            if self._should_emit_state():
+                self._emit_state_message()
         self._has_closed_at_least_one_slice = True
 
-    def _add_slice_to_state(self, partition: Partition) -> None:
+    def _add_slice_to_state(self, partition: Partition) -> bool:
+        """
+        Add the slice of the partition to the state and return whether a slice was added.
+        """
         if self._slice_boundary_fields:
-            if "slices" not in self.state:
+            if self._slice_intervals is None:
                 raise RuntimeError(
                     f"The state for stream {self._stream_name} should have at least one slice to delineate the sync start time, but no slices are present. This is unexpected. Please contact Support."
                 )
-            self.state["slices"].append(
-                {
-                    "start": self._extract_from_slice(partition, self._slice_boundary_fields[self._START_BOUNDARY]),
-                    "end": self._extract_from_slice(partition, self._slice_boundary_fields[self._END_BOUNDARY]),
-                }
+            self._slice_intervals.add(
+                self._extract_from_slice(partition, self._slice_boundary_fields[self._START_BOUNDARY]),
+                self._extract_from_slice(partition, self._slice_boundary_fields[self._END_BOUNDARY]),
             )
+            return True
         elif self._most_recent_record:
             if self._has_closed_at_least_one_slice:
                 # If we track state value using records cursor field, we can only do that if there is one partition. This is because we save
@@ -219,12 +243,28 @@ class ConcurrentCursor(Cursor):
                     "expected. Please contact the Airbyte team."
                 )
 
-            self.state["slices"].append(
-                {
-                    self._connector_state_converter.START_KEY: self.start,
-                    self._connector_state_converter.END_KEY: self._extract_cursor_value(self._most_recent_record),
-                }
-            )
+            self._get_slice_intervals().add(self.start, self._extract_cursor_value(self._most_recent_record))
+            return True
+        return False
+
+    def _get_slice_intervals(self) -> SliceIntervals:
+        if self._slice_intervals is None:
+            self._slice_intervals = SliceIntervals(self._connector_state_converter, [])
+            self.state["slices"] = self._slice_intervals.slices
+        return self._slice_intervals
+
+    def _should_emit_state(self) -> bool:
+        if self._partitions_per_state_emission is None and self._state_emission_interval is None:
+            return True
+        if (
+            self._partitions_per_state_emission is not None
+            and self._partitions_closed_since_state_emission >= self._partitions_per_state_emission
+        ):
+            return True
+        return (
+            self._state_emission_interval is not None
+            and time.monotonic() - self._last_state_emission_time >= self._state_emission_interval.total_seconds()
+        )
 
     def _emit_state_message(self) -> None:
         self._connector_state_manager.update_state_for_stream(
@@ -234,9 +274,8 @@ class ConcurrentCursor(Cursor):
         )
         state_message = self._connector_state_manager.create_state_message(self._stream_name, self._stream_namespace)
         self._message_repository.emit_message(state_message)
-
-    def _merge_partitions(self) -> None:
-        self.state["slices"] = self._connector_state_converter.merge_intervals(self.state["slices"])
+        self._partitions_closed_since_state_emission = 0
+        self._last_state_emission_time = time.monotonic()
 
     def _extract_from_slice(self, partition: Partition, key: str) -> CursorValueType:
         try:
@@ -266,31 +305,22 @@ class ConcurrentCursor(Cursor):
         Note that the slices will overlap at their boundaries. We therefore expect to have at least the lower or the upper boundary to be
         inclusive in the API that is queried.
         """
-        self._merge_partitions()
+        slice_intervals = self._get_slice_intervals()
+        if len(slice_intervals) == 0:
+            raise ValueError("Expected at least one slice")
 
         if self._start is not None and self._is_start_before_first_slice():
-            yield from self._split_per_slice_range(self._start, self.state["slices"][0][self._connector_state_converter.START_KEY])
+            yield from self._split_per_slice_range(self._start, slice_intervals.slices[0][self._connector_state_converter.START_KEY])
 
-        if len(self.state["slices"]) == 1:
-            yield from self._split_per_slice_range(
-                self._calculate_lower_boundary_of_last_slice(self.state["slices"][0][self._connector_state_converter.END_KEY]),
-                self._end_provider(),
-            )
-        elif len(self.state["slices"]) > 1:
-            for i in range(len(self.state["slices"]) - 1):
-                yield from self._split_per_slice_range(
-                    self.state["slices"][i][self._connector_state_converter.END_KEY],
-                    self.state["slices"][i + 1][self._connector_state_converter.START_KEY],
-                )
-            yield from self._split_per_slice_range(
-                self._calculate_lower_boundary_of_last_slice(self.state["slices"][-1][self._connector_state_converter.END_KEY]),
-                self._end_provider(),
-            )
-        else:
-            raise ValueError("Expected at least one slice")
+        # The boundaries are copied before generating slices as closing the partitions of those slices updates the slice intervals
+        gaps = list(slice_intervals.gaps())
+        last_slice_end = slice_intervals.slices[-1][self._connector_state_converter.END_KEY]
+        for gap_lower_boundary, gap_upper_boundary in gaps:
+            yield from self._split_per_slice_range(gap_lower_boundary, gap_upper_boundary)
+        yield from self._split_per_slice_range(self._calculate_lower_boundary_of_last_slice(last_slice_end), self._end_provider())
 
     def _is_start_before_first_slice(self) -> bool:
-        return self._start is not None and self._start < self.state["slices"][0][self._connector_state_converter.START_KEY]
+        return self._start is not None and self._start < self._get_slice_intervals().slices[0][self._connector_state_converter.START_KEY]
 
     def _calculate_lower_boundary_of_last_slice(self, lower_boundary: CursorValueType) -> CursorValueType:
         if self._lookback_window:
@@ -1,25 +1,38 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import time
 from queue import Queue
+from typing import List
 
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
 from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
 
 
 class PartitionReader:
     """
     Generates records from a partition and puts them in a queue.
+
+    Records can be put in the queue in batches (i.e. lists of records) to reduce the contention on the queue and the per-item dispatch
+    on the consumer side when many workers produce small records.
     """
 
     _IS_SUCCESSFUL = True
 
-    def __init__(self, queue: Queue[QueueItem]) -> None:
+    def __init__(self, queue: Queue[QueueItem], record_batch_size: int = 1, record_batch_max_latency_seconds: float = 1.0) -> None:
         """
         :param queue: The queue to put the records in.
+        :param record_batch_size: The maximum number of records put in the queue as one batch. If 1, records are put individually.
+        :param record_batch_max_latency_seconds: The maximum time a record can be held in a batch. As this is only checked when records
+          are produced, records will also wait for the partition to produce the next record or to complete.
         """
+        if record_batch_size < 1:
+            raise ValueError(f"The record batch size must be at least 1, got {record_batch_size}")
         self._queue = queue
+        self._record_batch_size = record_batch_size
+        self._record_batch_max_latency_seconds = record_batch_max_latency_seconds
 
     def process_partition(self, partition: Partition) -> None:
         """
@@ -33,6 +46,10 @@ class PartitionReader:
         :param partition: The partition to read data from
         :return: None
         """
+        if self._record_batch_size > 1:
+            self._process_partition_in_batches(partition)
+            return
+
         try:
             for record in partition.read():
                 self._queue.put(record)
@@ -40,3 +57,24 @@ class PartitionReader:
         except Exception as e:
             self._queue.put(StreamThreadException(e, partition.stream_name()))
             self._queue.put(PartitionCompleteSentinel(partition, not self._IS_SUCCESSFUL))
+
+    def _process_partition_in_batches(self, partition: Partition) -> None:
+        batch: List[Record] = []
+        batch_started_at = 0.0
+        try:
+            for record in partition.read():
+                if not batch:
+                    batch_started_at = time.monotonic()
+                batch.append(record)
+                if len(batch) >= self._record_batch_size or time.monotonic() - batch_started_at >= self._record_batch_max_latency_seconds:
+                    self._queue.put(batch)
+                    batch = []
+            if batch:
+                self._queue.put(batch)
+            self._queue.put(PartitionCompleteSentinel(partition, self._IS_SUCCESSFUL))
+        except Exception as e:
+            # Records read before the error are still emitted
+            if batch:
+                self._queue.put(batch)
+            self._queue.put(StreamThreadException(e, partition.stream_name()))
+            self._queue.put(PartitionCompleteSentinel(partition, not self._IS_SUCCESSFUL))
@@ -0,0 +1,256 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+import io
+import logging
+import multiprocessing
+import pickle
+import time
+from multiprocessing.connection import Connection
+from queue import Queue
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from airbyte_cdk.models import AirbyteMessage, Level
+from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
+from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPoolManager
+from airbyte_cdk.sources.message import LogMessage, MessageRepository
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor
+from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
+
+# A call made in a worker process on an object owned by the main process: (object id, method name, args)
+_ForwardedCall = Tuple[int, str, Tuple[Any, ...]]
+# What a worker process sends for a partition: batches of record data with the calls made while reading them, an exception if the
+# partition could not be read and None once the partition has been fully read
+_WorkerOutput = Union[Tuple[List[Any], List[_ForwardedCall]], BaseException, None]
+
+
+class ProcessPoolPartitionReader(PartitionReader):
+    """
+    Reads partitions in the process pool of the ThreadPoolManager so that CPU-bound work (decoding, schema normalization, transformations,
+    file parsing, etc.) is not limited by the GIL.
+
+    Each partition is pickled and read in a worker process. The record data is sent back in batches to a thread of the main process which
+    puts them in the queue. Hence, records are still handled by the ConcurrentReadProcessor on the main process.
+
+    Objects holding the state of the sync (cursors, message repositories, ...) are not copied to the worker process: they are replaced by
+    stand-ins that forward the calls made on them back to the main process where they are replayed on the original objects. This way,
+    cursors and state are still managed by the main process.
+
+    Partitions that can't be pickled (for example because they hold a client with an open connection) are read in the thread like
+    PartitionReader does.
+    """
+
+    DEFAULT_RECORD_BATCH_SIZE = 1000
+    _POLL_INTERVAL_SECONDS = 0.1
+
+    def __init__(
+        self,
+        queue: Queue[QueueItem],
+        thread_pool_manager: ThreadPoolManager,
+        logger: logging.Logger,
+        record_batch_size: int = DEFAULT_RECORD_BATCH_SIZE,
+        record_batch_max_latency_seconds: float = 1.0,
+    ) -> None:
+        """
+        :param queue: The queue to put the records in.
+        :param thread_pool_manager: The ThreadPoolManager holding the process pool to read the partitions in
+        :param logger: The logger to log to
+        :param record_batch_size: The maximum number of records sent by a worker process as one batch.
+        :param record_batch_max_latency_seconds: The maximum time a record can be held in a batch by a worker process.
+        """
+        super().__init__(queue, record_batch_size, record_batch_max_latency_seconds)
+        if not thread_pool_manager.has_process_pool:
+            raise ValueError("A ThreadPoolManager with a process pool is required to read partitions in other processes")
+        # Imported here as the file-based CDK itself depends on the concurrent CDK
+        from airbyte_cdk.sources.file_based.exceptions import FileBasedErrorsCollector
+
+        self._thread_pool_manager = thread_pool_manager
+        self._logger = logger
+        self._main_process_owned_types: Tuple[type, ...] = (Cursor, MessageRepository, FileBasedErrorsCollector)
+        self._streams_read_in_threads: Set[str] = set()
+
+    def process_partition(self, partition: Partition) -> None:
+        """
+        Send the partition to a worker process and put the records it reads in the output queue. This method is meant to be called from a
+        thread of the main process.
+        :param partition: The partition to read data from
+        :return: None
+        """
+        try:
+            payload, main_process_objects = self._pickle_partition(partition)
+        except Exception as exception:
+            if partition.stream_name() not in self._streams_read_in_threads:
+                self._streams_read_in_threads.add(partition.stream_name())
+                self._logger.warning(
+                    f"Partitions of stream {partition.stream_name()} can't be sent to another process and will be read in threads: {exception}"
+                )
+            super().process_partition(partition)
+            return
+
+        try:
+            exception = self._read_in_worker_process(partition, payload, main_process_objects)
+            if exception:
+                self._queue.put(StreamThreadException(exception, partition.stream_name()))
+                self._queue.put(PartitionCompleteSentinel(partition, not self._IS_SUCCESSFUL))
+            else:
+                self._queue.put(PartitionCompleteSentinel(partition, self._IS_SUCCESSFUL))
+        except Exception as e:
+            self._queue.put(StreamThreadException(e, partition.stream_name()))
+            self._queue.put(PartitionCompleteSentinel(partition, not self._IS_SUCCESSFUL))
+
+    def _pickle_partition(self, partition: Partition) -> Tuple[bytes, Dict[int, Any]]:
+        main_process_objects: Dict[int, Any] = {}
+        buffer = io.BytesIO()
+        _MainProcessObjectsPickler(buffer, self._main_process_owned_types, main_process_objects).dump(partition)
+        return buffer.getvalue(), main_process_objects
+
+    def _read_in_worker_process(
+        self, partition: Partition, payload: bytes, main_process_objects: Dict[int, Any]
+    ) -> Optional[BaseException]:
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        try:
+            future = self._thread_pool_manager.submit_to_process_pool(
+                _read_partition, payload, sender, self._record_batch_size, self._record_batch_max_latency_seconds
+            )
+            while True:
+                if not receiver.poll(self._POLL_INTERVAL_SECONDS):
+                    if future.done() and not receiver.poll():
+                        # The worker process always sends None before returning so this only happens if the worker process failed
+                        future.result()
+                        raise RuntimeError(f"The worker process stopped before reading all of partition {partition}")
+                    continue
+
+                output: _WorkerOutput = receiver.recv()
+                if output is None:
+                    return None
+                if isinstance(output, BaseException):
+                    return output
+
+                records_data, forwarded_calls = output
+                for object_id, method_name, args in forwarded_calls:
+                    getattr(main_process_objects[object_id], method_name)(*args)
+                if records_data:
+                    self._queue.put([Record(data, partition.stream_name()) for data in records_data])
+        finally:
+            receiver.close()
+            sender.close()
+
+
+class _MainProcessObjectsPickler(pickle.Pickler):
+    """
+    Pickles objects of the given types by reference so that they are not copied to the worker process.
+    """
+
+    def __init__(self, file: io.BytesIO, main_process_owned_types: Tuple[type, ...], main_process_objects: Dict[int, Any]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._main_process_owned_types = main_process_owned_types
+        self._main_process_objects = main_process_objects
+
+    def persistent_id(self, obj: Any) -> Optional[int]:
+        if isinstance(obj, self._main_process_owned_types):
+            self._main_process_objects[id(obj)] = obj
+            return id(obj)
+        return None
+
+
+class _MainProcessObjectsUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, forwarded_calls: List[_ForwardedCall]) -> None:
+        super().__init__(file)
+        self._forwarded_calls = forwarded_calls
+
+    def persistent_load(self, object_id: int) -> "_MainProcessObjectStandIn":
+        return _MainProcessObjectStandIn(object_id, self._forwarded_calls)
+
+
+class _MainProcessObjectStandIn:
+    """
+    Replaces an object owned by the main process in a worker process. Method calls are recorded to be replayed on the main process. As the
+    calls are asynchronous, their return values are not available: only methods returning nothing are forwarded and accessing any other
+    attribute raises an AttributeError.
+    """
+
+    _FORWARDED_METHODS = frozenset(
+        {
+            # Cursor
+            "observe",
+            "close_partition",
+            "ensure_at_least_one_state_emitted",
+            # AbstractConcurrentFileBasedCursor
+            "add_file",
+            "set_pending_partitions",
+            "emit_state_message",
+            # MessageRepository
+            "emit_message",
+            "log_message",
+            # FileBasedErrorsCollector
+            "collect",
+        }
+    )
+
+    def __init__(self, object_id: int, forwarded_calls: List[_ForwardedCall]) -> None:
+        self._object_id = object_id
+        self._forwarded_calls = forwarded_calls
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        if name not in self._FORWARDED_METHODS:
+            raise AttributeError(f"{name} is not available in worker processes as only calls to methods returning nothing are forwarded")
+
+        def forward(*args: Any) -> None:
+            self._forwarded_calls.append((self._object_id, name, args))
+
+        return forward
+
+    def log_message(self, level: Level, message_provider: Callable[[], LogMessage]) -> None:
+        # The message provider is usually a lambda that can't be pickled so it is evaluated in the worker process
+        self._forwarded_calls.append((self._object_id, "log_message", (level, _LogMessageProvider(message_provider()))))
+
+    def emit_message(self, message: AirbyteMessage) -> None:
+        self._forwarded_calls.append((self._object_id, "emit_message", (message,)))
+
+
+class _LogMessageProvider:
+    def __init__(self, message: LogMessage) -> None:
+        self._message = message
+
+    def __call__(self) -> LogMessage:
+        return self._message
+
+
+def _read_partition(payload: bytes, sender: Connection, record_batch_size: int, record_batch_max_latency_seconds: float) -> None:
+    """
+    Entry point of the worker processes
+    """
+    forwarded_calls: List[_ForwardedCall] = []
+    batch: List[Any] = []
+    batch_started_at = 0.0
+    try:
+        partition = _MainProcessObjectsUnpickler(io.BytesIO(payload), forwarded_calls).load()
+        for record in partition.read():
+            if not batch:
+                batch_started_at = time.monotonic()
+            batch.append(record.data)
+            if len(batch) >= record_batch_size or time.monotonic() - batch_started_at >= record_batch_max_latency_seconds:
+                sender.send((batch, forwarded_calls))
+                batch = []
+                forwarded_calls.clear()
+        if batch or forwarded_calls:
+            sender.send((batch, forwarded_calls))
+        sender.send(None)
+    except Exception as exception:
+        # Records read before the error are still emitted
+        if batch or forwarded_calls:
+            sender.send((batch, forwarded_calls))
+        sender.send(_as_picklable_exception(exception))
+    finally:
+        sender.close()
+
+
+def _as_picklable_exception(exception: Exception) -> BaseException:
+    try:
+        pickle.loads(pickle.dumps(exception))
+        return exception
+    except Exception:
+        return RuntimeError(f"{type(exception).__name__}: {exception}")
@@ -0,0 +1,59 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from bisect import bisect_right
+from typing import Any, Iterable, Iterator, List, MutableMapping, Tuple
+
+from airbyte_cdk.sources.streams.concurrent.state_converters.abstract_stream_state_converter import AbstractStreamStateConverter
+
+
+class SliceIntervals:
+    """
+    The slices of a concurrent state, kept sorted and merged as they are added.
+
+    Two slices are merged if the start of the second one is 1 unit or less (as defined by the `increment` method of the state converter)
+    after the end of the first one, like `AbstractStreamStateConverter.merge_intervals` does. Adding a slice looks up its position with a
+    binary search and only merges it with its neighbors instead of sorting and merging all the slices again.
+
+    `slices` is the list of slices as stored in the state: it is updated in place so that it can be referenced by the state.
+    """
+
+    def __init__(self, connector_state_converter: AbstractStreamStateConverter, slices: Iterable[MutableMapping[str, Any]]) -> None:
+        self._converter = connector_state_converter
+        self._start_key = connector_state_converter.START_KEY
+        self._end_key = connector_state_converter.END_KEY
+        self.slices: List[MutableMapping[str, Any]] = connector_state_converter.merge_intervals(list(slices))
+        self._starts = [stream_slice[self._start_key] for stream_slice in self.slices]
+
+    def add(self, start: Any, end: Any) -> None:
+        index = bisect_right(self._starts, start)
+        if index > 0 and self._converter.increment(self.slices[index - 1][self._end_key]) >= start:
+            index -= 1
+            merged_slice = self.slices[index]
+            merged_slice[self._end_key] = max(merged_slice[self._end_key], end)
+        else:
+            merged_slice = {self._start_key: start, self._end_key: end}
+            self.slices.insert(index, merged_slice)
+            self._starts.insert(index, start)
+
+        # The slices being sorted and merged, only the slices following the new one can now overlap with it
+        last_merged_index = index
+        while (
+            last_merged_index + 1 < len(self.slices)
+            and self._converter.increment(merged_slice[self._end_key]) >= self._starts[last_merged_index + 1]
+        ):
+            last_merged_index += 1
+            merged_slice[self._end_key] = max(merged_slice[self._end_key], self.slices[last_merged_index][self._end_key])
+        del self.slices[index + 1 : last_merged_index + 1]
+        del self._starts[index + 1 : last_merged_index + 1]
+
+    def gaps(self) -> Iterator[Tuple[Any, Any]]:
+        """
+        Yield the (end of a slice, start of the next slice) boundaries between the slices.
+        """
+        for index in range(len(self.slices) - 1):
+            yield self.slices[index][self._end_key], self.slices[index + 1][self._start_key]
+
+    def __len__(self) -> int:
+        return len(self.slices)
@@ -47,6 +47,7 @@ class HttpStream(Stream, CheckpointMixin, ABC):
             use_cache=self.use_cache,
             backoff_strategy=self.get_backoff_strategy(),
             message_repository=InMemoryMessageRepository(),
+            use_persistent_cache=self.use_persistent_cache,
         )
 
         # Stream's with at least one cursor_field is incremental and thus a superior sync than RFR. We also cannot
@@ -84,6 +85,15 @@ class HttpStream(Stream, CheckpointMixin, ABC):
         """
         return False
 
+    @property
+    def use_persistent_cache(self) -> bool:
+        """
+        Override if needed. If True, responses with an ETag or a Last-Modified header are cached across syncs and revalidated with the
+        server using conditional requests. This is useful for slow-changing streams like parents of substreams.
+        Note that if the environment variable PERSISTENT_REQUEST_CACHE_PATH is not set, this has no effect.
+        """
+        return False
+
     @property
     @abstractmethod
     def url_base(self) -> str:
@@ -5,8 +5,9 @@
 import logging
 import os
 import urllib
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 import requests
 import requests_cache
@@ -35,7 +36,12 @@ from airbyte_cdk.sources.streams.http.rate_limiting import (
     rate_limit_default_backoff_handler,
     user_defined_backoff_handler,
 )
-from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
+from airbyte_cdk.utils.constants import (
+    ENV_PERSISTENT_REQUEST_CACHE_MAX_AGE_SECONDS,
+    ENV_PERSISTENT_REQUEST_CACHE_MAX_SIZE_BYTES,
+    ENV_PERSISTENT_REQUEST_CACHE_PATH,
+    ENV_REQUEST_CACHE_PATH,
+)
 from airbyte_cdk.utils.stream_status_utils import as_airbyte_message as stream_status_as_airbyte_message
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from requests.auth import AuthBase
@@ -64,6 +70,8 @@ class HttpClient:
 
     _DEFAULT_MAX_RETRY: int = 5
     _DEFAULT_MAX_TIME: int = 60 * 10
+    _DEFAULT_PERSISTENT_CACHE_MAX_AGE_SECONDS: int = 60 * 60 * 24 * 7
+    _DEFAULT_PERSISTENT_CACHE_MAX_SIZE_BYTES: int = 512 * 1024 * 1024
 
     def __init__(
         self,
@@ -78,20 +86,22 @@ class HttpClient:
         error_message_parser: Optional[ErrorMessageParser] = None,
         disable_retries: bool = False,
         message_repository: Optional[MessageRepository] = None,
+        use_persistent_cache: bool = False,
     ):
         self._name = name
+        self._logger = logger
         self._api_budget: APIBudget = api_budget or APIBudget(policies=[])
         if session:
             self._session = session
         else:
             self._use_cache = use_cache
+            self._use_persistent_cache = use_persistent_cache
             self._session = self._request_session()
             self._session.mount(
                 "https://", requests.adapters.HTTPAdapter(pool_connections=MAX_CONNECTION_POOL_SIZE, pool_maxsize=MAX_CONNECTION_POOL_SIZE)
             )
         if isinstance(authenticator, AuthBase):
             self._session.auth = authenticator
-        self._logger = logger
         self._error_handler = error_handler or HttpStatusErrorHandler(self._logger)
         if backoff_strategy is not None:
             if isinstance(backoff_strategy, list):
@@ -115,9 +125,12 @@ class HttpClient:
 
     def _request_session(self) -> requests.Session:
         """
-        Session factory based on use_cache property and call rate limits (api_budget parameter)
+        Session factory based on use_cache and use_persistent_cache properties and call rate limits (api_budget parameter)
         :return: instance of request-based session
         """
+        persistent_cache_dir = os.getenv(ENV_PERSISTENT_REQUEST_CACHE_PATH)
+        if self._use_persistent_cache and persistent_cache_dir:
+            return self._persistent_cache_session(Path(persistent_cache_dir))
         if self._use_cache:
             cache_dir = os.getenv(ENV_REQUEST_CACHE_PATH)
             # Use in-memory cache if cache_dir is not set
@@ -130,6 +143,68 @@ class HttpClient:
         else:
             return LimiterSession(api_budget=self._api_budget)
 
+    def _persistent_cache_session(self, cache_dir: Path) -> requests.Session:
+        """
+        Unlike the cache enabled by use_cache which only lives for the duration of a sync, this cache is kept across syncs. Responses are
+        only stored if they have an ETag or a Last-Modified header and they are always revalidated with the server by sending
+        If-None-Match/If-Modified-Since: the server either answers 304 Not Modified and the cached body is re-used or sends the new body
+        which replaces the cached one. This saves downloading the same data over and over again without ever returning stale data.
+
+        As the cache keys don't depend on the credentials, the cache directory should not be shared between connections.
+        """
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        session = CachedLimiterSession(
+            str(cache_dir / self.cache_filename),
+            backend="sqlite",
+            api_budget=self._api_budget,
+            expire_after=requests_cache.EXPIRE_IMMEDIATELY,
+            filter_fn=lambda response: bool(response.headers.get("ETag") or response.headers.get("Last-Modified")),
+        )  # type: ignore # there are no typeshed stubs for requests_cache
+        self._evict_from_persistent_cache(session.cache)
+        return session  # type: ignore # there are no typeshed stubs for requests_cache
+
+    def _evict_from_persistent_cache(self, cache: requests_cache.SQLiteCache) -> None:
+        """
+        Remove the responses that have not been revalidated for longer than the max age then, if the cache is still bigger than the max
+        size, the least recently revalidated responses.
+        """
+        max_age = timedelta(
+            seconds=int(os.getenv(ENV_PERSISTENT_REQUEST_CACHE_MAX_AGE_SECONDS, self._DEFAULT_PERSISTENT_CACHE_MAX_AGE_SECONDS))
+        )
+        max_size = int(os.getenv(ENV_PERSISTENT_REQUEST_CACHE_MAX_SIZE_BYTES, self._DEFAULT_PERSISTENT_CACHE_MAX_SIZE_BYTES))
+
+        # As responses expire as soon as they are stored or revalidated, the expiration date is the last time they were used. The
+        # creation date can't be used as it is not updated when a response is revalidated.
+        oldest_allowed = datetime.now(timezone.utc) - max_age
+        keys_to_delete: Set[str] = set()
+        for response in cache.sorted(key="expires"):
+            if response.expires and response.expires >= oldest_allowed:
+                break
+            keys_to_delete.add(response.cache_key)
+
+        # The size of the SQLite file can't be used as it doesn't shrink when responses are deleted until the database is vacuumed
+        cached_size = 0
+        for cache_key, response_size in self._persistent_cache_response_sizes(cache):
+            if cache_key in keys_to_delete:
+                continue
+            cached_size += response_size
+            if cached_size > max_size:
+                keys_to_delete.add(cache_key)
+
+        if keys_to_delete:
+            self._logger.info(f"Evicting {len(keys_to_delete)} responses from the persistent request cache of stream {self._name}")
+            cache.delete(*keys_to_delete)
+
+    @staticmethod
+    def _persistent_cache_response_sizes(cache: requests_cache.SQLiteCache) -> List[Tuple[str, int]]:
+        """
+        Return the cache key and stored size of each response, most recently revalidated first, without deserializing them
+        """
+        with cache.responses.connection() as connection:
+            return connection.execute(  # type: ignore # there are no typeshed stubs for requests_cache
+                f"SELECT key, LENGTH(value) FROM {cache.responses.table_name} ORDER BY expires DESC"
+            ).fetchall()
+
     def clear_cache(self) -> None:
         """
         Clear cached requests for current session, can be called any time
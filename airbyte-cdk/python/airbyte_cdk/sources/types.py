@@ -53,9 +53,18 @@ class Record(Mapping[str, Any]):
 
 
 class StreamSlice(Mapping[str, Any]):
-    def __init__(self, *, partition: Mapping[str, Any], cursor_slice: Mapping[str, Any]) -> None:
+    def __init__(
+        self, *, partition: Mapping[str, Any], cursor_slice: Mapping[str, Any], extra_fields: Optional[Mapping[str, Any]] = None
+    ) -> None:
+        """
+        :param partition: The partition keys of the slice
+        :param cursor_slice: The cursor keys of the slice
+        :param extra_fields: Additional fields used by the components processing the slice. They are not part of the mapping and are not
+            considered when comparing slices
+        """
         self._partition = partition
         self._cursor_slice = cursor_slice
+        self._extra_fields = extra_fields or {}
         if partition.keys() & cursor_slice.keys():
             raise ValueError("Keys for partition and incremental sync cursor should not overlap")
         self._stream_slice = dict(partition) | dict(cursor_slice)
@@ -74,6 +83,10 @@ class StreamSlice(Mapping[str, Any]):
             c = c.cursor_slice
         return c
 
+    @property
+    def extra_fields(self) -> Mapping[str, Any]:
+        return self._extra_fields
+
     def __repr__(self) -> str:
         return repr(self._stream_slice)
 
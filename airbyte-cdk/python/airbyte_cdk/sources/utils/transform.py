@@ -3,16 +3,38 @@
 #
 
 import logging
+import numbers
 from distutils.util import strtobool
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
-from jsonschema import Draft7Validator, ValidationError, validators
+from jsonschema import Draft7Validator, RefResolutionError, RefResolver, ValidationError, validators
 
 json_to_python_simple = {"string": str, "number": float, "integer": int, "boolean": bool, "null": type(None)}
 json_to_python = {**json_to_python_simple, **{"object": dict, "array": list}}
 python_to_json = {v: k for k, v in json_to_python.items()}
 
+# Python types matching each json schema type for the type checker of the validator created by TypeTransformer (i.e. jsonschema's
+# default types). Booleans only match the "boolean" type.
+_type_checks: Mapping[str, Tuple[type, ...]] = {
+    "array": (list,),
+    "boolean": (bool,),
+    "integer": (int,),
+    "null": (type(None),),
+    "number": (numbers.Number,),
+    "object": (dict,),
+    "string": (str,),
+}
+
+# Path of a value within the record, as reported in transformation warnings
+_Path = List[Union[str, int]]
+# Walks a value according to a compiled schema. Values are normalized in place and type mismatches are reported as warnings
+_CompiledWalker = Callable[[Any, _Path], None]
+_Converter = Callable[[Any], Any]
+
+# Number of compiled schemas kept by a TypeTransformer. Streams usually reuse the same schema object for all their records
+_MAX_COMPILED_SCHEMAS = 64
+
 logger = logging.getLogger("airbyte")
 
 
@@ -33,6 +55,19 @@ class TransformConfig(Flag):
     # with DefaultSchemaNormalization. In this case default type casting would
     # be applied before custom one.
     CustomSchemaNormalization = auto()
+    # Applies the same type casting as DefaultSchemaNormalization, but the
+    # schema is compiled once into per-field converters with references
+    # resolved ahead of time instead of traversing every record with the
+    # jsonschema validator. Schemas using features which can't be compiled
+    # fall back to the jsonschema traversal. Can be combined with
+    # CustomSchemaNormalization.
+    CompiledSchemaNormalization = auto()
+
+
+class _NotCompilableError(Exception):
+    """
+    Raised when a schema uses features which can't be compiled and needs to be traversed by the jsonschema validator.
+    """
 
 
 class TypeTransformer:
@@ -57,6 +92,8 @@ class TypeTransformer:
             if key in ["type", "array", "$ref", "properties", "items"]
         }
         self._normalizer = validators.create(meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators)
+        # Compiled walkers indexed by schema id. The schema is kept along with its walker so the id can't be reused by another object
+        self._compiled_schemas: Dict[int, Tuple[Mapping[str, Any], Optional[_CompiledWalker]]] = {}
 
     def registerCustomTransform(self, normalization_callback: Callable[[Any, Dict[str, Any]], Any]) -> Callable:
         """
@@ -79,13 +116,17 @@ class TypeTransformer:
         :param subschema part of the jsonschema containing field type/format data.
         :return Final field value.
         """
-        if TransformConfig.DefaultSchemaNormalization in self._config:
+        if self._applies_default_normalization:
             original_item = self.default_convert(original_item, subschema)
 
         if self._custom_normalizer:
             original_item = self._custom_normalizer(original_item, subschema)
         return original_item
 
+    @property
+    def _applies_default_normalization(self) -> bool:
+        return bool(self._config & (TransformConfig.DefaultSchemaNormalization | TransformConfig.CompiledSchemaNormalization))
+
     @staticmethod
     def default_convert(original_item: Any, subschema: Dict[str, Any]) -> Any:
         """
@@ -180,6 +221,11 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
+        if TransformConfig.CompiledSchemaNormalization in self._config:
+            walk = self._get_compiled_schema(schema)
+            if walk:
+                walk(record, [])
+                return
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -194,3 +240,283 @@ class TypeTransformer:
         return (
             f"Failed to transform value {repr(e.instance)} of type '{instance_json_type}' to '{e.validator_value}', key path: '{key_path}'"
         )
+
+    def _get_compiled_schema(self, schema: Mapping[str, Any]) -> Optional[_CompiledWalker]:
+        """
+        Returns the walker compiled for this schema object, compiling it on first use. Schemas are expected not to be mutated once they have
+        been used to transform records.
+        :return None if the schema can't be compiled
+        """
+        cached = self._compiled_schemas.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
+        walker: Optional[_CompiledWalker]
+        try:
+            walker = _SchemaCompiler(self, schema).compile() or _skip_value
+        except _NotCompilableError as exception:
+            logger.debug(f"Schema can't be compiled, falling back to jsonschema traversal: {exception}")
+            walker = None
+        if len(self._compiled_schemas) >= _MAX_COMPILED_SCHEMAS:
+            self._compiled_schemas.clear()
+        self._compiled_schemas[id(schema)] = (schema, walker)
+        return walker
+
+    def _report_type_error(self, instance: Any, types: Union[str, List[str]], path: _Path) -> None:
+        types_list = types if isinstance(types, list) else [types]
+        error = ValidationError(
+            f"{instance!r} is not of type {', '.join(repr(t) for t in types_list)}",
+            validator="type",
+            validator_value=types,
+            instance=instance,
+            path=path,
+        )
+        logger.warning(self.get_error_message(error))
+
+
+def _skip_value(instance: Any, path: _Path) -> None:
+    pass
+
+
+class _SchemaCompiler:
+    """
+    Compiles a json schema into a tree of closures reproducing the traversal TypeTransformer does with the jsonschema validator: values
+    are converted on the way down for every `properties` and `items` keyword and `type` keywords are checked after conversion. As
+    TypeTransformer only registers the `type`, `$ref`, `properties` and `items` validators, other keywords are ignored.
+    """
+
+    def __init__(self, transformer: TypeTransformer, schema: Mapping[str, Any]):
+        self._transformer = transformer
+        self._schema = schema
+        self._resolver = RefResolver.from_schema(schema, id_of=Draft7Validator.ID_OF)
+        self._compiled: Dict[int, Optional[_CompiledWalker]] = {}
+        # Schemas being compiled, used to support recursive schemas
+        self._in_progress: Dict[int, List[Optional[_CompiledWalker]]] = {}
+
+    def compile(self) -> Optional[_CompiledWalker]:
+        return self._compile_node(self._schema)
+
+    def _compile_node(self, schema: Any) -> Optional[_CompiledWalker]:
+        if not isinstance(schema, dict):
+            raise _NotCompilableError(f"Unsupported schema {schema}")
+        key = id(schema)
+        if key in self._compiled:
+            return self._compiled[key]
+        if key in self._in_progress:
+            cell = self._in_progress[key]
+            return lambda instance, path: cell[0](instance, path) if cell[0] else None
+
+        self._in_progress[key] = cell = [None]
+        if Draft7Validator.ID_OF(schema):
+            raise _NotCompilableError("Schemas changing the resolution scope are not supported")
+        if schema.get("$ref") is not None:
+            # As with jsonschema, other keywords are ignored when a reference is defined
+            walker = self._compile_node(self._resolve(schema["$ref"]))
+        else:
+            steps = []
+            for keyword, value in schema.items():
+                step = None
+                if keyword == "type":
+                    step = self._compile_type(value)
+                elif keyword == "properties":
+                    step = self._compile_properties(value)
+                elif keyword == "items":
+                    step = self._compile_items(value)
+                if step:
+                    steps.append(step)
+            walker = self._chain(steps)
+        cell[0] = walker
+        del self._in_progress[key]
+        self._compiled[key] = walker
+        return walker
+
+    @staticmethod
+    def _chain(steps: List[_CompiledWalker]) -> Optional[_CompiledWalker]:
+        if not steps:
+            return None
+        if len(steps) == 1:
+            return steps[0]
+
+        def walk(instance: Any, path: _Path) -> None:
+            for step in steps:
+                step(instance, path)
+
+        return walk
+
+    def _resolve(self, ref: Any) -> Any:
+        if not isinstance(ref, str) or not ref.startswith("#"):
+            raise _NotCompilableError(f"Only local references are supported, got {ref}")
+        try:
+            _, resolved = self._resolver.resolve(ref)
+        except RefResolutionError as exception:
+            raise _NotCompilableError(f"Reference {ref} can't be resolved") from exception
+        return resolved
+
+    def _resolve_once(self, subschema: Any) -> Any:
+        """
+        Mirrors the resolution done by TypeTransformer before normalizing a value: only one level of reference is followed.
+        """
+        if not isinstance(subschema, dict):
+            raise _NotCompilableError(f"Unsupported schema {subschema}")
+        if "$ref" in subschema:
+            subschema = self._resolve(subschema["$ref"])
+            if not isinstance(subschema, dict):
+                raise _NotCompilableError(f"Unsupported schema {subschema}")
+        return subschema
+
+    def _compile_type(self, types: Any) -> _CompiledWalker:
+        type_names = types if isinstance(types, list) else [types]
+        if not all(isinstance(type_name, str) and type_name in _type_checks for type_name in type_names):
+            raise _NotCompilableError(f"Unsupported type {types}")
+        python_types = tuple(python_type for type_name in type_names for python_type in _type_checks[type_name])
+        accepts_booleans = "boolean" in type_names
+        report = self._transformer._report_type_error
+
+        def check_type(instance: Any, path: _Path) -> None:
+            if isinstance(instance, bool):
+                if not accepts_booleans:
+                    report(instance, types, path)
+            elif not isinstance(instance, python_types):
+                report(instance, types, path)
+
+        return check_type
+
+    def _compile_properties(self, properties: Any) -> Optional[_CompiledWalker]:
+        if not isinstance(properties, dict):
+            raise _NotCompilableError(f"Unsupported properties {properties}")
+        converters: List[Tuple[str, _Converter]] = []
+        walkers: List[Tuple[str, _CompiledWalker]] = []
+        for name, subschema in properties.items():
+            converter = self._compile_converter(self._resolve_once(subschema))
+            if converter:
+                converters.append((name, converter))
+            walker = self._compile_node(subschema)
+            if walker:
+                walkers.append((name, walker))
+        if not converters and not walkers:
+            return None
+
+        def walk_properties(instance: Any, path: _Path) -> None:
+            if not isinstance(instance, dict):
+                return
+            for name, convert in converters:
+                if name in instance:
+                    instance[name] = convert(instance[name])
+            for name, walk in walkers:
+                if name in instance:
+                    path.append(name)
+                    walk(instance[name], path)
+                    path.pop()
+
+        return walk_properties
+
+    def _compile_items(self, items: Any) -> Optional[_CompiledWalker]:
+        # Tuple validation (i.e. a list of schemas) isn't supported by TypeTransformer
+        convert = self._compile_converter(self._resolve_once(items))
+        walk = self._compile_node(items)
+        if not convert and not walk:
+            return None
+
+        def walk_items(instance: Any, path: _Path) -> None:
+            if not isinstance(instance, list):
+                return
+            if convert:
+                for index, item in enumerate(instance):
+                    instance[index] = convert(item)
+            if walk:
+                for index, item in enumerate(instance):
+                    path.append(index)
+                    walk(item, path)
+                    path.pop()
+
+        return walk_items
+
+    def _compile_converter(self, subschema: Mapping[str, Any]) -> Optional[_Converter]:
+        """
+        Specializes TypeTransformer.default_convert and the custom normalizer for a given subschema.
+        """
+        transformer = self._transformer
+        default_converter = self._compile_default_converter(subschema) if transformer._applies_default_normalization else None
+        if TransformConfig.CustomSchemaNormalization not in transformer._config and not transformer._custom_normalizer:
+            return default_converter
+
+        def convert(original_item: Any) -> Any:
+            if default_converter:
+                original_item = default_converter(original_item)
+            # The custom normalizer can be registered after the schema is compiled
+            if transformer._custom_normalizer:
+                original_item = transformer._custom_normalizer(original_item, subschema)
+            return original_item
+
+        return convert
+
+    def _compile_default_converter(self, subschema: Mapping[str, Any]) -> Optional[_Converter]:
+        if type(self._transformer).default_convert is not TypeTransformer.default_convert:
+            default_convert = self._transformer.default_convert
+            return lambda original_item: default_convert(original_item, subschema)
+
+        target_type = subschema.get("type", [])
+        try:
+            nullable = "null" in target_type
+        except TypeError as exception:
+            raise _NotCompilableError(f"Unsupported type {target_type}") from exception
+        if isinstance(target_type, list):
+            target_type = [t for t in target_type if t != "null"]
+            if len(target_type) != 1:
+                # Ambiguous types are not converted
+                return None
+            target_type = target_type[0]
+
+        cast = self._compile_cast(target_type, subschema)
+        if cast is None:
+            return None
+
+        def convert(original_item: Any) -> Any:
+            if original_item is None and nullable:
+                return None
+            try:
+                return cast(original_item)
+            except (ValueError, TypeError):
+                return original_item
+
+        return convert
+
+    @staticmethod
+    def _compile_cast(target_type: Any, subschema: Mapping[str, Any]) -> Optional[Callable[[Any], Any]]:
+        """
+        Returns the cast TypeTransformer.default_convert applies for this target type, or None if values of this type are not converted.
+        """
+        if target_type == "string":
+            return str
+        if target_type == "number":
+            return float
+        if target_type == "integer":
+            return int
+        if target_type == "boolean":
+            return _cast_to_boolean
+        if target_type == "array":
+            return _SchemaCompiler._compile_array_cast(subschema)
+        return None
+
+    @staticmethod
+    def _compile_array_cast(subschema: Mapping[str, Any]) -> Optional[Callable[[Any], Any]]:
+        try:
+            item_types = set(subschema.get("items", {}).get("type", set()))
+        except (AttributeError, TypeError) as exception:
+            raise _NotCompilableError(f"Unsupported items {subschema.get('items')}") from exception
+        if not item_types.issubset(json_to_python_simple):
+            return None
+        simple_types = set(json_to_python_simple.values())
+
+        def cast(original_item: Any) -> Any:
+            if type(original_item) in simple_types:
+                return [original_item]
+            return original_item
+
+        return cast
+
+
+def _cast_to_boolean(original_item: Any) -> Any:
+    if isinstance(original_item, str):
+        return strtobool(original_item) == 1
+    return bool(original_item)
@@ -3,3 +3,6 @@
 #
 
 ENV_REQUEST_CACHE_PATH = "REQUEST_CACHE_PATH"
+ENV_PERSISTENT_REQUEST_CACHE_PATH = "PERSISTENT_REQUEST_CACHE_PATH"
+ENV_PERSISTENT_REQUEST_CACHE_MAX_AGE_SECONDS = "PERSISTENT_REQUEST_CACHE_MAX_AGE_SECONDS"
+ENV_PERSISTENT_REQUEST_CACHE_MAX_SIZE_BYTES = "PERSISTENT_REQUEST_CACHE_MAX_SIZE_BYTES"
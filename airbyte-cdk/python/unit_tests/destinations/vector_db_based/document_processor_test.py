@@ -2,10 +2,14 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import os
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
 from typing import Any, List, Mapping, Optional
 from unittest.mock import MagicMock
 
 import pytest
+from airbyte_cdk.destinations.vector_db_based import document_processor
 from airbyte_cdk.destinations.vector_db_based.config import (
     CodeSplitterConfigModel,
     FieldNameMappingConfigModel,
@@ -656,3 +660,94 @@ def test_process_cdc_records(record, sync_mode, has_chunks, raises, expected_id_
         if has_chunks:
             assert len(chunks) > 0
         assert id_to_delete == expected_id_to_delete
+
+
+def _a_markdown_record(index: int, sections: int = 3) -> AirbyteRecordMessage:
+    text = "\n".join(
+        f"# Section {section} of document {index}\n"
+        + f"This is paragraph {section} of the document and it is long enough to be split. " * 20
+        for section in range(sections)
+    )
+    return AirbyteRecordMessage(stream="stream1", namespace="namespace1", data={"id": index, "text": text}, emitted_at=1234)
+
+
+def test_process_records_in_parallel_returns_the_same_chunks_in_order():
+    processor = initialize_processor(
+        ProcessingConfigModel(
+            chunk_size=100,
+            chunk_overlap=0,
+            text_fields=["text"],
+            metadata_fields=["id"],
+            text_splitter=MarkdownHeaderSplitterConfigModel(mode="markdown", split_level=2),
+        )
+    )
+    processor.streams["namespace1_stream1"].destination_sync_mode = DestinationSyncMode.append_dedup
+    processor.max_workers = 2
+    processor.records_per_worker_batch = 3
+    records = [_a_markdown_record(index) for index in range(20)]
+    records.insert(
+        5, AirbyteRecordMessage(stream="stream1", namespace="namespace1", data={"id": 99, "_ab_cdc_deleted_at": 1234}, emitted_at=1234)
+    )
+
+    try:
+        processed_records = list(processor.process_records(records))
+    finally:
+        processor.close()
+
+    assert processed_records == [processor.process(record) for record in records]
+    assert processed_records[5] == ([], "namespace1_stream1_99")
+    assert all(chunk.record is records[0] for chunk in processed_records[0][0])
+
+
+def test_given_invalid_record_when_process_records_in_parallel_then_raise():
+    processor = initialize_processor(ProcessingConfigModel(chunk_size=48, chunk_overlap=0, text_fields=["text"], metadata_fields=None))
+    processor.max_workers = 2
+    processor.records_per_worker_batch = 2
+    records = [_a_markdown_record(index, sections=1) for index in range(4)]
+    records.append(AirbyteRecordMessage(stream="stream1", namespace="namespace1", data={"id": 5}, emitted_at=1234))
+
+    try:
+        with pytest.raises(AirbyteTracedException):
+            list(processor.process_records(records))
+    finally:
+        processor.close()
+
+
+def test_process_records_in_parallel_only_submits_a_few_batches_per_worker_at_a_time(mocker):
+    processor = initialize_processor(ProcessingConfigModel(chunk_size=48, chunk_overlap=0, text_fields=["text"], metadata_fields=None))
+    processor.max_workers = 2
+    processor.records_per_worker_batch = 1
+    process_pool = mocker.patch.object(document_processor, "ProcessPoolExecutor").return_value
+
+    def _submit(function, batch):
+        future = Future()
+        future.set_result([([("a chunk", {})], None)] * len(batch))
+        return future
+
+    process_pool.submit.side_effect = _submit
+
+    processed_records = processor.process_records([_a_markdown_record(index, sections=1) for index in range(10)])
+
+    next(processed_records)
+    assert process_pool.submit.call_count == 4
+    assert len(list(processed_records)) == 9
+    assert process_pool.submit.call_count == 10
+
+
+class _ExitProcessWhenUnpickled:
+    def __reduce__(self):
+        return os._exit, (1,)
+
+
+def test_given_worker_process_dies_when_process_records_in_parallel_then_raise_broken_process_pool():
+    processor = initialize_processor(ProcessingConfigModel(chunk_size=48, chunk_overlap=0, text_fields=["text"], metadata_fields=None))
+    processor.max_workers = 2
+    processor.records_per_worker_batch = 2
+    records = [_a_markdown_record(index, sections=1) for index in range(4)]
+    records[2].data["unpicklable"] = _ExitProcessWhenUnpickled()
+
+    with pytest.raises(BrokenProcessPool):
+        list(processor.process_records(records))
+
+    processor.close()
+    assert processor._process_pool is None
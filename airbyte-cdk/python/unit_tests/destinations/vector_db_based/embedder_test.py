@@ -2,7 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from unittest.mock import MagicMock, call
+import threading
+import time
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 from airbyte_cdk.destinations.vector_db_based.config import (
@@ -17,12 +19,14 @@ from airbyte_cdk.destinations.vector_db_based.embedder import (
     COHERE_VECTOR_SIZE,
     OPEN_AI_VECTOR_SIZE,
     AzureOpenAIEmbedder,
+    BaseOpenAIEmbedder,
     CohereEmbedder,
     Document,
     FakeEmbedder,
     FromFieldEmbedder,
     OpenAICompatibleEmbedder,
     OpenAIEmbedder,
+    _TokenRateLimiter,
 )
 from airbyte_cdk.models.airbyte_protocol import AirbyteRecordMessage
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
@@ -121,3 +125,61 @@ def test_openai_chunking():
     chunks = [Document(page_content="a", record=AirbyteRecordMessage(stream="mystream", data={}, emitted_at=0)) for _ in range(1005)]
     assert embedder.embed_documents(chunks) == [[0] * OPEN_AI_VECTOR_SIZE] * 1005
     mock_embedding_instance.embed_documents.assert_has_calls([call(["a"] * 1000), call(["a"] * 5)])
+
+
+def test_openai_batches_are_embedded_concurrently():
+    config = OpenAIEmbeddingConfigModel(**{"mode": "openai", "openai_key": "abc"})
+    embedder = OpenAIEmbedder(config, 150)
+    mock_embedding_instance = MagicMock()
+    embedder.embeddings = mock_embedding_instance
+    both_batches_sent = threading.Barrier(2, timeout=5)
+
+    def embed_documents(texts):
+        both_batches_sent.wait()
+        return [[len(text)] for text in texts]
+
+    mock_embedding_instance.embed_documents.side_effect = embed_documents
+
+    chunks = [
+        Document(page_content="a" * (i % 7), record=AirbyteRecordMessage(stream="mystream", data={}, emitted_at=0)) for i in range(1005)
+    ]
+    assert embedder.embed_documents(chunks) == [[i % 7] for i in range(1005)]
+
+
+def test_given_no_tokens_per_minute_when_embed_documents_then_do_not_throttle():
+    config = OpenAIEmbeddingConfigModel(**{"mode": "openai", "openai_key": "abc"})
+    embedder = OpenAIEmbedder(config, 1000)
+    mock_embedding_instance = MagicMock()
+    embedder.embeddings = mock_embedding_instance
+    mock_embedding_instance.embed_documents.side_effect = lambda texts: [[0] * OPEN_AI_VECTOR_SIZE] * len(texts)
+    chunks = [Document(page_content="a" * 4000, record=AirbyteRecordMessage(stream="mystream", data={}, emitted_at=0)) for _ in range(150)]
+
+    started_at = time.monotonic()
+    for _ in range(32):
+        embedder.embed_documents(chunks)
+
+    # 32 * 150 chunks of 1000 tokens is way above the default per-minute token limit used to size the batches
+    assert time.monotonic() - started_at < 5
+    assert mock_embedding_instance.embed_documents.call_count == 32
+
+
+def test_given_tokens_per_minute_when_embed_documents_then_throttle():
+    embedder = BaseOpenAIEmbedder(MagicMock(), 1000, tokens_per_minute=1000)
+
+    with patch.object(_TokenRateLimiter, "acquire") as acquire:
+        embedder.embed_documents([Document(page_content="a" * 400, record=AirbyteRecordMessage(stream="mystream", data={}, emitted_at=0))])
+
+    acquire.assert_called_once_with(101)
+
+
+def test_token_rate_limiter_waits_for_the_tokens_to_be_available():
+    rate_limiter = _TokenRateLimiter(tokens_per_period=100, period_in_seconds=0.2)
+
+    started_at = time.monotonic()
+    rate_limiter.acquire(60)
+    rate_limiter.acquire(40)
+    assert time.monotonic() - started_at < 0.1
+    rate_limiter.acquire(10)
+    assert time.monotonic() - started_at >= 0.2
+    # requests larger than the limit are sent alone
+    rate_limiter.acquire(1000)
@@ -0,0 +1,112 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from airbyte_cdk.destinations.vector_db_based import ProcessingConfigModel, SqliteEmbeddingCache, Writer
+from airbyte_cdk.destinations.vector_db_based.config import (
+    FakeEmbeddingConfigModel,
+    FromFieldEmbeddingConfigModel,
+    OpenAICompatibleEmbeddingConfigModel,
+    OpenAIEmbeddingConfigModel,
+)
+from airbyte_cdk.destinations.vector_db_based.embedder import Document, OpenAIEmbedder, create_from_config
+from airbyte_cdk.models.airbyte_protocol import AirbyteRecordMessage
+
+_OPENAI_CONFIG = OpenAIEmbeddingConfigModel(mode="openai", openai_key="a_key")
+
+
+def _a_compatible_config(model_name: str) -> OpenAICompatibleEmbeddingConfigModel:
+    return OpenAICompatibleEmbeddingConfigModel(
+        mode="openai_compatible", api_key="a_key", base_url="https://my-service.com", model_name=model_name, dimensions=2
+    )
+
+
+def _a_cache(path: str, embedding_config, **kwargs) -> SqliteEmbeddingCache:
+    embedder = create_from_config(embedding_config, ProcessingConfigModel(chunk_size=1000, text_fields=["text"]))
+    return SqliteEmbeddingCache(path, embedding_config, embedder, **kwargs)
+
+
+def _a_document(text: str) -> Document:
+    return Document(page_content=text, record=AirbyteRecordMessage(stream="mystream", data={}, emitted_at=0))
+
+
+def test_embeddings_are_persisted(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = _a_cache(path, _OPENAI_CONFIG)
+    cache.put_embeddings(["a", "b"], [[0.1, 0.2], [0.3, 0.4]])
+    cache.close()
+
+    assert _a_cache(path, _OPENAI_CONFIG).get_embeddings(["b", "c", "a", "b"]) == [[0.3, 0.4], None, [0.1, 0.2], [0.3, 0.4]]
+
+
+def test_given_different_embedding_config_when_get_embeddings_then_miss(tmp_path):
+    path = str(tmp_path / "cache.db")
+    _a_cache(path, _a_compatible_config("a-model")).put_embeddings(["a"], [[0.1, 0.2]])
+
+    assert _a_cache(path, _a_compatible_config("another-model")).get_embeddings(["a"]) == [None]
+    assert _a_cache(path, FakeEmbeddingConfigModel(mode="fake")).get_embeddings(["a"]) == [None]
+
+
+def test_given_same_config_and_different_model_when_get_embeddings_then_miss(tmp_path):
+    path = str(tmp_path / "cache.db")
+    _a_cache(path, _OPENAI_CONFIG).put_embeddings(["a"], [[0.1, 0.2]])
+    embedder = OpenAIEmbedder(_OPENAI_CONFIG, chunk_size=1000)
+    embedder.embeddings.model = "another-model"
+
+    assert SqliteEmbeddingCache(path, _OPENAI_CONFIG, embedder).get_embeddings(["a"]) == [None]
+
+
+def test_given_same_config_and_different_dimensions_when_get_embeddings_then_miss(tmp_path):
+    path = str(tmp_path / "cache.db")
+    _a_cache(path, _OPENAI_CONFIG).put_embeddings(["a"], [[0.1, 0.2]])
+
+    with patch.object(OpenAIEmbedder, "embedding_dimensions", new_callable=PropertyMock, return_value=3072):
+        assert _a_cache(path, _OPENAI_CONFIG).get_embeddings(["a"]) == [None]
+
+
+def test_given_different_secret_when_get_embeddings_then_hit(tmp_path):
+    path = str(tmp_path / "cache.db")
+    _a_cache(path, _OPENAI_CONFIG).put_embeddings(["a"], [[0.1, 0.2]])
+
+    assert _a_cache(path, OpenAIEmbeddingConfigModel(mode="openai", openai_key="a_new_key")).get_embeddings(["a"]) == [[0.1, 0.2]]
+
+
+def test_given_cache_is_full_when_put_embeddings_then_evict_least_recently_used(tmp_path):
+    # each embedding of 2 floats takes 16 bytes
+    cache = _a_cache(str(tmp_path / "cache.db"), _OPENAI_CONFIG, max_size_bytes=16 * 3)
+    cache.put_embeddings(["a", "b", "c"], [[0.0, 1.0], [1.0, 2.0], [2.0, 3.0]])
+    cache.get_embeddings(["a"])
+
+    cache.put_embeddings(["d"], [[3.0, 4.0]])
+
+    # the cache is brought back to 90% of its maximum size
+    assert cache.get_embeddings(["a", "b", "c", "d"]) == [[0.0, 1.0], None, None, [3.0, 4.0]]
+
+
+def test_given_from_field_embedding_when_create_cache_then_raise(tmp_path):
+    with pytest.raises(ValueError):
+        _a_cache(str(tmp_path / "cache.db"), FromFieldEmbeddingConfigModel(mode="from_field", field_name="a", dimensions=2))
+
+
+def test_writer_only_embeds_documents_missing_from_the_cache(tmp_path):
+    cache = _a_cache(str(tmp_path / "cache.db"), _OPENAI_CONFIG)
+    cache.put_embeddings(["a", "c"], [[0.0, 1.0], [2.0, 3.0]])
+    embedder = MagicMock()
+    embedder.embed_documents.side_effect = lambda documents: [[float(len(document.page_content))] * 2 for document in documents]
+    writer = Writer(
+        ProcessingConfigModel(chunk_size=1000, text_fields=["text"]),
+        MagicMock(),
+        embedder,
+        batch_size=32,
+        omit_raw_text=False,
+        embedding_cache=cache,
+    )
+
+    embeddings = writer._embed_documents([_a_document("a"), _a_document("bb"), _a_document("c"), _a_document("dddd")])
+
+    assert embeddings == [[0.0, 1.0], [2.0, 2.0], [2.0, 3.0], [4.0, 4.0]]
+    assert [document.page_content for document in embedder.embed_documents.call_args[0][0]] == ["bb", "dddd"]
+    assert cache.get_embeddings(["bb", "dddd"]) == [[2.0, 2.0], [4.0, 4.0]]
@@ -2,11 +2,12 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
 from typing import Optional
 from unittest.mock import ANY, MagicMock, call
 
 import pytest
-from airbyte_cdk.destinations.vector_db_based import ProcessingConfigModel, Writer
+from airbyte_cdk.destinations.vector_db_based import PipelinedWriter, ProcessingConfigModel, Writer
 from airbyte_cdk.models.airbyte_protocol import (
     AirbyteLogMessage,
     AirbyteMessage,
@@ -115,7 +116,8 @@ def test_write(omit_raw_text: bool):
     mock_indexer.post_sync.assert_called()
 
 
-def test_write_stream_namespace_split():
+@pytest.mark.parametrize("writer_class", [Writer, PipelinedWriter])
+def test_write_stream_namespace_split(writer_class):
     """
     Test separate handling of streams and namespaces in the writer
 
@@ -148,7 +150,7 @@ def test_write_stream_namespace_split():
     mock_indexer.post_sync.return_value = []
 
     # Create the DestinationLangchain instance
-    writer = Writer(config_model, mock_indexer, mock_embedder, BATCH_SIZE, False)
+    writer = writer_class(config_model, mock_indexer, mock_embedder, BATCH_SIZE, False)
 
     output_messages = writer.write(configured_catalog, input_messages)
     next(output_messages)
@@ -170,3 +172,118 @@ def test_write_stream_namespace_split():
         ]
     )
     assert mock_embedder.embed_documents.call_count == 4
+
+
+@pytest.mark.parametrize("omit_raw_text", [True, False])
+def test_pipelined_write(omit_raw_text: bool):
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+
+    configured_catalog: ConfiguredAirbyteCatalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+    input_messages = [_generate_record_message(i) for i in range(BATCH_SIZE + 5)]
+    state_message = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage())
+    input_messages.append(state_message)
+    input_messages.extend([_generate_record_message(i) for i in range(5)])
+
+    mock_embedder = generate_mock_embedder()
+    mock_indexer = MagicMock()
+    post_sync_log_message = AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message="post sync"))
+    mock_indexer.post_sync.return_value = [post_sync_log_message]
+    index_call_count_when_state_is_emitted = []
+
+    writer = PipelinedWriter(config_model, mock_indexer, mock_embedder, BATCH_SIZE, omit_raw_text)
+    output_messages = []
+    for message in writer.write(configured_catalog, input_messages):
+        output_messages.append(message)
+        if message == state_message:
+            index_call_count_when_state_is_emitted.append(mock_indexer.index.call_count)
+
+    assert output_messages == [state_message, post_sync_log_message]
+    # the state message is only emitted once the two batches before it are indexed
+    assert index_call_count_when_state_is_emitted[0] >= 2
+    mock_indexer.pre_sync.assert_called_with(configured_catalog)
+    assert mock_indexer.index.call_count == 3
+    assert mock_indexer.delete.call_count == 3
+    assert mock_embedder.embed_documents.call_count == 3
+    for call_args in mock_indexer.index.call_args_list:
+        for chunk in call_args[0][0]:
+            assert (chunk.page_content is None) == omit_raw_text
+    mock_indexer.post_sync.assert_called()
+
+
+@pytest.mark.parametrize("writer_class", [Writer, PipelinedWriter])
+def test_write_with_processing_workers_indexes_the_same_chunks(writer_class):
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+    configured_catalog: ConfiguredAirbyteCatalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+    state_message = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage())
+    input_messages = [_generate_record_message(i) for i in range(BATCH_SIZE * 5)] + [state_message]
+    input_messages.extend([_generate_record_message(i) for i in range(BATCH_SIZE * 5, BATCH_SIZE * 5 + 10)])
+
+    def indexed_texts_when_writing(max_processing_workers: int):
+        mock_indexer = MagicMock()
+        mock_indexer.post_sync.return_value = []
+        indexed_texts = []
+        texts_indexed_when_state_is_emitted = []
+        mock_indexer.index.side_effect = lambda chunks, namespace, stream: indexed_texts.extend(chunk.page_content for chunk in chunks)
+        writer = writer_class(
+            config_model, mock_indexer, generate_mock_embedder(), BATCH_SIZE, False, max_processing_workers=max_processing_workers
+        )
+        for output_message in writer.write(configured_catalog, input_messages):
+            assert output_message == state_message
+            texts_indexed_when_state_is_emitted.append(len(indexed_texts))
+        return indexed_texts, texts_indexed_when_state_is_emitted
+
+    indexed_texts, texts_indexed_when_state_is_emitted = indexed_texts_when_writing(max_processing_workers=2)
+
+    assert indexed_texts == indexed_texts_when_writing(max_processing_workers=0)[0]
+    # the records buffered for processing before the state message are indexed before it is emitted
+    assert len(texts_indexed_when_state_is_emitted) == 1 and texts_indexed_when_state_is_emitted[0] >= BATCH_SIZE * 5
+    assert len(indexed_texts) == BATCH_SIZE * 5 + 10
+
+
+def test_pipelined_write_indexes_batches_in_order_while_embedding_concurrently():
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+    configured_catalog: ConfiguredAirbyteCatalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+    input_messages = [_generate_record_message(i) for i in range(BATCH_SIZE * 4)]
+    state_message = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage())
+    input_messages.append(state_message)
+
+    embedding_started = threading.Barrier(2, timeout=5)
+
+    def embed_documents(documents):
+        # The first two batches only complete if they are embedded at the same time
+        if documents[0].record.data["id"] < BATCH_SIZE * 2:
+            embedding_started.wait()
+        return [[0] * 1536] * len(documents)
+
+    mock_embedder = MagicMock()
+    mock_embedder.embed_documents.side_effect = embed_documents
+    mock_indexer = MagicMock()
+    mock_indexer.post_sync.return_value = []
+    indexed_ids = []
+    mock_indexer.index.side_effect = lambda chunks, namespace, stream: indexed_ids.extend(chunk.record.data["id"] for chunk in chunks)
+
+    writer = PipelinedWriter(config_model, mock_indexer, mock_embedder, BATCH_SIZE, False, max_concurrent_embeddings=2)
+    output_messages = list(writer.write(configured_catalog, input_messages))
+
+    assert output_messages == [state_message]
+    assert indexed_ids == list(range(BATCH_SIZE * 4))
+    assert mock_indexer.delete.call_count == 4
+
+
+def test_given_indexing_error_when_pipelined_write_then_raise_and_do_not_emit_state():
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+    configured_catalog: ConfiguredAirbyteCatalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+    input_messages = [_generate_record_message(i) for i in range(BATCH_SIZE * 4)]
+    input_messages.append(AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage()))
+
+    mock_indexer = MagicMock()
+    mock_indexer.index.side_effect = ValueError("indexing failed")
+
+    writer = PipelinedWriter(config_model, mock_indexer, generate_mock_embedder(), BATCH_SIZE, False)
+    output_messages = []
+    with pytest.raises(ValueError):
+        for message in writer.write(configured_catalog, input_messages):
+            output_messages.append(message)
+
+    assert output_messages == []
+    mock_indexer.post_sync.assert_not_called()
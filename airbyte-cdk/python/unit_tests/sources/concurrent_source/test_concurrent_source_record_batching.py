@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import time
+from typing import List
+
+import pytest
+from airbyte_cdk.models import Type
+from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
+from airbyte_cdk.sources.message import InMemoryMessageRepository
+from airbyte_cdk.sources.streams.concurrent.cursor import FinalStateCursor
+from airbyte_cdk.sources.streams.concurrent.default_stream import DefaultStream
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from unit_tests.sources.streams.concurrent.scenarios.thread_based_concurrent_stream_source_builder import (
+    AlwaysAvailableAvailabilityStrategy,
+    InMemoryPartition,
+    InMemoryPartitionGenerator,
+    NeverLogSliceLogger,
+)
+
+_LOGGER = logging.getLogger("airbyte")
+_STREAM_NAME = "stream"
+_NUMBER_OF_PARTITIONS = 40
+_RECORDS_PER_PARTITION = 500
+
+
+def _a_stream(number_of_partitions: int, records_per_partition: int) -> DefaultStream:
+    message_repository = InMemoryMessageRepository()
+    partitions = [
+        InMemoryPartition(
+            f"partition_{partition_index}",
+            _STREAM_NAME,
+            {"partition": partition_index},
+            [Record({"id": partition_index * records_per_partition + index}, _STREAM_NAME) for index in range(records_per_partition)],
+        )
+        for partition_index in range(number_of_partitions)
+    ]
+    return DefaultStream(
+        partition_generator=InMemoryPartitionGenerator(partitions),
+        name=_STREAM_NAME,
+        json_schema={},
+        availability_strategy=AlwaysAvailableAvailabilityStrategy(),
+        primary_key=[],
+        cursor_field=None,
+        logger=_LOGGER,
+        cursor=FinalStateCursor(stream_name=_STREAM_NAME, stream_namespace=None, message_repository=message_repository),
+    )
+
+
+def _read_record_ids(num_workers: int, record_batch_size: int, stream: DefaultStream, num_partition_processes: int = 0) -> List[int]:
+    source = ConcurrentSource.create(
+        num_workers,
+        1,
+        _LOGGER,
+        NeverLogSliceLogger(),
+        InMemoryMessageRepository(),
+        record_batch_size=record_batch_size,
+        num_partition_processes=num_partition_processes,
+    )
+    return [message.record.data["id"] for message in source.read([stream]) if message.type == Type.RECORD]
+
+
+@pytest.mark.parametrize("record_batch_size", [1, 7, 100])
+def test_given_record_batch_size_when_read_then_all_records_are_emitted(record_batch_size):
+    record_ids = _read_record_ids(4, record_batch_size, _a_stream(_NUMBER_OF_PARTITIONS, _RECORDS_PER_PARTITION))
+
+    assert sorted(record_ids) == list(range(_NUMBER_OF_PARTITIONS * _RECORDS_PER_PARTITION))
+
+
+def test_given_num_partition_processes_when_read_then_records_read_in_other_processes_are_emitted():
+    record_ids = _read_record_ids(4, 1, _a_stream(_NUMBER_OF_PARTITIONS, _RECORDS_PER_PARTITION), num_partition_processes=2)
+
+    assert sorted(record_ids) == list(range(_NUMBER_OF_PARTITIONS * _RECORDS_PER_PARTITION))
+
+
+def test_benchmark_records_per_second_by_number_of_workers_with_and_without_batching():
+    """
+    Not a performance assertion: this logs the throughput of the main thread consuming records produced by an increasing number of
+    workers so the effect of batching can be compared locally (run with `-o log_cli=true`).
+    """
+    results = []
+    for num_workers in [2, 4, 8, 16]:
+        for record_batch_size in [1, 100]:
+            stream = _a_stream(_NUMBER_OF_PARTITIONS, _RECORDS_PER_PARTITION)
+            start = time.perf_counter()
+            number_of_records = len(_read_record_ids(num_workers, record_batch_size, stream))
+            records_per_second = number_of_records / (time.perf_counter() - start)
+            results.append((num_workers, record_batch_size, records_per_second))
+            assert number_of_records == _NUMBER_OF_PARTITIONS * _RECORDS_PER_PARTITION
+
+    for num_workers, record_batch_size, records_per_second in results:
+        _LOGGER.info(f"workers={num_workers:>2} record_batch_size={record_batch_size:>3} records/sec={records_per_second:,.0f}")
@@ -0,0 +1,145 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from datetime import timedelta
+from typing import Dict, Iterable, List
+from unittest.mock import Mock
+
+import pytest
+import requests
+from airbyte_cdk.sources.declarative.async_job.job import AsyncJob
+from airbyte_cdk.sources.declarative.async_job.job_orchestrator import AsyncJobOrchestrator
+from airbyte_cdk.sources.declarative.async_job.repository import AsyncJobRepository
+from airbyte_cdk.sources.declarative.async_job.status import AsyncJobStatus
+from airbyte_cdk.sources.types import StreamSlice
+from airbyte_cdk.utils.traced_exception import AirbyteTracedException
+
+
+def _slice(index: int) -> StreamSlice:
+    return StreamSlice(partition={"index": index}, cursor_slice={})
+
+
+class _FakeJobRepository(AsyncJobRepository):
+    """
+    Each poll moves the jobs one step forward in the list of statuses given for their slice. Jobs complete right away by default.
+    """
+
+    def __init__(self, statuses_per_slice_index: Dict[int, List[AsyncJobStatus]]) -> None:
+        self._statuses_per_slice_index = statuses_per_slice_index
+        self.started_jobs: List[AsyncJob] = []
+        self.polled_job_counts: List[int] = []
+        self.aborted_jobs: List[AsyncJob] = []
+        self.deleted_jobs: List[AsyncJob] = []
+
+    def start(self, stream_slice: StreamSlice) -> AsyncJob:
+        job = AsyncJob(str(len(self.started_jobs)), stream_slice)
+        self.started_jobs.append(job)
+        return job
+
+    def update_jobs_status(self, jobs: Iterable[AsyncJob]) -> None:
+        jobs = list(jobs)
+        self.polled_job_counts.append(len(jobs))
+        for job in jobs:
+            statuses = self._statuses_per_slice_index.get(job.job_parameters()["index"], [])
+            job.update_status(statuses.pop(0) if statuses else AsyncJobStatus.COMPLETED)
+
+    def fetch_results(self, job: AsyncJob) -> Iterable[requests.Response]:
+        yield Mock(spec=requests.Response)
+
+    def abort(self, job: AsyncJob) -> None:
+        self.aborted_jobs.append(job)
+
+    def delete(self, job: AsyncJob) -> None:
+        self.deleted_jobs.append(job)
+
+
+def _an_orchestrator(repository: AsyncJobRepository, number_of_slices: int, sleep: Mock, **kwargs) -> AsyncJobOrchestrator:
+    return AsyncJobOrchestrator(repository, [_slice(index) for index in range(number_of_slices)], sleep=sleep, **kwargs)
+
+
+def test_given_many_slices_when_create_and_get_completed_jobs_then_limit_running_jobs():
+    repository = _FakeJobRepository({index: [AsyncJobStatus.RUNNING] * index for index in range(10)})
+    orchestrator = _an_orchestrator(repository, 10, Mock(), max_concurrent_jobs=3)
+
+    completed_jobs = list(orchestrator.create_and_get_completed_jobs())
+
+    assert sorted(job.job_parameters()["index"] for job in completed_jobs) == list(range(10))
+    assert max(repository.polled_job_counts) == 3
+    assert not repository.aborted_jobs
+
+
+def test_given_jobs_complete_out_of_order_when_create_and_get_completed_jobs_then_yield_jobs_as_they_complete():
+    repository = _FakeJobRepository({0: [AsyncJobStatus.RUNNING] * 3, 1: [AsyncJobStatus.RUNNING], 2: []})
+    orchestrator = _an_orchestrator(repository, 3, Mock(), max_concurrent_jobs=3)
+
+    completed_jobs = list(orchestrator.create_and_get_completed_jobs())
+
+    assert [job.job_parameters()["index"] for job in completed_jobs] == [2, 1, 0]
+
+
+def test_given_no_job_completes_when_create_and_get_completed_jobs_then_back_off_exponentially_and_reset_on_completion():
+    repository = _FakeJobRepository({0: [AsyncJobStatus.RUNNING] * 4, 1: [AsyncJobStatus.RUNNING] * 6})
+    sleep = Mock()
+    orchestrator = _an_orchestrator(
+        repository, 2, sleep, max_concurrent_jobs=2, initial_polling_delay_in_seconds=1, max_polling_delay_in_seconds=4
+    )
+
+    list(orchestrator.create_and_get_completed_jobs())
+
+    assert [call.args[0] for call in sleep.call_args_list] == [1, 2, 4, 4, 1]
+
+
+def test_given_job_fails_when_create_and_get_completed_jobs_then_create_job_again_for_the_same_slice():
+    repository = _FakeJobRepository({1: [AsyncJobStatus.FAILED, AsyncJobStatus.TIMED_OUT]})
+    orchestrator = _an_orchestrator(repository, 2, Mock(), max_job_attempts=3)
+
+    completed_jobs = list(orchestrator.create_and_get_completed_jobs())
+
+    assert sorted(job.job_parameters()["index"] for job in completed_jobs) == [0, 1]
+    assert [job.job_parameters()["index"] for job in repository.started_jobs] == [0, 1, 1, 1]
+    # Only the timed out job is aborted as the API considers it as still running
+    assert [job.api_job_id() for job in repository.aborted_jobs] == ["2"]
+    assert [job.api_job_id() for job in repository.deleted_jobs if job.status() == AsyncJobStatus.FAILED] == ["1"]
+
+
+def test_given_job_fails_too_many_times_when_create_and_get_completed_jobs_then_raise_and_abort_running_jobs():
+    repository = _FakeJobRepository({0: [AsyncJobStatus.FAILED] * 2, 1: [AsyncJobStatus.RUNNING] * 10})
+    orchestrator = _an_orchestrator(repository, 2, Mock(), max_job_attempts=2)
+
+    with pytest.raises(AirbyteTracedException):
+        list(orchestrator.create_and_get_completed_jobs())
+
+    assert [job.job_parameters()["index"] for job in repository.aborted_jobs] == [1]
+
+
+def test_given_consumer_stops_when_create_and_get_completed_jobs_then_abort_running_jobs():
+    repository = _FakeJobRepository({1: [AsyncJobStatus.RUNNING] * 10})
+    orchestrator = _an_orchestrator(repository, 2, Mock())
+
+    completed_jobs = orchestrator.create_and_get_completed_jobs()
+    next(completed_jobs)
+    completed_jobs.close()
+
+    assert [job.job_parameters()["index"] for job in repository.aborted_jobs] == [1]
+
+
+def test_when_fetch_results_then_delete_job_once_results_are_fetched():
+    repository = _FakeJobRepository({})
+    orchestrator = _an_orchestrator(repository, 1, Mock())
+    job = next(orchestrator.create_and_get_completed_jobs())
+
+    results = orchestrator.fetch_results(job)
+    next(results)
+    assert not repository.deleted_jobs
+    list(results)
+
+    assert repository.deleted_jobs == [job]
+
+
+def test_given_job_reaches_timeout_when_status_then_timed_out():
+    job = AsyncJob("an_api_job_id", _slice(0), timeout=timedelta(seconds=-1))
+
+    assert job.status() == AsyncJobStatus.TIMED_OUT
+    job.update_status(AsyncJobStatus.COMPLETED)
+    assert job.status() == AsyncJobStatus.COMPLETED
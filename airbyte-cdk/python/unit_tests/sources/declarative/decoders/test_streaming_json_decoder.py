@@ -0,0 +1,120 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+import json
+import tracemalloc
+
+import pytest
+import requests
+from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
+from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
+
+_BODIES = [
+    {"data": [{"id": 1}, {"id": 2, "nested": {"values": [1.5, -2e10, None, True, 'a \\"quoted\\" string']}}], "meta": {"count": 2}},
+    {"meta": {"next": None}, "data": {"id": 1, "data": [3]}},
+    {"data": [], "other": [{"id": 1}]},
+    {"data": {}},
+    {"data": 12345678},
+    {"data": [{"record": {"id": 1}}, {"record": {"id": 2}}, {"not_a_record": 3}]},
+    [{"data": [{"id": 1}]}, {"data": {"id": 2}}, {"other": 3}],
+    [{"id": 1}, [{"id": 2}], {}],
+    {"dàtà": [{"ünicode": "✓ ü 🎉"}]},
+    {},
+    [],
+]
+_FIELD_PATHS = [
+    [],
+    ["data"],
+    ["data", "*"],
+    ["data", "*", "record"],
+    ["*", "count"],
+    ["data", "1"],
+    ["d?ta"],
+    ["dàtà"],
+    ["missing", "path"],
+]
+
+
+def _a_response(requests_mock, body: str) -> requests.Response:
+    requests_mock.register_uri("GET", "https://airbyte.io/", text=body)
+    return requests.get("https://airbyte.io/", stream=True)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+@pytest.mark.parametrize("body", _BODIES)
+def test_decode_is_equivalent_to_json_decoder(requests_mock, body, chunk_size):
+    expected = list(JsonDecoder(parameters={}).decode(_a_response(requests_mock, json.dumps(body))))
+
+    assert list(StreamingJsonDecoder(parameters={}, chunk_size=chunk_size).decode(_a_response(requests_mock, json.dumps(body)))) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+@pytest.mark.parametrize("field_path", _FIELD_PATHS)
+@pytest.mark.parametrize("body", _BODIES)
+def test_extract_records_is_equivalent_to_json_decoder(requests_mock, body, field_path, chunk_size):
+    serialized_body = json.dumps(body, indent=1, ensure_ascii=False)
+    expected = list(
+        DpathExtractor(field_path, {}, {}, JsonDecoder(parameters={})).extract_records(_a_response(requests_mock, serialized_body))
+    )
+
+    streaming_extractor = DpathExtractor(field_path, {}, {}, StreamingJsonDecoder(parameters={}, chunk_size=chunk_size))
+    assert list(streaming_extractor.extract_records(_a_response(requests_mock, serialized_body))) == expected
+
+
+_NUMBERS_PAYLOAD = '{"data":[1.5,2.25,-3e5]}'
+_SKIPPED_VALUES_PAYLOAD = json.dumps(
+    {
+        "skipped": {"a": 'x"]}', "b": [1, {"c": "\\"}, []], "d": '\\"'},
+        "data": [-0.5e-3, {"id": '"}', "values": [10, 2e2]}, "\\"],
+        "other": ["[", "{"],
+    },
+    separators=(",", ":"),
+)
+
+
+@pytest.mark.parametrize("chunk_size", range(1, len(_NUMBERS_PAYLOAD) + 1))
+def test_given_numbers_split_across_chunks_when_decode_then_equivalent_to_json_loads(requests_mock, chunk_size):
+    decoder = StreamingJsonDecoder(parameters={}, chunk_size=chunk_size)
+
+    assert list(decoder.decode(_a_response(requests_mock, _NUMBERS_PAYLOAD))) == [json.loads(_NUMBERS_PAYLOAD)]
+    assert list(decoder.decode_field_path(_a_response(requests_mock, _NUMBERS_PAYLOAD), ["data"])) == json.loads(_NUMBERS_PAYLOAD)["data"]
+
+
+@pytest.mark.parametrize("chunk_size", range(1, len(_SKIPPED_VALUES_PAYLOAD) + 1))
+def test_given_skipped_values_split_across_chunks_when_decode_field_path_then_equivalent_to_json_loads(requests_mock, chunk_size):
+    decoder = StreamingJsonDecoder(parameters={}, chunk_size=chunk_size)
+
+    records = list(decoder.decode_field_path(_a_response(requests_mock, _SKIPPED_VALUES_PAYLOAD), ["data"]))
+
+    assert records == json.loads(_SKIPPED_VALUES_PAYLOAD)["data"]
+
+
+@pytest.mark.parametrize(
+    "body, expected_records",
+    [("", []), ('{"data": [{"id": 1}, {"id": ', [{"id": 1}])],
+    ids=["empty_response", "truncated_response"],
+)
+def test_given_invalid_json_when_decode_then_stop_after_the_last_valid_record(requests_mock, body, expected_records):
+    assert list(StreamingJsonDecoder(parameters={}).decode(_a_response(requests_mock, body))) == [{}]
+    assert list(StreamingJsonDecoder(parameters={}).decode_field_path(_a_response(requests_mock, body), ["data"])) == expected_records
+
+
+def test_given_large_response_when_extract_records_then_memory_is_bounded_by_a_record(requests_mock):
+    record = {"id": 1, "description": "x" * 1000}
+    body = json.dumps({"data": [record] * 20_000, "meta": {"page": 1}})
+    response = _a_response(requests_mock, body)
+    extractor = DpathExtractor(["data"], {}, {}, StreamingJsonDecoder(parameters={}))
+
+    tracemalloc.start()
+    number_of_records = sum(1 for _ in extractor.extract_records(response))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert number_of_records == 20_000
+    # requests_mock keeps the whole body in memory already so we only assert that it is not decoded as a whole
+    assert peak < len(body) / 4
+
+
+def test_is_stream_response():
+    assert StreamingJsonDecoder(parameters={}).is_stream_response()
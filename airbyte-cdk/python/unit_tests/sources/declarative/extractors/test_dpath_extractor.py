@@ -3,8 +3,12 @@
 #
 import io
 import json
+import logging
+import time
 from typing import Dict, List, Union
+from unittest.mock import patch
 
+import dpath
 import pytest
 import requests
 from airbyte_cdk import Decoder
@@ -91,3 +95,67 @@ def test_dpath_extractor(field_path: List, decoder: Decoder, body, expected_reco
     actual_records = list(extractor.extract_records(response))
 
     assert actual_records == expected_records
+
+
+@pytest.mark.parametrize(
+    "field_path, body, expected_records",
+    [
+        (["data", "-1"], {"data": [{"id": 1}, {"id": 2}]}, [{"id": 2}]),
+        (["data", "1"], {"data": [{"id": 1}, {"id": 2}]}, [{"id": 2}]),
+        (["data", "1"], {"data": {"1": {"id": 1}}}, []),
+        (["data", "*", "id"], {"data": {"a": {"id": 1}, "b": {"id": 2}, "c": {}}}, [1, 2]),
+        (["data", "*"], {"data": [[{"id": 1}], {"id": 2}]}, [[{"id": 1}], {"id": 2}]),
+        (["data", "item?"], {"data": {"item1": {"id": 1}}}, [{"id": 1}]),
+        (["data", "**", "id"], {"data": {"a": {"b": {"id": 1}}}}, [1]),
+    ],
+    ids=[
+        "test_negative_index",
+        "test_integer_index",
+        "test_interpolated_integer_segment_does_not_match_key",
+        "test_wildcard_on_object",
+        "test_wildcard_does_not_flatten_matched_lists",
+        "test_glob_segment",
+        "test_double_wildcard",
+    ],
+)
+def test_dpath_extractor_path_compilation_is_equivalent_to_dpath(field_path: List, body, expected_records: List):
+    extractor = DpathExtractor(field_path=field_path, config=config, decoder=decoder_json, parameters=parameters)
+
+    assert list(extractor.extract_records(create_response(body))) == expected_records
+
+
+def test_given_interpolated_field_path_when_extract_records_then_field_path_is_evaluated_once():
+    extractor = DpathExtractor(field_path=["{{ config['field'] }}"], config=config, decoder=decoder_json, parameters=parameters)
+
+    with patch.object(extractor._field_path[0], "eval", wraps=extractor._field_path[0].eval) as eval_mock:
+        for _ in range(3):
+            assert list(extractor.extract_records(create_response({"record_array": [{"id": 1}]}))) == [{"id": 1}]
+
+    eval_mock.assert_called_once()
+
+
+@pytest.mark.parametrize("field_path", [["data"], ["data", "*", "record"]])
+def test_benchmark_extract_records_on_large_page(field_path: List):
+    """
+    Not a performance assertion: this logs the time spent extracting the records of a large page with and without the compiled path
+    (run with `-o log_cli=true`).
+    """
+    body = {"data": [{"record": {"id": index, "name": f"name {index}", "tags": ["a", "b"]}} for index in range(10_000)], "next": None}
+    extractor = DpathExtractor(field_path=field_path, config=config, decoder=decoder_json, parameters=parameters)
+
+    def path_as_dpath(body):
+        return dpath.values(body, field_path) if "*" in field_path else dpath.get(body, field_path)
+
+    with patch.object(JsonDecoder, "decode", side_effect=lambda response: iter([body])):
+        start = time.perf_counter()
+        records = list(extractor.extract_records(create_response({})))
+        compiled_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected_records = path_as_dpath(body)
+    dpath_duration = time.perf_counter() - start
+
+    assert records == expected_records
+    logging.getLogger("airbyte").info(
+        f"field_path={field_path} records={len(records)} compiled={compiled_duration * 1000:.2f}ms dpath={dpath_duration * 1000:.2f}ms"
+    )
@@ -2,17 +2,27 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import logging
+import time
 from collections import OrderedDict
 from unittest.mock import Mock
 
 import pytest
+from airbyte_cdk.sources.declarative.incremental.datetime_based_cursor import DatetimeBasedCursor
 from airbyte_cdk.sources.declarative.incremental.declarative_cursor import DeclarativeCursor
-from airbyte_cdk.sources.declarative.incremental.per_partition_cursor import PerPartitionCursor, PerPartitionKeySerializer, StreamSlice
+from airbyte_cdk.sources.declarative.incremental.per_partition_cursor import (
+    CursorFactory,
+    PerPartitionCursor,
+    PerPartitionKeySerializer,
+    StreamSlice,
+)
 from airbyte_cdk.sources.declarative.partition_routers.partition_router import PartitionRouter
 from airbyte_cdk.sources.types import Record
 from airbyte_cdk.utils import AirbyteTracedException
 from airbyte_protocol.models import FailureType
 
+logger = logging.getLogger(__name__)
+
 PARTITION = {
     "partition_key string": "partition value",
     "partition_key int": 1,
@@ -526,3 +536,121 @@ def test_given_invalid_state_when_set_initial_state_then_raise_config_error(mock
         cursor.set_initial_state({"invalid_state": 1})
 
     assert exception.value.failure_type == FailureType.config_error
+
+
+def _bounded_cursor(mocked_cursor_factory, mocked_partition_router, partitions, max_partitions, cursor_state=None):
+    mocked_partition_router.stream_slices.return_value = [StreamSlice(partition=partition, cursor_slice={}) for partition in partitions]
+    mocked_partition_router.get_stream_state.return_value = {}
+    mocked_cursor_factory.create.side_effect = (
+        lambda: MockedCursorBuilder().with_stream_slices([{CURSOR_SLICE_FIELD: "a slice"}]).with_stream_state(cursor_state or {}).build()
+    )
+    return PerPartitionCursor(mocked_cursor_factory, mocked_partition_router, max_partitions=max_partitions)
+
+
+def test_given_slice_generated_by_cursor_when_observe_then_do_not_serialize_partition_again(mocked_cursor_factory, mocked_partition_router):
+    cursor = _bounded_cursor(mocked_cursor_factory, mocked_partition_router, [{"partition key": "a partition"}], max_partitions=10)
+    stream_slice = next(iter(cursor.stream_slices()))
+    cursor._partition_serializer = Mock(wraps=PerPartitionKeySerializer())
+
+    for _ in range(10):
+        cursor.observe(stream_slice, Record({}, stream_slice))
+    cursor.close_slice(stream_slice)
+
+    cursor._partition_serializer.to_partition_key.assert_not_called()
+
+
+def test_given_max_partitions_when_close_slices_then_state_is_updated_from_closed_slices(mocked_cursor_factory, mocked_partition_router):
+    partitions = [{"partition key": "first partition"}, {"partition key": "second partition"}]
+    cursor = _bounded_cursor(mocked_cursor_factory, mocked_partition_router, partitions, max_partitions=2, cursor_state=CURSOR_STATE)
+    cursor._global_cursor.get_stream_state.return_value = {}
+    stream_slices = iter(cursor.stream_slices())
+
+    cursor.close_slice(next(stream_slices))
+
+    assert cursor.get_stream_state() == {"states": [{"partition": partitions[0], "cursor": CURSOR_STATE}]}
+    cursor.close_slice(next(stream_slices))
+    assert cursor.get_stream_state() == {"states": [{"partition": partition, "cursor": CURSOR_STATE} for partition in partitions]}
+
+
+def test_given_more_partitions_than_max_partitions_then_fall_back_to_global_state(mocked_cursor_factory, mocked_partition_router):
+    partitions = [{"partition key": f"partition {index}"} for index in range(5)]
+    cursor = _bounded_cursor(mocked_cursor_factory, mocked_partition_router, partitions, max_partitions=2, cursor_state=CURSOR_STATE)
+
+    for stream_slice in cursor.stream_slices():
+        cursor.observe(stream_slice, Record({}, stream_slice))
+        cursor.close_slice(stream_slice)
+        assert len(cursor._cursor_per_partition) <= 2
+
+    assert cursor.get_stream_state() == {"use_global_cursor": True, "state": CURSOR_STATE}
+
+
+def test_given_global_cursor_when_all_slices_are_processed_then_close_global_cursor(mocked_cursor_factory, mocked_partition_router):
+    partitions = [{"partition key": "first partition"}, {"partition key": "second partition"}]
+    cursor = _bounded_cursor(mocked_cursor_factory, mocked_partition_router, partitions, max_partitions=10)
+    global_cursor = cursor._global_cursor
+
+    stream_slices = list(cursor.stream_slices())
+    cursor.close_slice(stream_slices[0])
+    global_cursor.close_slice.assert_not_called()
+    cursor.close_slice(stream_slices[1])
+
+    global_cursor.close_slice.assert_called_once()
+
+
+def test_given_global_state_when_stream_slices_then_new_partitions_start_from_global_state(mocked_cursor_factory, mocked_partition_router):
+    known_partition = {"partition key": "known partition"}
+    cursor = _bounded_cursor(
+        mocked_cursor_factory, mocked_partition_router, [known_partition, {"partition key": "new partition"}], max_partitions=10
+    )
+    global_state = {CURSOR_STATE_KEY: "global state value"}
+    cursor._global_cursor.get_stream_state.return_value = global_state
+    initial_state = {"states": [{"partition": known_partition, "cursor": CURSOR_STATE}], "state": global_state}
+
+    cursor.set_initial_state(initial_state)
+    list(cursor.stream_slices())
+
+    cursor._global_cursor.set_initial_state.assert_called_with(global_state)
+    assert cursor._cursor_per_partition[cursor._to_partition_key(known_partition)].set_initial_state.call_args.args == (CURSOR_STATE,)
+    new_partition_cursor = cursor._cursor_per_partition[cursor._to_partition_key({"partition key": "new partition"})]
+    new_partition_cursor.set_initial_state.assert_called_once_with(global_state)
+    assert cursor.get_stream_state() == {"states": [{"partition": known_partition, "cursor": CURSOR_STATE}], "state": global_state}
+
+
+def test_given_state_using_global_cursor_when_set_initial_state_then_keep_using_global_cursor(mocked_cursor_factory, mocked_partition_router):
+    cursor = _bounded_cursor(mocked_cursor_factory, mocked_partition_router, [{"partition key": "a partition"}], max_partitions=10)
+
+    cursor.set_initial_state({"use_global_cursor": True, "state": CURSOR_STATE})
+    for stream_slice in cursor.stream_slices():
+        cursor.close_slice(stream_slice)
+
+    assert "states" not in cursor.get_stream_state()
+    assert cursor.get_stream_state()["use_global_cursor"]
+
+
+def test_read_many_partitions_with_max_partitions_performance(mocked_partition_router):
+    number_of_partitions = 10_000
+    mocked_partition_router.stream_slices.return_value = [
+        StreamSlice(partition={"parent_id": index}, cursor_slice={}) for index in range(number_of_partitions)
+    ]
+    mocked_partition_router.get_stream_state.return_value = {}
+    cursor_factory = CursorFactory(
+        lambda: DatetimeBasedCursor(
+            start_datetime="2024-01-01T00:00:00Z",
+            end_datetime="2024-06-01T00:00:00Z",
+            cursor_field="updated_at",
+            datetime_format="%Y-%m-%dT%H:%M:%SZ",
+            config={},
+            parameters={},
+        )
+    )
+    cursor = PerPartitionCursor(cursor_factory, mocked_partition_router, max_partitions=2_000)
+
+    started_at = time.perf_counter()
+    for stream_slice in cursor.stream_slices():
+        cursor.observe(stream_slice, Record({"updated_at": "2024-02-01T00:00:00Z"}, stream_slice))
+        cursor.close_slice(stream_slice)
+        cursor.get_stream_state()  # the state is checkpointed after every slice
+    elapsed = time.perf_counter() - started_at
+
+    assert cursor.get_stream_state() == {"use_global_cursor": True, "state": {"updated_at": "2024-02-01T00:00:00Z"}}
+    logger.info(f"Read {number_of_partitions} partitions at {number_of_partitions / elapsed:.0f} partitions per second")
@@ -2,7 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import ast
 import datetime
+from unittest.mock import patch
 
 import pytest
 from airbyte_cdk import StreamSlice
@@ -274,3 +276,77 @@ def test_interpolation_private_partition_attribute():
     actual_output = JinjaInterpolation().eval(template, {}, **{"stream_slice": stream_slice})
 
     assert actual_output == expected_output
+
+
+def test_template_is_compiled_only_once():
+    interpolation = JinjaInterpolation()
+    # The cache is shared by all the instances so the template should not be used by any other test
+    template = "{{ record['id_compiled_only_once'] }}"
+
+    with patch.object(interpolation._environment, "from_string", wraps=interpolation._environment.from_string) as from_string, \
+            patch.object(interpolation._environment, "parse", wraps=interpolation._environment.parse) as parse:
+        values = [interpolation.eval(template, {}, record={"id_compiled_only_once": f"id_{i}"}) for i in range(5)]
+        other_instance_value = JinjaInterpolation().eval(template, {}, record={"id_compiled_only_once": "id_5"})
+
+    assert values == [f"id_{i}" for i in range(5)]
+    assert other_instance_value == "id_5"
+    assert from_string.call_count == 1
+    assert parse.call_count == 1
+
+
+def test_undeclared_variables_are_validated_against_each_context_even_when_template_is_cached():
+    interpolation = JinjaInterpolation()
+    template = "{{ record['id'] }}"
+
+    assert interpolation.eval(template, {}, record={"id": "an_id"}) == "an_id"
+    with pytest.raises(ValueError):
+        interpolation.eval(template, {})
+
+
+@pytest.mark.parametrize(
+    "static_string",
+    [
+        pytest.param("hello world", id="test_plain_string"),
+        pytest.param("{ not: a template }", id="test_single_braces"),
+        pytest.param("", id="test_empty_string"),
+    ],
+)
+def test_static_strings_are_not_rendered_by_jinja(static_string):
+    interpolation = JinjaInterpolation()
+
+    with patch.object(interpolation._environment, "from_string") as from_string, patch.object(interpolation._environment, "parse") as parse:
+        assert interpolation.eval(static_string, {}, default=static_string) == static_string
+
+    from_string.assert_not_called()
+    parse.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "s, expected_value",
+    [
+        pytest.param("hello\n", "hello", id="test_trailing_newline_is_dropped"),
+        pytest.param("hello\r\nworld", "hello\nworld", id="test_newlines_are_normalized"),
+    ],
+)
+def test_strings_with_newlines_are_rendered_by_jinja(s, expected_value):
+    assert interpolation.eval(s, {}) == expected_value
+
+
+@pytest.mark.parametrize(
+    "s, valid_types, expected_value, expected_literal_eval_call",
+    [
+        pytest.param("2022-01-01", None, "2022-01-01", True, id="test_date_is_not_a_literal"),
+        pytest.param("a_value", None, "a_value", False, id="test_word_is_not_evaluated"),
+        pytest.param("https://api.com", None, "https://api.com", False, id="test_url_is_not_evaluated"),
+        pytest.param(" 12", None, 12, True, id="test_leading_whitespace_is_ignored"),
+        pytest.param("True", None, True, True, id="test_boolean"),
+        pytest.param("None", (str,), "None", True, id="test_none_with_str_valid_types"),
+        pytest.param("'quoted'", (str,), "quoted", True, id="test_quoted_string_with_str_valid_types"),
+        pytest.param("set()", None, set(), True, id="test_empty_set"),
+    ],
+)
+def test_literal_eval_fast_path(s, valid_types, expected_value, expected_literal_eval_call):
+    with patch("airbyte_cdk.sources.declarative.interpolation.jinja.ast.literal_eval", wraps=ast.literal_eval) as literal_eval:
+        assert interpolation._literal_eval(s, valid_types) == expected_value
+
+    assert literal_eval.called == expected_literal_eval_call
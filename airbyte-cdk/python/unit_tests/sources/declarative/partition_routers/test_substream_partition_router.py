@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import time
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 
 import pytest as pytest
@@ -13,7 +14,7 @@ from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig, SubstreamPartitionRouter
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.streams.checkpoint import Cursor
-from airbyte_cdk.sources.types import Record
+from airbyte_cdk.sources.types import Record, StreamState
 from airbyte_cdk.utils import AirbyteTracedException
 
 parent_records = [{"id": 1, "data": "data1"}, {"id": 2, "data": "data2"}]
@@ -729,3 +730,125 @@ def test_substream_using_resumable_full_refresh_parent_stream(use_incremental_de
         if use_incremental_dependency:
             assert partition_router._parent_state["persona_3_characters"] == expected_parent_state[expected_counter]
         expected_counter += 1
+
+
+class _ClosedSlicesCursor(Cursor):
+    def __init__(self) -> None:
+        self._observed_records: List[Record] = []
+        self._closed_slices: List[str] = []
+
+    def set_initial_state(self, stream_state: StreamState) -> None:
+        pass
+
+    def observe(self, stream_slice: StreamSlice, record: Record) -> None:
+        self._observed_records.append(record)
+
+    def close_slice(self, stream_slice: StreamSlice, *args: Any) -> None:
+        self._closed_slices.append(stream_slice["slice"])
+
+    def get_stream_state(self) -> StreamState:
+        return {"closed_slices": list(self._closed_slices)}
+
+    def should_be_synced(self, record: Record) -> bool:
+        return True
+
+    def is_greater_than_or_equal(self, first: Record, second: Record) -> bool:
+        return bool(first["id"] >= second["id"])
+
+    def select_state(self, stream_slice: Optional[StreamSlice] = None) -> Optional[StreamState]:
+        return None
+
+
+class _CursorStateStream(MockStream):
+    @property
+    def state(self) -> Mapping[str, Any]:
+        return self._cursor.get_stream_state()
+
+    @state.setter
+    def state(self, value: Mapping[str, Any]) -> None:
+        pass
+
+
+class _SlowSliceStream(MockStream):
+    def __init__(self, slices, records, name, delay_by_slice: Mapping[str, float]):
+        super().__init__(slices, records, name)
+        self._delay_by_slice = delay_by_slice
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        time.sleep(self._delay_by_slice.get(stream_slice["slice"], 0))
+        yield from super().read_records(sync_mode, cursor_field, stream_slice, stream_state)
+
+
+def _a_concurrent_parent_stream_config(
+    parent_stream: MockStream, delay_by_slice: Mapping[str, float], incremental_dependency: bool
+) -> ParentStreamConfig:
+    return ParentStreamConfig(
+        stream=parent_stream,
+        parent_key="id",
+        partition_field="first_stream_id",
+        incremental_dependency=incremental_dependency,
+        max_concurrent_slices=3,
+        stream_factory=lambda: _SlowSliceStream(parent_slices, all_parent_data, "first_stream", delay_by_slice),
+        parameters={},
+        config={},
+    )
+
+
+@pytest.mark.parametrize("incremental_dependency", [False, True])
+def test_given_max_concurrent_slices_when_stream_slices_then_emit_slices_as_soon_as_parent_slice_is_read(incremental_dependency):
+    parent_stream = _CursorStateStream(parent_slices, all_parent_data, "first_stream", cursor=_ClosedSlicesCursor())
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[_a_concurrent_parent_stream_config(parent_stream, {"first": 0.5}, incremental_dependency)],
+        parameters={},
+        config={},
+    )
+
+    actual_slices = list(partition_router.stream_slices())
+
+    assert actual_slices == [
+        {"first_stream_id": 2, "parent_slice": {"slice": "second"}},
+        {"first_stream_id": 0, "parent_slice": {"slice": "first"}},
+        {"first_stream_id": 1, "parent_slice": {"slice": "first"}},
+    ]
+
+
+def test_given_max_concurrent_slices_and_incremental_dependency_when_stream_slices_then_parent_state_follows_parent_slice_order():
+    parent_cursor = _ClosedSlicesCursor()
+    parent_stream = _CursorStateStream(parent_slices, all_parent_data, "first_stream", cursor=parent_cursor)
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[_a_concurrent_parent_stream_config(parent_stream, {"first": 0.5}, incremental_dependency=True)],
+        parameters={},
+        config={},
+    )
+
+    parent_states = []
+    for _ in partition_router.stream_slices():
+        parent_states.append(partition_router.get_stream_state()["first_stream"])
+
+    # The second and third parent slices are read first but the parent state can only move past them once the first parent slice has
+    # been read
+    assert parent_states == [
+        {"closed_slices": []},
+        {"closed_slices": ["first", "second", "third"]},
+        {"closed_slices": ["first", "second", "third"]},
+    ]
+    assert partition_router.get_stream_state() == {"first_stream": {"closed_slices": ["first", "second", "third"]}}
+    assert [record["id"] for record in parent_cursor._observed_records] == [0, 1, 2]
+
+
+def test_given_max_concurrent_slices_without_stream_factory_when_create_parent_stream_config_then_raise_value_error():
+    with pytest.raises(ValueError):
+        ParentStreamConfig(
+            stream=MockStream(parent_slices, all_parent_data, "first_stream"),
+            parent_key="id",
+            partition_field="first_stream_id",
+            max_concurrent_slices=2,
+            parameters={},
+            config={},
+        )
@@ -0,0 +1,48 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from typing import List
+from unittest.mock import Mock
+
+import requests
+from airbyte_cdk.sources.declarative.async_job.job_orchestrator import AsyncJobOrchestrator
+from airbyte_cdk.sources.declarative.async_job.status import AsyncJobStatus
+from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
+from airbyte_cdk.sources.declarative.requesters.http_job_repository import AsyncHttpJobRepository
+from airbyte_cdk.sources.declarative.requesters.requester import Requester
+from airbyte_cdk.sources.types import StreamSlice
+
+
+def _a_requester() -> Mock:
+    requester = Mock(spec=Requester)
+    requester.send_request.return_value = Mock(spec=requests.Response)
+    requester.send_request.return_value.json.return_value = {"id": "a_job_id"}
+    return requester
+
+
+def _an_extractor(records_per_call: List[List[str]]) -> Mock:
+    extractor = Mock(spec=RecordExtractor)
+    extractor.extract_records.side_effect = records_per_call
+    return extractor
+
+
+def test_given_job_fails_then_completes_when_orchestrated_then_forget_about_both_jobs():
+    delete_requester = _a_requester()
+    repository = AsyncHttpJobRepository(
+        creation_requester=_a_requester(),
+        polling_requester=_a_requester(),
+        download_requester=_a_requester(),
+        status_extractor=_an_extractor([["failed"], ["completed"]]),
+        status_mapping={"failed": AsyncJobStatus.FAILED, "completed": AsyncJobStatus.COMPLETED},
+        urls_extractor=_an_extractor([["https://a_url.com"]]),
+        delete_requester=delete_requester,
+    )
+    orchestrator = AsyncJobOrchestrator(repository, [StreamSlice(partition={}, cursor_slice={})], sleep=Mock())
+
+    for job in orchestrator.create_and_get_completed_jobs():
+        list(orchestrator.fetch_results(job))
+
+    assert delete_requester.send_request.call_count == 2
+    assert not repository._create_job_response_by_id
+    assert not repository._urls_by_id
@@ -0,0 +1,167 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import json
+from typing import Any, List, Mapping
+from unittest.mock import patch
+
+import pytest
+from airbyte_cdk.models import AirbyteStream, ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode, Type
+from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.retrievers import AsyncRetriever
+from airbyte_cdk.sources.types import StreamSlice
+from airbyte_cdk.utils.traced_exception import AirbyteTracedException
+
+_URL_BASE = "https://api.airbyte.io/v1"
+_REPORTS = ["a_report", "another_report", "a_third_report"]
+
+
+def _a_manifest(**retriever_fields: Any) -> Mapping[str, Any]:
+    retriever = {
+        "type": "AsyncRetriever",
+        "partition_router": {"type": "ListPartitionRouter", "values": _REPORTS, "cursor_field": "report"},
+        "creation_requester": {
+            "type": "HttpRequester",
+            "url_base": _URL_BASE,
+            "path": "jobs",
+            "http_method": "POST",
+            "request_body_json": {"report": "{{ stream_slice['report'] }}"},
+        },
+        "polling_requester": {
+            "type": "HttpRequester",
+            "url_base": _URL_BASE,
+            "path": "jobs/{{ stream_slice['create_job_response']['id'] }}",
+        },
+        # The URLs of the results are absolute so they replace the url_base
+        "download_requester": {"type": "HttpRequester", "url_base": _URL_BASE, "path": "{{ stream_slice['url'] }}"},
+        "delete_requester": {
+            "type": "HttpRequester",
+            "url_base": _URL_BASE,
+            "path": "jobs/{{ stream_slice['create_job_response']['id'] }}",
+            "http_method": "DELETE",
+        },
+        "status_extractor": {"type": "DpathExtractor", "field_path": ["status"]},
+        "status_mapping": {"running": ["pending", "processing"], "completed": ["done"], "failed": ["error"], "timeout": []},
+        "urls_extractor": {"type": "DpathExtractor", "field_path": ["files", "*"]},
+        "decoder": {"type": "JsonlDecoder"},
+        "record_selector": {"type": "RecordSelector", "extractor": {"type": "DpathExtractor", "field_path": []}},
+        "max_concurrent_jobs": 2,
+    }
+    retriever.update(retriever_fields)
+    return {
+        "version": "0.51.0",
+        "definitions": {},
+        "streams": [
+            {
+                "type": "DeclarativeStream",
+                "name": "reports",
+                "primary_key": [],
+                "schema_loader": {"type": "InlineSchemaLoader", "schema": {"type": "object", "properties": {}}},
+                "retriever": retriever,
+            }
+        ],
+        "check": {"type": "CheckStream", "stream_names": ["reports"]},
+    }
+
+
+def _a_catalog() -> ConfiguredAirbyteCatalog:
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name="reports", json_schema={}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+        ]
+    )
+
+
+def _mock_report_jobs(requests_mock, polls_before_completion: Mapping[str, int]) -> None:
+    for report in _REPORTS:
+        job_id = f"{report}_job"
+        requests_mock.register_uri("POST", f"{_URL_BASE}/jobs", additional_matcher=_body_matcher(report), json={"id": job_id})
+        requests_mock.register_uri(
+            "GET",
+            f"{_URL_BASE}/jobs/{job_id}",
+            [{"json": {"status": "processing"}}] * polls_before_completion.get(report, 0)
+            + [{"json": {"status": "done", "files": [f"https://files.airbyte.io/{report}/0", f"https://files.airbyte.io/{report}/1"]}}],
+        )
+        requests_mock.register_uri("DELETE", f"{_URL_BASE}/jobs/{job_id}", json={})
+        for file_index in range(2):
+            requests_mock.register_uri(
+                "GET",
+                f"https://files.airbyte.io/{report}/{file_index}",
+                text="\n".join(json.dumps({"report": report, "file": file_index, "row": row}) for row in range(3)),
+            )
+
+
+def _body_matcher(report: str):
+    return lambda request: request.json() == {"report": report}
+
+
+def _read_records(manifest: Mapping[str, Any]) -> List[Mapping[str, Any]]:
+    source = ManifestDeclarativeSource(source_config=manifest)
+    messages = source.read(logger=source.logger, config={}, catalog=_a_catalog(), state=None)
+    return [message.record.data for message in messages if message.type == Type.RECORD]
+
+
+@patch("time.sleep", return_value=None)
+def test_given_many_slices_when_read_then_read_the_results_of_all_jobs(mock_sleep, requests_mock):
+    _mock_report_jobs(requests_mock, {"a_report": 3, "another_report": 1})
+
+    records = _read_records(_a_manifest())
+
+    assert sorted((record["report"], record["file"], record["row"]) for record in records) == sorted(
+        (report, file_index, row) for report in _REPORTS for file_index in range(2) for row in range(3)
+    )
+    # a_third_report is created once another_report completes and it completes before a_report which was created first
+    assert [record["report"] for record in records][::6] == ["another_report", "a_third_report", "a_report"]
+    assert len([request for request in requests_mock.request_history if request.method == "DELETE"]) == len(_REPORTS)
+
+
+@patch("time.sleep", return_value=None)
+def test_given_jobs_still_running_when_read_then_at_most_max_concurrent_jobs_run_at_the_same_time(mock_sleep, requests_mock):
+    _mock_report_jobs(requests_mock, {"a_report": 2, "another_report": 2, "a_third_report": 2})
+
+    _read_records(_a_manifest(max_concurrent_jobs=2))
+
+    running_jobs = 0
+    max_running_jobs = 0
+    for request in requests_mock.request_history:
+        if request.method == "POST":
+            running_jobs += 1
+            max_running_jobs = max(max_running_jobs, running_jobs)
+        elif request.method == "DELETE":
+            running_jobs -= 1
+    assert max_running_jobs == 2
+
+
+@patch("time.sleep", return_value=None)
+def test_given_job_fails_too_many_times_when_read_then_raise(mock_sleep, requests_mock):
+    _mock_report_jobs(requests_mock, {})
+    requests_mock.register_uri("GET", f"{_URL_BASE}/jobs/another_report_job", json={"status": "error"})
+
+    with pytest.raises(AirbyteTracedException):
+        _read_records(_a_manifest(max_job_attempts=2))
+
+
+def test_given_incremental_sync_when_create_stream_then_raise():
+    manifest = _a_manifest()
+    manifest["streams"][0]["incremental_sync"] = {
+        "type": "DatetimeBasedCursor",
+        "cursor_field": "updated_at",
+        "datetime_format": "%Y-%m-%d",
+        "start_datetime": "2024-01-01",
+    }
+
+    with pytest.raises(ValueError):
+        ManifestDeclarativeSource(source_config=manifest).streams(config={})
+
+
+def test_given_slice_not_coming_from_stream_slices_when_read_records_then_raise():
+    retriever = ManifestDeclarativeSource(source_config=_a_manifest()).streams(config={})[0].retriever
+    assert isinstance(retriever, AsyncRetriever)
+
+    with pytest.raises(AirbyteTracedException):
+        list(retriever.read_records({}, StreamSlice(partition={"report": "a_report"}, cursor_slice={})))
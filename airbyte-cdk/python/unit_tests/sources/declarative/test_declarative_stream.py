@@ -215,6 +215,29 @@ def test_is_resumable(use_cursor, expected_supports_checkpointing):
     assert stream.is_resumable == expected_supports_checkpointing
 
 
+def test_given_many_slices_when_read_records_then_load_schema_once_and_pass_the_same_schema_to_the_retriever():
+    schema_loader = _schema_loader()
+    schema_loader.get_json_schema.side_effect = lambda: dict(_json_schema)
+    retriever = MagicMock()
+    retriever.read_records.return_value = []
+    stream = DeclarativeStream(
+        name=_name,
+        primary_key=_primary_key,
+        schema_loader=schema_loader,
+        retriever=retriever,
+        config={},
+        parameters={},
+    )
+
+    for day in range(1, 4):
+        list(stream.read_records(SyncMode.full_refresh, stream_slice=StreamSlice(partition={}, cursor_slice={"date": f"2021-01-0{day}"})))
+
+    schema_loader.get_json_schema.assert_called_once()
+    records_schemas = [call.args[0] for call in retriever.read_records.call_args_list]
+    assert records_schemas[0] == _json_schema
+    assert all(records_schema is records_schemas[0] for records_schema in records_schemas)
+
+
 def _schema_loader():
     schema_loader = MagicMock()
     schema_loader.get_json_schema.return_value = _json_schema
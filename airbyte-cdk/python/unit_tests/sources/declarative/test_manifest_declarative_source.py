@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import datetime
 import json
 import logging
 import os
@@ -657,6 +658,78 @@ class TestManifestDeclarativeSource:
         with pytest.raises(ValidationError):
             ManifestDeclarativeSource(source_config=manifest)
 
+    def test_given_compiled_manifest_when_create_source_then_do_not_process_manifest_again(self):
+        manifest = self._a_manifest_with_references()
+        compiled_manifest = json.loads(json.dumps(ManifestDeclarativeSource(source_config=manifest).compiled_manifest))
+
+        with patch.object(ManifestDeclarativeSource, "_validate_source") as validate_source:
+            source = ManifestDeclarativeSource(source_config=manifest, compiled_manifest=compiled_manifest)
+
+        validate_source.assert_not_called()
+        assert source.resolved_manifest == ManifestDeclarativeSource(source_config=manifest).resolved_manifest
+        assert [stream.name for stream in source.streams({})] == ["lists"]
+
+    def test_given_compiled_manifest_of_another_manifest_when_create_source_then_process_manifest(self):
+        manifest = self._a_manifest_with_references()
+        compiled_manifest = ManifestDeclarativeSource(source_config=manifest).compiled_manifest
+        manifest["definitions"]["requester"]["path"] = "/v4/marketing/lists"
+
+        with patch.object(ManifestDeclarativeSource, "_validate_source") as validate_source:
+            source = ManifestDeclarativeSource(source_config=manifest, compiled_manifest=compiled_manifest)
+
+        validate_source.assert_called_once()
+        assert source.resolved_manifest["streams"][0]["retriever"]["requester"]["path"] == "/v4/marketing/lists"
+
+    def test_given_no_compiled_manifest_when_create_source_then_do_not_compute_manifest_hash(self):
+        with patch.object(ManifestDeclarativeSource, "_get_manifest_hash") as get_manifest_hash:
+            ManifestDeclarativeSource(source_config=self._a_manifest_with_references())
+
+        get_manifest_hash.assert_not_called()
+
+    def test_given_mapping_with_keys_of_different_types_when_compiled_manifest_then_manifest_is_compiled(self):
+        manifest = self._a_manifest_with_references()
+        manifest["definitions"]["mapping"] = {1: "an integer key", "a": "a string key", None: "a null key"}
+        compiled_manifest = ManifestDeclarativeSource(source_config=manifest).compiled_manifest
+
+        with patch.object(ManifestDeclarativeSource, "_validate_source") as validate_source:
+            ManifestDeclarativeSource(source_config=manifest, compiled_manifest=compiled_manifest)
+
+        validate_source.assert_not_called()
+
+    def test_given_date_and_same_date_as_string_when_compiled_manifest_then_hashes_differ(self):
+        manifest_with_date = self._a_manifest_with_references()
+        manifest_with_date["definitions"]["start_date"] = datetime.date(2024, 1, 1)
+        manifest_with_string = self._a_manifest_with_references()
+        manifest_with_string["definitions"]["start_date"] = "2024-01-01"
+
+        assert (
+            ManifestDeclarativeSource(source_config=manifest_with_date).compiled_manifest["manifest_hash"]
+            != ManifestDeclarativeSource(source_config=manifest_with_string).compiled_manifest["manifest_hash"]
+        )
+
+    @staticmethod
+    def _a_manifest_with_references() -> Mapping[str, Any]:
+        return {
+            "version": "0.29.3",
+            "definitions": {
+                "requester": {"type": "HttpRequester", "url_base": "https://api.sendgrid.com", "path": "/v3/marketing/lists"},
+            },
+            "streams": [
+                {
+                    "type": "DeclarativeStream",
+                    "name": "lists",
+                    "primary_key": "id",
+                    "schema_loader": {"type": "InlineSchemaLoader", "schema": {}},
+                    "retriever": {
+                        "type": "SimpleRetriever",
+                        "requester": {"$ref": "#/definitions/requester"},
+                        "record_selector": {"type": "RecordSelector", "extractor": {"type": "DpathExtractor", "field_path": ["result"]}},
+                    },
+                }
+            ],
+            "check": {"type": "CheckStream", "stream_names": ["lists"]},
+        }
+
     @patch("airbyte_cdk.sources.declarative.declarative_source.DeclarativeSource.read")
     def test_given_debug_when_read_then_set_log_level(self, declarative_source_read):
         any_valid_manifest = {
@@ -1266,14 +1339,14 @@ def _run_read(manifest: Mapping[str, Any], stream_name: str) -> List[AirbyteMess
 
 def test_declarative_component_schema_valid_ref_links():
     def load_yaml(file_path) -> Mapping[str, Any]:
-        with open(file_path, 'r') as file:
+        with open(file_path, "r") as file:
             return yaml.safe_load(file)
 
-    def extract_refs(data, base_path='#') -> List[str]:
+    def extract_refs(data, base_path="#") -> List[str]:
         refs = []
         if isinstance(data, dict):
             for key, value in data.items():
-                if key == '$ref' and isinstance(value, str) and value.startswith('#'):
+                if key == "$ref" and isinstance(value, str) and value.startswith("#"):
                     ref_path = value
                     refs.append(ref_path)
                 else:
@@ -1284,11 +1357,11 @@ def test_declarative_component_schema_valid_ref_links():
         return refs
 
     def resolve_pointer(data: Mapping[str, Any], pointer: str) -> bool:
-        parts = pointer.split('/')[1:]  # Skip the first empty part due to leading '#/'
+        parts = pointer.split("/")[1:]  # Skip the first empty part due to leading '#/'
         current = data
         try:
             for part in parts:
-                part = part.replace('~1', '/').replace('~0', '~')  # Unescape JSON Pointer
+                part = part.replace("~1", "/").replace("~0", "~")  # Unescape JSON Pointer
                 current = current[part]
             return True
         except (KeyError, TypeError):
@@ -1297,8 +1370,10 @@ def test_declarative_component_schema_valid_ref_links():
     def validate_refs(yaml_file: str) -> List[str]:
         data = load_yaml(yaml_file)
         refs = extract_refs(data)
-        invalid_refs = [ref for ref in refs if not resolve_pointer(data, ref.replace('#', ''))]
+        invalid_refs = [ref for ref in refs if not resolve_pointer(data, ref.replace("#", ""))]
         return invalid_refs
 
-    yaml_file_path = Path(__file__).resolve().parent.parent.parent.parent / 'airbyte_cdk/sources/declarative/declarative_component_schema.yaml'
+    yaml_file_path = (
+        Path(__file__).resolve().parent.parent.parent.parent / "airbyte_cdk/sources/declarative/declarative_component_schema.yaml"
+    )
     assert not validate_refs(yaml_file_path)
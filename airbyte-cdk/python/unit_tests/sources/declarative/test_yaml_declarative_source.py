@@ -2,11 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
 import logging
 import os
 import tempfile
+from unittest.mock import patch
 
 import pytest
+from airbyte_cdk.sources.declarative import compile_manifest
+from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
 from airbyte_cdk.sources.declarative.parsers.custom_exceptions import UndefinedReferenceException
 from airbyte_cdk.sources.declarative.yaml_declarative_source import YamlDeclarativeSource
 from yaml.parser import ParserError
@@ -41,6 +45,13 @@ class MockYamlDeclarativeSource(YamlDeclarativeSource):
             parsed_config = YamlDeclarativeSource._parse(config_content)
             return parsed_config
 
+    def _read_compiled_manifest(self, path_to_yaml_file):
+        try:
+            with open(self.compiled_manifest_path(path_to_yaml_file), "r") as f:
+                return json.load(f)
+        except OSError:
+            return None
+
 
 class TestYamlDeclarativeSource:
     def test_source_is_created_if_toplevel_fields_are_known(self):
@@ -129,6 +140,68 @@ class TestYamlDeclarativeSource:
         with pytest.raises(UndefinedReferenceException):
             MockYamlDeclarativeSource(temporary_file.filename)
 
+    def test_given_compiled_manifest_next_to_yaml_when_create_source_then_do_not_validate_manifest(self, tmp_path):
+        path_to_yaml = tmp_path / "manifest.yaml"
+        path_to_yaml.write_text(_A_VALID_MANIFEST)
+        compile_manifest.main([str(path_to_yaml)])
+
+        with patch.object(ManifestDeclarativeSource, "_validate_source") as validate_source:
+            source = MockYamlDeclarativeSource(str(path_to_yaml))
+
+        validate_source.assert_not_called()
+        assert source.resolved_manifest == MockYamlDeclarativeSource(str(path_to_yaml)).resolved_manifest
+        assert [stream.name for stream in source.streams({})] == ["lists"]
+
+    def test_given_outdated_compiled_manifest_when_create_source_then_validate_manifest(self, tmp_path):
+        path_to_yaml = tmp_path / "manifest.yaml"
+        path_to_yaml.write_text(_A_VALID_MANIFEST)
+        compile_manifest.main([str(path_to_yaml)])
+        path_to_yaml.write_text(_A_VALID_MANIFEST.replace("/v3/marketing/lists", "/v4/marketing/lists"))
+
+        with patch.object(ManifestDeclarativeSource, "_validate_source") as validate_source:
+            source = MockYamlDeclarativeSource(str(path_to_yaml))
+
+        validate_source.assert_called_once()
+        assert source.resolved_manifest["streams"][0]["retriever"]["requester"]["path"] == "/v4/marketing/lists"
+
+
+    def test_given_manifest_with_unquoted_date_when_compile_then_write_date_as_string(self, tmp_path):
+        path_to_yaml = tmp_path / "manifest.yaml"
+        path_to_yaml.write_text(_A_VALID_MANIFEST + "definitions:\n  start_date: 2024-01-01\n")
+        compile_manifest.main([str(path_to_yaml)])
+
+        with patch.object(ManifestDeclarativeSource, "_validate_source") as validate_source:
+            source = MockYamlDeclarativeSource(str(path_to_yaml))
+
+        validate_source.assert_not_called()
+        assert source.resolved_manifest["definitions"]["start_date"] == "2024-01-01"
+
+
+_A_VALID_MANIFEST = """
+version: "0.29.3"
+streams:
+  - type: DeclarativeStream
+    name: lists
+    primary_key: id
+    schema_loader:
+      type: InlineSchemaLoader
+      schema: {}
+    retriever:
+      type: SimpleRetriever
+      requester:
+        type: HttpRequester
+        url_base: "https://api.sendgrid.com"
+        path: "/v3/marketing/lists"
+      record_selector:
+        type: RecordSelector
+        extractor:
+          type: DpathExtractor
+          field_path: ["result"]
+check:
+  type: CheckStream
+  stream_names: ["lists"]
+"""
+
 
 class TestFileContent:
     def __init__(self, content):
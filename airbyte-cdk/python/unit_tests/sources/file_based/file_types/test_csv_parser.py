@@ -25,7 +25,7 @@ from airbyte_cdk.sources.file_based.config.csv_format import (
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
-from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser, _CsvReader
+from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser, _ArrowCsvReader, _CsvReader
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
@@ -618,17 +618,119 @@ def test_encoding_is_passed_to_stream_reader() -> None:
         ]
     )
 
-    mock_obj.__enter__ = Mock(return_value=io.StringIO("c1,c2\nv1,v2"))
+    sample_obj = stream_reader.open_file_sample.return_value
+    sample_obj.__enter__ = Mock(return_value=io.StringIO("c1,c2\nv1,v2"))
+    sample_obj.__exit__ = Mock(return_value=None)
     loop = asyncio.get_event_loop()
     loop.run_until_complete(parser.infer_schema(config, file, stream_reader, logger))
-    stream_reader.open_file.assert_called_with(file, FileReadMode.READ, encoding, logger)
-    stream_reader.open_file.assert_has_calls(
+    stream_reader.open_file_sample.assert_has_calls(
         [
-            mock.call(file, FileReadMode.READ, encoding, logger),
-            mock.call().__enter__(),
-            mock.call().__exit__(None, None, None),
-            mock.call(file, FileReadMode.READ, encoding, logger),
+            mock.call(file, FileReadMode.READ, encoding, logger, CsvParser._MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE),
             mock.call().__enter__(),
             mock.call().__exit__(None, None, None),
         ]
     )
+
+
+_ARROW_ENGINE_SCHEMA = {
+    "properties": {
+        "id": {"type": "integer"},
+        "amount": {"type": ["null", "number"]},
+        "is_active": {"type": "boolean"},
+        "payload": {"type": "object"},
+        "description": {"type": "string"},
+    }
+}
+
+
+@pytest.mark.parametrize(
+    "content, config_format, discovered_schema",
+    [
+        pytest.param(
+            'id,amount,is_active,payload,description,not_in_schema\n1,2.5,true,{},a,x\n2,,false,"{""a"": 1}",,y\n',
+            CsvFormat(),
+            _ARROW_ENGINE_SCHEMA,
+            id="cast_to_schema",
+        ),
+        pytest.param(
+            'id,amount,is_active,payload,description\nnot an int,not a number,maybe,not json," spaced "\n 3 ,1e3,1,1,NULL\n',
+            CsvFormat(null_values={"NULL", ""}, strings_can_be_null=True),
+            _ARROW_ENGINE_SCHEMA,
+            id="invalid_and_null_values",
+        ),
+        pytest.param(
+            'id,description\r\n1,"multi\r\nline"\r\n\r\n2,"quoted ""value"""\r\n',
+            CsvFormat(),
+            _ARROW_ENGINE_SCHEMA,
+            id="multiline_values_and_empty_lines",
+        ),
+        pytest.param("a;a;b\n1;2;\\;3\n", CsvFormat(delimiter=";", escape_char="\\"), None, id="duplicated_headers_and_escape_char"),
+        pytest.param(
+            "skipped\nid,description\nskipped\n1,a\n",
+            CsvFormat(skip_rows_before_header=1, skip_rows_after_header=1),
+            _ARROW_ENGINE_SCHEMA,
+            id="skipped_rows",
+        ),
+        pytest.param("1,a\n2,b\n", CsvFormat(header_definition=CsvHeaderAutogenerated()), None, id="autogenerated_headers"),
+        pytest.param(
+            "\ufeff1,a\n2,b\n",
+            CsvFormat(header_definition=CsvHeaderUserProvided(column_names=["id", "description"])),
+            _ARROW_ENGINE_SCHEMA,
+            id="user_provided_headers_and_byte_order_mark",
+        ),
+        pytest.param("id,description\n", CsvFormat(), _ARROW_ENGINE_SCHEMA, id="no_rows"),
+    ],
+)
+def test_arrow_engine_produces_the_same_records_and_warnings_as_the_csv_module(
+    content: str, config_format: CsvFormat, discovered_schema: Dict[str, Any]
+) -> None:
+    expected_records, expected_warnings = _parse_records(
+        CsvParser(arrow_csv_reader=_disabled_arrow_csv_reader()), content, config_format, discovered_schema
+    )
+
+    records, warnings = _parse_records(CsvParser(), content, config_format, discovered_schema)
+
+    assert records == expected_records
+    assert warnings == expected_warnings
+
+
+def test_given_value_larger_than_block_size_when_parse_records_then_read_the_rest_of_the_file_with_the_csv_module() -> None:
+    content = "id,description\n" + "".join(f"{index},{'a' * index * 10}\n" for index in range(20))
+
+    records, _ = _parse_records(CsvParser(arrow_csv_reader=_ArrowCsvReader(block_size=64)), content, CsvFormat(), _ARROW_ENGINE_SCHEMA)
+
+    assert records == [{"id": index, "description": "a" * index * 10} for index in range(20)]
+
+
+def test_given_row_with_missing_column_when_parse_records_then_raise_after_emitting_the_previous_records() -> None:
+    content = "id,description\n1,a\n2,b\n3\n4,d\n"
+    parsed_records = []
+
+    with pytest.raises(RecordParseError) as exception:
+        for record in _a_parser_reading(CsvParser(), content, CsvFormat(), _ARROW_ENGINE_SCHEMA):
+            parsed_records.append(record)
+
+    assert parsed_records == [{"id": 1, "description": "a"}, {"id": 2, "description": "b"}]
+    assert "lineno=2" in str(exception.value)
+
+
+def _disabled_arrow_csv_reader() -> Mock:
+    arrow_csv_reader = Mock(spec=_ArrowCsvReader)
+    arrow_csv_reader.supports.return_value = False
+    return arrow_csv_reader
+
+
+def _a_parser_reading(
+    parser: CsvParser, content: str, config_format: CsvFormat, discovered_schema: Dict[str, Any], a_logger: logging.Logger = logger
+) -> Generator[Dict[str, Any], None, None]:
+    stream_reader = Mock(spec=AbstractFileBasedStreamReader)
+    stream_reader.open_file.side_effect = lambda *args: io.StringIO(content)
+    config = FileBasedStreamConfig(name="test", validation_policy="Emit Record", file_type="csv", format=config_format)
+    file = RemoteFile(uri="a_file.csv", last_modified=datetime.now())
+    yield from parser.parse_records(config, file, stream_reader, a_logger, discovered_schema)
+
+
+def _parse_records(parser: CsvParser, content: str, config_format: CsvFormat, discovered_schema: Dict[str, Any]) -> Any:
+    a_logger = Mock(spec=logging.Logger)
+    records = list(_a_parser_reading(parser, content, config_format, discovered_schema, a_logger))
+    return records, a_logger.warning.call_args_list
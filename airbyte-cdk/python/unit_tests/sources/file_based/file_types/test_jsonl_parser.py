@@ -40,7 +40,11 @@ INVALID_JSON_CONTENT = [
 
 @pytest.fixture
 def stream_reader() -> MagicMock:
-    return MagicMock(spec=AbstractFileBasedStreamReader)
+    stream_reader = MagicMock(spec=AbstractFileBasedStreamReader)
+    stream_reader.open_file_sample.side_effect = lambda file, mode, encoding, logger, max_bytes: stream_reader.open_file(
+        file, mode, encoding, logger
+    )
+    return stream_reader
 
 
 def _infer_schema(stream_reader: MagicMock) -> Dict[str, Any]:
@@ -156,3 +160,79 @@ def test_given_unparsable_json_when_parse_records_then_raise_error(stream_reader
     with pytest.raises(RecordParseError):
         list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, logger, None))
     assert logger.warning.call_count == 0
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        '{"int": 12345678901234567890123456789, "float": 0.1, "exp": 1e400, "nan": NaN, "neg": -0}',
+        '{"unicode": "\\u00e9\\ud83c\\udf89 ✓", "escaped": "a \\"quoted\\" \\\\ value\\n", "lone_surrogate": "\\ud800"}',
+        '{"nested": {"list": [1, [2, {"a": null}], true, false]}, "duplicated": 1, "duplicated": 2}',
+        '  {"surrounded_by": "whitespaces"}  ',
+    ],
+)
+def test_parse_records_is_equivalent_to_json_loads(stream_reader: MagicMock, line: str) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.StringIO(line + "\n")
+
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+
+    assert json.dumps(records) == json.dumps([json.loads(line)])
+
+
+def test_given_single_line_records_after_multiline_json_objects_when_parse_records_then_return_all_records(
+    stream_reader: MagicMock,
+) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = (
+        JSONL_CONTENT_WITH_MULTILINE_JSON_OBJECTS + [b""] + JSONL_CONTENT_WITHOUT_MULTILINE_JSON_OBJECTS
+    )
+
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+
+    assert records == [{"a": 1, "b": "1"}, {"a": 2, "b": "2"}] * 2
+
+
+def test_given_invalid_line_followed_by_many_lines_when_parse_records_then_raise_error_without_reading_the_rest_of_the_file(
+    stream_reader: MagicMock,
+) -> None:
+    lines = iter([b'{"a": 1}', b'{"a": '] + [b'{"a": 2}'] * 1000)
+    stream_reader.open_file.return_value.__enter__.return_value = lines
+    records = []
+
+    with pytest.raises(RecordParseError) as exception:
+        for record in JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None):
+            records.append(record)
+
+    assert records == [{"a": 1}]
+    assert "lineno=5" in str(exception.value)
+    assert len(list(lines)) == 997
+
+
+def test_given_line_that_cannot_start_a_json_value_when_parse_records_then_raise_error(stream_reader: MagicMock) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = [b'{"a": 1}', b'{"a": 2}}', b'{"a": 3}']
+
+    with pytest.raises(RecordParseError):
+        list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+
+
+def test_given_multiline_json_object_too_large_when_parse_records_then_raise_error(
+    stream_reader: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(JsonlParser, "MAX_BYTES_PER_MULTILINE_JSON_OBJECT", 1000)
+    stream_reader.open_file.return_value.__enter__.return_value = [b'{"a": ['] + [b"1,"] * 1000 + [b"1]}"]
+
+    with pytest.raises(RecordParseError) as exception:
+        list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+
+    assert "larger than the maximum size allowed" in str(exception.value)
+
+
+def test_given_large_multiline_json_object_when_parse_records_then_return_records(stream_reader: MagicMock) -> None:
+    large_record = {
+        "items": [{"id": index, "meta": {"a": index, "text": 'a "quoted" [value] with {brackets} \\'}} for index in range(1500)]
+    }
+    content = json.dumps(large_record, indent=2) + "\n" + json.dumps({"a": 1}, indent=2) + "\n"
+    stream_reader.open_file.return_value.__enter__.return_value = io.StringIO(content)
+
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+
+    assert records == [large_record, {"a": 1}]
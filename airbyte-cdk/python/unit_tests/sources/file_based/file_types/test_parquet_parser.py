@@ -4,11 +4,13 @@
 
 import asyncio
 import datetime
+import decimal
 import math
-from typing import Any, Mapping, Union
+from typing import Any, List, Mapping, Union
 from unittest.mock import Mock
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ValidationPolicy
@@ -272,3 +274,44 @@ def test_wrong_file_format(file_format: Union[CsvFormat, JsonlFormat]) -> None:
     logger = Mock()
     with pytest.raises(ValueError):
         asyncio.get_event_loop().run_until_complete(parser.infer_schema(config, file, stream_reader, logger))
+
+
+_A_TABLE = pa.table(
+    {
+        "id": pa.array(range(25), type=pa.int64()),
+        "timestamp": pa.array([datetime.datetime(2024, 1, 1, second=i) if i % 3 else None for i in range(25)], type=pa.timestamp("ms", "utc")),
+        "date": pa.array([datetime.date(2024, 1, 1 + i) for i in range(25)], type=pa.date32()),
+        "binary": pa.array([f"binary {i}".encode() for i in range(25)], type=pa.binary()),
+        "decimal": pa.array([decimal.Decimal(f"{i}.125") for i in range(25)], type=pa.decimal128(6, 3)),
+        "duration": pa.array([datetime.timedelta(milliseconds=i) for i in range(25)], type=pa.duration("ms")),
+        "map": pa.array([[("key", i)] for i in range(25)], type=pa.map_(pa.string(), pa.int32())),
+        "dictionary": pa.array([["a", "b"][i % 2] for i in range(25)]).dictionary_encode(),
+        "struct": pa.array([{"field": i} for i in range(25)], type=pa.struct([pa.field("field", pa.int32())])),
+        "null": pa.array([None] * 25, type=pa.null()),
+    }
+)
+
+
+def _parse_records(tmp_path, table: pa.Table, parquet_format: ParquetFormat, record_batch_size: int) -> List[Mapping[str, Any]]:
+    file_path = tmp_path / "a_file.parquet"
+    pq.write_table(table, file_path, row_group_size=10)
+    config = FileBasedStreamConfig(name="test", format=parquet_format, validation_policy=ValidationPolicy.emit_record)
+    file = RemoteFile(uri="s3://mybucket/year=2024/month=01/a_file.parquet", last_modified=datetime.datetime.now())
+    stream_reader = Mock()
+    stream_reader.open_file.side_effect = lambda *args: open(file_path, "rb")
+    return list(ParquetParser(record_batch_size=record_batch_size).parse_records(config, file, stream_reader, Mock(), None))
+
+
+@pytest.mark.parametrize("parquet_format", [_default_parquet_format, _decimal_as_float_parquet_format])
+@pytest.mark.parametrize("record_batch_size", [1, 7, 10_000])
+def test_parse_records_is_equivalent_to_converting_each_value(tmp_path, parquet_format, record_batch_size) -> None:
+    expected_records = [
+        {
+            **{column: ParquetParser._to_output_value(_A_TABLE.column(column)[row], parquet_format) for column in _A_TABLE.column_names},
+            "year": "2024",
+            "month": "01",
+        }
+        for row in range(_A_TABLE.num_rows)
+    ]
+
+    assert _parse_records(tmp_path, _A_TABLE, parquet_format, record_batch_size) == expected_records
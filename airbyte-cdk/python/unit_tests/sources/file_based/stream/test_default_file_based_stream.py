@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
 import traceback
 import unittest
 from datetime import datetime, timezone
@@ -104,6 +105,22 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         messages = list(self._stream.read_records_from_slice({"files": [RemoteFile(uri="uri", last_modified=self._NOW)]}))
         assert list(map(lambda message: message.record.data["data"], messages)) == [self._A_RECORD]
 
+    def test_when_read_records_from_slice_then_prefetch_the_next_file_once_the_current_one_is_opened(self) -> None:
+        files = [RemoteFile(uri=f"file{i}", last_modified=self._NOW) for i in range(3)]
+        calls = []
+        self._stream_reader.prefetch_file.side_effect = lambda file, logger, after: calls.append(("prefetch", file.uri, after.uri))
+        self._parser.parse_records.side_effect = lambda config, file, stream_reader, logger, schema: calls.append(("parse", file.uri)) or []
+
+        list(self._stream.read_records_from_slice({"files": files}))
+
+        assert calls == [
+            ("prefetch", "file1", "file0"),
+            ("parse", "file0"),
+            ("prefetch", "file2", "file1"),
+            ("parse", "file1"),
+            ("parse", "file2"),
+        ]
+
     def test_given_exception_when_read_records_from_slice_then_do_process_other_files(
         self,
     ) -> None:
@@ -195,6 +212,26 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         }
         assert self._parser.infer_schema.call_count == 3
 
+    def test_given_many_files_when_infer_schema_then_infer_files_concurrently(self) -> None:
+        self._discovery_policy.n_concurrent_requests = 3
+        self._discovery_policy.get_max_n_files_for_schema_inference.return_value = 6
+        self._stream.config.input_schema = None
+        self._stream.config.schemaless = None
+        self._stream.config.recent_n_files_to_read_for_schema_discovery = None
+        # Each file can only be inferred once two other files are being inferred at the same time
+        barrier = threading.Barrier(3, timeout=5)
+
+        async def infer_file_schema(config: Any, file: RemoteFile, stream_reader: Any, logger: Any) -> Mapping[str, Any]:
+            barrier.wait()
+            return {file.uri: {"type": "integer"}}
+
+        self._parser.infer_schema.side_effect = infer_file_schema
+        self._stream_reader.get_matching_files.return_value = [RemoteFile(uri=f"file{i}", last_modified=self._NOW) for i in range(6)]
+
+        schema = self._stream.get_json_schema()
+
+        assert {f"file{i}" for i in range(6)}.issubset(schema["properties"].keys())
+
     def _iter(self, x: Iterable[Any]) -> Iterator[Any]:
         for item in x:
             if isinstance(item, Exception):
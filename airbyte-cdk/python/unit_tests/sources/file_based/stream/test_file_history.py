@@ -0,0 +1,131 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import copy
+import json
+import logging
+import pickle
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Mapping, Optional
+
+import pytest
+from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ValidationPolicy
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.stream.cursor import DefaultFileBasedCursor, FileHistory
+
+DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+logger = logging.getLogger(__name__)
+
+
+class _LargeHistoryCursor(DefaultFileBasedCursor):
+    DEFAULT_MAX_HISTORY_SIZE = 10_000
+
+
+def _earliest_by_scan(history: Mapping[str, str]) -> Optional[RemoteFile]:
+    if not history:
+        return None
+    uri, timestamp = min(history.items(), key=lambda item: (item[1], item[0]))
+    return RemoteFile(uri=uri, last_modified=datetime.strptime(timestamp, DATE_TIME_FORMAT))
+
+
+def _latest_by_scan(history: Mapping[str, str]) -> Optional[RemoteFile]:
+    if not history:
+        return None
+    uri, timestamp = max(history.items(), key=lambda item: (item[1], item[0]))
+    return RemoteFile(uri=uri, last_modified=datetime.strptime(timestamp, DATE_TIME_FORMAT))
+
+
+def test_given_state_history_when_init_then_behave_like_the_history_dict() -> None:
+    state_history = {"b.csv": "2023-06-05T03:54:07.000000Z", "a.csv": "2023-06-05T03:54:07.000000Z", "c.csv": "2023-06-01T00:00:00.000000Z"}
+
+    history = FileHistory(state_history)
+
+    assert history == state_history
+    assert json.loads(json.dumps({"history": history})) == {"history": state_history}
+    assert history.get_last_modified("a.csv") == datetime(2023, 6, 5, 3, 54, 7)
+    assert history.get_last_modified("d.csv") is None
+    assert history.earliest_file() == RemoteFile(uri="c.csv", last_modified=datetime(2023, 6, 1))
+    assert history.latest_file() == RemoteFile(uri="b.csv", last_modified=datetime(2023, 6, 5, 3, 54, 7))
+
+
+def test_given_empty_history_then_no_earliest_or_latest_file() -> None:
+    history = FileHistory()
+
+    assert history.earliest_file() is None
+    assert history.latest_file() is None
+    assert history.remove_earliest_file() is None
+
+
+def test_given_random_operations_then_earliest_and_latest_files_match_a_scan_of_the_history() -> None:
+    rng = random.Random(0)
+    history = FileHistory()
+    expected: dict = {}
+    start = datetime(2024, 1, 1)
+
+    for _ in range(5000):
+        operation = rng.random()
+        uri = f"file{rng.randrange(300)}.csv"
+        if operation < 0.6:
+            timestamp = (start + timedelta(minutes=rng.randrange(500))).strftime(DATE_TIME_FORMAT)
+            history[uri] = timestamp
+            expected[uri] = timestamp
+        elif operation < 0.75:
+            removed = history.remove_earliest_file()
+            expected_removed = _earliest_by_scan(expected)
+            assert removed == expected_removed
+            if expected_removed:
+                del expected[expected_removed.uri]
+        elif operation < 0.9:
+            assert history.pop(uri, None) == expected.pop(uri, None)
+        else:
+            history.update({uri: start.strftime(DATE_TIME_FORMAT)})
+            expected[uri] = start.strftime(DATE_TIME_FORMAT)
+
+        assert history == expected
+        assert history.earliest_file() == _earliest_by_scan(expected)
+        assert history.latest_file() == _latest_by_scan(expected)
+
+
+def test_given_history_when_pickle_or_copy_then_keep_the_history_and_its_index() -> None:
+    history = FileHistory({"a.csv": "2023-06-05T03:54:07.000000Z", "b.csv": "2023-06-01T00:00:00.000000Z"})
+
+    for restored_history in [pickle.loads(pickle.dumps(history)), copy.deepcopy(history), copy.copy(history)]:
+        assert isinstance(restored_history, FileHistory)
+        assert restored_history == history
+        assert restored_history.earliest_file() == RemoteFile(uri="b.csv", last_modified=datetime(2023, 6, 1))
+        assert restored_history.latest_file() == RemoteFile(uri="a.csv", last_modified=datetime(2023, 6, 5, 3, 54, 7))
+
+
+@pytest.mark.parametrize(
+    "timestamp", ["2023-01-01Z", "2023-01-01T00:00:00Z", "2023-01-01T00:00:00.000+00:00Z", "2023-01-01T00:00:00.000000"]
+)
+def test_given_timestamp_not_in_the_history_format_when_init_then_raise(timestamp: str) -> None:
+    with pytest.raises(ValueError):
+        FileHistory({"a.csv": timestamp})
+
+
+def test_given_timestamp_with_fewer_digits_when_init_then_parse_like_strptime() -> None:
+    history = FileHistory({"a.csv": "2023-6-5T3:54:07.5Z"})
+
+    assert history.get_last_modified("a.csv") == datetime.strptime("2023-6-5T3:54:07.5Z", DATE_TIME_FORMAT)
+
+
+def test_add_files_to_a_large_history_performance() -> None:
+    number_of_files = 200_000
+    cursor = _LargeHistoryCursor(FileBasedStreamConfig(format=CsvFormat(), name="test", validation_policy=ValidationPolicy.emit_record))
+    start = datetime(2024, 1, 1)
+    files = [RemoteFile(uri=f"file{index}.csv", last_modified=start + timedelta(seconds=index)) for index in range(number_of_files)]
+
+    started_at = time.perf_counter()
+    for file in files:
+        cursor.add_file(file)
+    state = cursor.get_state()
+    elapsed = time.perf_counter() - started_at
+
+    assert len(state["history"]) == cursor.DEFAULT_MAX_HISTORY_SIZE
+    assert state[cursor.CURSOR_FIELD] == f"{files[-1].last_modified.strftime(DATE_TIME_FORMAT)}_{files[-1].uri}"
+    logger.info(f"Added {number_of_files} files to the history at {number_of_files / elapsed:.0f} files per second")
@@ -7,7 +7,7 @@ from typing import Any, Iterable, List, Mapping, Optional, Set
 
 import pytest
 from airbyte_cdk.sources.file_based.config.abstract_file_based_spec import AbstractFileBasedSpec
-from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
+from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from pydantic.v1 import AnyUrl
 from unit_tests.sources.file_based.helpers import make_remote_files
@@ -270,3 +270,17 @@ def test_globs_and_prefixes_from_globs(
     reader.config = TestSpec(**config)
     assert set([f.uri for f in reader.filter_files_by_globs_and_start_date(FILES, globs)]) == expected_matches
     assert set(reader.get_prefixes_from_globs(globs)) == expected_path_prefixes
+
+
+@pytest.mark.parametrize(
+    "prefix, is_whole_file, mode, expected_content",
+    [
+        pytest.param(b'{"a": 1}\n{"a": 2}\n{"a"', False, FileReadMode.READ, '{"a": 1}\n{"a": 2}\n', id="truncated_line_is_dropped"),
+        pytest.param(b'{"a": 1}\n{"a": 2}', True, FileReadMode.READ, '{"a": 1}\n{"a": 2}', id="whole_file_is_kept"),
+        pytest.param(b"a,b\r\n1,\xc3\xa9\r\n2,", False, FileReadMode.READ, "a,b\r\n1,\u00e9\r\n", id="line_breaks_are_not_translated"),
+        pytest.param(b"a,b\n1,2\n3,", False, FileReadMode.READ_BINARY, b"a,b\n1,2\n", id="binary"),
+        pytest.param(b"no line break", False, FileReadMode.READ, "", id="no_complete_line"),
+    ],
+)
+def test_file_sample_from_prefix(prefix: bytes, is_whole_file: bool, mode: FileReadMode, expected_content: Any) -> None:
+    assert AbstractFileBasedStreamReader.file_sample_from_prefix(prefix, is_whole_file, mode, "utf-8").read() == expected_content
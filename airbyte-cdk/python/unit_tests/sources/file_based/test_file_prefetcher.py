@@ -0,0 +1,197 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import logging
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pytest
+from airbyte_cdk.sources.file_based.config.abstract_file_based_spec import AbstractFileBasedSpec
+from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
+from airbyte_cdk.sources.file_based.file_prefetcher import FilePrefetcher
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+_LOGGER = logging.getLogger("airbyte")
+_CONTENT = bytes(range(256)) * 40 + "é\nà\n".encode("utf-8")
+_A_FILE = RemoteFile(uri="a_file.csv", last_modified=datetime(2024, 1, 1))
+_ANOTHER_FILE = RemoteFile(uri="another_file.csv", last_modified=datetime(2024, 1, 1))
+
+
+class _RangeReader:
+    def __init__(self, contents: Dict[str, bytes]) -> None:
+        self._contents = contents
+        self.requested_ranges: List[Tuple[str, int, int]] = []
+        self._lock = threading.Lock()
+
+    def read_range(self, file: RemoteFile, start: int, end: int) -> bytes:
+        with self._lock:
+            self.requested_ranges.append((file.uri, start, end))
+        return self._contents[file.uri][start:end]
+
+    def get_size(self, file: RemoteFile) -> int:
+        return len(self._contents[file.uri])
+
+
+class _RangeStreamReader(AbstractFileBasedStreamReader):
+    PREFETCH_BLOCK_SIZE = 100
+    PREFETCH_MAX_BLOCKS_AHEAD = 3
+
+    def __init__(self, contents: Dict[str, bytes]) -> None:
+        super().__init__()
+        self._range_reader = _RangeReader(contents)
+
+    @property
+    def config(self) -> Optional[AbstractFileBasedSpec]:
+        return self._config
+
+    @config.setter
+    def config(self, value: AbstractFileBasedSpec) -> None:
+        self._config = value
+
+    def get_matching_files(self, globs: List[str], prefix: Optional[str], logger: logging.Logger) -> Iterable[RemoteFile]:
+        pass
+
+    def open_file(self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger) -> io.IOBase:
+        return self.open_file_with_prefetching(file, mode, encoding, logger)
+
+    def read_file_range(self, file: RemoteFile, start: int, end: int, logger: logging.Logger) -> bytes:
+        return self._range_reader.read_range(file, start, end)
+
+    def get_file_size(self, file: RemoteFile, logger: logging.Logger) -> int:
+        return self._range_reader.get_size(file)
+
+
+def _a_prefetcher(range_reader: _RangeReader, block_size: int = 100, max_blocks_ahead: int = 3) -> FilePrefetcher:
+    return FilePrefetcher(range_reader.read_range, range_reader.get_size, block_size=block_size, max_blocks_ahead=max_blocks_ahead)
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 100, len(_CONTENT), 10 * len(_CONTENT)])
+@pytest.mark.parametrize("read_size", [1, 64, -1])
+def test_read_returns_the_content_of_the_file(block_size: int, read_size: int) -> None:
+    prefetcher = _a_prefetcher(_RangeReader({_A_FILE.uri: _CONTENT}), block_size=block_size)
+
+    with io.BufferedReader(prefetcher.open(_A_FILE)) as file:
+        chunks = []
+        while chunk := file.read(read_size):
+            chunks.append(chunk)
+
+    assert b"".join(chunks) == _CONTENT
+
+
+def test_given_empty_file_when_read_then_return_no_content() -> None:
+    range_reader = _RangeReader({_A_FILE.uri: b""})
+
+    with io.BufferedReader(_a_prefetcher(range_reader).open(_A_FILE)) as file:
+        assert file.read() == b""
+    assert range_reader.requested_ranges == []
+
+
+def test_seek_and_tell() -> None:
+    with io.BufferedReader(_a_prefetcher(_RangeReader({_A_FILE.uri: _CONTENT})).open(_A_FILE)) as file:
+        file.read(150)
+        assert file.tell() == 150
+        file.seek(0)
+        assert file.read(10) == _CONTENT[:10]
+        file.seek(-8, io.SEEK_END)
+        assert file.read() == _CONTENT[-8:]
+        file.seek(250)
+        file.seek(-20, io.SEEK_CUR)
+        assert file.read(30) == _CONTENT[230:260]
+
+
+def test_blocks_are_only_requested_up_to_the_read_ahead_limit() -> None:
+    raw_file = _a_prefetcher(_RangeReader({_A_FILE.uri: _CONTENT}), max_blocks_ahead=3).open(_A_FILE)
+
+    raw_file.read(10)
+    assert sorted(raw_file._blocks.keys()) == [0, 1, 2]
+    raw_file.seek(250)
+    raw_file.read(10)
+    assert sorted(raw_file._blocks.keys()) == [2, 3, 4]
+    raw_file.close()
+    assert raw_file._blocks == {}
+
+
+def test_given_prefetched_file_when_open_then_reuse_the_downloaded_blocks() -> None:
+    range_reader = _RangeReader({_A_FILE.uri: _CONTENT, _ANOTHER_FILE.uri: _CONTENT[::-1]})
+    prefetcher = _a_prefetcher(range_reader)
+
+    prefetcher.prefetch(_A_FILE)
+    with io.BufferedReader(prefetcher.open(_A_FILE)) as file:
+        assert file.read() == _CONTENT
+
+    requested_starts = [start for _, start, _ in range_reader.requested_ranges]
+    assert len(requested_starts) == len(set(requested_starts))
+
+
+def test_given_too_many_prefetched_files_when_prefetch_then_drop_the_oldest_one() -> None:
+    range_reader = _RangeReader({_A_FILE.uri: _CONTENT, _ANOTHER_FILE.uri: _CONTENT[::-1]})
+    prefetcher = FilePrefetcher(range_reader.read_range, range_reader.get_size, max_prefetched_files=1)
+
+    prefetcher.prefetch(_A_FILE)
+    prefetcher.prefetch(_ANOTHER_FILE)
+
+    assert list(prefetcher._prefetched_files.keys()) == [_ANOTHER_FILE.uri]
+    with io.BufferedReader(prefetcher.open(_A_FILE)) as file:
+        assert file.read() == _CONTENT
+
+
+def test_given_range_read_error_when_read_then_raise() -> None:
+    def _failing_read_range(file: RemoteFile, start: int, end: int) -> bytes:
+        raise ValueError("range read failed")
+
+    prefetcher = FilePrefetcher(_failing_read_range, lambda file: len(_CONTENT))
+
+    with pytest.raises(ValueError):
+        with io.BufferedReader(prefetcher.open(_A_FILE)) as file:
+            file.read()
+
+
+@pytest.mark.parametrize(
+    "mode, expected_content", [(FileReadMode.READ_BINARY, _CONTENT), (FileReadMode.READ, "é\nà\n" * 100)], ids=["binary", "text"]
+)
+def test_stream_reader_open_file_with_prefetching(mode: FileReadMode, expected_content: object) -> None:
+    content = expected_content if isinstance(expected_content, bytes) else expected_content.encode("utf-8")
+    stream_reader = _RangeStreamReader({_A_FILE.uri: content})
+
+    with stream_reader.open_file(_A_FILE, mode, "utf-8", _LOGGER) as file:
+        assert file.read() == expected_content
+
+
+def test_given_prefetching_is_not_used_when_prefetch_file_then_do_nothing() -> None:
+    stream_reader = _RangeStreamReader({_A_FILE.uri: _CONTENT})
+
+    stream_reader.prefetch_file(_A_FILE, _LOGGER)
+
+    assert stream_reader._file_prefetcher is None
+    assert stream_reader._range_reader.requested_ranges == []
+
+
+def test_given_next_file_prefetched_after_current_file_when_read_files_in_order_then_download_each_range_once() -> None:
+    files = [RemoteFile(uri=f"file_{index}.csv", last_modified=datetime(2024, 1, 1)) for index in range(5)]
+    stream_reader = _RangeStreamReader({file.uri: _CONTENT for file in files})
+
+    for index, file in enumerate(files):
+        next_file = files[index + 1] if index + 1 < len(files) else None
+        if next_file:
+            stream_reader.prefetch_file(next_file, _LOGGER, after=file)
+        with stream_reader.open_file(file, FileReadMode.READ_BINARY, None, _LOGGER) as opened_file:
+            assert opened_file.read() == _CONTENT
+        if next_file:
+            assert next_file.uri in stream_reader._file_prefetcher._prefetched_files
+
+    requested_ranges = Counter(stream_reader._range_reader.requested_ranges)
+    number_of_blocks = -(-len(_CONTENT) // _RangeStreamReader.PREFETCH_BLOCK_SIZE)
+    assert set(requested_ranges.values()) == {1}
+    assert len(requested_ranges) == len(files) * number_of_blocks
+
+
+def test_given_file_to_prefetch_after_a_file_that_is_not_opened_when_prefetch_file_then_do_not_download() -> None:
+    stream_reader = _RangeStreamReader({_A_FILE.uri: _CONTENT, _ANOTHER_FILE.uri: _CONTENT})
+
+    stream_reader.prefetch_file(_ANOTHER_FILE, _LOGGER, after=_A_FILE)
+
+    assert stream_reader._range_reader.requested_ranges == []
@@ -422,6 +422,49 @@ class TestConcurrentReadProcessor(unittest.TestCase):
         assert messages == expected_messages
         assert handler._record_counter[_STREAM_NAME] == 2
 
+    @freezegun.freeze_time("2020-01-01T00:00:00")
+    def test_on_record_batch_emits_records_and_repository_messages_once_per_batch(self):
+        repository_message = AirbyteMessage(
+            type=MessageType.LOG, log=AirbyteLogMessage(level=LogLevel.INFO, message="message emitted from the repository")
+        )
+        self._message_repository.consume_queue.return_value = [repository_message]
+        handler = ConcurrentReadProcessor(
+            [self._stream],
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+        )
+
+        messages = list(handler.on_record_batch([self._record, self._record]))
+
+        record_message = AirbyteMessage(
+            type=MessageType.RECORD,
+            record=AirbyteRecordMessage(
+                stream=_STREAM_NAME,
+                data=self._record_data,
+                emitted_at=1577836800000,
+            ),
+        )
+        assert messages == [
+            AirbyteMessage(
+                type=MessageType.TRACE,
+                trace=AirbyteTraceMessage(
+                    type=TraceType.STREAM_STATUS,
+                    emitted_at=1577836800000.0,
+                    stream_status=AirbyteStreamStatusTraceMessage(
+                        stream_descriptor=StreamDescriptor(name=_STREAM_NAME), status=AirbyteStreamStatus(AirbyteStreamStatus.RUNNING)
+                    ),
+                ),
+            ),
+            record_message,
+            record_message,
+            repository_message,
+        ]
+        assert handler._record_counter[_STREAM_NAME] == 2
+
     @freezegun.freeze_time("2020-01-01T00:00:00")
     def test_on_record_emits_status_message_on_first_record_no_repository_message(self):
         self._streams_currently_generating_partitions = [_STREAM_NAME]
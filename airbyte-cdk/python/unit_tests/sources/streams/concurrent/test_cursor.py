@@ -164,6 +164,63 @@ class ConcurrentCursorStateTest(TestCase):
         with pytest.raises(KeyError):
             cursor.close_partition(_partition({"not_matching_key": "value"}))
 
+    def _throttled_cursor(self, partitions_per_state_emission=None, state_emission_interval=None) -> ConcurrentCursor:
+        return ConcurrentCursor(
+            _A_STREAM_NAME,
+            _A_STREAM_NAMESPACE,
+            {},
+            self._message_repository,
+            self._state_manager,
+            EpochValueConcurrentStreamStateConverter(is_sequential_state=False),
+            CursorField(_A_CURSOR_FIELD_KEY),
+            _SLICE_BOUNDARY_FIELDS,
+            None,
+            EpochValueConcurrentStreamStateConverter.get_end_provider(),
+            _NO_LOOKBACK_WINDOW,
+            partitions_per_state_emission=partitions_per_state_emission,
+            state_emission_interval=state_emission_interval,
+        )
+
+    def test_given_partitions_per_state_emission_when_close_partitions_then_emit_state_every_n_partitions(self) -> None:
+        cursor = self._throttled_cursor(partitions_per_state_emission=3)
+
+        for lower_boundary in range(0, 70, 10):
+            cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: lower_boundary, _UPPER_SLICE_BOUNDARY_FIELD: lower_boundary + 10}))
+
+        assert self._message_repository.emit_message.call_count == 2
+        cursor.ensure_at_least_one_state_emitted()
+        self._state_manager.update_state_for_stream.assert_called_with(
+            _A_STREAM_NAME,
+            _A_STREAM_NAMESPACE,
+            {"slices": [{"start": 0, "end": 70}], "state_type": "date-range"},
+        )
+
+    def test_given_state_emission_interval_when_close_partitions_then_emit_state_once_interval_elapsed(self) -> None:
+        with freezegun.freeze_time("2024-01-01T00:00:00Z") as frozen_time:
+            cursor = self._throttled_cursor(state_emission_interval=timedelta(seconds=60))
+
+            cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: 0, _UPPER_SLICE_BOUNDARY_FIELD: 10}))
+            frozen_time.tick(timedelta(seconds=30))
+            cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: 10, _UPPER_SLICE_BOUNDARY_FIELD: 20}))
+            assert self._message_repository.emit_message.call_count == 0
+
+            frozen_time.tick(timedelta(seconds=30))
+            cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: 20, _UPPER_SLICE_BOUNDARY_FIELD: 30}))
+            assert self._message_repository.emit_message.call_count == 1
+
+    def test_given_partitions_closed_out_of_order_when_close_partition_then_state_slices_are_merged(self) -> None:
+        cursor = self._throttled_cursor()
+
+        cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: 20, _UPPER_SLICE_BOUNDARY_FIELD: 30}))
+        cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: 40, _UPPER_SLICE_BOUNDARY_FIELD: 50}))
+        cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: 1, _UPPER_SLICE_BOUNDARY_FIELD: 20}))
+
+        self._state_manager.update_state_for_stream.assert_called_with(
+            _A_STREAM_NAME,
+            _A_STREAM_NAMESPACE,
+            {"slices": [{"start": 0, "end": 30}, {"start": 40, "end": 50}], "state_type": "date-range"},
+        )
+
     @freezegun.freeze_time(time_to_freeze=datetime.fromtimestamp(50, timezone.utc))
     def test_given_no_state_when_generate_slices_then_create_slice_from_start_to_end(self):
         start = datetime.fromtimestamp(10, timezone.utc)
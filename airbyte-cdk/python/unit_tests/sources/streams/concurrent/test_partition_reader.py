@@ -50,6 +50,36 @@ class PartitionReaderTest(unittest.TestCase):
 
         assert queue_content == _RECORDS + [StreamThreadException(exception, partition.stream_name()), PartitionCompleteSentinel(partition)]
 
+    def test_given_batch_size_when_process_partition_then_queue_records_in_batches(self):
+        partition = self._a_partition(_RECORDS + [Record({"id": 3, "name": "Jane"}, "stream")])
+        PartitionReader(self._queue, record_batch_size=2).process_partition(partition)
+
+        queue_content = self._consume_queue()
+
+        assert queue_content == [_RECORDS, [Record({"id": 3, "name": "Jane"}, "stream")], PartitionCompleteSentinel(partition)]
+
+    def test_given_batch_max_latency_reached_when_process_partition_then_queue_batch_before_it_is_full(self):
+        partition = self._a_partition(_RECORDS)
+        PartitionReader(self._queue, record_batch_size=10, record_batch_max_latency_seconds=0).process_partition(partition)
+
+        queue_content = self._consume_queue()
+
+        assert queue_content == [[_RECORDS[0]], [_RECORDS[1]], PartitionCompleteSentinel(partition)]
+
+    def test_given_exception_and_batch_size_when_process_partition_then_queue_records_read_before_the_exception(self):
+        partition = Mock()
+        exception = ValueError()
+        partition.read.side_effect = self._read_with_exception(_RECORDS, exception)
+        PartitionReader(self._queue, record_batch_size=10).process_partition(partition)
+
+        queue_content = self._consume_queue()
+
+        assert queue_content == [_RECORDS, StreamThreadException(exception, partition.stream_name()), PartitionCompleteSentinel(partition)]
+
+    def test_given_invalid_batch_size_when_create_then_raise(self):
+        with pytest.raises(ValueError):
+            PartitionReader(self._queue, record_batch_size=0)
+
     def _a_partition(self, records: List[Record]) -> Partition:
         partition = Mock(spec=Partition)
         partition.read.return_value = iter(records)
@@ -0,0 +1,176 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+import multiprocessing
+import os
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from queue import Queue
+from typing import Any, Iterable, List, Mapping, Optional
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.models import AirbyteMessage, AirbyteStateMessage, Level
+from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
+from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPoolManager
+from airbyte_cdk.sources.message import InMemoryMessageRepository, MessageRepository
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
+from airbyte_cdk.sources.streams.concurrent.process_pool_partition_reader import ProcessPoolPartitionReader, _MainProcessObjectStandIn
+
+_STREAM_NAME = "stream"
+_RECORDS = [Record({"id": index}, _STREAM_NAME) for index in range(5)]
+_A_MESSAGE = AirbyteMessage(type=MessageType.STATE, state=AirbyteStateMessage(data={"a_state": "a_value"}))
+
+
+class _PickledPartition(Partition):
+    """
+    Partition defined at module level so that it can be unpickled by the worker processes
+    """
+
+    def __init__(
+        self,
+        records: List[Record],
+        cursor: Optional[Cursor] = None,
+        message_repository: Optional[MessageRepository] = None,
+        exception: Optional[Exception] = None,
+        exit_process: bool = False,
+    ) -> None:
+        self._records = records
+        self._cursor = cursor
+        self._message_repository = message_repository
+        self._exception = exception
+        self._exit_process = exit_process
+        self._lock: Optional[Any] = None
+
+    def read(self) -> Iterable[Record]:
+        if self._message_repository:
+            self._message_repository.emit_message(_A_MESSAGE)
+            self._message_repository.log_message(Level.INFO, lambda: {"message": f"pid {os.getpid()}"})
+        for record in self._records:
+            if self._cursor:
+                self._cursor.observe(record)
+            yield record
+        if self._exit_process:
+            os._exit(1)
+        if self._exception:
+            raise self._exception
+
+    def to_slice(self) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def stream_name(self) -> str:
+        return _STREAM_NAME
+
+    def close(self) -> None:
+        pass
+
+    def is_closed(self) -> bool:
+        return False
+
+    def __hash__(self) -> int:
+        return hash(_STREAM_NAME)
+
+
+class ProcessPoolPartitionReaderTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._process_pool = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._process_pool.shutdown()
+
+    def setUp(self) -> None:
+        self._queue: Queue[QueueItem] = Queue()
+        self._thread_pool_manager = ThreadPoolManager(Mock(spec=ThreadPoolExecutor), Mock(), process_pool=self._process_pool)
+        self._logger = Mock()
+        self._partition_reader = ProcessPoolPartitionReader(self._queue, self._thread_pool_manager, self._logger, record_batch_size=2)
+
+    def test_given_read_partition_successful_when_process_partition_then_queue_record_batches_and_sentinel(self):
+        partition = _PickledPartition(_RECORDS)
+
+        self._partition_reader.process_partition(partition)
+
+        assert self._consume_queue() == [_RECORDS[0:2], _RECORDS[2:4], _RECORDS[4:5], PartitionCompleteSentinel(partition)]
+
+    def test_given_main_process_objects_when_process_partition_then_calls_are_replayed_on_the_main_process(self):
+        cursor = Mock(spec=Cursor)
+        message_repository = InMemoryMessageRepository()
+        partition = _PickledPartition(_RECORDS, cursor=cursor, message_repository=message_repository)
+
+        self._partition_reader.process_partition(partition)
+        self._consume_queue()
+
+        assert [call.args[0] for call in cursor.observe.call_args_list] == _RECORDS
+        messages = list(message_repository.consume_queue())
+        assert messages[0] == _A_MESSAGE
+        assert messages[1].log.message != f"pid {os.getpid()}"
+
+    def test_given_exception_when_process_partition_then_queue_records_and_exception_and_sentinel(self):
+        exception = ValueError("an error")
+        partition = _PickledPartition(_RECORDS[0:3], exception=exception)
+
+        self._partition_reader.process_partition(partition)
+
+        queue_content = self._consume_queue()
+        assert queue_content[:2] == [_RECORDS[0:2], _RECORDS[2:3]]
+        assert isinstance(queue_content[2], StreamThreadException)
+        assert str(queue_content[2].exception) == str(exception)
+        assert queue_content[3] == PartitionCompleteSentinel(partition)
+
+    def test_given_partition_cannot_be_pickled_when_process_partition_then_read_in_thread(self):
+        partition = _PickledPartition(_RECORDS)
+        partition._lock = threading.Lock()
+
+        self._partition_reader.process_partition(partition)
+
+        assert self._consume_queue() == [_RECORDS[0:2], _RECORDS[2:4], _RECORDS[4:5], PartitionCompleteSentinel(partition)]
+        self._logger.warning.assert_called_once()
+
+    def test_given_worker_process_dies_when_process_partition_then_queue_exception_and_sentinel(self):
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as process_pool:
+            thread_pool_manager = ThreadPoolManager(Mock(spec=ThreadPoolExecutor), Mock(), process_pool=process_pool)
+            partition = _PickledPartition([], exit_process=True)
+
+            ProcessPoolPartitionReader(self._queue, thread_pool_manager, self._logger).process_partition(partition)
+
+        queue_content = self._consume_queue()
+        assert isinstance(queue_content[0], StreamThreadException)
+        assert queue_content[1] == PartitionCompleteSentinel(partition)
+
+    def test_given_no_process_pool_when_init_then_raise_value_error(self):
+        with pytest.raises(ValueError):
+            ProcessPoolPartitionReader(self._queue, ThreadPoolManager(Mock(spec=ThreadPoolExecutor), Mock()), self._logger)
+
+    def _consume_queue(self) -> List[QueueItem]:
+        queue_content = []
+        while queue_item := self._queue.get():
+            queue_content.append(queue_item)
+            if isinstance(queue_item, PartitionCompleteSentinel):
+                break
+        return queue_content
+
+
+def test_given_method_returning_nothing_when_call_on_stand_in_then_call_is_forwarded():
+    forwarded_calls = []
+    stand_in = _MainProcessObjectStandIn(1, forwarded_calls)
+
+    stand_in.observe(_RECORDS[0])
+
+    assert forwarded_calls == [(1, "observe", (_RECORDS[0],))]
+
+
+@pytest.mark.parametrize("attribute", ["state", "get_state", "consume_queue", "an_unknown_method"])
+def test_given_attribute_not_forwarded_when_access_on_stand_in_then_raise_attribute_error(attribute):
+    forwarded_calls = []
+    stand_in = _MainProcessObjectStandIn(1, forwarded_calls)
+
+    with pytest.raises(AttributeError):
+        getattr(stand_in, attribute)
+    assert not hasattr(stand_in, attribute)
+    assert forwarded_calls == []
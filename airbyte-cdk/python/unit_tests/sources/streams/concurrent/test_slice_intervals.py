@@ -0,0 +1,100 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Mapping
+from unittest.mock import Mock
+
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+from airbyte_cdk.sources.message import MessageRepository
+from airbyte_cdk.sources.streams.concurrent.cursor import ConcurrentCursor, CursorField
+from airbyte_cdk.sources.streams.concurrent.state_converters.datetime_stream_state_converter import EpochValueConcurrentStreamStateConverter
+from airbyte_cdk.sources.streams.concurrent.state_converters.slice_intervals import SliceIntervals
+
+logger = logging.getLogger(__name__)
+
+_CONVERTER = EpochValueConcurrentStreamStateConverter()
+_START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _datetime(seconds: int) -> datetime:
+    return _START + timedelta(seconds=seconds)
+
+
+def _slice(start: int, end: int):
+    return {_CONVERTER.START_KEY: _datetime(start), _CONVERTER.END_KEY: _datetime(end)}
+
+
+class _SlicePartition:
+    def __init__(self, _slice: Mapping[str, Any]) -> None:
+        self._slice = _slice
+
+    def to_slice(self) -> Mapping[str, Any]:
+        return self._slice
+
+
+def test_given_unsorted_slices_when_init_then_slices_are_sorted_and_merged() -> None:
+    slice_intervals = SliceIntervals(_CONVERTER, [_slice(30, 40), _slice(0, 10), _slice(11, 20)])
+
+    assert slice_intervals.slices == [_slice(0, 20), _slice(30, 40)]
+    assert list(slice_intervals.gaps()) == [(_datetime(20), _datetime(30))]
+
+
+def test_given_slice_bridging_many_slices_when_add_then_merge_them() -> None:
+    slice_intervals = SliceIntervals(_CONVERTER, [_slice(0, 10), _slice(20, 30), _slice(40, 50), _slice(60, 70)])
+
+    slice_intervals.add(_datetime(5), _datetime(55))
+
+    assert slice_intervals.slices == [_slice(0, 55), _slice(60, 70)]
+    assert len(slice_intervals) == 2
+
+
+def test_given_random_slices_when_add_then_match_merge_intervals() -> None:
+    rng = random.Random(0)
+    slice_intervals = SliceIntervals(_CONVERTER, [])
+    added_slices = []
+
+    for _ in range(2000):
+        start = rng.randrange(10_000)
+        end = start + rng.randrange(50)
+        slice_intervals.add(_datetime(start), _datetime(end))
+        added_slices.append(_slice(start, end))
+
+        if len(added_slices) % 50 == 0:
+            assert slice_intervals.slices == _CONVERTER.merge_intervals([dict(added_slice) for added_slice in added_slices])
+
+
+def test_close_many_partitions_out_of_order_performance() -> None:
+    number_of_partitions = 30_000
+    cursor = ConcurrentCursor(
+        "a stream name",
+        None,
+        {},
+        Mock(spec=MessageRepository),
+        Mock(spec=ConnectorStateManager),
+        EpochValueConcurrentStreamStateConverter(is_sequential_state=False),
+        CursorField("a_cursor_field_key"),
+        ("lower_boundary", "upper_boundary"),
+        _START,
+        EpochValueConcurrentStreamStateConverter.get_end_provider(),
+        partitions_per_state_emission=1000,
+    )
+    # Every other partition is closed first so that the state keeps many slices
+    partitions = [
+        _SlicePartition(
+            {"lower_boundary": int(_datetime(index * 60).timestamp()), "upper_boundary": int(_datetime(index * 60 + 30).timestamp())}
+        )
+        for index in list(range(0, number_of_partitions, 2)) + list(range(1, number_of_partitions, 2))
+    ]
+
+    started_at = time.perf_counter()
+    for partition in partitions:
+        cursor.close_partition(partition)  # type: ignore  # only the slice of the partition is used by the cursor
+    elapsed = time.perf_counter() - started_at
+
+    assert len(cursor.state["slices"]) == number_of_partitions
+    logger.info(f"Closed {number_of_partitions} partitions at {number_of_partitions / elapsed:.0f} partitions per second")
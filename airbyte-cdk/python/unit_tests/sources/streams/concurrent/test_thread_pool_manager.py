@@ -1,7 +1,7 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from unittest import TestCase
 from unittest.mock import Mock
 
@@ -79,3 +79,17 @@ class ThreadPoolManagerTest(TestCase):
 
         self._thread_pool_manager.check_for_errors_and_shutdown()
         self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
+
+    def test_given_process_pool_when_check_for_errors_and_shutdown_then_shutdown_process_pool(self):
+        process_pool = Mock(spec=ProcessPoolExecutor)
+        thread_pool_manager = ThreadPoolManager(self._threadpool, Mock(), process_pool=process_pool)
+
+        thread_pool_manager.submit_to_process_pool(self._fn, self._arg)
+        thread_pool_manager.check_for_errors_and_shutdown()
+
+        process_pool.submit.assert_called_with(self._fn, self._arg)
+        process_pool.shutdown.assert_called_with(wait=False, cancel_futures=True)
+
+    def test_given_no_process_pool_when_submit_to_process_pool_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            self._thread_pool_manager.submit_to_process_pool(self._fn, self._arg)
@@ -12,6 +12,11 @@ from airbyte_cdk.sources.streams.http import HttpClient
 from airbyte_cdk.sources.streams.http.error_handlers import BackoffStrategy, ErrorResolution, HttpStatusErrorHandler, ResponseAction
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
+from airbyte_cdk.utils.constants import (
+    ENV_PERSISTENT_REQUEST_CACHE_MAX_AGE_SECONDS,
+    ENV_PERSISTENT_REQUEST_CACHE_MAX_SIZE_BYTES,
+    ENV_PERSISTENT_REQUEST_CACHE_PATH,
+)
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from requests_cache import CachedRequest
 
@@ -339,6 +344,95 @@ def test_that_response_was_cached(requests_mock):
     assert not requests_mock.called
 
 
+def _a_persistent_cache_http_client(monkeypatch, cache_dir, **env_variables) -> HttpClient:
+    monkeypatch.setenv(ENV_PERSISTENT_REQUEST_CACHE_PATH, str(cache_dir))
+    for name, value in env_variables.items():
+        monkeypatch.setenv(name, str(value))
+    return HttpClient(name="StubPersistentCacheHttpClient", logger=MagicMock(), use_persistent_cache=True)
+
+
+def _send_get(http_client: HttpClient, url: str) -> requests.Response:
+    return http_client._send(http_client._create_prepared_request(http_method="GET", url=url), {})
+
+
+def test_given_persistent_cache_when_next_sync_then_revalidate_cached_response(monkeypatch, tmp_path, requests_mock):
+    requests_mock.register_uri(
+        "GET",
+        "https://airbyte.io/repos",
+        [{"json": [{"id": 1}], "headers": {"ETag": "v1"}}, {"status_code": 304, "headers": {"ETag": "v1"}}],
+    )
+    _send_get(_a_persistent_cache_http_client(monkeypatch, tmp_path), "https://airbyte.io/repos")
+
+    response = _send_get(_a_persistent_cache_http_client(monkeypatch, tmp_path), "https://airbyte.io/repos")
+
+    assert requests_mock.last_request.headers["If-None-Match"] == "v1"
+    assert response.status_code == 200
+    assert response.json() == [{"id": 1}]
+    assert response.from_cache
+
+
+def test_given_persistent_cache_and_response_changed_when_next_sync_then_return_new_response(monkeypatch, tmp_path, requests_mock):
+    requests_mock.register_uri(
+        "GET",
+        "https://airbyte.io/repos",
+        [{"json": [{"id": 1}], "headers": {"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}}, {"json": [{"id": 2}]}],
+    )
+    _send_get(_a_persistent_cache_http_client(monkeypatch, tmp_path), "https://airbyte.io/repos")
+
+    response = _send_get(_a_persistent_cache_http_client(monkeypatch, tmp_path), "https://airbyte.io/repos")
+
+    assert requests_mock.last_request.headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert response.json() == [{"id": 2}]
+    assert not response.from_cache
+
+
+def test_given_persistent_cache_when_response_has_no_validator_then_do_not_cache(monkeypatch, tmp_path, requests_mock):
+    requests_mock.register_uri("GET", "https://airbyte.io/repos", json=[{"id": 1}])
+    http_client = _a_persistent_cache_http_client(monkeypatch, tmp_path)
+
+    _send_get(http_client, "https://airbyte.io/repos")
+
+    assert len(http_client._session.cache.responses) == 0
+
+
+def test_given_persistent_cache_path_not_set_when_use_persistent_cache_then_do_not_cache(monkeypatch):
+    monkeypatch.delenv(ENV_PERSISTENT_REQUEST_CACHE_PATH, raising=False)
+    http_client = HttpClient(name="test", logger=MagicMock(), use_persistent_cache=True)
+
+    assert isinstance(http_client._session, LimiterSession)
+    assert not isinstance(http_client._session, CachedLimiterSession)
+
+
+def test_given_responses_older_than_max_age_when_create_persistent_cache_then_evict_them(monkeypatch, tmp_path, requests_mock):
+    requests_mock.register_uri("GET", "https://airbyte.io/repos", json=[{"id": 1}], headers={"ETag": "v1"})
+    _send_get(_a_persistent_cache_http_client(monkeypatch, tmp_path), "https://airbyte.io/repos")
+
+    http_client = _a_persistent_cache_http_client(monkeypatch, tmp_path, **{ENV_PERSISTENT_REQUEST_CACHE_MAX_AGE_SECONDS: -1})
+
+    assert len(http_client._session.cache.responses) == 0
+
+
+def test_given_cache_bigger_than_max_size_when_create_persistent_cache_then_evict_least_recently_used(monkeypatch, tmp_path, requests_mock):
+    for index in range(3):
+        requests_mock.register_uri("GET", f"https://airbyte.io/repos/{index}", text="x" * 1000, headers={"ETag": "v1"})
+    http_client = _a_persistent_cache_http_client(monkeypatch, tmp_path)
+    for index in range(3):
+        _send_get(http_client, f"https://airbyte.io/repos/{index}")
+    response_sizes = [size for _, size in HttpClient._persistent_cache_response_sizes(http_client._session.cache)]
+    max_size = response_sizes[0] + response_sizes[1]
+
+    http_client = _a_persistent_cache_http_client(monkeypatch, tmp_path, **{ENV_PERSISTENT_REQUEST_CACHE_MAX_SIZE_BYTES: max_size})
+
+    cached_urls = [response.url for response in http_client._session.cache.sorted()]
+    assert cached_urls == ["https://airbyte.io/repos/1", "https://airbyte.io/repos/2"]
+
+    # The SQLite file can be bigger than the responses it stores but nothing else is evicted as long as they fit within the max size
+    http_client = _a_persistent_cache_http_client(monkeypatch, tmp_path, **{ENV_PERSISTENT_REQUEST_CACHE_MAX_SIZE_BYTES: max_size})
+
+    assert len(http_client._session.cache.responses) == 2
+    http_client._logger.info.assert_not_called()
+
+
 def test_send_handles_response_action_given_session_send_raises_request_exception():
     error_resolution = ErrorResolution(ResponseAction.FAIL, FailureType.system_error, "test fail message")
 
@@ -205,8 +205,9 @@ VERY_NESTED_SCHEMA = {
         ),
     ],
 )
-def test_transform(schema, actual, expected, expected_warns, caplog):
-    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+@pytest.mark.parametrize("config", [TransformConfig.DefaultSchemaNormalization, TransformConfig.CompiledSchemaNormalization])
+def test_transform(schema, actual, expected, expected_warns, config, caplog):
+    t = TypeTransformer(config)
     t.transform(actual, schema)
     assert json.dumps(actual) == json.dumps(expected)
     if expected_warns:
@@ -249,9 +250,10 @@ def test_custom_transform():
     assert obj == {"value": "transformed"}
 
 
-def test_custom_transform_with_default_normalization():
+@pytest.mark.parametrize("config", [TransformConfig.DefaultSchemaNormalization, TransformConfig.CompiledSchemaNormalization])
+def test_custom_transform_with_default_normalization(config):
     class NotAStream:
-        transformer = TypeTransformer(TransformConfig.CustomSchemaNormalization | TransformConfig.DefaultSchemaNormalization)
+        transformer = TypeTransformer(TransformConfig.CustomSchemaNormalization | config)
 
         @transformer.registerCustomTransform
         def transform_cb(instance, schema):
@@ -264,3 +266,38 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+@pytest.mark.parametrize(
+    "schema, is_compilable",
+    [
+        pytest.param({"type": "object", "properties": {"value": {"type": "string"}}}, True, id="test_simple_schema"),
+        pytest.param({"type": "object", "properties": {"value": {"type": "string"}, "other": True}}, False, id="test_boolean_subschema"),
+        pytest.param(
+            {"$id": "http://schema", "type": "object", "properties": {"value": {"type": "string"}}}, False, id="test_schema_with_id"
+        ),
+    ],
+)
+def test_compiled_schema_is_reused_or_falls_back_to_jsonschema(schema, is_compilable, mocker):
+    transformer = TypeTransformer(TransformConfig.CompiledSchemaNormalization)
+    jsonschema_normalizer = mocker.spy(transformer, "_normalizer")
+
+    for _ in range(3):
+        record = {"value": 12}
+        transformer.transform(record, schema)
+        assert record == {"value": "12"}
+
+    assert len(transformer._compiled_schemas) == 1
+    assert jsonschema_normalizer.call_count == (0 if is_compilable else 3)
+
+
+def test_compiled_schema_with_recursive_reference():
+    schema = {
+        "type": "object",
+        "properties": {"name": {"type": "string"}, "children": {"type": "array", "items": {"$ref": "#"}}},
+    }
+    record = {"name": 1, "children": [{"name": 2, "children": [{"name": 3, "children": []}]}]}
+
+    TypeTransformer(TransformConfig.CompiledSchemaNormalization).transform(record, schema)
+
+    assert record == {"name": "1", "children": [{"name": "2", "children": [{"name": "3", "children": []}]}]}
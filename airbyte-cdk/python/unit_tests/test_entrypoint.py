@@ -2,6 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import datetime
+import decimal
+import io
 import os
 from argparse import Namespace
 from collections import defaultdict
@@ -426,3 +429,111 @@ def test_handle_record_counts(incoming_message, stream_message_count, expected_m
 
     if actual_message.type == Type.STATE:
         assert isinstance(actual_message.state.sourceStats.recordCount, float), "recordCount value should be expressed as a float"
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": 1}, emitted_at=1)),
+            id="test_record",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", namespace="public", data={"id": 1}, emitted_at=1)),
+            id="test_record_with_namespace",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", namespace=None, data={"id": 1}, emitted_at=1)),
+            id="test_record_with_namespace_explicitly_set_to_none",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.RECORD,
+                record=AirbyteRecordMessage(
+                    stream="utilisateurs \"é\"",
+                    data={
+                        "text": "é 😀 \"quoted\" \\ \n\t\u0000",
+                        "big_int": 2**70,
+                        "float": 1e16,
+                        "small_float": 1.5e-7,
+                        "nan": float("nan"),
+                        "inf": float("inf"),
+                        "datetime": datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.timezone.utc),
+                        "date": datetime.date(2024, 1, 1),
+                        "decimal": decimal.Decimal("1.10"),
+                        "bytes": b"bytes",
+                        "tuple": (1, 2),
+                        "nested": {"list": [None, True, {"a": []}]},
+                    },
+                    emitted_at=1700000000000,
+                ),
+            ),
+            id="test_record_with_various_types",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.RECORD,
+                record=AirbyteRecordMessage(stream="users", data={"id": 1}, emitted_at=1, meta={"changes": []}),
+            ),
+            id="test_record_with_meta",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": 1}, emitted_at=1, extra_field=1)),
+            id="test_record_with_extra_field",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"cursor": 1})),
+            id="test_state",
+        ),
+    ],
+)
+def test_airbyte_message_to_string_is_identical_to_pydantic_serialization(message):
+    assert AirbyteEntrypoint.airbyte_message_to_string(message) == message.model_dump_json(exclude_unset=True)
+    assert AirbyteEntrypoint.airbyte_message_to_bytes(message) == message.model_dump_json(exclude_unset=True).encode()
+
+
+def _record(record_id: int) -> AirbyteMessage:
+    return AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": record_id}, emitted_at=1))
+
+
+def _record_line(record_id: int) -> bytes:
+    return AirbyteEntrypoint.airbyte_message_to_bytes(_record(record_id))
+
+
+def test_message_writer_buffers_records_until_another_message_type_is_written():
+    output = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    writer = entrypoint_module._MessageWriter(output)
+    state_line = AirbyteEntrypoint.airbyte_message_to_bytes(AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"cursor": 1})))
+
+    writer.write(_record_line(1))
+    writer.write(_record_line(2))
+    assert output.buffer.getvalue() == b""
+
+    writer.write(state_line)
+    assert output.buffer.getvalue() == _record_line(1) + b"\n" + _record_line(2) + b"\n" + state_line + b"\n"
+
+
+def test_message_writer_flushes_records_when_buffer_is_full(mocker):
+    mocker.patch.object(entrypoint_module._MessageWriter, "MAX_BUFFERED_BYTES", len(_record_line(1)) * 2)
+    output = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    writer = entrypoint_module._MessageWriter(output)
+
+    writer.write(_record_line(1))
+    assert output.buffer.getvalue() == b""
+    writer.write(_record_line(2))
+    assert output.buffer.getvalue() == _record_line(1) + b"\n" + _record_line(2) + b"\n"
+
+
+def test_launch_writes_buffered_records_when_read_fails(mocker, capsys):
+    mocker.patch.object(AirbyteEntrypoint, "parse_args")
+
+    def _run_messages(self, parsed_args):
+        yield _record(1)
+        raise ValueError("an error")
+
+    mocker.patch.object(AirbyteEntrypoint, "_run_messages", _run_messages)
+
+    with pytest.raises(ValueError):
+        entrypoint_module.launch(MockSource(), ["read"])
+
+    assert capsys.readouterr().out == f"{_record_line(1).decode()}\n"
@@ -4,6 +4,8 @@
 from __future__ import annotations
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from textwrap import dedent, indent
 from typing import TYPE_CHECKING, Any
@@ -12,8 +14,10 @@ import dpath
 import sqlalchemy
 from airbyte._processors.file.jsonl import JsonlWriter
 from airbyte.secrets import SecretString
+from airbyte.strategies import WriteStrategy
 from airbyte.types import SQLTypeConverter
 from airbyte_cdk.destinations.vector_db_based import embedder
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
 from airbyte_cdk.destinations.vector_db_based.document_processor import (
     DocumentProcessor as DocumentSplitter,
 )
@@ -42,6 +46,31 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
+EMBEDDING_REQUEST_MAX_CHUNKS = 1000
+"""The maximum number of chunks sent in a single embedding request."""
+
+EMBEDDING_REQUEST_MAX_CHARACTERS = 100_000
+"""The maximum number of characters sent in a single embedding request (about 25k tokens)."""
+
+MAX_CONCURRENT_EMBEDDING_REQUESTS = 4
+"""The number of embedding requests sent at the same time."""
+
+RECORD_STREAM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        DOCUMENT_ID_COLUMN: {"type": "string"},
+        CHUNK_ID_COLUMN: {"type": "string"},
+        METADATA_COLUMN: {"type": "object"},
+        DOCUMENT_CONTENT_COLUMN: {"type": "string"},
+        EMBEDDING_COLUMN: {
+            "type": "array",
+            "items": {"type": "float"},
+        },
+    },
+}
+"""The schema of the rows written to the local files, one row per chunk."""
+
+
 class SnowflakeCortexConfig(SqlConfig):
     """A Snowflake configuration for use with Cortex functions."""
 
@@ -157,6 +186,8 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
         """Initialize the Snowflake processor."""
         self.splitter_config = splitter_config
         self.embedder_config = embedder_config
+        self._pending_chunks: list[Chunk] = []
+        self._pending_characters = 0
         super().__init__(
             sql_config=sql_config,
             catalog_provider=catalog_provider,
@@ -311,28 +342,58 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
         We override the SQLProcessor implementation in order to handle chunking, embedding, etc.
 
         This method is called for each record message, before the record is written to local file.
+        Embedding every record on its own costs one round trip to the embedding API per record, so
+        the chunks of consecutive records are buffered and embedded together once enough text was
+        collected to fill one embedding request per concurrent request. `write_all_stream_data()`
+        flushes the remaining chunks before the local files are loaded.
         """
         document_chunks, id_to_delete = self.splitter.process(record_msg)
 
         # TODO: Decide if we need to incorporate this into the final implementation:
         _ = id_to_delete
 
+        self._pending_chunks.extend(document_chunks)
+        self._pending_characters += sum(len(chunk.page_content or "") for chunk in document_chunks)
+
+        if (
+            len(self._pending_chunks)
+            >= EMBEDDING_REQUEST_MAX_CHUNKS * MAX_CONCURRENT_EMBEDDING_REQUESTS
+            or self._pending_characters
+            >= EMBEDDING_REQUEST_MAX_CHARACTERS * MAX_CONCURRENT_EMBEDDING_REQUESTS
+        ):
+            self._flush_pending_chunks()
+
+    @overrides
+    def write_all_stream_data(self, write_strategy: WriteStrategy) -> None:
+        """Finalize any pending writes.
+
+        The buffered chunks are embedded and written to the local files first, so that they are
+        part of the batches loaded into Snowflake.
+        """
+        self._flush_pending_chunks()
+        super().write_all_stream_data(write_strategy=write_strategy)
+
+    def _flush_pending_chunks(self) -> None:
+        """Embed the buffered chunks and write them to the local files, in the order received."""
+        pending_chunks = self._pending_chunks
+        self._pending_chunks = []
+        self._pending_characters = 0
+        if not pending_chunks:
+            return
+
+        embeddings: list[list[float] | None] = [None] * len(pending_chunks)
         if not self.sql_config.cortex_embedding_model:
-            embeddings = self.embedder.embed_documents(
-                # TODO: Check this: Expects a list of documents, not chunks (docs are inconsistent)
-                documents=document_chunks,
-            )
-        for i, chunk in enumerate(document_chunks, start=0):
+            embeddings = self._embed_chunks(pending_chunks)
+
+        for chunk, embedding in zip(pending_chunks, embeddings):
+            record_msg = chunk.record
             new_data: dict[str, Any] = {
                 DOCUMENT_ID_COLUMN: self._create_document_id(record_msg),
                 CHUNK_ID_COLUMN: str(uuid.uuid4().int),
                 METADATA_COLUMN: chunk.metadata,
                 DOCUMENT_CONTENT_COLUMN: chunk.page_content,
-                EMBEDDING_COLUMN: None,
+                EMBEDDING_COLUMN: embedding,
             }
-            if not self.sql_config.cortex_embedding_model:
-                new_data[EMBEDDING_COLUMN] = embeddings[i]
-
             self.file_writer.process_record_message(
                 record_msg=AirbyteRecordMessage(
                     namespace=record_msg.namespace,
@@ -340,21 +401,46 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
                     data=new_data,
                     emitted_at=record_msg.emitted_at,
                 ),
-                stream_schema={
-                    "type": "object",
-                    "properties": {
-                        DOCUMENT_ID_COLUMN: {"type": "string"},
-                        CHUNK_ID_COLUMN: {"type": "string"},
-                        METADATA_COLUMN: {"type": "object"},
-                        DOCUMENT_CONTENT_COLUMN: {"type": "string"},
-                        EMBEDDING_COLUMN: {
-                            "type": "array",
-                            "items": {"type": "float"},
-                        },
-                    },
-                },
+                stream_schema=RECORD_STREAM_SCHEMA,
             )
 
+    def _embed_chunks(self, chunks: list[Chunk]) -> list[list[float] | None]:
+        """Embed the chunks with concurrent requests and return the embeddings in the same order.
+
+        The chunks are split into requests holding at most `EMBEDDING_REQUEST_MAX_CHUNKS` chunks
+        and `EMBEDDING_REQUEST_MAX_CHARACTERS` characters (a single larger chunk gets its own
+        request).
+        """
+        requests: list[list[Chunk]] = []
+        request_characters = 0
+        for chunk in chunks:
+            chunk_characters = len(chunk.page_content or "")
+            if (
+                not requests
+                or len(requests[-1]) >= EMBEDDING_REQUEST_MAX_CHUNKS
+                or request_characters + chunk_characters > EMBEDDING_REQUEST_MAX_CHARACTERS
+            ):
+                requests.append([])
+                request_characters = 0
+            requests[-1].append(chunk)
+            request_characters += chunk_characters
+
+        if len(requests) == 1:
+            return self.embedder.embed_documents(documents=requests[0])
+
+        with ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_EMBEDDING_REQUESTS,
+            thread_name_prefix="cortex_embedder",
+        ) as executor:
+            futures = [
+                executor.submit(self.embedder.embed_documents, documents=request)
+                for request in requests
+            ]
+            embeddings: list[list[float] | None] = []
+            for future in futures:
+                embeddings.extend(future.result())
+        return embeddings
+
     def _get_table_by_name(
         self,
         table_name: str,
@@ -395,8 +481,9 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
         """
         pass
 
-    @property
+    @cached_property
     def embedder(self) -> embedder.Embedder:
+        """Return the embedder, created once as it holds the client of the embedding API."""
         return embedder.create_from_config(
             embedding_config=self.embedder_config,  # type: ignore [arg-type]  # No common base class
             processing_config=self.splitter_config,
@@ -407,8 +494,9 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
         """Return the number of dimensions for the embeddings."""
         return self.embedder.embedding_dimensions
 
-    @property
+    @cached_property
     def splitter(self) -> DocumentSplitter:
+        """Return the document splitter, created once as it holds the text splitter."""
         return DocumentSplitter(
             config=self.splitter_config,
             catalog=self.catalog_provider.configured_catalog,
@@ -0,0 +1,122 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from airbyte.secrets import SecretString
+from airbyte.strategies import WriteStrategy
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
+from airbyte_protocol.models import AirbyteRecordMessage
+
+from destination_snowflake_cortex import cortex_processor
+from destination_snowflake_cortex.cortex_processor import (
+    SnowflakeCortexConfig,
+    SnowflakeCortexSqlProcessor,
+)
+from destination_snowflake_cortex.globals import (
+    DOCUMENT_CONTENT_COLUMN,
+    DOCUMENT_ID_COLUMN,
+    EMBEDDING_COLUMN,
+)
+
+
+class TestSnowflakeCortexSqlProcessor(unittest.TestCase):
+    def setUp(self):
+        catalog_provider = MagicMock()
+        catalog_provider.stream_names = []
+        catalog_provider.get_configured_stream_info.return_value.primary_key = [["id"]]
+        with patch.object(SnowflakeCortexSqlProcessor, "_ensure_schema_exists"):
+            self.processor = SnowflakeCortexSqlProcessor(
+                sql_config=SnowflakeCortexConfig(
+                    host="MYACCOUNT",
+                    username="MYUSERNAME",
+                    password=SecretString("xxxxxxx"),
+                    warehouse="MYWAREHOUSE",
+                    database="MYDATABASE",
+                    role="MYROLE",
+                ),
+                splitter_config=MagicMock(),
+                embedder_config=MagicMock(),
+                catalog_provider=catalog_provider,
+                temp_dir=Path("/tmp"),
+            )
+        # Each record is split into two chunks and each chunk is embedded as [length of its text]
+        self.processor.splitter = MagicMock()
+        self.processor.splitter.process.side_effect = lambda record: (
+            [
+                Chunk(page_content=f"{record.data['text']}_{index}", metadata={}, record=record)
+                for index in range(2)
+            ],
+            None,
+        )
+        self.processor.embedder = MagicMock()
+        self.processor.embedder.embed_documents.side_effect = lambda documents: [
+            [float(len(chunk.page_content))] for chunk in documents
+        ]
+        self.processor.file_writer = MagicMock()
+
+    def _process_records(self, texts):
+        for index, text in enumerate(texts):
+            self.processor.process_record_message(
+                AirbyteRecordMessage(
+                    stream="mystream", data={"id": index, "text": text}, emitted_at=0
+                ),
+                stream_schema={},
+            )
+
+    def _written_rows(self):
+        return [
+            call.kwargs["record_msg"].data
+            for call in self.processor.file_writer.process_record_message.call_args_list
+        ]
+
+    def test_given_records_below_budget_when_process_then_embed_once_all_stream_data_is_written(
+        self,
+    ):
+        self._process_records(["a", "bb", "ccc"])
+
+        self.processor.embedder.embed_documents.assert_not_called()
+        self.processor.file_writer.process_record_message.assert_not_called()
+
+        self.processor.write_all_stream_data(write_strategy=WriteStrategy.AUTO)
+
+        self.processor.embedder.embed_documents.assert_called_once()
+        rows = self._written_rows()
+        self.assertEqual(
+            [row[DOCUMENT_CONTENT_COLUMN] for row in rows],
+            ["a_0", "a_1", "bb_0", "bb_1", "ccc_0", "ccc_1"],
+        )
+        self.assertEqual(
+            [row[EMBEDDING_COLUMN] for row in rows],
+            [[3.0], [3.0], [4.0], [4.0], [5.0], [5.0]],
+        )
+        self.assertEqual(rows[2][DOCUMENT_ID_COLUMN], "Stream_mystream_Key_1")
+
+    @patch.object(cortex_processor, "MAX_CONCURRENT_EMBEDDING_REQUESTS", 2)
+    @patch.object(cortex_processor, "EMBEDDING_REQUEST_MAX_CHUNKS", 3)
+    def test_given_records_above_budget_when_process_then_embed_concurrent_requests_in_order(
+        self,
+    ):
+        texts = [str(index) * (index + 1) for index in range(5)]
+
+        self._process_records(texts)
+
+        # The budget of 2 requests of 3 chunks is reached on the third record
+        self.assertEqual(self.processor.embedder.embed_documents.call_count, 2)
+        self.assertEqual(len(self._written_rows()), 6)
+
+        self.processor.write_all_stream_data(write_strategy=WriteStrategy.AUTO)
+
+        self.assertEqual(self.processor.embedder.embed_documents.call_count, 4)
+        rows = self._written_rows()
+        self.assertEqual(
+            [row[DOCUMENT_CONTENT_COLUMN] for row in rows],
+            [f"{text}_{index}" for text in texts for index in range(2)],
+        )
+        self.assertEqual(
+            [row[EMBEDDING_COLUMN] for row in rows],
+            [[float(len(text) + 2)] for text in texts for _ in range(2)],
+        )
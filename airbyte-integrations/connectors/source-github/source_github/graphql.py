@@ -9,10 +9,15 @@ from typing import Optional
 import sgqlc.operation
 from sgqlc.operation import Selector
 
-from . import github_schema
 
-_schema = github_schema
-_schema_root = _schema.github_schema
+def _schema_root():
+    """
+    The generated GitHub schema defines thousands of types which takes seconds to import. It is only imported once the first query is
+    built so that the commands and streams which do not use GraphQL don't pay for it.
+    """
+    from . import github_schema
+
+    return github_schema.github_schema
 
 
 def select_user_fields(user):
@@ -31,7 +36,7 @@ def get_query_pull_requests(owner, name, first, after, direction):
     if after:
         kwargs["after"] = after
 
-    op = sgqlc.operation.Operation(_schema_root.query_type)
+    op = sgqlc.operation.Operation(_schema_root().query_type)
     repository = op.repository(owner=owner, name=name)
     repository.name()
     repository.owner.login()
@@ -55,7 +60,7 @@ def get_query_pull_requests(owner, name, first, after, direction):
     reviews = pull_requests.nodes.reviews(first=100, __alias__="review_comments")
     reviews.total_count()
     reviews.nodes.comments.__fields__(total_count=True)
-    user = pull_requests.nodes.merged_by(__alias__="merged_by").__as__(_schema_root.User)
+    user = pull_requests.nodes.merged_by(__alias__="merged_by").__as__(_schema_root().User)
     select_user_fields(user)
     pull_requests.page_info.__fields__(has_next_page=True, end_cursor=True)
     return str(op)
@@ -66,7 +71,7 @@ def get_query_projectsV2(owner, name, first, after, direction):
     if after:
         kwargs["after"] = after
 
-    op = sgqlc.operation.Operation(_schema_root.query_type)
+    op = sgqlc.operation.Operation(_schema_root().query_type)
     repository = op.repository(owner=owner, name=name)
     repository.name()
     repository.owner.login()
@@ -96,7 +101,7 @@ def get_query_projectsV2(owner, name, first, after, direction):
 
 
 def get_query_reviews(owner, name, first, after, number=None):
-    op = sgqlc.operation.Operation(_schema_root.query_type)
+    op = sgqlc.operation.Operation(_schema_root().query_type)
     repository = op.repository(owner=owner, name=name)
     repository.name()
     repository.owner.login()
@@ -128,13 +133,13 @@ def get_query_reviews(owner, name, first, after, number=None):
         updated_at="updated_at",
     )
     reviews.nodes.commit.oid()
-    user = reviews.nodes.author(__alias__="user").__as__(_schema_root.User)
+    user = reviews.nodes.author(__alias__="user").__as__(_schema_root().User)
     select_user_fields(user)
     return str(op)
 
 
 def get_query_issue_reactions(owner, name, first, after, number=None):
-    op = sgqlc.operation.Operation(_schema_root.query_type)
+    op = sgqlc.operation.Operation(_schema_root().query_type)
     repository = op.repository(owner=owner, name=name)
     repository.name()
     repository.owner.login()
@@ -223,7 +228,7 @@ class QueryReactions:
         }
         """
         op = self._get_operation()
-        pull_request = op.node(id=node_id).__as__(_schema_root.PullRequest)
+        pull_request = op.node(id=node_id).__as__(_schema_root().PullRequest)
         pull_request.id(__alias__="node_id")
         pull_request.repository.name()
         pull_request.repository.owner.login()
@@ -246,7 +251,7 @@ class QueryReactions:
         }
         """
         op = self._get_operation()
-        review = op.node(id=node_id).__as__(_schema_root.PullRequestReview)
+        review = op.node(id=node_id).__as__(_schema_root().PullRequestReview)
         review.id(__alias__="node_id")
         review.repository.name()
         review.repository.owner.login()
@@ -266,7 +271,7 @@ class QueryReactions:
         }
         """
         op = self._get_operation()
-        comment = op.node(id=node_id).__as__(_schema_root.PullRequestReviewComment)
+        comment = op.node(id=node_id).__as__(_schema_root().PullRequestReviewComment)
         comment.id(__alias__="node_id")
         comment.database_id(__alias__="id")
         comment.repository.name()
@@ -308,7 +313,7 @@ class QueryReactions:
         return reviews
 
     def _get_operation(self):
-        return sgqlc.operation.Operation(_schema_root.query_type)
+        return sgqlc.operation.Operation(_schema_root().query_type)
 
 
 class CursorStorage:
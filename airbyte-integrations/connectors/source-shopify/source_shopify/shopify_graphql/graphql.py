@@ -7,10 +7,15 @@ from typing import Optional
 
 import sgqlc.operation
 
-from . import schema
 
-_schema = schema
-_schema_root = _schema.shopify_schema
+def _schema_root():
+    """
+    The generated Shopify schema defines thousands of types which takes seconds to import. It is only imported once the first query is
+    built so that the commands and the streams which don't use it, like the BULK streams, don't pay for it.
+    """
+    from . import schema
+
+    return schema.shopify_schema
 
 
 # the graphql api requires the query filter to be snake case even though the column returned is camel case
@@ -25,7 +30,7 @@ def _camel_to_snake(camel_case: str):
 
 
 def get_query_products(first: int, filter_field: str, filter_value: str, next_page_token: Optional[str]):
-    op = sgqlc.operation.Operation(_schema_root.query_type)
+    op = sgqlc.operation.Operation(_schema_root().query_type)
     snake_case_filter_field = _camel_to_snake(filter_field)
     products_args = {
         "first": first,
@@ -0,0 +1,18 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import importlib
+import sys
+from unittest.mock import patch
+
+
+def test_import_source_does_not_import_graphql_schema():
+    # The modules imported by other tests are removed for the duration of the test so that the source is imported from scratch
+    with patch.dict(sys.modules):
+        for module_name in [name for name in sys.modules if name.split(".")[0] == "source_shopify"]:
+            del sys.modules[module_name]
+
+        importlib.import_module("source_shopify")
+
+        assert "source_shopify.shopify_graphql.schema" not in sys.modules